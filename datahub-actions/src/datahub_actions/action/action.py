@@ -13,12 +13,28 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
+from typing import List
 
 from datahub.ingestion.api.closeable import Closeable
 from datahub_actions.event.event_envelope import EventEnvelope
 from datahub_actions.pipeline.pipeline_context import PipelineContext
 
 
+class ActionBatchError(Exception):
+    """
+    Raised by act_batch when it fails part way through a batch of events.
+
+    The first num_completed events of the batch were processed successfully, so the pipeline only
+    retries the events which follow them.
+    """
+
+    def __init__(self, num_completed: int) -> None:
+        super().__init__(
+            f"Failed to process a batch of events after completing {num_completed} of them"
+        )
+        self.num_completed = num_completed
+
+
 class Action(Closeable, metaclass=ABCMeta):
     """
     The base class for all DataHub Actions.
@@ -29,6 +45,11 @@ class Action(Closeable, metaclass=ABCMeta):
     Each Action may provide its own semantics, configurations, compatibility and guarantees.
     """
 
+    # Whether processing the same event more than once is harmless. When an act_batch override fails
+    # without raising an ActionBatchError, the pipeline can't tell which events were completed, so it
+    # only retries the events of the batch if the action is idempotent.
+    idempotent: bool = False
+
     @classmethod
     @abstractmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Action":
@@ -39,3 +60,20 @@ class Action(Closeable, metaclass=ABCMeta):
     def act(self, event: EventEnvelope) -> None:
         """Take Action on DataHub events, provided an instance of a DataHub event."""
         pass
+
+    def act_batch(self, events: List[EventEnvelope]) -> None:
+        """
+        Take Action on a batch of DataHub events, in the order in which they were received.
+
+        This is only invoked when the pipeline is configured with a batch_size. By default, it simply
+        invokes act for each event. Actions that can process events more efficiently in bulk, e.g. by
+        emitting a single update per entity, can override it.
+
+        Overrides that fail part way through a batch should raise an ActionBatchError, so that the
+        events which were already processed aren't processed again.
+        """
+        for i, event in enumerate(events):
+            try:
+                self.act(event)
+            except Exception as e:
+                raise ActionBatchError(num_completed=i) from e
@@ -0,0 +1,114 @@
+import json
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+from datahub_actions.event.event_envelope import EventEnvelope
+
+_Matcher = Callable[[Any], bool]
+
+# Top-level fields with these types have the same value in the event object as in its
+# JSON representation, so they can be matched without serializing the event.
+_PRIMITIVE_TYPES = (str, int, float, bool)
+
+
+def _compile_matcher(match_val: Any) -> _Matcher:
+    if isinstance(match_val, dict):
+        return _compile_dict_matcher(match_val)
+    if isinstance(match_val, list):
+        return _compile_list_matcher(match_val)
+    return lambda match_with: match_val == match_with
+
+
+def _compile_list_matcher(match_filters: List) -> _Matcher:
+    """When matching lists we do ANY not ALL match"""
+
+    # Only strings can match, so the filters are indexed in a set.
+    values: FrozenSet[str] = frozenset(
+        filter for filter in match_filters if isinstance(filter, str)
+    )
+
+    def _matches(match_with: Any) -> bool:
+        return isinstance(match_with, str) and match_with in values
+
+    return _matches
+
+
+def _compile_dict_matcher(match_filters: Dict[str, Any]) -> _Matcher:
+    matchers = [(key, _compile_matcher(val)) for key, val in match_filters.items()]
+
+    def _matches(match_with: Any) -> bool:
+        if isinstance(match_with, str):
+            try:
+                match_with = json.loads(match_with)
+            except ValueError:
+                pass
+        if not isinstance(match_with, dict):
+            return False
+        for key, matcher in matchers:
+            if not matcher(match_with.get(key)):
+                return False
+        return True
+
+    return _matches
+
+
+class EventFilter:
+    """
+    A filter on the type and body of events, compiled once from the filter configuration of a pipeline.
+
+    Filters on the top-level fields of the event body are matched directly against the event object
+    whenever possible, so that most events can be rejected without serializing them to JSON. Filters
+    on nested fields still require the JSON representation of the event.
+    """
+
+    def __init__(
+        self,
+        event_type: Union[str, List[str]],
+        event: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.event_types: FrozenSet[str] = frozenset(
+            [event_type] if isinstance(event_type, str) else event_type
+        )
+
+        # (key, matcher, whether the field can be matched without the JSON representation)
+        field_matchers: List[Tuple[str, _Matcher, bool]] = [
+            (key, _compile_matcher(val), not isinstance(val, dict))
+            for key, val in (event or {}).items()
+        ]
+        # Check the cheap filters first, since they can often reject the event on their own.
+        self._field_matchers = sorted(
+            field_matchers, key=lambda field_matcher: not field_matcher[2]
+        )
+
+    def matches(self, env_event: EventEnvelope) -> bool:
+        if env_event.event_type not in self.event_types:
+            return False
+
+        fields = getattr(env_event.event, "_inner_dict", None)
+        body_as_json_dict: Optional[dict] = None
+        for key, matcher, indexed in self._field_matchers:
+            value = fields.get(key) if indexed and fields is not None else None
+            if not isinstance(value, _PRIMITIVE_TYPES):
+                if body_as_json_dict is None:
+                    body_as_json_dict = json.loads(env_event.event.as_json())
+                value = body_as_json_dict.get(key)
+            if not matcher(value):
+                return False
+        return True
+
+    def may_match(
+        self, event_type: str, raw_fields: Optional[Mapping[str, Any]] = None
+    ) -> bool:
+        """
+        Checks whether an event that hasn't been fully built yet may match the filter, given its type and
+        its raw top-level fields, e.g. as deserialized from Kafka. Returns True if this can't be decided
+        from the raw fields alone.
+        """
+        if event_type not in self.event_types:
+            return False
+
+        if raw_fields is not None:
+            for key, matcher, indexed in self._field_matchers:
+                value = raw_fields.get(key) if indexed else None
+                if isinstance(value, _PRIMITIVE_TYPES) and not matcher(value):
+                    return False
+        return True
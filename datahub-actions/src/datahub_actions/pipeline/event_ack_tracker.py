@@ -0,0 +1,82 @@
+import collections
+import threading
+import time
+from dataclasses import dataclass
+from typing import Deque, Dict, Hashable, List
+
+from datahub_actions.event.event_envelope import EventEnvelope
+
+
+@dataclass
+class InFlightEvent:
+    envelope: EventEnvelope
+
+    # Timestamp in milliseconds when the event was received from the source.
+    received_at: int
+
+    done: bool = False
+    processed: bool = True
+
+
+def get_ack_partition(enveloped_event: EventEnvelope) -> Hashable:
+    # Offsets are only ordered within a single partition of a Kafka topic.
+    # Events from other sources all share a single partition.
+    kafka_meta = (enveloped_event.meta or {}).get("kafka")
+    if kafka_meta:
+        return (kafka_meta.get("topic"), kafka_meta.get("partition"))
+    return None
+
+
+class EventAckTracker:
+    """
+    Tracks the events that are being processed concurrently, and releases them for
+    acking in the order in which they were received from the event source.
+
+    The order is tracked per source partition, so that a slow event only holds back the
+    acks of the events that came after it in the same partition. Since the Kafka
+    source commits offsets, acking an event out of order could otherwise mark
+    events that were never processed as consumed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Deque[InFlightEvent]] = {}
+        self._in_flight_count = 0
+
+    def add(self, enveloped_event: EventEnvelope) -> InFlightEvent:
+        in_flight_event = InFlightEvent(
+            envelope=enveloped_event, received_at=int(time.time() * 1000)
+        )
+        partition = get_ack_partition(enveloped_event)
+        with self._lock:
+            self._in_flight.setdefault(partition, collections.deque()).append(
+                in_flight_event
+            )
+            self._in_flight_count += 1
+        return in_flight_event
+
+    def complete(
+        self, in_flight_event: InFlightEvent, processed: bool
+    ) -> List[InFlightEvent]:
+        """
+        Marks an event as done, and returns the events which are now ready to be acked, in order.
+        Callers must ack the returned events before completing another event, otherwise acks
+        may still be issued out of order.
+        """
+        partition = get_ack_partition(in_flight_event.envelope)
+        with self._lock:
+            in_flight_event.done = True
+            in_flight_event.processed = processed
+
+            queue = self._in_flight[partition]
+            ready = []
+            while queue and queue[0].done:
+                ready.append(queue.popleft())
+            if not queue:
+                del self._in_flight[partition]
+
+            self._in_flight_count -= len(ready)
+            return ready
+
+    def in_flight_count(self) -> int:
+        return self._in_flight_count
@@ -14,10 +14,17 @@
 
 import logging
 import os
-from typing import List, Optional
-
-from datahub_actions.action.action import Action
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import partial
+from typing import List, Optional, Tuple, Union
+
+from datahub.utilities.partition_executor import PartitionExecutor
+from datahub_actions.action.action import Action, ActionBatchError
 from datahub_actions.event.event_envelope import EventEnvelope
+from datahub_actions.pipeline.event_ack_tracker import EventAckTracker, InFlightEvent
 from datahub_actions.pipeline.pipeline_config import FailureMode, PipelineConfig
 from datahub_actions.pipeline.pipeline_stats import PipelineStats
 from datahub_actions.pipeline.pipeline_util import (
@@ -26,6 +33,7 @@ from datahub_actions.pipeline.pipeline_util import (
     create_event_source,
     create_filter_transformer,
     create_transformer,
+    get_event_entity_urn,
     normalize_directory_name,
 )
 from datahub_actions.source.event_source import EventSource
@@ -39,6 +47,13 @@ DEFAULT_RETRY_COUNT = 0  # Do not retry unless instructed.
 DEFAULT_FAILED_EVENTS_DIR = "/tmp/logs/datahub/actions"
 DEFAULT_FAILED_EVENTS_FILE_NAME = "failed_events.log"  # Not currently configurable.
 DEFAULT_FAILURE_MODE = FailureMode.CONTINUE
+DEFAULT_MAX_WORKERS = 1  # Process events one at a time unless instructed.
+DEFAULT_MAX_PENDING_EVENTS = 1000
+DEFAULT_BATCH_SIZE = 1  # Hand events to the action one at a time unless instructed.
+DEFAULT_BATCH_MAX_WAIT_MS = 1000
+
+# How often the thread reading events for batching checks whether the pipeline is stopping.
+_EVENT_QUEUE_POLL_INTERVAL_SECONDS = 0.1
 
 
 class PipelineException(Exception):
@@ -50,6 +65,13 @@ class PipelineException(Exception):
     pass
 
 
+class _SourceExhausted:
+    pass
+
+
+_SOURCE_EXHAUSTED = _SourceExhausted()
+
+
 class Pipeline:
     """
     A Pipeline is responsible for coordinating execution of a single DataHub Action.
@@ -65,6 +87,8 @@ class Pipeline:
 
         - Configurable retries of event processing in cases of component failure
         - Configurable dead letter queue
+        - Configurable concurrent processing of events, preserving the order of events per entity
+        - Configurable batching of events handed to the Action
         - Capturing basic statistics about each Pipeline component
         - At-will start and stop of an individual pipeline
 
@@ -79,12 +103,18 @@ class Pipeline:
     _shutdown: bool = False
 
     # Pipeline statistics
-    _stats: PipelineStats = PipelineStats()
+    _stats: PipelineStats
 
     # Options
     _retry_count: int = DEFAULT_RETRY_COUNT  # Number of times a single event should be retried in case of processing error.
     _failure_mode: FailureMode = DEFAULT_FAILURE_MODE
     _failed_events_dir: str = DEFAULT_FAILED_EVENTS_DIR  # The top-level path where failed events will be logged.
+    _max_workers: int = DEFAULT_MAX_WORKERS  # Number of events to process concurrently.
+    _max_pending_events: int = DEFAULT_MAX_PENDING_EVENTS
+    _batch_size: int = (
+        DEFAULT_BATCH_SIZE  # Max number of events handed to the action at once.
+    )
+    _batch_max_wait_ms: int = DEFAULT_BATCH_MAX_WAIT_MS
 
     def __init__(
         self,
@@ -95,11 +125,16 @@ class Pipeline:
         retry_count: Optional[int],
         failure_mode: Optional[FailureMode],
         failed_events_dir: Optional[str],
+        max_workers: Optional[int] = None,
+        max_pending_events: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        batch_max_wait_ms: Optional[int] = None,
     ) -> None:
         self.name = name
         self.source = source
         self.transforms = transforms
         self.action = action
+        self._stats = PipelineStats()
 
         if retry_count is not None:
             self._retry_count = retry_count
@@ -107,8 +142,24 @@ class Pipeline:
             self._failure_mode = failure_mode
         if failed_events_dir is not None:
             self._failed_events_dir = failed_events_dir
+        if max_workers is not None:
+            self._max_workers = max_workers
+        if max_pending_events is not None:
+            self._max_pending_events = max_pending_events
+        if batch_size is not None:
+            self._batch_size = batch_size
+        if batch_max_wait_ms is not None:
+            self._batch_max_wait_ms = batch_max_wait_ms
+        if self._batch_size > 1 and self._max_workers > 1:
+            raise PipelineException(
+                "Pipeline options batch_size and max_workers cannot be used together."
+            )
         self._init_failed_events_dir()
 
+        # Used when processing events concurrently.
+        self._ack_lock = threading.Lock()
+        self._fatal_error: Optional[Exception] = None
+
     @classmethod
     def create(cls, config_dict: dict) -> "Pipeline":
         # Bind config
@@ -128,7 +179,11 @@ class Pipeline:
         # Create Transforms
         transforms = []
         if config.filter is not None:
-            transforms.append(create_filter_transformer(config.filter, ctx))
+            filter_transformer = create_filter_transformer(config.filter, ctx)
+            transforms.append(filter_transformer)
+
+            # The filter is the first transformer, so the source may apply it early as well.
+            event_source.set_event_filter(filter_transformer.event_filter)
 
         if config.transform is not None:
             for transform_config in config.transform:
@@ -146,6 +201,10 @@ class Pipeline:
             config.options.retry_count if config.options else None,
             config.options.failure_mode if config.options else None,
             config.options.failed_events_dir if config.options else None,
+            config.options.max_workers if config.options else None,
+            config.options.max_pending_events if config.options else None,
+            config.options.batch_size if config.options else None,
+            config.options.batch_max_wait_ms if config.options else None,
         )
 
     async def start(self) -> None:
@@ -161,6 +220,13 @@ class Pipeline:
         """
         self._stats.mark_start()
 
+        if self._max_workers > 1:
+            self._run_concurrently()
+            return
+        if self._batch_size > 1:
+            self._run_batched()
+            return
+
         # First, source the events.
         enveloped_events = self.source.events()
         for enveloped_event in enveloped_events:
@@ -175,6 +241,204 @@ class Pipeline:
             # Finally, ack the event.
             self._ack_event(enveloped_event, retval)
 
+    def _run_concurrently(self) -> None:
+        # The source is read on a separate thread, so that a fatal error raised by one of the
+        # workers stops the pipeline promptly, even while the source is waiting for new events.
+        events, stop_reading = self._start_reading_events(maxsize=self._max_workers)
+        ack_tracker = EventAckTracker()
+        try:
+            with PartitionExecutor(
+                max_workers=self._max_workers, max_pending=self._max_pending_events
+            ) as executor:
+                i = 0
+                while self._fatal_error is None:
+                    try:
+                        item = events.get(timeout=_EVENT_QUEUE_POLL_INTERVAL_SECONDS)
+                    except queue.Empty:
+                        continue
+
+                    if isinstance(item, _SourceExhausted):
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+
+                    enveloped_event = item
+                    in_flight_event = ack_tracker.add(enveloped_event)
+                    self._stats.set_in_flight_event_count(ack_tracker.in_flight_count())
+
+                    # Events for the same entity are processed one at a time, in order.
+                    # Events which aren't about a specific entity can run in any order.
+                    key = get_event_entity_urn(enveloped_event) or f"__event_{i}"
+                    i += 1
+                    executor.submit(
+                        key,
+                        self._process_event,
+                        enveloped_event,
+                        done_callback=partial(
+                            self._on_event_processed, ack_tracker, in_flight_event
+                        ),
+                    )
+        finally:
+            stop_reading.set()
+
+        if self._fatal_error is not None:
+            raise self._fatal_error
+
+    def _on_event_processed(
+        self,
+        ack_tracker: EventAckTracker,
+        in_flight_event: InFlightEvent,
+        future: Future,
+    ) -> None:
+        try:
+            retval = future.result()
+        except Exception as e:
+            # Raised in THROW failure mode. Like when processing events sequentially,
+            # the event is not acked, which also holds back the acks of later events.
+            if self._fatal_error is None:
+                self._fatal_error = e
+            return
+
+        # The events must be acked in the order they were received, so acking happens
+        # under a lock, and only once all preceding events have been processed.
+        with self._ack_lock:
+            ready = ack_tracker.complete(
+                in_flight_event, processed=True if retval is None else retval
+            )
+            for ready_event in ready:
+                self._ack_event(ready_event.envelope, ready_event.processed)
+                self._stats.record_ack_lag(ready_event.received_at)
+            self._stats.set_in_flight_event_count(ack_tracker.in_flight_count())
+
+    def _run_batched(self) -> None:
+        # The source is read on a separate thread, since it may block for a long time while
+        # waiting for new events, but a partial batch must still be processed once it has
+        # waited for batch_max_wait_ms.
+        events, stop_reading = self._start_reading_events(maxsize=self._batch_size)
+
+        batch: List[EventEnvelope] = []
+        deadline = 0.0
+        try:
+            while True:
+                try:
+                    item = events.get(
+                        timeout=max(deadline - time.monotonic(), 0) if batch else None
+                    )
+                except queue.Empty:
+                    # The oldest event in the batch has waited long enough.
+                    self._process_batch(batch)
+                    batch = []
+                    continue
+
+                if isinstance(item, _SourceExhausted):
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                if not batch:
+                    deadline = time.monotonic() + self._batch_max_wait_ms / 1000
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    self._process_batch(batch)
+                    batch = []
+
+            if batch:
+                self._process_batch(batch)
+        finally:
+            stop_reading.set()
+
+    def _start_reading_events(
+        self, maxsize: int
+    ) -> Tuple[
+        "queue.Queue[Union[EventEnvelope, _SourceExhausted, Exception]]",
+        threading.Event,
+    ]:
+        events: "queue.Queue[Union[EventEnvelope, _SourceExhausted, Exception]]" = (
+            queue.Queue(maxsize=maxsize)
+        )
+        stop_reading = threading.Event()
+        reader = threading.Thread(
+            target=self._read_events,
+            args=(events, stop_reading),
+            name=f"{self.name}-event-reader",
+            daemon=True,
+        )
+        reader.start()
+        return events, stop_reading
+
+    def _read_events(
+        self,
+        events: "queue.Queue[Union[EventEnvelope, _SourceExhausted, Exception]]",
+        stop_reading: threading.Event,
+    ) -> None:
+        def _put(item: Union[EventEnvelope, _SourceExhausted, Exception]) -> bool:
+            while not stop_reading.is_set():
+                try:
+                    events.put(item, timeout=_EVENT_QUEUE_POLL_INTERVAL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for enveloped_event in self.source.events():
+                if not _put(enveloped_event):
+                    return
+        except Exception as e:
+            _put(e)
+            return
+        _put(_SOURCE_EXHAUSTED)
+
+    def _process_batch(self, batch: List[EventEnvelope]) -> None:
+        self._stats.increment_batch_count()
+
+        # Each event is only transformed once. Events which fail to transform are processed
+        # individually afterwards, so that retries and the failure mode apply to them.
+        processed: List[Optional[bool]] = [None] * len(batch)
+        to_act: List[Tuple[int, EventEnvelope]] = []
+        failed_to_transform: List[int] = []
+        for i, enveloped_event in enumerate(batch):
+            try:
+                transformed_event = self._execute_transformers(enveloped_event)
+            except Exception:
+                logger.exception(
+                    f"Caught exception while attempting to transform event. event type: {enveloped_event.event_type}, pipeline name: {self.name}"
+                )
+                failed_to_transform.append(i)
+                continue
+            if transformed_event is not None:
+                to_act.append((i, transformed_event))
+
+        num_completed = len(to_act)
+        can_retry = True
+        try:
+            if to_act:
+                self._execute_action_batch([event for _, event in to_act])
+        except PipelineException as e:
+            self._stats.increment_failed_batch_count()
+            if isinstance(e.__cause__, ActionBatchError):
+                num_completed = e.__cause__.num_completed
+            else:
+                # There's no telling which events were completed, so the remaining events can only
+                # be retried if the action doesn't mind processing some of them twice.
+                num_completed = 0
+                can_retry = self.action.idempotent
+            logger.exception(
+                f"Caught exception while attempting to process a batch of {len(to_act)} events, pipeline name: {self.name}. {num_completed} of them were processed successfully."
+            )
+
+        for i, transformed_event in to_act[num_completed:]:
+            if can_retry:
+                processed[i] = self._process_event(batch[i], transformed_event)
+            else:
+                self._stats.increment_failed_event_count()
+                self._handle_failure(batch[i])
+        for i in failed_to_transform:
+            processed[i] = self._process_event(batch[i])
+
+        for enveloped_event, retval in zip(batch, processed):
+            self._ack_event(enveloped_event, True if retval is None else retval)
+
     def stop(self) -> None:
         """
         Stops a running action pipeline.
@@ -191,15 +455,24 @@ class Pipeline:
         """
         return self._stats
 
-    def _process_event(self, enveloped_event: EventEnvelope) -> Optional[bool]:
-        # Attempt to process the incoming event, with retry.
+    def _process_event(
+        self,
+        enveloped_event: EventEnvelope,
+        already_transformed_event: Optional[EventEnvelope] = None,
+    ) -> Optional[bool]:
+        # Attempt to process the incoming event, with retry. If the event was already
+        # transformed, only the action is retried.
         curr_attempt = 1
         max_attempts = self._retry_count + 1
         retval = None
         while curr_attempt <= max_attempts:
             try:
                 # First, transform the event.
-                transformed_event = self._execute_transformers(enveloped_event)
+                transformed_event = (
+                    already_transformed_event
+                    if already_transformed_event is not None
+                    else self._execute_transformers(enveloped_event)
+                )
 
                 # Then, invoke the action if the event is non-null.
                 if transformed_event is not None:
@@ -270,6 +543,20 @@ class Pipeline:
                 f"Caught exception while executing Action with type {type(self.action).__name__}"
             ) from e
 
+    def _execute_action_batch(self, enveloped_events: List[EventEnvelope]) -> None:
+        try:
+            self.action.act_batch(enveloped_events)
+            for _ in enveloped_events:
+                self._stats.increment_action_success_count()
+        except Exception as e:
+            if isinstance(e, ActionBatchError):
+                for _ in range(e.num_completed):
+                    self._stats.increment_action_success_count()
+            self._stats.increment_action_exception_count()
+            raise PipelineException(
+                f"Caught exception while executing Action with type {type(self.action).__name__} on a batch of events"
+            ) from e
+
     def _ack_event(self, enveloped_event: EventEnvelope, processed: bool) -> None:
         try:
             self.source.ack(enveloped_event, processed)
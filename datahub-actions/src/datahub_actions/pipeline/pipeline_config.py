@@ -54,6 +54,15 @@ class PipelineOptions(BaseModel):
     failed_events_dir: Optional[str] = (
         None  # The path where failed events should be logged.
     )
+    # The number of events to process concurrently. Events for the same entity are
+    # always processed in order. Requires the transformers and action to be thread-safe.
+    max_workers: Optional[int] = None
+    # The maximum number of events waiting for a worker, before sourcing more events blocks.
+    max_pending_events: Optional[int] = None
+    # The maximum number of events handed to the action at once. Cannot be combined with max_workers.
+    batch_size: Optional[int] = None
+    # The maximum time in milliseconds to wait for a batch to fill up before processing it anyway.
+    batch_max_wait_ms: Optional[int] = None
 
 
 class PipelineConfig(ConfigModel):
@@ -14,6 +14,7 @@
 
 import datetime
 import json
+import threading
 from time import time
 from typing import Dict
 
@@ -31,55 +32,98 @@ class PipelineStats:
     started_at: int
 
     # Number of events that failed processing even after retry.
-    failed_event_count: int = 0
+    failed_event_count: int
 
     # Number of events that failed when "ack" was invoked.
-    failed_ack_count: int = 0
+    failed_ack_count: int
 
     # Top-level number of succeeded processing executions.
-    success_count: int = 0
+    success_count: int
+
+    # Number of events that have been received from the source, but not yet acked.
+    in_flight_event_count: int
+    max_in_flight_event_count: int
+
+    # Time in milliseconds between receiving the most recently acked event and acking it.
+    ack_lag_ms: int
+
+    # Number of batches handed to the action, and the number of those which failed and
+    # were processed again one event at a time.
+    batch_count: int
+    failed_batch_count: int
 
     # Transformer Stats
-    transformer_stats: Dict[str, TransformerStats] = {}
+    transformer_stats: Dict[str, TransformerStats]
 
     # Action Stats
-    action_stats: ActionStats = ActionStats()
+    action_stats: ActionStats
+
+    def __init__(self) -> None:
+        self.failed_event_count = 0
+        self.failed_ack_count = 0
+        self.success_count = 0
+        self.in_flight_event_count = 0
+        self.max_in_flight_event_count = 0
+        self.ack_lag_ms = 0
+        self.batch_count = 0
+        self.failed_batch_count = 0
+        self.transformer_stats = {}
+        self.action_stats = ActionStats()
+
+        # Events may be processed concurrently, so counters are updated under a lock.
+        self._lock = threading.Lock()
 
     def mark_start(self) -> None:
         self.started_at = int(time() * 1000)
 
     def increment_failed_event_count(self) -> None:
-        self.failed_event_count = self.failed_event_count + 1
+        with self._lock:
+            self.failed_event_count = self.failed_event_count + 1
 
     def increment_failed_ack_count(self) -> None:
-        self.failed_ack_count = self.failed_ack_count + 1
+        with self._lock:
+            self.failed_ack_count = self.failed_ack_count + 1
 
     def increment_success_count(self) -> None:
-        self.success_count = self.success_count + 1
+        with self._lock:
+            self.success_count = self.success_count + 1
+
+    def set_in_flight_event_count(self, count: int) -> None:
+        with self._lock:
+            self.in_flight_event_count = count
+            self.max_in_flight_event_count = max(self.max_in_flight_event_count, count)
+
+    def record_ack_lag(self, received_at: int) -> None:
+        with self._lock:
+            self.ack_lag_ms = int(time() * 1000) - received_at
+
+    def increment_batch_count(self) -> None:
+        with self._lock:
+            self.batch_count = self.batch_count + 1
+
+    def increment_failed_batch_count(self) -> None:
+        with self._lock:
+            self.failed_batch_count = self.failed_batch_count + 1
 
     def increment_transformer_exception_count(self, transformer: Transformer) -> None:
-        transformer_name = get_transformer_name(transformer)
-        if transformer_name not in self.transformer_stats:
-            self.transformer_stats[transformer_name] = TransformerStats()
-        self.transformer_stats[transformer_name].increment_exception_count()
+        with self._lock:
+            self._get_transformer_stats(transformer).increment_exception_count()
 
     def increment_transformer_processed_count(self, transformer: Transformer) -> None:
-        transformer_name = get_transformer_name(transformer)
-        if transformer_name not in self.transformer_stats:
-            self.transformer_stats[transformer_name] = TransformerStats()
-        self.transformer_stats[transformer_name].increment_processed_count()
+        with self._lock:
+            self._get_transformer_stats(transformer).increment_processed_count()
 
     def increment_transformer_filtered_count(self, transformer: Transformer) -> None:
-        transformer_name = get_transformer_name(transformer)
-        if transformer_name not in self.transformer_stats:
-            self.transformer_stats[transformer_name] = TransformerStats()
-        self.transformer_stats[transformer_name].increment_filtered_count()
+        with self._lock:
+            self._get_transformer_stats(transformer).increment_filtered_count()
 
     def increment_action_exception_count(self) -> None:
-        self.action_stats.increment_exception_count()
+        with self._lock:
+            self.action_stats.increment_exception_count()
 
     def increment_action_success_count(self) -> None:
-        self.action_stats.increment_success_count()
+        with self._lock:
+            self.action_stats.increment_success_count()
 
     def get_started_at(self) -> int:
         return self.started_at
@@ -93,7 +137,20 @@ class PipelineStats:
     def get_success_count(self) -> int:
         return self.success_count
 
+    def get_in_flight_event_count(self) -> int:
+        return self.in_flight_event_count
+
+    def get_batch_count(self) -> int:
+        return self.batch_count
+
+    def get_failed_batch_count(self) -> int:
+        return self.failed_batch_count
+
     def get_transformer_stats(self, transformer: Transformer) -> TransformerStats:
+        with self._lock:
+            return self._get_transformer_stats(transformer)
+
+    def _get_transformer_stats(self, transformer: Transformer) -> TransformerStats:
         transformer_name = get_transformer_name(transformer)
         if transformer_name not in self.transformer_stats:
             self.transformer_stats[transformer_name] = TransformerStats()
@@ -103,7 +160,12 @@ class PipelineStats:
         return self.action_stats
 
     def as_string(self) -> str:
-        return json.dumps(self.__dict__, indent=4, sort_keys=True)
+        counters = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_lock", "transformer_stats", "action_stats")
+        }
+        return json.dumps(counters, indent=4, sort_keys=True)
 
     def pretty_print_summary(self, name: str) -> None:
         curr_time = int(time() * 1000)
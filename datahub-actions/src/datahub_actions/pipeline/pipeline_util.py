@@ -20,6 +20,7 @@ from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
 from datahub_actions.action.action import Action
 from datahub_actions.action.action_registry import action_registry
 from datahub_actions.api.action_graph import AcrylDataHubGraph
+from datahub_actions.event.event_envelope import EventEnvelope
 from datahub_actions.pipeline.pipeline_config import (
     ActionConfig,
     FilterConfig,
@@ -81,7 +82,7 @@ def create_event_source(
 
 def create_filter_transformer(
     filter_config: FilterConfig, ctx: PipelineContext
-) -> Transformer:
+) -> FilterTransformer:
     try:
         logger.debug("Attempting to instantiate filter transformer..")
         filter_transformer_config = FilterTransformerConfig(
@@ -154,3 +155,10 @@ def normalize_directory_name(name: str) -> str:
 def get_transformer_name(transformer: Transformer) -> str:
     # TODO: Would be better to compute this using the transformer registry itself.
     return type(transformer).__name__
+
+
+def get_event_entity_urn(enveloped_event: EventEnvelope) -> Optional[str]:
+    # Metadata change logs and entity change events are about a single entity, while
+    # relationship change events are keyed by the source of the relationship.
+    event = enveloped_event.event
+    return getattr(event, "entityUrn", None) or getattr(event, "sourceUrn", None)
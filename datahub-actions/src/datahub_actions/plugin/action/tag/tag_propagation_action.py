@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -77,6 +77,9 @@ class TagPropagationDirective(BaseModel):
 
 
 class TagPropagationAction(Action):
+    # Adding tags which are already present is a no-op.
+    idempotent = True
+
     def __init__(self, config: TagPropagationConfig, ctx: PipelineContext):
         self.config: TagPropagationConfig = config
         self.ctx = ctx
@@ -159,5 +162,37 @@ class TagPropagationAction(Action):
             else:
                 logger.debug(f"Not propagating {tag_propagation_directive.tag}")
 
+    def act_batch(self, events: List[EventEnvelope]) -> None:
+        # Group the tags to propagate by the entity they were applied to, so that lineage
+        # is only looked up once per entity, and each downstream is only updated once.
+        tags_by_entity: Dict[str, List[str]] = {}
+        for event in events:
+            tag_propagation_directive = self.should_propagate(event)
+            if tag_propagation_directive is None:
+                continue
+            if not tag_propagation_directive.propagate:
+                logger.debug(f"Not propagating {tag_propagation_directive.tag}")
+                continue
+            tags = tags_by_entity.setdefault(tag_propagation_directive.entity, [])
+            if tag_propagation_directive.tag not in tags:
+                tags.append(tag_propagation_directive.tag)
+
+        for entity_urn, tags in tags_by_entity.items():
+            assert self.ctx.graph
+            downstreams = self.ctx.graph.get_downstreams(entity_urn)
+            logger.info(
+                f"Detected {len(downstreams)} downstreams for {entity_urn}: {downstreams}"
+            )
+            logger.info(f"Detected tags {tags} on {entity_urn}")
+            for d in downstreams:
+                self.ctx.graph.add_tags_to_dataset(
+                    d,
+                    tags,
+                    context={
+                        "propagated": True,
+                        "origin": entity_urn,
+                    },
+                )
+
     def close(self) -> None:
         return
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -79,6 +79,9 @@ class TermPropagationConfig(ConfigModel):
 
 
 class TermPropagationAction(Action):
+    # Adding terms which are already present is a no-op.
+    idempotent = True
+
     def __init__(self, config: TermPropagationConfig, ctx: PipelineContext):
         self.config = config
         self.ctx = ctx
@@ -188,5 +191,35 @@ class TermPropagationAction(Action):
                     f"Will add term {term_propagation_directive.term} to {dataset}"
                 )
 
+    def act_batch(self, events: List[EventEnvelope]) -> None:
+        """Like act, but looks up the downstreams of each entity and updates each downstream only once per batch"""
+
+        terms_by_entity: Dict[str, List[str]] = {}
+        for event in events:
+            term_propagation_directive = self.should_propagate(event)
+            if (
+                term_propagation_directive is not None
+                and term_propagation_directive.propagate
+            ):
+                terms = terms_by_entity.setdefault(
+                    term_propagation_directive.entity, []
+                )
+                if term_propagation_directive.term not in terms:
+                    terms.append(term_propagation_directive.term)
+
+        for entity_urn, terms in terms_by_entity.items():
+            assert self.ctx.graph
+            downstreams = self.ctx.graph.get_downstreams(entity_urn=entity_urn)
+            for dataset in downstreams:
+                self.ctx.graph.add_terms_to_dataset(
+                    dataset,
+                    terms,
+                    context={
+                        "propagated": True,
+                        "origin": entity_urn,
+                    },
+                )
+                logger.info(f"Will add terms {terms} to {dataset}")
+
     def close(self) -> None:
         return
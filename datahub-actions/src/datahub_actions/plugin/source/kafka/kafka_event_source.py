@@ -30,6 +30,7 @@ from datahub.emitter.serialization_helper import post_json_transform
 # DataHub imports.
 from datahub.metadata.schema_classes import GenericPayloadClass, MetadataChangeLogClass
 from datahub_actions.event.event_envelope import EventEnvelope
+from datahub_actions.event.event_filter import EventFilter
 from datahub_actions.event.event_registry import (
     ENTITY_CHANGE_EVENT_V1_TYPE,
     METADATA_CHANGE_LOG_EVENT_V1_TYPE,
@@ -67,6 +68,12 @@ MESSAGE_COUNTER_METRIC = Counter(
     labelnames=["pipeline_name", "error"],
 )
 
+FILTERED_MESSAGE_COUNTER_METRIC = Counter(
+    name="kafka_messages_filtered",
+    documentation="Number of kafka messages skipped because they can't match the pipeline filter",
+    labelnames=["pipeline_name"],
+)
+
 
 # Converts a Kafka Message to a Kafka Metadata Dictionary.
 def build_kafka_meta(msg: Any) -> dict:
@@ -157,12 +164,19 @@ class KafkaEventSource(EventSource):
             }
         )
         self._observe_message: Callable = kafka_messages_observer(ctx.pipeline_name)
+        self._filtered_messages = FILTERED_MESSAGE_COUNTER_METRIC.labels(
+            pipeline_name=ctx.pipeline_name
+        )
+        self._event_filter: Optional[EventFilter] = None
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "EventSource":
         config = KafkaEventSourceConfig.model_validate(config_dict)
         return cls(config, ctx)
 
+    def set_event_filter(self, event_filter: EventFilter) -> None:
+        self._event_filter = event_filter
+
     def events(self) -> Iterable[EventEnvelope]:
         topic_routes = self.source_config.topic_routes or DEFAULT_TOPIC_ROUTES
         topics_to_subscribe = list(topic_routes.values())
@@ -189,6 +203,10 @@ class KafkaEventSource(EventSource):
                     )
                 elif msg.error():
                     raise KafkaException(msg.error())
+            elif not self._may_match_filter(msg, topic_routes):
+                # Skipped messages are never acked. Their offsets are committed along with
+                # the next message from the same partition which does get processed.
+                self._filtered_messages.inc()
             else:
                 if "mcl" in topic_routes and msg.topic() == topic_routes["mcl"]:
                     yield from self.handle_mcl(msg)
@@ -204,6 +222,24 @@ class KafkaEventSource(EventSource):
 
         logger.info("Kafka consumer exiting main loop")
 
+    def _may_match_filter(self, msg: Any, topic_routes: Dict[str, str]) -> bool:
+        # Checks the raw message against the pipeline filter, to avoid building events
+        # which the filter would reject anyway.
+        if self._event_filter is None:
+            return True
+
+        value: dict = msg.value()
+        if msg.topic() in (topic_routes.get("mcl"), topic_routes.get("mcl_timeseries")):
+            return self._event_filter.may_match(
+                METADATA_CHANGE_LOG_EVENT_V1_TYPE, value
+            )
+        if msg.topic() == topic_routes.get("pe"):
+            if value.get("name") == ENTITY_CHANGE_EVENT_NAME:
+                return self._event_filter.may_match(ENTITY_CHANGE_EVENT_V1_TYPE)
+            if value.get("name") == RELATIONSHIP_CHANGE_EVENT_NAME:
+                return self._event_filter.may_match(RELATIONSHIP_CHANGE_EVENT_V1_TYPE)
+        return True
+
     @staticmethod
     def handle_mcl(msg: Any) -> Iterable[EventEnvelope]:
         metadata_change_log_event = build_metadata_change_log_event(msg)
@@ -17,6 +17,7 @@ from typing import Iterable
 
 from datahub.ingestion.api.closeable import Closeable
 from datahub_actions.event.event_envelope import EventEnvelope
+from datahub_actions.event.event_filter import EventFilter
 from datahub_actions.pipeline.pipeline_context import PipelineContext
 
 
@@ -46,6 +47,16 @@ class EventSource(Closeable, metaclass=ABCMeta):
         can produce a continuous stream of events.
         """
 
+    def set_event_filter(self, event_filter: EventFilter) -> None:
+        """
+        Provides the filter configured for the pipeline, before events are requested.
+
+        Event Sources may use it to skip events which can't match the filter as early as possible, e.g.
+        before fully deserializing them. Skipped events are never provided to the pipeline, so they are never acked.
+        The pipeline still applies the filter to all events provided by the source, so this is optional.
+        """
+        pass
+
     @abstractmethod
     def ack(self, event: EventEnvelope, processed: bool = True) -> None:
         """
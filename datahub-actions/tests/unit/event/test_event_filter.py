@@ -0,0 +1,88 @@
+from datahub.metadata.schema_classes import AuditStampClass, MetadataChangeLogClass
+from datahub_actions.event.event_envelope import EventEnvelope
+from datahub_actions.event.event_filter import EventFilter
+from datahub_actions.event.event_registry import (
+    ENTITY_CHANGE_EVENT_V1_TYPE,
+    METADATA_CHANGE_LOG_EVENT_V1_TYPE,
+    MetadataChangeLogEvent,
+)
+
+
+class CountingMetadataChangeLogEvent(MetadataChangeLogEvent):
+    as_json_count = 0
+
+    def as_json(self) -> str:
+        CountingMetadataChangeLogEvent.as_json_count += 1
+        return super().as_json()
+
+
+def _mcl_envelope(aspect_name: str) -> EventEnvelope:
+    event = CountingMetadataChangeLogEvent.from_class(
+        MetadataChangeLogClass(
+            entityType="dataset",
+            changeType="UPSERT",
+            entityUrn="urn:li:dataset:(urn:li:dataPlatform:hive,table,PROD)",
+            aspectName=aspect_name,
+            created=AuditStampClass(0, "urn:li:corpuser:datahub"),
+        )
+    )
+    return EventEnvelope(METADATA_CHANGE_LOG_EVENT_V1_TYPE, event, {})
+
+
+def test_matches_top_level_fields_without_serializing():
+    event_filter = EventFilter(
+        event_type=[METADATA_CHANGE_LOG_EVENT_V1_TYPE],
+        event={"entityType": "dataset", "aspectName": ["status", "schemaMetadata"]},
+    )
+    CountingMetadataChangeLogEvent.as_json_count = 0
+
+    assert event_filter.matches(_mcl_envelope("status"))
+    assert event_filter.matches(_mcl_envelope("schemaMetadata"))
+    assert not event_filter.matches(_mcl_envelope("ownership"))
+    assert CountingMetadataChangeLogEvent.as_json_count == 0
+
+
+def test_matches_nested_fields():
+    event_filter = EventFilter(
+        event_type=METADATA_CHANGE_LOG_EVENT_V1_TYPE,
+        event={
+            "aspectName": "status",
+            "created": {"actor": "urn:li:corpuser:datahub"},
+        },
+    )
+    CountingMetadataChangeLogEvent.as_json_count = 0
+
+    assert event_filter.matches(_mcl_envelope("status"))
+    assert CountingMetadataChangeLogEvent.as_json_count == 1
+
+    # The nested filter is only evaluated if the top-level filters match.
+    assert not event_filter.matches(_mcl_envelope("ownership"))
+    assert CountingMetadataChangeLogEvent.as_json_count == 1
+
+
+def test_may_match_raw_fields():
+    event_filter = EventFilter(
+        event_type=METADATA_CHANGE_LOG_EVENT_V1_TYPE,
+        event={"aspectName": ["status"], "created": {"actor": "urn:li:corpuser:a"}},
+    )
+
+    assert not event_filter.may_match(ENTITY_CHANGE_EVENT_V1_TYPE)
+    assert event_filter.may_match(METADATA_CHANGE_LOG_EVENT_V1_TYPE)
+    assert event_filter.may_match(
+        METADATA_CHANGE_LOG_EVENT_V1_TYPE, {"aspectName": "status"}
+    )
+    assert not event_filter.may_match(
+        METADATA_CHANGE_LOG_EVENT_V1_TYPE, {"aspectName": "ownership"}
+    )
+
+    # Fields which can't be matched from the raw message are left to the pipeline.
+    assert event_filter.may_match(
+        METADATA_CHANGE_LOG_EVENT_V1_TYPE,
+        {
+            "aspectName": "status",
+            "created": (
+                "com.linkedin.pegasus2avro.common.AuditStamp",
+                {"time": 0, "actor": "urn:li:corpuser:b"},
+            ),
+        },
+    )
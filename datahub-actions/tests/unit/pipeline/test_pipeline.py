@@ -14,13 +14,23 @@
 
 import json
 import os
+import random
+import threading
+import time
+from typing import Dict, Iterable, List
 
 import pytest
 from pydantic import ValidationError
 
+from datahub.metadata.schema_classes import AuditStampClass, MetadataChangeLogClass
+from datahub_actions.action.action import Action
+from datahub_actions.event.event_envelope import EventEnvelope
+from datahub_actions.event.event_registry import MetadataChangeLogEvent
 from datahub_actions.pipeline.pipeline import Pipeline, PipelineException
 from datahub_actions.pipeline.pipeline_config import FailureMode
+from datahub_actions.pipeline.pipeline_context import PipelineContext
 from datahub_actions.plugin.transform.filter.filter_transformer import FilterTransformer
+from datahub_actions.source.event_source import EventSource
 from tests.unit.test_helpers import TestAction, TestEventSource, TestTransformer
 
 
@@ -99,6 +109,19 @@ def test_run():
     assert valid_pipeline.source.ack_count == 3  # type: ignore
 
 
+def test_stats_are_per_pipeline():
+    first = Pipeline.create(_build_basic_pipeline_config())
+    second = Pipeline.create(_build_basic_pipeline_config())
+
+    first.run()
+
+    assert first.stats().success_count == 3
+    assert second.stats().success_count == 0
+    assert second.stats().action_stats.success_count == 0
+    assert second.stats().transformer_stats == {}
+    assert json.loads(first.stats().as_string())["success_count"] == 3
+
+
 def test_stop():
     # Configure a pipeline with a long-running event source
     stoppable_pipeline_config = _build_stoppable_pipeline_config()
@@ -161,6 +184,325 @@ def test_failed_events_throw_mode():
     assert throwing_action_pipeline.source.ack_count == 0  # type: ignore
 
 
+class PartitionedEventSource(EventSource):
+    """
+    Event Source which emits change logs for a few datasets, spread over two Kafka partitions.
+    """
+
+    def __init__(self, num_entities: int, events_per_entity: int) -> None:
+        self.envelopes: List[EventEnvelope] = []
+        for i in range(num_entities * events_per_entity):
+            entity = i % num_entities
+            event = MetadataChangeLogEvent.from_class(
+                MetadataChangeLogClass(
+                    entityType="dataset",
+                    changeType="UPSERT",
+                    entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,table{entity},PROD)",
+                    aspectName="status",
+                    created=AuditStampClass(i, "urn:li:corpuser:datahub"),
+                )
+            )
+            meta = {"kafka": {"topic": "mcl", "partition": entity % 2, "offset": i}}
+            self.envelopes.append(
+                EventEnvelope("MetadataChangeLogEvent_v1", event, meta)
+            )
+        self.acked: List[EventEnvelope] = []
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "EventSource":
+        raise NotImplementedError
+
+    def events(self) -> Iterable[EventEnvelope]:
+        return self.envelopes
+
+    def ack(self, event: EventEnvelope, processed: bool = True) -> None:
+        self.acked.append(event)
+
+    def close(self) -> None:
+        pass
+
+
+class SlowRecordingAction(Action):
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.seen: Dict[str, List[int]] = {}
+        self.active = 0
+        self.max_active = 0
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Action":
+        raise NotImplementedError
+
+    def act(self, event: EventEnvelope) -> None:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(random.random() / 200)
+        with self.lock:
+            self.active -= 1
+            assert isinstance(event.event, MetadataChangeLogClass)
+            assert event.event.entityUrn is not None
+            self.seen.setdefault(event.event.entityUrn, []).append(
+                event.meta["kafka"]["offset"]
+            )
+
+    def close(self) -> None:
+        pass
+
+
+def test_run_concurrently():
+    source = PartitionedEventSource(num_entities=8, events_per_entity=20)
+    action = SlowRecordingAction()
+    pipeline = Pipeline(
+        "concurrent-pipeline",
+        source,
+        [],
+        action,
+        retry_count=0,
+        failure_mode=FailureMode.CONTINUE,
+        failed_events_dir="/tmp/datahub/test",
+        max_workers=4,
+    )
+    pipeline.run()
+
+    assert action.max_active > 1
+
+    # Events for the same entity are processed in order.
+    for offsets in action.seen.values():
+        assert offsets == sorted(offsets)
+    assert sum(len(offsets) for offsets in action.seen.values()) == 160
+
+    # Events are acked in order within each partition.
+    acked_by_partition: Dict[int, List[int]] = {}
+    for envelope in source.acked:
+        kafka_meta = envelope.meta["kafka"]
+        acked_by_partition.setdefault(kafka_meta["partition"], []).append(
+            kafka_meta["offset"]
+        )
+    expected: Dict[int, List[int]] = {}
+    for envelope in source.envelopes:
+        kafka_meta = envelope.meta["kafka"]
+        expected.setdefault(kafka_meta["partition"], []).append(kafka_meta["offset"])
+    assert acked_by_partition == expected
+
+    assert pipeline.stats().get_in_flight_event_count() == 0
+    assert pipeline.stats().max_in_flight_event_count > 1
+
+
+class IdleEventSource(PartitionedEventSource):
+    """
+    Event Source which waits for new events after emitting the first few, like an idle topic.
+    """
+
+    def __init__(self, num_entities: int, events_per_entity: int) -> None:
+        super().__init__(num_entities, events_per_entity)
+        self.closed = threading.Event()
+
+    def events(self) -> Iterable[EventEnvelope]:
+        yield from self.envelopes
+        self.closed.wait(timeout=30)
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+class FailingAction(SlowRecordingAction):
+    def act(self, event: EventEnvelope) -> None:
+        raise Exception("Ouch! Failed to process event.")
+
+
+def test_run_concurrently_throw_mode_stops_on_idle_source():
+    source = IdleEventSource(num_entities=2, events_per_entity=1)
+    pipeline = Pipeline(
+        "concurrent-pipeline",
+        source,
+        [],
+        FailingAction(),
+        retry_count=0,
+        failure_mode=FailureMode.THROW,
+        failed_events_dir="/tmp/datahub/test",
+        max_workers=4,
+    )
+
+    start = time.monotonic()
+    try:
+        with pytest.raises(
+            PipelineException, match="Failed to process event after maximum retries"
+        ):
+            pipeline.run()
+
+        # The failure surfaces without waiting for the source to emit another event.
+        assert time.monotonic() - start < 10
+        assert source.acked == []
+    finally:
+        source.close()
+
+
+class StallingEventSource(PartitionedEventSource):
+    """
+    Event Source which stalls for a while after emitting the first few events.
+    """
+
+    def events(self) -> Iterable[EventEnvelope]:
+        yield from self.envelopes[:3]
+        time.sleep(0.5)
+        yield from self.envelopes[3:]
+
+
+class BatchRecordingAction(Action):
+    def __init__(self, fail_batches: bool = False, idempotent: bool = False) -> None:
+        self.fail_batches = fail_batches
+        self.idempotent = idempotent
+        self.batches: List[List[int]] = []
+        self.acted: List[int] = []
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Action":
+        raise NotImplementedError
+
+    def act(self, event: EventEnvelope) -> None:
+        self.acted.append(event.meta["kafka"]["offset"])
+
+    def act_batch(self, events: List[EventEnvelope]) -> None:
+        if self.fail_batches:
+            raise Exception("Ouch! Failed to process batch.")
+        self.batches.append([event.meta["kafka"]["offset"] for event in events])
+
+    def close(self) -> None:
+        pass
+
+
+def _build_batched_pipeline(
+    source: EventSource, action: Action, batch_max_wait_ms: int = 60000
+) -> Pipeline:
+    return Pipeline(
+        "batched-pipeline",
+        source,
+        [],
+        action,
+        retry_count=0,
+        failure_mode=FailureMode.CONTINUE,
+        failed_events_dir="/tmp/datahub/test",
+        batch_size=10,
+        batch_max_wait_ms=batch_max_wait_ms,
+    )
+
+
+def test_run_batched():
+    source = PartitionedEventSource(num_entities=5, events_per_entity=5)
+    action = BatchRecordingAction()
+    pipeline = _build_batched_pipeline(source, action)
+    pipeline.run()
+
+    # Events are handed to the action in order, in batches of at most batch_size.
+    assert action.batches == [
+        list(range(0, 10)),
+        list(range(10, 20)),
+        list(range(20, 25)),
+    ]
+    assert action.acted == []
+
+    # Events are still acked individually, in order.
+    assert source.acked == source.envelopes
+
+
+def test_run_batched_max_wait():
+    source = StallingEventSource(num_entities=4, events_per_entity=3)
+    action = BatchRecordingAction()
+    pipeline = _build_batched_pipeline(source, action, batch_max_wait_ms=50)
+    pipeline.run()
+
+    # The first events are processed without waiting for the source to fill the batch.
+    assert action.batches == [[0, 1, 2], list(range(3, 12))]
+    assert source.acked == source.envelopes
+
+
+def test_run_batched_failure_falls_back_to_single_events():
+    source = PartitionedEventSource(num_entities=5, events_per_entity=3)
+    action = BatchRecordingAction(fail_batches=True, idempotent=True)
+    pipeline = _build_batched_pipeline(source, action)
+    failed_batch_count = pipeline.stats().get_failed_batch_count()
+    pipeline.run()
+
+    assert action.acted == list(range(15))
+    assert source.acked == source.envelopes
+    assert pipeline.stats().get_failed_batch_count() == failed_batch_count + 2
+
+
+def test_run_batched_failure_does_not_retry_non_idempotent_actions():
+    source = PartitionedEventSource(num_entities=5, events_per_entity=3)
+    action = BatchRecordingAction(fail_batches=True)
+    pipeline = _build_batched_pipeline(source, action)
+    failed_event_count = pipeline.stats().get_failed_event_count()
+    pipeline.run()
+
+    # The action may have processed some of the events, so none of them are retried.
+    assert action.acted == []
+    assert source.acked == source.envelopes
+    assert pipeline.stats().get_failed_event_count() == failed_event_count + 15
+
+
+class FlakyAction(Action):
+    def __init__(self, fail_offset: int) -> None:
+        self.fail_offset = fail_offset
+        self.acted: List[int] = []
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Action":
+        raise NotImplementedError
+
+    def act(self, event: EventEnvelope) -> None:
+        offset = event.meta["kafka"]["offset"]
+        if offset == self.fail_offset:
+            # Only fail the first attempt.
+            self.fail_offset = -1
+            raise Exception("Ouch! Failed to process event.")
+        self.acted.append(offset)
+
+    def close(self) -> None:
+        pass
+
+
+def test_run_batched_failure_only_retries_incomplete_events():
+    source = PartitionedEventSource(num_entities=5, events_per_entity=3)
+    action = FlakyAction(fail_offset=4)
+    transformer = TestTransformer()
+    pipeline = Pipeline(
+        "batched-pipeline",
+        source,
+        [transformer],
+        action,
+        retry_count=0,
+        failure_mode=FailureMode.CONTINUE,
+        failed_events_dir="/tmp/datahub/test",
+        batch_size=10,
+    )
+    failed_event_count = pipeline.stats().get_failed_event_count()
+    pipeline.run()
+
+    # The events before the failing one are not processed again, and every event
+    # is only transformed once.
+    assert action.acted == list(range(15))
+    assert source.acked == source.envelopes
+    assert pipeline.stats().get_failed_event_count() == failed_event_count
+    assert pipeline.stats().get_transformer_stats(transformer).processed_count == 15
+
+
+def test_batching_cannot_be_combined_with_max_workers():
+    with pytest.raises(PipelineException, match="batch_size and max_workers"):
+        Pipeline(
+            "batched-pipeline",
+            PartitionedEventSource(num_entities=1, events_per_entity=1),
+            [],
+            BatchRecordingAction(),
+            retry_count=0,
+            failure_mode=FailureMode.CONTINUE,
+            failed_events_dir="/tmp/datahub/test",
+            max_workers=4,
+            batch_size=10,
+        )
+
+
 # Test Dead Letter Queue
 def test_failed_events_file():
     failed_events_file_path = (
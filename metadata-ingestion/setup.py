@@ -57,7 +57,14 @@ framework_common = {
     "ruamel.yaml",
 }
 
-rest_common = {"requests", "requests_file"}
+rest_common = {
+    "requests",
+    "requests_file",
+    # Used by the REST emitter to serialize aspects faster and to compress requests
+    # with zstd. Both are optional at runtime, and fall back to json and gzip.
+    "orjson>=3.9.0",
+    "zstandard",
+}
 
 kafka_common = {
     # Note that confluent_kafka 1.9.0 introduced a hard compatibility break, and
@@ -197,6 +204,7 @@ looker_common = {
     # See https://github.com/joshtemple/lkml/issues/73.
     "lkml>=1.3.4",
     *sqlglot_lib,
+    *cachetools_lib,
     "GitPython>2",
     # python-liquid 2 includes a bunch of breaking changes.
     # See https://jg-rp.github.io/liquid/migration/
@@ -1,5 +1,6 @@
 """Convenience functions for creating MCEs"""
 
+import functools
 import hashlib
 import json
 import logging
@@ -63,6 +64,7 @@ from datahub.metadata.urns import (
     TagUrn,
 )
 from datahub.utilities.urn_encoder import UrnEncoder
+from datahub.utilities.urns._urn_base import _URN_CACHE_SIZE
 
 logger = logging.getLogger(__name__)
 Aspect = TypeVar("Aspect", bound=AspectAbstract)
@@ -145,6 +147,15 @@ def make_dataset_urn_with_platform_instance(
 ) -> str:
     if DATASET_URN_TO_LOWER:
         name = name.lower()
+    return _make_dataset_urn_with_platform_instance(
+        platform, name, platform_instance, env
+    )
+
+
+@functools.lru_cache(maxsize=_URN_CACHE_SIZE)
+def _make_dataset_urn_with_platform_instance(
+    platform: str, name: str, platform_instance: Optional[str], env: str
+) -> str:
     return str(
         DatasetUrn.create_from_ids(
             platform_id=platform,
@@ -173,10 +184,20 @@ def schema_field_urn_to_key(schema_field_urn: str) -> Optional[SchemaFieldKeyCla
 
 
 def dataset_urn_to_key(dataset_urn: str) -> Optional[DatasetKeyClass]:
+    parts = _split_dataset_urn(dataset_urn)
+    if parts is not None:
+        platform, name, origin = parts
+        return DatasetKeyClass(platform=platform, name=name, origin=origin)
+    return None
+
+
+@functools.lru_cache(maxsize=_URN_CACHE_SIZE)
+def _split_dataset_urn(dataset_urn: str) -> Optional[Tuple[str, str, str]]:
+    # The key aspect is mutable, so we cache its parts rather than the aspect itself.
     pattern = r"urn:li:dataset:\((.*),(.*),(.*)\)"
     results = re.search(pattern, dataset_urn)
     if results is not None:
-        return DatasetKeyClass(platform=results[1], name=results[2], origin=results[3])
+        return results[1], results[2], results[3]
     return None
 
 
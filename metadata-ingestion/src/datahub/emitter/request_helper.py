@@ -1,7 +1,8 @@
+import gzip
 import json
 import shlex
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import requests
 from requests.auth import HTTPBasicAuth
@@ -14,6 +15,17 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
 )
 from datahub.metadata.schema_classes import ChangeTypeClass
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+# Request bodies smaller than this aren't worth compressing.
+REQUEST_COMPRESSION_MIN_BYTES = 1024
+
+_GZIP_COMPRESSION_LEVEL = 6
+_ZSTD_COMPRESSION_LEVEL = 3
+
 
 def _decode_bytes(value: Union[str, bytes]) -> str:
     """Decode bytes to string, if necessary."""
@@ -52,6 +64,33 @@ def make_curl_command(
     return shlex.join(fragments)
 
 
+def get_client_request_encodings() -> List[str]:
+    """The request encodings this client can produce, in order of preference."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return encodings
+
+
+def choose_request_encoding(server_encodings: Sequence[str]) -> Optional[str]:
+    """Picks the preferred request encoding that the server also accepts, if any."""
+    accepted = {encoding.lower() for encoding in server_encodings}
+    for encoding in get_client_request_encodings():
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def compress_request_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # Setting mtime makes the output deterministic.
+        return gzip.compress(body, compresslevel=_GZIP_COMPRESSION_LEVEL, mtime=0)
+    elif encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=_ZSTD_COMPRESSION_LEVEL).compress(body)
+    raise ValueError(f"Unsupported request encoding: {encoding}")
+
+
 @dataclass
 class OpenApiRequest:
     """Represents an OpenAPI request for entity operations."""
@@ -4,6 +4,7 @@ import functools
 import json
 import logging
 import re
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass
@@ -50,13 +51,19 @@ from datahub.configuration.env_vars import (
 )
 from datahub.emitter.generic_emitter import Emitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.request_helper import OpenApiRequest, make_curl_command
+from datahub.emitter.request_helper import (
+    REQUEST_COMPRESSION_MIN_BYTES,
+    OpenApiRequest,
+    choose_request_encoding,
+    compress_request_body,
+    make_curl_command,
+)
 from datahub.emitter.response_helper import (
     TraceData,
     extract_trace_data,
     extract_trace_data_from_mcps,
 )
-from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.emitter.serialization_helper import json_dumps, pre_json_transform
 from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.graph.config import (
     DATAHUB_COMPONENT_ENV,
@@ -118,6 +125,10 @@ def preserve_unicode_escapes(obj: Any) -> Any:
     elif isinstance(obj, list):
         return [preserve_unicode_escapes(item) for item in obj]
     elif isinstance(obj, str):
+        if obj.isascii():
+            # Fast path - the vast majority of strings need no escaping.
+            return obj
+
         # Convert non-ASCII characters back to \u escapes
         def escape_unicode(match: Any) -> Any:
             return f"\\u{ord(match.group(0)):04x}"
@@ -293,6 +304,42 @@ class RequestsSessionConfig(ConfigModel):
         return f"DataHub-Client/1.0 ({client_mode.name.lower()}; {self.datahub_component if self.datahub_component else DATAHUB_COMPONENT_ENV}; {version}){requests_user_agent}"
 
 
+@dataclass
+class RestEmitterStats:
+    """Request payload stats. A single instance may be shared across emitters and threads."""
+
+    num_requests: int = 0
+    num_requests_compressed: int = 0
+    # Size of the serialized request bodies, before and after compression.
+    payload_bytes: int = 0
+    bytes_on_wire: int = 0
+    serialization_time_seconds: float = 0.0
+    compression_time_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        # Not a dataclass field, so that the stats can still be converted with dataclasses.asdict.
+        self._lock = threading.Lock()
+
+    def record_serialization(self, start_time: float) -> None:
+        elapsed = time.perf_counter() - start_time
+        with self._lock:
+            self.serialization_time_seconds += elapsed
+
+    def record_request(
+        self,
+        payload_bytes: int,
+        bytes_on_wire: int,
+        compression_time_seconds: Optional[float],
+    ) -> None:
+        with self._lock:
+            self.num_requests += 1
+            self.payload_bytes += payload_bytes
+            self.bytes_on_wire += bytes_on_wire
+            if compression_time_seconds is not None:
+                self.num_requests_compressed += 1
+                self.compression_time_seconds += compression_time_seconds
+
+
 @dataclass
 class _Chunk:
     items: List[str]
@@ -313,6 +360,29 @@ class _Chunk:
         return "[" + ",".join(chunk.items) + "]"
 
 
+def _make_emit_error(response: requests.Response, e: Exception) -> OperationalError:
+    try:
+        info: Dict = response.json()
+    except JSONDecodeError:
+        # If we can't parse the JSON, just use the original error.
+        return OperationalError(
+            "Unable to emit metadata to DataHub GMS", {"message": str(e)}
+        )
+
+    if info.get("stackTrace"):
+        logger.debug("Full stack trace from DataHub:\n%s", info.get("stackTrace"))
+        info.pop("stackTrace", None)
+
+    hint = ""
+    if "unrecognized field found but not allowed" in (info.get("message") or ""):
+        hint = ", likely because the server version is too old relative to the client"
+
+    return OperationalError(
+        f"Unable to emit metadata to DataHub GMS{hint}: {info.get('message')}",
+        info,
+    )
+
+
 class DataHubRestEmitter(Closeable, Emitter):
     _gms_server: str
     _token: Optional[str]
@@ -338,6 +408,8 @@ class DataHubRestEmitter(Closeable, Emitter):
         client_mode: Optional[ClientMode] = None,
         datahub_component: Optional[str] = None,
         server_config_refresh_interval: Optional[int] = None,
+        request_compression: bool = True,
+        stats: Optional[RestEmitterStats] = None,
     ):
         if not gms_server:
             raise ConfigurationError("gms server is required")
@@ -356,6 +428,11 @@ class DataHubRestEmitter(Closeable, Emitter):
         self._server_config_refresh_interval = server_config_refresh_interval
         self._config_fetch_time: Optional[float] = None
 
+        # Request bodies are only compressed if the server advertises support for it.
+        self._request_compression = request_compression
+        self._request_encoding: Optional[str] = None
+        self.stats = stats or RestEmitterStats()
+
         headers = {
             "X-RestLi-Protocol-Version": "2.0.0",
             "Content-Type": "application/json",
@@ -473,7 +550,18 @@ class DataHubRestEmitter(Closeable, Emitter):
 
         return self._server_config
 
+    def set_server_config(self, server_config: RestServiceConfig) -> None:
+        """Use a server config which was already fetched, e.g. by another emitter."""
+        self._server_config = server_config
+        self._config_fetch_time = time.time()
+        self._post_fetch_server_config()
+
     def _post_fetch_server_config(self) -> None:
+        if self._request_compression:
+            self._request_encoding = choose_request_encoding(
+                self._server_config.supported_request_encodings
+            )
+
         # Determine OpenAPI mode
         if self._openapi_ingestion is None:
             # No constructor parameter
@@ -651,7 +739,9 @@ class DataHubRestEmitter(Closeable, Emitter):
             else:
                 url = f"{self._gms_server}/aspects?action=ingestProposal"
 
+                serialization_start = time.perf_counter()
                 mcp_obj = preserve_unicode_escapes(pre_json_transform(mcp.to_obj()))
+                self.stats.record_serialization(serialization_start)
                 payload_dict = {
                     "proposal": mcp_obj,
                     "async": "true"
@@ -659,7 +749,7 @@ class DataHubRestEmitter(Closeable, Emitter):
                     else "false",
                 }
 
-            payload = json.dumps(payload_dict)
+            payload = json_dumps(payload_dict)
 
             response = self._emit_generic(url, payload)
 
@@ -713,6 +803,35 @@ class DataHubRestEmitter(Closeable, Emitter):
         :param wait_timeout: timeout for blocking queue
         :return: number of requests
         """
+        batches = self._prepare_openapi_batches(mcps, emit_mode)
+
+        responses = []
+        for (method, url), chunks in batches.items():
+            for chunk in chunks:
+                response = self._emit_generic(
+                    url, payload=_Chunk.join(chunk), method=method
+                )
+                responses.append(response)
+
+        if self._should_trace(emit_mode):
+            trace_data = []
+            for response in responses:
+                data = extract_trace_data(response) if response else None
+                if data is not None:
+                    trace_data.append(data)
+
+            if trace_data:
+                self._await_status(trace_data, wait_timeout)
+
+        return len(responses)
+
+    def _prepare_openapi_batches(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+        emit_mode: EmitMode,
+    ) -> Dict[Tuple[str, str], List[_Chunk]]:
+        serialization_start = time.perf_counter()
+
         # Group by entity URL and HTTP method
         batches: Dict[Tuple[str, str], List[_Chunk]] = defaultdict(
             lambda: [_Chunk(items=[])]
@@ -726,7 +845,7 @@ class DataHubRestEmitter(Closeable, Emitter):
                 current_chunk = batches[key][-1]  # Get the last chunk
 
                 # Only serialize once - we're serializing a single payload item
-                serialized_item = json.dumps(request.payload[0])
+                serialized_item = json_dumps(request.payload[0])
                 item_bytes = len(serialized_item.encode())
 
                 # If adding this item would exceed max_bytes, create a new chunk
@@ -741,25 +860,8 @@ class DataHubRestEmitter(Closeable, Emitter):
 
                 current_chunk.add_item(serialized_item)
 
-        responses = []
-        for (method, url), chunks in batches.items():
-            for chunk in chunks:
-                response = self._emit_generic(
-                    url, payload=_Chunk.join(chunk), method=method
-                )
-                responses.append(response)
-
-        if self._should_trace(emit_mode):
-            trace_data = []
-            for response in responses:
-                data = extract_trace_data(response) if response else None
-                if data is not None:
-                    trace_data.append(data)
-
-            if trace_data:
-                self._await_status(trace_data, wait_timeout)
-
-        return len(responses)
+        self.stats.record_serialization(serialization_start)
+        return batches
 
     def _emit_restli_mcps(
         self,
@@ -768,9 +870,21 @@ class DataHubRestEmitter(Closeable, Emitter):
     ) -> int:
         url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
 
+        payloads = self._prepare_restli_payloads(mcps, emit_mode)
+        for payload in payloads:
+            self._emit_generic(url, payload)
+
+        return len(payloads)
+
+    def _prepare_restli_payloads(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+        emit_mode: EmitMode,
+    ) -> List[str]:
+        serialization_start = time.perf_counter()
         mcp_objs = [pre_json_transform(mcp.to_obj()) for mcp in mcps]
         if len(mcp_objs) == 0:
-            return 0
+            return []
 
         # As a safety mechanism, we need to make sure we don't exceed the max payload size for GMS.
         # If we will exceed the limit, we need to break it up into chunks.
@@ -778,7 +892,9 @@ class DataHubRestEmitter(Closeable, Emitter):
         current_chunk_size = 0
         for mcp_obj in mcp_objs:
             mcp_identifier = f"{mcp_obj.get('entityUrn')}-{mcp_obj.get('aspectName')}"
-            mcp_obj_size = len(json.dumps(mcp_obj))
+            # Each object is serialized exactly once, and reused when building the payload.
+            serialized_mcp_obj = json_dumps(mcp_obj)
+            mcp_obj_size = len(serialized_mcp_obj.encode())
             if _DATAHUB_EMITTER_TRACE:
                 logger.debug(
                     f"Iterating through object ({mcp_identifier}) with size {mcp_obj_size}"
@@ -797,27 +913,24 @@ class DataHubRestEmitter(Closeable, Emitter):
                     logger.debug("Decided to create new chunk")
                 mcp_obj_chunks.append([])
                 current_chunk_size = 0
-            mcp_obj_chunks[-1].append(mcp_obj)
+            mcp_obj_chunks[-1].append(serialized_mcp_obj)
             current_chunk_size += mcp_obj_size
         if len(mcp_obj_chunks) > 1 or _DATAHUB_EMITTER_TRACE:
             logger.debug(
                 f"Decided to send {len(mcps)} MCP batch in {len(mcp_obj_chunks)} chunks"
             )
 
-        for mcp_obj_chunk in mcp_obj_chunks:
-            # TODO: We're calling json.dumps on each MCP object twice, once to estimate
-            # the size when chunking, and again for the actual request.
-            payload_dict: dict = {
-                "proposals": mcp_obj_chunk,
-                "async": "true"
-                if emit_mode in (EmitMode.ASYNC, EmitMode.ASYNC_WAIT)
-                else "false",
-            }
-
-            payload = json.dumps(payload_dict)
-            self._emit_generic(url, payload)
+        async_value = json.dumps(
+            "true" if emit_mode in (EmitMode.ASYNC, EmitMode.ASYNC_WAIT) else "false"
+        )
+        payloads = [
+            # Equivalent to json.dumps({"proposals": [...], "async": ...}).
+            f'{{"proposals": [{", ".join(mcp_obj_chunk)}], "async": {async_value}}}'
+            for mcp_obj_chunk in mcp_obj_chunks
+        ]
 
-        return len(mcp_obj_chunks)
+        self.stats.record_serialization(serialization_start)
+        return payloads
 
     @deprecated("Use emit with a datasetUsageStatistics aspect instead")
     def emit_usage(self, usageStats: UsageAggregation) -> None:
@@ -837,6 +950,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             payload = json.dumps(payload)
 
         curl_command = make_curl_command(self._session, method, url, payload)
+        body, headers = self._encode_request_body(payload)
         payload_size = len(payload)
         if payload_size > INGEST_MAX_PAYLOAD_BYTES:
             # since we know total payload size here, we could simply avoid sending such payload at all and report a warning, with current approach we are going to cause whole ingestion to fail
@@ -850,39 +964,44 @@ class DataHubRestEmitter(Closeable, Emitter):
         )
         try:
             method_func = getattr(self._session, method.lower())
-            response = method_func(url, data=payload) if payload else method_func(url)
+            if not payload:
+                response = method_func(url)
+            elif headers:
+                response = method_func(url, data=body, headers=headers)
+            else:
+                response = method_func(url, data=body)
             response.raise_for_status()
             return response
         except HTTPError as e:
-            try:
-                info: Dict = response.json()
-
-                if info.get("stackTrace"):
-                    logger.debug(
-                        "Full stack trace from DataHub:\n%s", info.get("stackTrace")
-                    )
-                    info.pop("stackTrace", None)
-
-                hint = ""
-                if "unrecognized field found but not allowed" in (
-                    info.get("message") or ""
-                ):
-                    hint = ", likely because the server version is too old relative to the client"
-
-                raise OperationalError(
-                    f"Unable to emit metadata to DataHub GMS{hint}: {info.get('message')}",
-                    info,
-                ) from e
-            except JSONDecodeError:
-                # If we can't parse the JSON, just raise the original error.
-                raise OperationalError(
-                    "Unable to emit metadata to DataHub GMS", {"message": str(e)}
-                ) from e
+            raise _make_emit_error(response, e) from e
         except RequestException as e:
             raise OperationalError(
                 "Unable to emit metadata to DataHub GMS", {"message": str(e)}
             ) from e
 
+    def _encode_request_body(self, payload: str) -> Tuple[bytes, Dict[str, str]]:
+        """Encodes the payload, compressing it if the server supports it.
+
+        Returns the request body and any additional headers to send with it.
+        """
+        body = payload.encode()
+        payload_bytes = len(body)
+        headers: Dict[str, str] = {}
+
+        compression_time_seconds: Optional[float] = None
+        if self._request_encoding and payload_bytes >= REQUEST_COMPRESSION_MIN_BYTES:
+            compression_start = time.perf_counter()
+            body = compress_request_body(body, self._request_encoding)
+            compression_time_seconds = time.perf_counter() - compression_start
+            headers["Content-Encoding"] = self._request_encoding
+
+        self.stats.record_request(
+            payload_bytes=payload_bytes,
+            bytes_on_wire=len(body),
+            compression_time_seconds=compression_time_seconds,
+        )
+        return body, headers
+
     def _await_status(
         self,
         trace_data: List[TraceData],
@@ -919,35 +1038,7 @@ class DataHubRestEmitter(Closeable, Emitter):
                     url = f"{base_url}/{trace.trace_id}?onlyIncludeErrors=false&detailed=true"
 
                     response = self._emit_generic(url, payload=trace.data)
-                    json_data = response.json()
-
-                    for urn, aspects in json_data.items():
-                        for aspect_name, aspect_status in aspects.items():
-                            if not aspect_status["success"]:
-                                error_msg = (
-                                    f"Unable to validate async write {trace.trace_id} ({trace.extract_timestamp()}) to DataHub GMS: "
-                                    f"Persistence failure for URN '{urn}' aspect '{aspect_name}'. "
-                                    f"Status: {aspect_status}"
-                                )
-                                raise TraceValidationError(error_msg, aspect_status)
-
-                            primary_storage = aspect_status["primaryStorage"][
-                                "writeStatus"
-                            ]
-                            search_storage = aspect_status["searchStorage"][
-                                "writeStatus"
-                            ]
-
-                            # Remove resolved statuses
-                            if (
-                                primary_storage != TRACE_PENDING_STATUS
-                                and search_storage != TRACE_PENDING_STATUS
-                            ):
-                                trace.data[urn].remove(aspect_name)
-
-                        # Remove urns with all statuses resolved
-                        if not trace.data[urn]:
-                            trace.data.pop(urn)
+                    self._update_trace_status(trace, response.json())
 
                     # Adjust backoff based on response
                     if trace.data:
@@ -964,6 +1055,37 @@ class DataHubRestEmitter(Closeable, Emitter):
             logger.error(f"Error during status verification: {str(e)}")
             raise
 
+    @staticmethod
+    def _update_trace_status(trace: TraceData, json_data: Dict[str, Any]) -> None:
+        """Removes the aspects whose writes have completed from `trace.data`.
+
+        Raises:
+            TraceValidationError: Expected write was not completed successfully
+        """
+        for urn, aspects in json_data.items():
+            for aspect_name, aspect_status in aspects.items():
+                if not aspect_status["success"]:
+                    error_msg = (
+                        f"Unable to validate async write {trace.trace_id} ({trace.extract_timestamp()}) to DataHub GMS: "
+                        f"Persistence failure for URN '{urn}' aspect '{aspect_name}'. "
+                        f"Status: {aspect_status}"
+                    )
+                    raise TraceValidationError(error_msg, aspect_status)
+
+                primary_storage = aspect_status["primaryStorage"]["writeStatus"]
+                search_storage = aspect_status["searchStorage"]["writeStatus"]
+
+                # Remove resolved statuses
+                if (
+                    primary_storage != TRACE_PENDING_STATUS
+                    and search_storage != TRACE_PENDING_STATUS
+                ):
+                    trace.data[urn].remove(aspect_name)
+
+            # Remove urns with all statuses resolved
+            if not trace.data[urn]:
+                trace.data.pop(urn)
+
     def _should_trace(self, emit_mode: EmitMode, warn: bool = True) -> bool:
         if emit_mode == EmitMode.ASYNC_WAIT:
             if not bool(self._openapi_ingestion):
@@ -1,6 +1,12 @@
+import json
 from collections import OrderedDict
 from typing import Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 def _pre_handle_union_with_aliases(
     obj: Any,
@@ -111,3 +117,19 @@ def post_json_transform(obj: Any) -> Any:
         to_pattern="com.linkedin.pegasus2avro.",
         pre=False,
     )
+
+
+def json_dumps(obj: Any) -> str:
+    """Serializes a JSON-compatible object, using orjson if it's installed.
+
+    orjson is several times faster than the stdlib encoder for large aspects.
+    The output is semantically equivalent, but not byte-for-byte identical:
+    it uses compact separators and emits non-ASCII characters as UTF-8.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # e.g. non-string dict keys or integers that don't fit in 64 bits.
+            pass
+    return json.dumps(obj)
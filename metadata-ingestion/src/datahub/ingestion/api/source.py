@@ -51,8 +51,14 @@ from datahub.ingestion.api.source_helpers import (
 from datahub.ingestion.api.source_protocols import (
     MetadataWorkUnitIterable,
     ProfilingCapable,
+    ShardedSource,
 )
 from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.api.workunit_shards import (
+    WorkUnitShardingReport,
+    generate_sharded_workunits,
+)
+from datahub.ingestion.graph.aspect_cache import AspectCacheReport
 from datahub.ingestion.source_report.ingestion_stage import (
     IngestionHighStage,
     IngestionStageReport,
@@ -219,6 +225,9 @@ class SourceReport(ExamplesReport, IngestionStageReport):
     events_produced: int = 0
     events_produced_per_sec: int = 0
     num_input_fields_filtered: int = 0
+    workunit_sharding: Optional[WorkUnitShardingReport] = None
+    # Only populated when the pipeline's DataHub client caches aspects.
+    aspect_cache: Optional[AspectCacheReport] = None
 
     _structured_logs: StructuredLogs = field(default_factory=StructuredLogs)
 
@@ -589,10 +598,32 @@ class Source(Closeable, metaclass=ABCMeta):
     def get_workunits_internal(
         self,
     ) -> MetadataWorkUnitIterable:
+        if isinstance(self, ShardedSource):
+            return self.get_sharded_workunits()
         raise NotImplementedError(
             "get_workunits_internal must be implemented if get_workunits is not overriden."
         )
 
+    def get_sharded_workunits(self) -> Iterable[MetadataWorkUnit]:
+        """Generate the work units for all shards of a ShardedSource.
+
+        Sources that need to emit additional work units, e.g. lineage that spans
+        multiple shards, can override `get_workunits_internal` and call this from there.
+        """
+        assert isinstance(self, ShardedSource)
+
+        report = self.get_report()
+        if report.workunit_sharding is None:
+            report.workunit_sharding = WorkUnitShardingReport()
+
+        return generate_sharded_workunits(
+            self.get_workunit_shards(),
+            lambda shard: auto_workunit(self.get_workunits_for_shard(shard)),
+            source_report=report,
+            sharding_report=report.workunit_sharding,
+            max_concurrency=self.ctx.flags.workunit_shard_concurrency,
+        )
+
     def get_config(self) -> Optional[ConfigModel]:
         """Overridable method to return the config object for this source.
 
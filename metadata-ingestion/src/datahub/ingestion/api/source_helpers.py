@@ -43,6 +43,7 @@ from datahub.metadata.urns import DatasetUrn, GlossaryTermUrn, TagUrn, Urn
 from datahub.sdk.entity import Entity
 from datahub.specific.dataset import DatasetPatchBuilder
 from datahub.telemetry import telemetry
+from datahub.utilities.file_backed_collections import FileBackedDict
 from datahub.utilities.urns.error import InvalidUrnError
 from datahub.utilities.urns.urn import guess_entity_type
 from datahub.utilities.urns.urn_iter import list_urns, lowercase_dataset_urns
@@ -229,6 +230,70 @@ def auto_lowercase_urns(
             yield wu
 
 
+# Past this many urns, auto_browse_path_v2 tracks the urns it has emitted on disk.
+_MAX_IN_MEMORY_EMITTED_URNS = 1_000_000
+
+
+class _EmittedUrns:
+    """A set of urns, which moves to disk once it holds too many urns.
+
+    Every urn in the stream ends up in this set, so it can't be kept in memory for
+    sources that emit tens of millions of entities.
+    """
+
+    def __init__(self) -> None:
+        self._max_in_memory = _MAX_IN_MEMORY_EMITTED_URNS
+        self._urns: Set[str] = set()
+        self._spilled: Optional[FileBackedDict[bool]] = None
+
+    def __contains__(self, urn: str) -> bool:
+        if self._spilled is not None:
+            return urn in self._spilled
+        return urn in self._urns
+
+    def add(self, urn: str) -> None:
+        if self._spilled is not None:
+            self._spilled[urn] = True
+            return
+
+        self._urns.add(urn)
+        if len(self._urns) > self._max_in_memory:
+            self._spilled = FileBackedDict[bool]()
+            self._spilled.update_many((urn, True) for urn in self._urns)
+            self._urns = set()
+
+    def close(self) -> None:
+        if self._spilled is not None:
+            self._spilled.close()
+
+
+class _ContainerPaths:
+    """Browse paths of containers, used to build the browse paths of their children."""
+
+    def __init__(self) -> None:
+        # Set for all containers, and all parents of urns with a Container aspect.
+        self.paths: Dict[str, List[BrowsePathEntryClass]] = {}
+
+        # Maps container -> (its path, the path of its children), so that all children
+        # share one list. Rebuilt whenever the container's own path is replaced.
+        self._child_paths: Dict[
+            str, Tuple[List[BrowsePathEntryClass], List[BrowsePathEntryClass]]
+        ] = {}
+
+    def get_child_path(self, parent_urn: str) -> List[BrowsePathEntryClass]:
+        parent_path = self.paths.setdefault(
+            parent_urn, []
+        )  # Guess parent has no parents
+        cached = self._child_paths.get(parent_urn)
+        if cached is None or cached[0] is not parent_path:
+            cached = (
+                parent_path,
+                [*parent_path, BrowsePathEntryClass(id=parent_urn, urn=parent_urn)],
+            )
+            self._child_paths[parent_urn] = cached
+        return cached[1]
+
+
 def auto_browse_path_v2(
     stream: Iterable[MetadataWorkUnit],
     *,
@@ -259,111 +324,113 @@ def auto_browse_path_v2(
     num_out_of_order = 0
     num_out_of_batch = 0
 
-    # Set for all containers and urns with a Container aspect
     # Used to construct browse path v2 while iterating through stream
     # Assumes topological order of entities in stream, i.e. parent's
     # browse path/container is seen before child's browse path/container.
-    paths: Dict[str, List[BrowsePathEntryClass]] = {}
+    paths = _ContainerPaths()
 
-    emitted_urns: Set[str] = set()
+    emitted_urns = _EmittedUrns()
     containers_used_as_parent: Set[str] = set()
-    for urn, batch in _batch_workunits_by_urn(stream):
-        # Do not generate browse path v2 for entities that do not support it
-        if not entity_supports_aspect(guess_entity_type(urn), BrowsePathsV2Class):
-            yield from batch
-            continue
-        container_path: Optional[List[BrowsePathEntryClass]] = None
-        legacy_path: Optional[List[BrowsePathEntryClass]] = None
-        browse_path_v2: Optional[List[BrowsePathEntryClass]] = None
-
-        for wu in batch:
-            if not wu.is_primary_source:
-                yield wu
+    try:
+        for urn, batch in _batch_workunits_by_urn(stream):
+            entity_type = guess_entity_type(urn)
+            # Do not generate browse path v2 for entities that do not support it
+            if not entity_supports_aspect(entity_type, BrowsePathsV2Class):
+                yield from batch
                 continue
-
-            browse_path_v2_aspect = wu.get_aspect_of_type(BrowsePathsV2Class)
-            if browse_path_v2_aspect is None:
-                yield wu
-            else:
-                # This is browse path v2 aspect. We will process
-                # and emit it later with platform instance, as required.
-                browse_path_v2 = browse_path_v2_aspect.path
-                if guess_entity_type(urn) == "container":
-                    paths[urn] = browse_path_v2
-
-            container_aspect = wu.get_aspect_of_type(ContainerClass)
-            if container_aspect:
-                parent_urn = container_aspect.container
-                containers_used_as_parent.add(parent_urn)
-                # If a container has both parent container and browsePathsV2
-                # emitted from source, prefer browsePathsV2, so using setdefault.
-                paths.setdefault(
-                    urn,
-                    [
-                        *paths.setdefault(
-                            parent_urn, []
-                        ),  # Guess parent has no parents
-                        BrowsePathEntryClass(id=parent_urn, urn=parent_urn),
-                    ],
-                )
-                container_path = paths[urn]
-
-                if urn in containers_used_as_parent:
-                    # Topological order invariant violated; we've used the previous value of paths[urn]
-                    # TODO: Add sentry alert
-                    num_out_of_order += 1
-
-            browse_path_aspect = wu.get_aspect_of_type(BrowsePathsClass)
-            if browse_path_aspect and browse_path_aspect.paths:
-                legacy_path = [
-                    BrowsePathEntryClass(id=p.strip())
-                    for p in browse_path_aspect.paths[0].strip("/").split("/")
-                    if p.strip() and p.strip() not in drop_dirs
-                ]
-
-        # Order of preference: browse path v2, container path, legacy browse path
-        path = browse_path_v2 or container_path or legacy_path
-        if path is not None and urn in emitted_urns:
-            # Batch invariant violated
-            # TODO: Add sentry alert
-            num_out_of_batch += 1
-        elif browse_path_v2 is not None:
-            emitted_urns.add(urn)
-            if not dry_run:
-                yield MetadataChangeProposalWrapper(
-                    entityUrn=urn,
-                    aspect=BrowsePathsV2Class(
-                        path=_prepend_platform_instance(
-                            browse_path_v2, platform, platform_instance
-                        )
-                    ),
-                ).as_workunit()
-            else:
-                yield MetadataChangeProposalWrapper(
-                    entityUrn=urn,
-                    aspect=BrowsePathsV2Class(path=browse_path_v2),
-                ).as_workunit()
-        elif path is not None:
-            emitted_urns.add(urn)
-            if not dry_run:
-                yield MetadataChangeProposalWrapper(
-                    entityUrn=urn,
-                    aspect=BrowsePathsV2Class(
-                        path=_prepend_platform_instance(
-                            path, platform, platform_instance
-                        )
-                    ),
-                ).as_workunit()
-        elif urn not in emitted_urns and guess_entity_type(urn) == "container":
-            # Root containers have no Container aspect, so they are not handled above
-            emitted_urns.add(urn)
-            if not dry_run:
-                yield MetadataChangeProposalWrapper(
-                    entityUrn=urn,
-                    aspect=BrowsePathsV2Class(
-                        path=_prepend_platform_instance([], platform, platform_instance)
-                    ),
-                ).as_workunit()
+            container_path: Optional[List[BrowsePathEntryClass]] = None
+            legacy_path: Optional[List[BrowsePathEntryClass]] = None
+            browse_path_v2: Optional[List[BrowsePathEntryClass]] = None
+
+            for wu in batch:
+                if not wu.is_primary_source:
+                    yield wu
+                    continue
+
+                browse_path_v2_aspect = wu.get_aspect_of_type(BrowsePathsV2Class)
+                if browse_path_v2_aspect is None:
+                    yield wu
+                else:
+                    # This is browse path v2 aspect. We will process
+                    # and emit it later with platform instance, as required.
+                    browse_path_v2 = browse_path_v2_aspect.path
+                    if entity_type == "container":
+                        paths.paths[urn] = browse_path_v2
+
+                container_aspect = wu.get_aspect_of_type(ContainerClass)
+                if container_aspect:
+                    parent_urn = container_aspect.container
+                    containers_used_as_parent.add(parent_urn)
+                    child_path = paths.get_child_path(parent_urn)
+                    if entity_type == "container":
+                        # If a container has both parent container and browsePathsV2
+                        # emitted from source, prefer browsePathsV2, so using setdefault.
+                        container_path = paths.paths.setdefault(urn, child_path)
+                    elif container_path is None:
+                        # Only containers can be parents, so there's no need to
+                        # remember the paths of other entities.
+                        container_path = child_path
+
+                    if urn in containers_used_as_parent:
+                        # Topological order invariant violated; we've used the previous value of paths[urn]
+                        # TODO: Add sentry alert
+                        num_out_of_order += 1
+
+                browse_path_aspect = wu.get_aspect_of_type(BrowsePathsClass)
+                if browse_path_aspect and browse_path_aspect.paths:
+                    legacy_path = [
+                        BrowsePathEntryClass(id=p.strip())
+                        for p in browse_path_aspect.paths[0].strip("/").split("/")
+                        if p.strip() and p.strip() not in drop_dirs
+                    ]
+
+            # Order of preference: browse path v2, container path, legacy browse path
+            path = browse_path_v2 or container_path or legacy_path
+            if path is not None and urn in emitted_urns:
+                # Batch invariant violated
+                # TODO: Add sentry alert
+                num_out_of_batch += 1
+            elif browse_path_v2 is not None:
+                emitted_urns.add(urn)
+                if not dry_run:
+                    yield MetadataChangeProposalWrapper(
+                        entityUrn=urn,
+                        aspect=BrowsePathsV2Class(
+                            path=_prepend_platform_instance(
+                                browse_path_v2, platform, platform_instance
+                            )
+                        ),
+                    ).as_workunit()
+                else:
+                    yield MetadataChangeProposalWrapper(
+                        entityUrn=urn,
+                        aspect=BrowsePathsV2Class(path=browse_path_v2),
+                    ).as_workunit()
+            elif path is not None:
+                emitted_urns.add(urn)
+                if not dry_run:
+                    yield MetadataChangeProposalWrapper(
+                        entityUrn=urn,
+                        aspect=BrowsePathsV2Class(
+                            path=_prepend_platform_instance(
+                                path, platform, platform_instance
+                            )
+                        ),
+                    ).as_workunit()
+            elif urn not in emitted_urns and entity_type == "container":
+                # Root containers have no Container aspect, so they are not handled above
+                emitted_urns.add(urn)
+                if not dry_run:
+                    yield MetadataChangeProposalWrapper(
+                        entityUrn=urn,
+                        aspect=BrowsePathsV2Class(
+                            path=_prepend_platform_instance(
+                                [], platform, platform_instance
+                            )
+                        ),
+                    ).as_workunit()
+    finally:
+        emitted_urns.close()
 
     if num_out_of_batch or num_out_of_order:
         properties = {
@@ -2,6 +2,7 @@ from typing import Iterable, Protocol, Union, runtime_checkable
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.api.workunit_shards import WorkUnitShard
 from datahub.sdk.entity import Entity
 
 # Type alias for metadata work units - Python 3.9 compatible
@@ -21,3 +22,22 @@ class ProfilingCapable(Protocol):
     def get_profiling_internal(self) -> MetadataWorkUnitIterable:
         """Generate profiling work units."""
         ...
+
+
+@runtime_checkable
+class ShardedSource(Protocol):
+    """Protocol for sources whose work can be split into independent shards.
+
+    Sources implementing this protocol don't need to implement `get_workunits_internal`.
+    Instead, the shards are processed by `Source.get_sharded_workunits`, concurrently
+    if the `workunit_shard_concurrency` pipeline flag is set. Workunit processors,
+    including stateful ingestion, still see a single merged stream of workunits.
+    """
+
+    def get_workunit_shards(self) -> Iterable[WorkUnitShard]:
+        """List the shards of this source. Called once, before processing any shard."""
+        ...
+
+    def get_workunits_for_shard(self, shard: WorkUnitShard) -> MetadataWorkUnitIterable:
+        """Generate the work units for a single shard. Must be thread-safe."""
+        ...
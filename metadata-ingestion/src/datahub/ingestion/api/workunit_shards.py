@@ -0,0 +1,190 @@
+import concurrent.futures
+import contextvars
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Union
+
+from datahub.ingestion.api.report import Report
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.utilities.lossy_collections import LossyDict, LossyList
+from datahub.utilities.perf_timer import PerfTimer
+
+if TYPE_CHECKING:
+    from datahub.ingestion.api.source import SourceReport
+
+logger = logging.getLogger(__name__)
+
+# How often blocked shard threads wake up to check for cancellation.
+_QUEUE_POLL_INTERVAL_SECONDS = 0.1
+
+
+@dataclass(frozen=True)
+class WorkUnitShard:
+    """An independent slice of a source's work, e.g. a database, project, or file prefix.
+
+    Shards must not depend on each other, since they may be processed concurrently
+    and in any order.
+    """
+
+    id: str
+
+    # Arbitrary source-specific data needed to process the shard.
+    data: Any = field(default=None, compare=False)
+
+
+@dataclass
+class WorkUnitShardReport(Report):
+    num_workunits: int = 0
+    failed: bool = False
+
+    # Wall-clock time from starting the shard until it was fully consumed.
+    timer: PerfTimer = field(default_factory=PerfTimer)
+
+
+@dataclass
+class WorkUnitShardingReport(Report):
+    max_concurrency: int = 1
+    num_shards: int = 0
+    num_shards_completed: int = 0
+    num_shards_failed: int = 0
+    failed_shards: LossyList[str] = field(default_factory=LossyList)
+
+    # A sample of the per-shard reports.
+    shards: LossyDict[str, WorkUnitShardReport] = field(default_factory=LossyDict)
+
+
+class _ShardCancelled(Exception):
+    pass
+
+
+class _ShardDone:
+    pass
+
+
+_SHARD_DONE = _ShardDone()
+
+
+def generate_sharded_workunits(
+    shards: Iterable[WorkUnitShard],
+    generate: Callable[[WorkUnitShard], Iterable[MetadataWorkUnit]],
+    *,
+    source_report: "SourceReport",
+    sharding_report: WorkUnitShardingReport,
+    max_concurrency: int = 1,
+    queue_size: int = 100,
+) -> Iterable[MetadataWorkUnit]:
+    """Generates the workunits for each shard, merging them into a single stream.
+
+    With a concurrency of 1, shards are processed one after another on the calling thread.
+    Otherwise, up to `max_concurrency` shards are processed on worker threads, and their
+    workunits are interleaved. Workunits from the same shard are always kept in order.
+
+    A shard that raises an exception is reported as a failure on the source report,
+    without affecting the other shards. Since the source report then has a failure,
+    stateful ingestion will skip the soft-deletion of stale entities, so entities from
+    the failed shard aren't accidentally removed.
+    """
+
+    shard_list = list(shards)
+    sharding_report.max_concurrency = max_concurrency
+    sharding_report.num_shards += len(shard_list)
+
+    # Shards may run on multiple threads, but share the sharding report.
+    report_lock = threading.Lock()
+
+    def _iterate_shard(shard: WorkUnitShard) -> Iterator[MetadataWorkUnit]:
+        shard_report = WorkUnitShardReport()
+        with report_lock:
+            sharding_report.shards[shard.id] = shard_report
+
+        with shard_report.timer:
+            try:
+                for wu in generate(shard):
+                    shard_report.num_workunits += 1
+                    yield wu
+            except Exception as e:
+                shard_report.failed = True
+                with report_lock:
+                    sharding_report.num_shards_failed += 1
+                    sharding_report.failed_shards.append(shard.id)
+                source_report.failure(
+                    title="Failed to generate workunits for shard",
+                    message="The remaining shards will still be processed.",
+                    context=shard.id,
+                    exc=e,
+                )
+            else:
+                with report_lock:
+                    sharding_report.num_shards_completed += 1
+
+    if max_concurrency <= 1:
+        for shard in shard_list:
+            yield from _iterate_shard(shard)
+        return
+
+    # Each worker thread pushes its workunits into this queue, and the calling thread
+    # drains it. The bounded size provides backpressure to the workers.
+    output: "queue.Queue[Union[MetadataWorkUnit, _ShardDone]]" = queue.Queue(
+        maxsize=queue_size
+    )
+    stop_event = threading.Event()
+
+    def _put(item: Union[MetadataWorkUnit, _ShardDone]) -> None:
+        while True:
+            if stop_event.is_set():
+                raise _ShardCancelled()
+            try:
+                output.put(item, timeout=_QUEUE_POLL_INTERVAL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _produce(shard: WorkUnitShard) -> None:
+        try:
+            for wu in _iterate_shard(shard):
+                _put(wu)
+        except _ShardCancelled:
+            logger.debug(f"Workunit shard {shard.id} was cancelled")
+            return
+        _put(_SHARD_DONE)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="workunit-shard"
+    ) as executor:
+        # Each shard runs in a copy of the caller's context, so that context variables
+        # (e.g. the global graph context) are visible to the shard.
+        futures: List[concurrent.futures.Future] = [
+            executor.submit(contextvars.copy_context().run, _produce, shard)
+            for shard in shard_list
+        ]
+
+        try:
+            num_pending = len(futures)
+            while num_pending > 0:
+                try:
+                    item = output.get(timeout=_QUEUE_POLL_INTERVAL_SECONDS)
+                except queue.Empty:
+                    _raise_worker_errors(futures)
+                    continue
+
+                if isinstance(item, _ShardDone):
+                    num_pending -= 1
+                else:
+                    yield item
+        finally:
+            # If we stopped early, e.g. because the consumer closed this generator,
+            # let the workers know that nobody is reading their output anymore.
+            stop_event.set()
+            for future in futures:
+                future.cancel()
+
+
+def _raise_worker_errors(futures: List[concurrent.futures.Future]) -> None:
+    # A worker that died unexpectedly will never send its done marker.
+    for future in futures:
+        if future.done() and not future.cancelled():
+            exc = future.exception()
+            if exc is not None:
+                raise exc
@@ -1,10 +1,13 @@
+import io
+import os
 from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Iterable, Optional
 from urllib.parse import urlparse
 
 import boto3
 import smart_open
+from botocore.exceptions import ClientError
 
 from datahub.ingestion.fs import s3_fs
 from datahub.ingestion.fs.fs_base import FileInfo, FileSystem
@@ -31,6 +34,134 @@ class S3Path:
         return f"S3Path({self.bucket}, {self.key})"
 
 
+class S3RangeReader(io.RawIOBase):
+    """
+    A read-only, seekable file object for an S3 object, which only downloads the byte ranges
+    that are actually read, with a ranged GetObject request for each read.
+
+    This is useful for formats whose metadata lives at a known position, like the footer of
+    a parquet file or the header of an avro file, so that they can be inspected without
+    downloading the whole object. Wrap it in an `io.BufferedReader` to coalesce small reads.
+
+    If `prefetch_size` is set, the first (or with `prefetch_from_end`, the last) bytes of the
+    object are downloaded with the first request, and reads within them are served from memory.
+    The response to that request also includes the object's size, so no HEAD request is needed.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        size: Optional[int] = None,
+        prefetch_size: int = 0,
+        prefetch_from_end: bool = False,
+    ) -> None:
+        self._s3 = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._position = 0
+        self._prefetch_size = prefetch_size
+        self._prefetch_from_end = prefetch_from_end
+        self._prefetched: Optional[bytes] = None
+        self._prefetched_start = 0
+        self.bytes_downloaded = 0
+        self.requests_made = 0
+
+    @classmethod
+    def from_path(cls, s3_client: Any, path: str, **kwargs: Any) -> "S3RangeReader":
+        s3_path = parse_s3_path(path)
+        return cls(s3_client, s3_path.bucket, s3_path.key, **kwargs)
+
+    @property
+    def size(self) -> int:
+        self._prefetch()
+        if self._size is None:
+            response = self._s3.head_object(Bucket=self._bucket, Key=self._key)
+            self.requests_made += 1
+            self._size = int(response["ContentLength"])
+        return self._size
+
+    def _prefetch(self) -> None:
+        if self._prefetch_size <= 0 or self._prefetched is not None:
+            return
+
+        if self._prefetch_from_end:
+            byte_range = f"bytes=-{self._prefetch_size}"
+        else:
+            byte_range = f"bytes=0-{self._prefetch_size - 1}"
+        self.requests_made += 1
+        try:
+            response = self._s3.get_object(
+                Bucket=self._bucket, Key=self._key, Range=byte_range
+            )
+        except ClientError as e:
+            # S3 rejects any range for an empty object.
+            if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            self._prefetched = b""
+            self._size = 0
+            return
+
+        self._prefetched = response["Body"].read()
+        self.bytes_downloaded += len(self._prefetched)
+
+        # The ContentRange header looks like "bytes 1000-1999/2000".
+        self._size = int(response["ContentRange"].rsplit("/", 1)[1])
+        if self._prefetch_from_end:
+            self._prefetched_start = self._size - len(self._prefetched)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"negative seek position: {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        length = min(len(buffer), self.size - self._position)
+        if length <= 0:
+            return 0
+
+        if self._prefetched:
+            offset = self._position - self._prefetched_start
+            if 0 <= offset < len(self._prefetched):
+                data = self._prefetched[offset : offset + length]
+                buffer[: len(data)] = data
+                self._position += len(data)
+                return len(data)
+
+        response = self._s3.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range=f"bytes={self._position}-{self._position + length - 1}",
+        )
+        data = response["Body"].read()
+        self.requests_made += 1
+        self.bytes_downloaded += len(data)
+
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 class S3ListIterator(Iterator):
     MAX_KEYS = 1000
 
@@ -1,10 +1,13 @@
 import concurrent.futures
+import concurrent.futures.process
 import logging
 import multiprocessing
+import threading
+import weakref
 from dataclasses import dataclass, field
 from functools import partial
 from math import ceil
-from typing import Callable, Dict, Iterable, List, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from datahub_classify.helper_classes import ColumnInfo, Metadata
 from pydantic import Field
@@ -28,6 +31,9 @@ from datahub.utilities.perf_timer import PerfTimer
 
 SAMPLE_SIZE_MULTIPLIER = 1.2
 
+# Minimum number of columns passed to the classify api at a time.
+MIN_CLASSIFICATION_BATCH_SIZE = 5
+
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -44,6 +50,31 @@ class ClassificationReportMixin:
         default_factory=LossyDict
     )
 
+    # Summed across tables, which may be classified concurrently.
+    classification_sample_fetch_time_seconds: float = 0.0
+    classification_time_seconds: float = 0.0
+    # Part of the classification time spent in the classifiers themselves, as opposed to
+    # transferring the samples to and from the worker processes.
+    classification_classifier_time_seconds: float = 0.0
+
+
+# Classifiers of the current worker process, set once when the process starts so that they
+# don't need to be sent along with every batch of columns.
+_worker_classifiers: List[Classifier] = []
+
+
+def _init_classification_worker(classifiers: List[Classifier]) -> None:
+    global _worker_classifiers
+    _worker_classifiers = classifiers
+
+
+def _classify_in_worker(
+    classifier_index: int, columns: List[ColumnInfo]
+) -> Tuple[List[ColumnInfo], float]:
+    with PerfTimer() as timer:
+        columns = _worker_classifiers[classifier_index].classify(columns)
+    return columns, timer.elapsed_seconds()
+
 
 class ClassificationSourceConfigMixin(ConfigModel):
     classification: ClassificationConfig = Field(
@@ -60,6 +91,43 @@ class ClassificationHandler:
         self.report = report
         self.classifiers = self.get_classifiers()
 
+        # A single pool of worker processes is shared by all tables, since starting the
+        # workers is much more expensive than classifying the columns of a typical table.
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.config.classification.max_workers,
+                    # The fork start method, which is the default on Linux for Python < 3.14, is not
+                    # safe when the main process uses threads. The default start method on windows/macOS is
+                    # already spawn, and will be changed to spawn for Linux in Python 3.14.
+                    # https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_classification_worker,
+                    initargs=(self.classifiers,),
+                )
+                # Stop the workers once the handler is gone, even if it was never closed.
+                weakref.finalize(self, self._executor.shutdown, wait=False)
+            return self._executor
+
+    def _discard_executor(
+        self, executor: concurrent.futures.ProcessPoolExecutor
+    ) -> None:
+        with self._executor_lock:
+            # Another thread may have already replaced the broken pool.
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
     def is_classification_enabled(self) -> bool:
         return (
             self.config.classification is not None
@@ -118,17 +186,21 @@ class ClassificationHandler:
         sample_data: Union[Dict[str, list], Callable[[], Dict[str, list]]],
     ) -> None:
         if not isinstance(sample_data, Dict):
-            try:
-                # TODO: In future, sample_data fetcher can be lazily called if classification
-                # requires values as prediction factor
-                sample_data = sample_data()
-            except Exception as e:
-                self.report.num_tables_fetch_sample_values_failed += 1
-                logger.warning(
-                    f"Failed to get sample values for dataset. Make sure you have granted SELECT permissions on dataset. {dataset_name}",
-                )
-                sample_data = dict()
-                logger.debug("Error", exc_info=e)
+            with PerfTimer() as sample_fetch_timer:
+                try:
+                    # TODO: In future, sample_data fetcher can be lazily called if classification
+                    # requires values as prediction factor
+                    sample_data = sample_data()
+                except Exception as e:
+                    self.report.num_tables_fetch_sample_values_failed += 1
+                    logger.warning(
+                        f"Failed to get sample values for dataset. Make sure you have granted SELECT permissions on dataset. {dataset_name}",
+                    )
+                    sample_data = dict()
+                    logger.debug("Error", exc_info=e)
+            self.report.classification_sample_fetch_time_seconds += (
+                sample_fetch_timer.elapsed_seconds()
+            )
 
         column_infos = self.get_columns_to_classify(
             dataset_name, schema_metadata, sample_data
@@ -144,14 +216,20 @@ class ClassificationHandler:
         field_terms: Dict[str, str] = {}
         with PerfTimer() as timer:
             try:
-                for classifier in self.classifiers:
+                for classifier_index, classifier in enumerate(self.classifiers):
                     column_infos_with_proposals: Iterable[ColumnInfo]
                     if self.config.classification.max_workers > 1:
                         column_infos_with_proposals = self.async_classify(
-                            classifier, column_infos
+                            classifier_index, column_infos
                         )
                     else:
-                        column_infos_with_proposals = classifier.classify(column_infos)
+                        with PerfTimer() as classifier_timer:
+                            column_infos_with_proposals = classifier.classify(
+                                column_infos
+                            )
+                        self.report.classification_classifier_time_seconds += (
+                            classifier_timer.elapsed_seconds()
+                        )
 
                     for column_info_proposal in column_infos_with_proposals:
                         self.update_field_terms(field_terms, column_info_proposal)
@@ -161,6 +239,7 @@ class ClassificationHandler:
                 raise
             finally:
                 time_taken = timer.elapsed_seconds()
+                self.report.classification_time_seconds += time_taken
                 logger.debug(
                     f"Finished classification {dataset_name}; took {time_taken:.3f} seconds"
                 )
@@ -177,40 +256,42 @@ class ClassificationHandler:
             field_terms[col_info.metadata.name] = term
 
     def async_classify(
-        self, classifier: Classifier, columns: List[ColumnInfo]
+        self, classifier_index: int, columns: List[ColumnInfo]
     ) -> Iterable[ColumnInfo]:
         num_columns = len(columns)
-        BATCH_SIZE = 5  # Number of columns passed to classify api at a time
+        max_workers = self.config.classification.max_workers
+        # Spread the columns of wide tables over all workers, but don't split narrow tables
+        # into batches which are too small to be worth sending to a worker on their own.
+        batch_size = max(MIN_CLASSIFICATION_BATCH_SIZE, ceil(num_columns / max_workers))
 
         logger.debug(
-            f"Will Classify {num_columns} column(s) with {self.config.classification.max_workers} worker(s) with batch size {BATCH_SIZE}."
+            f"Will Classify {num_columns} column(s) with {max_workers} worker(s) with batch size {batch_size}."
         )
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=self.config.classification.max_workers,
-            # The fork start method, which is the default on Linux for Python < 3.14, is not
-            # safe when the main process uses threads. The default start method on windows/macOS is
-            # already spawn, and will be changed to spawn for Linux in Python 3.14.
-            # https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
-            mp_context=multiprocessing.get_context("spawn"),
-        ) as executor:
+        executor = self._get_executor()
+        column_infos_with_proposals: List[ColumnInfo] = []
+        try:
             column_info_proposal_futures = [
                 executor.submit(
-                    classifier.classify,
-                    columns[
-                        (i * BATCH_SIZE) : min(i * BATCH_SIZE + BATCH_SIZE, num_columns)
-                    ],
+                    _classify_in_worker,
+                    classifier_index,
+                    columns[start : start + batch_size],
                 )
-                for i in range(ceil(num_columns / BATCH_SIZE))
+                for start in range(0, num_columns, batch_size)
             ]
 
-            return [
-                column_with_proposal
-                for proposal_future in concurrent.futures.as_completed(
-                    column_info_proposal_futures
-                )
-                for column_with_proposal in proposal_future.result()
-            ]
+            for proposal_future in concurrent.futures.as_completed(
+                column_info_proposal_futures
+            ):
+                batch_with_proposals, classifier_time = proposal_future.result()
+                self.report.classification_classifier_time_seconds += classifier_time
+                column_infos_with_proposals.extend(batch_with_proposals)
+        except concurrent.futures.process.BrokenProcessPool:
+            # A worker died, e.g. because it ran out of memory. The pool can't be used
+            # anymore, so the next table gets a new one.
+            self._discard_executor(executor)
+            raise
+        return column_infos_with_proposals
 
     def populate_terms_in_schema_metadata(
         self,
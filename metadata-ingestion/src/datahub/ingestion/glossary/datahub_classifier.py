@@ -168,6 +168,10 @@ class DataHubClassifierConfig(ConfigModel):
 class DataHubClassifier(Classifier):
     def __init__(self, config: DataHubClassifierConfig):
         self.config = config
+        # Converted once, rather than for every batch of columns.
+        self._global_config: Dict[str, Dict[str, Any]] = {
+            k: v.dict() for k, v in self.config.info_types_config.items()
+        }
 
     @classmethod
     def create(cls, config_dict: Optional[Dict[str, Any]]) -> "DataHubClassifier":
@@ -182,9 +186,7 @@ class DataHubClassifier(Classifier):
         columns = predict_infotypes(
             column_infos=columns,
             confidence_level_threshold=self.config.confidence_level_threshold,
-            global_config={
-                k: v.dict() for k, v in self.config.info_types_config.items()
-            },
+            global_config=self._global_config,
             infotypes=self.config.info_types,
             minimum_values_threshold=self.config.minimum_values_threshold,
         )
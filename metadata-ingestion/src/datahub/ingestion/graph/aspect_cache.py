@@ -0,0 +1,126 @@
+import copy
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set, Tuple, Union
+
+from datahub._codegen.aspect import _Aspect
+from datahub.utilities.sentinels import Unset, unset
+
+# (entity urn, aspect name)
+_CacheKey = Tuple[str, str]
+
+
+@dataclass
+class AspectCacheReport:
+    # This isn't a Report, since datahub.ingestion.api.report indirectly imports
+    # the graph client. It still gets rendered as part of other reports via as_obj.
+
+    num_hits: int = 0
+    num_misses: int = 0
+    num_expired: int = 0
+    num_evictions: int = 0
+    num_invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.num_hits + self.num_misses
+        return round(self.num_hits / lookups, 4) if lookups else 0.0
+
+    def as_obj(self) -> dict:
+        return {**dataclasses.asdict(self), "hit_rate": self.hit_rate}
+
+
+class AspectCache:
+    """A thread-safe LRU cache of aspects fetched from DataHub, with a time-to-live.
+
+    Missing aspects are cached as None, so that repeated lookups of entities that don't
+    exist (or don't have the aspect) don't hit the server either. Entries are copied on
+    the way in and out, since callers frequently mutate the aspects they get back.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_sec: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self.report = AspectCacheReport()
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_CacheKey, Tuple[float, Optional[_Aspect]]]" = (
+            OrderedDict()
+        )
+        # Index used to invalidate all aspects of an entity.
+        self._aspect_names_by_urn: Dict[str, Set[str]] = {}
+
+    def get(self, urn: str, aspect_name: str) -> Union[Optional[_Aspect], Unset]:
+        """Returns the cached aspect (possibly None), or `unset` if it isn't cached."""
+
+        key = (urn, aspect_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.report.num_misses += 1
+                return unset
+
+            expires_at, aspect = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self.report.num_expired += 1
+                self.report.num_misses += 1
+                return unset
+
+            self._entries.move_to_end(key)
+            self.report.num_hits += 1
+        return copy.deepcopy(aspect)
+
+    def put(self, urn: str, aspect_name: str, aspect: Optional[_Aspect]) -> None:
+        key = (urn, aspect_name)
+        value = copy.deepcopy(aspect)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_sec, value)
+            self._entries.move_to_end(key)
+            self._aspect_names_by_urn.setdefault(urn, set()).add(aspect_name)
+
+            while len(self._entries) > self.max_size:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.report.num_evictions += 1
+
+    def invalidate(self, urn: str, aspect_name: Optional[str] = None) -> None:
+        """Drops a single aspect of an entity, or all of its aspects if no name is given."""
+
+        with self._lock:
+            if aspect_name is not None:
+                keys = (
+                    [(urn, aspect_name)] if (urn, aspect_name) in self._entries else []
+                )
+            else:
+                keys = [(urn, name) for name in self._aspect_names_by_urn.get(urn, ())]
+
+            for key in keys:
+                self._remove(key)
+            self.report.num_invalidations += len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aspect_names_by_urn.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: _CacheKey) -> None:
+        # Must be called with the lock held.
+        del self._entries[key]
+        urn, aspect_name = key
+        aspect_names = self._aspect_names_by_urn[urn]
+        aspect_names.discard(aspect_name)
+        if not aspect_names:
+            del self._aspect_names_by_urn[urn]
@@ -20,6 +20,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 
 import progressbar
@@ -39,6 +40,7 @@ from datahub.emitter.rest_emitter import (
     DatahubRestEmitter,
 )
 from datahub.emitter.serialization_helper import post_json_transform
+from datahub.ingestion.graph.aspect_cache import AspectCache
 from datahub.ingestion.graph.config import (
     ClientMode,
     DatahubClientConfig as DatahubClientConfig,
@@ -62,9 +64,11 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
 )
 from datahub.metadata.schema_classes import (
     ASPECT_NAME_MAP,
+    KEY_ASPECT_NAMES,
     KEY_ASPECTS,
     AspectBag,
     BrowsePathsClass,
+    ChangeTypeClass,
     DatasetPropertiesClass,
     DatasetUsageStatisticsClass,
     DomainPropertiesClass,
@@ -88,6 +92,8 @@ from datahub.metadata.urns import (
 )
 from datahub.telemetry.telemetry import telemetry_instance
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.sentinels import Unset
+from datahub.utilities.server_config_util import ServiceFeature
 from datahub.utilities.str_enum import StrEnum
 from datahub.utilities.urns.urn import guess_entity_type
 
@@ -181,6 +187,19 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
             server_config_refresh_interval=config.server_config_refresh_interval,
         )
         self.server_id: str = _MISSING_SERVER_ID
+        self.aspect_cache: Optional[AspectCache] = None
+
+    def enable_aspect_cache(self, max_size: int, ttl_sec: float) -> AspectCache:
+        """
+        Cache the aspects read via get_aspect and get_aspects_for_urns.
+
+        Writes made through this client invalidate the affected cache entries.
+        Writes made through other clients (e.g. a separate sink) are only picked
+        up once the cached entries expire.
+        """
+
+        self.aspect_cache = AspectCache(max_size=max_size, ttl_sec=ttl_sec)
+        return self.aspect_cache
 
     def test_connection(self) -> None:
         super().test_connection()
@@ -331,6 +350,54 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
             for item in items:
                 sink.emit_async(item)
 
+    def emit_mce(self, mce: MetadataChangeEvent) -> None:
+        try:
+            super().emit_mce(mce)
+        finally:
+            if self.aspect_cache is not None:
+                self.aspect_cache.invalidate(mce.proposedSnapshot.urn)
+
+    def emit_mcp(
+        self,
+        mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        try:
+            super().emit_mcp(mcp, *args, **kwargs)
+        finally:
+            self._invalidate_cached_aspects([mcp])
+
+    def emit_mcps(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> int:
+        try:
+            return super().emit_mcps(mcps, *args, **kwargs)
+        finally:
+            self._invalidate_cached_aspects(mcps)
+
+    def _invalidate_cached_aspects(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+    ) -> None:
+        # We invalidate even if the write failed, since it may have partially succeeded.
+        if self.aspect_cache is None:
+            return
+        for mcp in mcps:
+            if mcp.entityUrn is None:
+                continue
+            if (
+                mcp.changeType == ChangeTypeClass.DELETE
+                and mcp.aspectName in KEY_ASPECT_NAMES
+            ):
+                # Deleting the key aspect deletes the whole entity.
+                self.aspect_cache.invalidate(mcp.entityUrn)
+            else:
+                self.aspect_cache.invalidate(mcp.entityUrn, mcp.aspectName)
+
     def get_aspect(
         self,
         entity_urn: str,
@@ -355,6 +422,25 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
                 'Cannot get a timeseries aspect using "get_aspect". Use "get_latest_timeseries_value" instead.'
             )
 
+        # Only the latest version of an aspect is cached.
+        if self.aspect_cache is None or version != 0:
+            return self._fetch_aspect(entity_urn, aspect_type, version)
+
+        cached = self.aspect_cache.get(entity_urn, aspect)
+        if not isinstance(cached, Unset):
+            return cast(Optional[Aspect], cached)
+
+        value = self._fetch_aspect(entity_urn, aspect_type, version)
+        self.aspect_cache.put(entity_urn, aspect, value)
+        return value
+
+    def _fetch_aspect(
+        self,
+        entity_urn: str,
+        aspect_type: Type[Aspect],
+        version: int,
+    ) -> Optional[Aspect]:
+        aspect = aspect_type.ASPECT_NAME
         url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version={version}"
         response = self._session.get(url)
         if response.status_code == 404:
@@ -378,6 +464,88 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
                 f"Failed to find {aspect_type_name} in response {response_json}"
             )
 
+    def get_aspects_for_urns(
+        self,
+        entity_urns: Iterable[str],
+        aspect_type: Type[Aspect],
+        batch_size: int = 100,
+    ) -> Dict[str, Optional[Aspect]]:
+        """
+        Get the latest version of an aspect for many entities.
+
+        Unlike calling `get_aspect` in a loop, this makes one request per batch of urns
+        (and entity type) instead of one request per urn. Servers without the OpenAPI v3
+        batch endpoint get one request per urn instead. If the aspect cache is enabled,
+        cached aspects are served from the cache and fetched aspects are added to it.
+
+        :param entity_urns: The urns of the entities. The entities can be of different types.
+        :param aspect_type: The type class of the aspect being requested
+        :param batch_size: The maximum number of urns to fetch in a single request
+        :return: a dict from each urn to its aspect, or None if the entity or aspect was not found
+
+        :raises TypeError: if the aspect type is a timeseries aspect
+        """
+
+        aspect_name = aspect_type.ASPECT_NAME
+        if aspect_name in TIMESERIES_ASPECT_MAP:
+            raise TypeError(
+                'Cannot get a timeseries aspect using "get_aspects_for_urns". Use "get_latest_timeseries_value" instead.'
+            )
+
+        result: Dict[str, Optional[Aspect]] = {}
+        urns_to_fetch: Dict[str, List[str]] = {}
+        for urn in entity_urns:
+            if urn in result:
+                continue
+            if self.aspect_cache is not None:
+                cached = self.aspect_cache.get(urn, aspect_name)
+                if not isinstance(cached, Unset):
+                    result[urn] = cast(Optional[Aspect], cached)
+                    continue
+
+            result[urn] = None
+            entity_type = guess_entity_type(urn)
+            urns_to_fetch.setdefault(entity_type, []).append(urn)
+
+        use_batch_get = bool(urns_to_fetch) and self.server_config.supports_feature(
+            ServiceFeature.OPEN_API_SDK
+        )
+        for entity_type, urns in urns_to_fetch.items():
+            for i in range(0, len(urns), batch_size):
+                batch = urns[i : i + batch_size]
+                fetched: Dict[str, Optional[Aspect]] = {}
+                if use_batch_get:
+                    try:
+                        entities = self.get_entities(
+                            entity_type, batch, aspects=[aspect_name]
+                        )
+                        for urn in batch:
+                            fetched[urn] = None
+                            if aspect_name in entities.get(urn, {}):
+                                fetched[urn] = cast(
+                                    Aspect, entities[urn][aspect_name][0]
+                                )
+                    except HTTPError as e:
+                        status_code = (
+                            e.response.status_code if e.response is not None else None
+                        )
+                        if status_code not in (404, 405):
+                            raise
+                        logger.debug(
+                            f"Batch get is not supported by the server, falling back to fetching aspects one by one: {e}"
+                        )
+                        use_batch_get = False
+                if not use_batch_get:
+                    for urn in batch:
+                        fetched[urn] = self._fetch_aspect(urn, aspect_type, 0)
+
+                for urn, value in fetched.items():
+                    result[urn] = value
+                    if self.aspect_cache is not None:
+                        self.aspect_cache.put(urn, aspect_name, value)
+
+        return result
+
     @deprecated("Use get_aspect instead which makes aspect string name optional")
     def get_aspect_v2(
         self,
@@ -1364,9 +1532,13 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
         assert urn
 
         payload_obj: Dict = {"urn": urn}
-        summary = self._post_generic(
-            f"{self._gms_server}/entities?action=delete", payload_obj
-        ).get("value", {})
+        try:
+            summary = self._post_generic(
+                f"{self._gms_server}/entities?action=delete", payload_obj
+            ).get("value", {})
+        finally:
+            if self.aspect_cache is not None:
+                self.aspect_cache.invalidate(urn)
 
         rows_affected: int = summary.get("rows", 0)
         timeseries_rows_affected: int = summary.get("timeseriesRows", 0)
@@ -2274,6 +2446,9 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
 
     def close(self) -> None:
         self._make_schema_resolver.cache_clear()
+        if self.aspect_cache is not None:
+            logger.debug(f"Aspect cache stats: {self.aspect_cache.report.as_obj()}")
+            self.aspect_cache.clear()
         super().close()
 
 
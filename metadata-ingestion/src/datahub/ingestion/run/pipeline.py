@@ -9,7 +9,7 @@ import sys
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import click
 import humanfriendly
@@ -26,16 +26,23 @@ from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnv
 from datahub.ingestion.api.global_context import set_graph_context
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
-from datahub.ingestion.api.sink import Sink, SinkReport
+from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.source import Extractor, Source
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
+from datahub.ingestion.graph.aspect_cache import AspectCache
 from datahub.ingestion.graph.client import DataHubGraph, get_default_graph
 from datahub.ingestion.graph.config import ClientMode
 from datahub.ingestion.reporting.reporting_provider_registry import (
     reporting_provider_registry,
 )
 from datahub.ingestion.run.pipeline_config import PipelineConfig, ReporterConfig
+from datahub.ingestion.run.pipeline_stages import (
+    PipelineStageReport,
+    StageQueue,
+    start_stage_thread,
+)
 from datahub.ingestion.run.sink_callback import DeadLetterQueueCallback, LoggingCallback
 from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 from datahub.ingestion.sink.sink_registry import sink_registry
@@ -103,6 +110,9 @@ class CliReport(Report):
     thread_count: Optional[int] = None
     peak_thread_count: Optional[int] = None
 
+    # Only populated when staged execution is enabled.
+    pipeline_stages: Optional[Dict[str, PipelineStageReport]] = None
+
     def compute_stats(self) -> None:
         try:
             mem_usage = psutil.Process(os.getpid()).memory_info().rss
@@ -228,6 +238,12 @@ class Pipeline:
                 with _add_init_error_context("setup default datahub client"):
                     self.graph = self.sink.emitter.to_graph()
                     self.graph.test_connection()
+            aspect_cache: Optional[AspectCache] = None
+            if self.graph is not None and self.config.flags.aspect_cache_max_size > 0:
+                aspect_cache = self.graph.enable_aspect_cache(
+                    max_size=self.config.flags.aspect_cache_max_size,
+                    ttl_sec=self.config.flags.aspect_cache_ttl_sec,
+                )
             self.ctx.graph = self.graph
             telemetry_instance.set_context(server=self.graph)
 
@@ -253,6 +269,9 @@ class Pipeline:
                     )
                     logger.info("Source configured successfully.")
 
+                if aspect_cache is not None:
+                    self.source.get_report().aspect_cache = aspect_cache.report
+
                 extractor_type = self.config.source.extractor
                 with _add_init_error_context(
                     f"configure the extractor ({extractor_type})"
@@ -488,42 +507,145 @@ class Pipeline:
                         )
                     )
                 )
-                for wu in itertools.islice(
-                    self.source.get_workunits(),
-                    self.preview_workunits if self.preview_mode else None,
-                ):
-                    try:
-                        if self._time_to_print() and not self.no_progress:
-                            self.pretty_print_summary(currently_running=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to print summary {e}")
+                if self.config.flags.staged_execution:
+                    self._run_staged(callback)
+                else:
+                    self._run_serial(callback)
+
+                # Stateful ingestion generates the updated state objects as part of the
+                # source's close method. Because of that, we need to close the source
+                # before we call process_commits.
+                self.inner_exit_stack.close()
+
+                self.process_commits()
+                self.final_status = PipelineStatus.COMPLETED
+
+            except (SystemExit, KeyboardInterrupt):
+                self.final_status = PipelineStatus.CANCELLED
+                logger.error("Caught error", exc_info=True)
+                raise
+            except Exception as exc:
+                self.final_status = PipelineStatus.ERROR
+                self._handle_uncaught_pipeline_exception(exc)
+            finally:
+                clear_global_warnings()
 
+    def _run_serial(self, callback: WriteCallback) -> None:
+        for wu in itertools.islice(
+            self.source.get_workunits(),
+            self.preview_workunits if self.preview_mode else None,
+        ):
+            try:
+                if self._time_to_print() and not self.no_progress:
+                    self.pretty_print_summary(currently_running=True)
+            except Exception as e:
+                logger.warning(f"Failed to print summary {e}")
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_start(wu)
+            try:
+                # Most of this code is meant to be fully stream-based instead of generating all records into memory.
+                # However, the extractor in particular will never generate a particularly large list. We want the
+                # exception reporting to be associated with the source, and not the transformer. As such, we
+                # need to materialize the generator returned by get_records().
+                record_envelopes = list(self.extractor.get_records(wu))
+            except Exception as e:
+                self.source.get_report().failure(
+                    "Source produced bad metadata", context=wu.id, exc=e
+                )
+                continue
+            try:
+                for record_envelope in self.transform(record_envelopes):
                     if not self.dry_run:
-                        self.sink.handle_work_unit_start(wu)
+                        try:
+                            self.sink.write_record_async(record_envelope, callback)
+                        except Exception as e:
+                            # In case the sink's error handling is bad, we still want to report the error.
+                            self.sink.report.report_failure(
+                                f"Failed to write record: {e}"
+                            )
+
+            except (RuntimeError, SystemExit):
+                raise
+            except Exception:
+                logger.error(
+                    "Failed to process some records. Continuing.",
+                    exc_info=True,
+                )
+                # TODO: Transformer errors should be reported more loudly / as part of the pipeline report.
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_end(wu)
+
+        # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+        for record_envelope in self.transform(
+            [
+                RecordEnvelope(
+                    record=EndOfStream(),
+                    metadata={"workunit_id": "end-of-stream"},
+                )
+            ]
+        ):
+            if not self.dry_run and not isinstance(record_envelope.record, EndOfStream):
+                # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
+                self.sink.write_record_async(record_envelope, callback)
+
+    def _run_staged(self, callback: WriteCallback) -> None:
+        """Runs the source, transformers, and sink on separate stages.
+
+        The source (plus extractor) and the transformers each run on their own thread,
+        while the sink is driven from the main thread. Stages are connected by bounded
+        queues, so a slow stage applies backpressure to the ones before it instead of
+        letting work pile up in memory.
+        """
+
+        queue_size = self.config.flags.staged_execution_queue_size
+        stop_event = threading.Event()
+        source_stage_report = PipelineStageReport()
+        transform_stage_report = PipelineStageReport()
+        sink_stage_report = PipelineStageReport(_start_time=time.perf_counter())
+        self.cli_report.pipeline_stages = {
+            "source": source_stage_report,
+            "transform": transform_stage_report,
+            "sink": sink_stage_report,
+        }
+
+        extracted: StageQueue[Tuple[MetadataWorkUnit, List[RecordEnvelope]]] = (
+            StageQueue(queue_size, source_stage_report, stop_event)
+        )
+        # The workunit is None for the records generated by the end-of-stream flush.
+        transformed: StageQueue[
+            Tuple[Optional[MetadataWorkUnit], List[RecordEnvelope]]
+        ] = StageQueue(queue_size, transform_stage_report, stop_event)
+
+        def _source_stage() -> None:
+            workunits = iter(
+                itertools.islice(
+                    self.source.get_workunits(),
+                    self.preview_workunits if self.preview_mode else None,
+                )
+            )
+            while True:
+                with source_stage_report.processing_timer:
+                    wu = next(workunits, None)
+                    if wu is None:
+                        break
                     try:
-                        # Most of this code is meant to be fully stream-based instead of generating all records into memory.
-                        # However, the extractor in particular will never generate a particularly large list. We want the
-                        # exception reporting to be associated with the source, and not the transformer. As such, we
-                        # need to materialize the generator returned by get_records().
                         record_envelopes = list(self.extractor.get_records(wu))
                     except Exception as e:
                         self.source.get_report().failure(
                             "Source produced bad metadata", context=wu.id, exc=e
                         )
                         continue
+                extracted.put((wu, record_envelopes))
+
+        def _transform_stage() -> None:
+            for wu, record_envelopes in extracted.consume(transform_stage_report):
+                with transform_stage_report.processing_timer:
+                    transformed_records: List[RecordEnvelope] = []
                     try:
                         for record_envelope in self.transform(record_envelopes):
-                            if not self.dry_run:
-                                try:
-                                    self.sink.write_record_async(
-                                        record_envelope, callback
-                                    )
-                                except Exception as e:
-                                    # In case the sink's error handling is bad, we still want to report the error.
-                                    self.sink.report.report_failure(
-                                        f"Failed to write record: {e}"
-                                    )
-
+                            transformed_records.append(record_envelope)
                     except (RuntimeError, SystemExit):
                         raise
                     except Exception:
@@ -531,43 +653,60 @@ class Pipeline:
                             "Failed to process some records. Continuing.",
                             exc_info=True,
                         )
-                        # TODO: Transformer errors should be reported more loudly / as part of the pipeline report.
-
-                    if not self.dry_run:
+                transformed.put((wu, transformed_records))
+
+            # No more data is coming, so let the transformers flush any state they are holding on to.
+            with transform_stage_report.processing_timer:
+                end_of_stream_records = [
+                    record_envelope
+                    for record_envelope in self.transform(
+                        [
+                            RecordEnvelope(
+                                record=EndOfStream(),
+                                metadata={"workunit_id": "end-of-stream"},
+                            )
+                        ]
+                    )
+                    if not isinstance(record_envelope.record, EndOfStream)
+                ]
+            transformed.put((None, end_of_stream_records))
+
+        threads = [
+            start_stage_thread("source", _source_stage, extracted, source_stage_report),
+            start_stage_thread(
+                "transform", _transform_stage, transformed, transform_stage_report
+            ),
+        ]
+        completed = False
+        try:
+            for wu, record_envelopes in transformed.consume(sink_stage_report):
+                try:
+                    if self._time_to_print() and not self.no_progress:
+                        self.pretty_print_summary(currently_running=True)
+                except Exception as e:
+                    logger.warning(f"Failed to print summary {e}")
+
+                with sink_stage_report.processing_timer:
+                    if not self.dry_run and wu is not None:
+                        self.sink.handle_work_unit_start(wu)
+                    for record_envelope in record_envelopes:
+                        if not self.dry_run:
+                            try:
+                                self.sink.write_record_async(record_envelope, callback)
+                            except Exception as e:
+                                # In case the sink's error handling is bad, we still want to report the error.
+                                self.sink.report.report_failure(
+                                    f"Failed to write record: {e}"
+                                )
+                    if not self.dry_run and wu is not None:
                         self.sink.handle_work_unit_end(wu)
-
-                # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
-                for record_envelope in self.transform(
-                    [
-                        RecordEnvelope(
-                            record=EndOfStream(),
-                            metadata={"workunit_id": "end-of-stream"},
-                        )
-                    ]
-                ):
-                    if not self.dry_run and not isinstance(
-                        record_envelope.record, EndOfStream
-                    ):
-                        # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
-                        self.sink.write_record_async(record_envelope, callback)
-
-                # Stateful ingestion generates the updated state objects as part of the
-                # source's close method. Because of that, we need to close the source
-                # before we call process_commits.
-                self.inner_exit_stack.close()
-
-                self.process_commits()
-                self.final_status = PipelineStatus.COMPLETED
-
-            except (SystemExit, KeyboardInterrupt):
-                self.final_status = PipelineStatus.CANCELLED
-                logger.error("Caught error", exc_info=True)
-                raise
-            except Exception as exc:
-                self.final_status = PipelineStatus.ERROR
-                self._handle_uncaught_pipeline_exception(exc)
-            finally:
-                clear_global_warnings()
+                sink_stage_report.num_items += 1
+            completed = True
+        finally:
+            # If the sink stage failed, this unblocks and cancels the upstream stages.
+            stop_event.set()
+            for thread in threads:
+                thread.join(timeout=None if completed else 1)
 
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
@@ -71,6 +71,51 @@ class FlagsConfig(ConfigModel):
         description="Set system metadata pipeline name. Requires `set_system_metadata` to be enabled.",
     )
 
+    staged_execution: bool = Field(
+        default=False,
+        description=(
+            "Run the source, transformers, and sink as separate pipeline stages connected by bounded queues, "
+            "so that extraction can overlap with transformation and writing. "
+            "Per-stage throughput and queue depth metrics are added to the ingestion report."
+        ),
+    )
+    staged_execution_queue_size: int = Field(
+        default=100,
+        gt=0,
+        description=(
+            "The maximum number of workunits buffered between pipeline stages. "
+            "Requires `staged_execution` to be enabled."
+        ),
+    )
+
+    workunit_shard_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "For sources that split their work into independent shards (e.g. databases or projects), "
+            "the number of shards to process concurrently on separate threads. "
+            "Has no effect on other sources."
+        ),
+    )
+
+    aspect_cache_max_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "The maximum number of aspects the pipeline's DataHub client caches after reading them "
+            "from DataHub, e.g. for transformers with PATCH semantics. 0 disables the cache. "
+            "Writes made through that client invalidate the affected cache entries."
+        ),
+    )
+    aspect_cache_ttl_sec: float = Field(
+        default=300,
+        gt=0,
+        description=(
+            "How long cached aspects are used for, in seconds. "
+            "Requires `aspect_cache_max_size` to be set."
+        ),
+    )
+
 
 def _generate_run_id(source_type: Optional[str] = None) -> str:
     current_time = datetime.datetime.now().strftime("%Y_%m_%d-%H_%M_%S")
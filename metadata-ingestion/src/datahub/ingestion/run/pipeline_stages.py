@@ -0,0 +1,163 @@
+import contextvars
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Iterator, Optional, TypeVar
+
+from datahub.ingestion.api.report import Report
+from datahub.utilities.perf_timer import PerfTimer
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How often blocked queue operations wake up to check for cancellation.
+_QUEUE_POLL_INTERVAL_SECONDS = 0.1
+
+
+@dataclass
+class PipelineStageReport(Report):
+    num_items: int = 0
+    throughput_per_second: Optional[float] = None
+
+    # Time spent doing actual work, vs waiting on the neighbouring stages.
+    processing_timer: PerfTimer = field(default_factory=PerfTimer)
+    waiting_for_input_timer: PerfTimer = field(default_factory=PerfTimer)
+    blocked_on_output_timer: PerfTimer = field(default_factory=PerfTimer)
+
+    output_queue_size: Optional[int] = None
+    output_queue_depth: int = 0
+    peak_output_queue_depth: int = 0
+
+    _start_time: Optional[float] = None
+
+    def compute_stats(self) -> None:
+        if self._start_time is not None:
+            elapsed = time.perf_counter() - self._start_time
+            if elapsed > 0:
+                self.throughput_per_second = round(self.num_items / elapsed, 2)
+        return super().compute_stats()
+
+
+class PipelineStageCancelled(Exception):
+    """Raised inside a stage when the pipeline is stopping, e.g. after a later stage failed."""
+
+
+class _EndOfStage:
+    pass
+
+
+@dataclass
+class _StageError:
+    exc: BaseException
+
+
+class StageQueue(Generic[T]):
+    """A bounded queue connecting two pipeline stages.
+
+    Producers block when the queue is full, which is how backpressure propagates
+    from the sink back to the source. Errors raised by the producer are forwarded
+    to the consumer, and the consumer can cancel the producer via `stop_event`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        producer_report: PipelineStageReport,
+        stop_event: threading.Event,
+    ):
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=maxsize)
+        self._producer_report = producer_report
+        self._producer_report.output_queue_size = maxsize
+        self._stop_event = stop_event
+
+    def _put(self, item: object) -> None:
+        with self._producer_report.blocked_on_output_timer:
+            while True:
+                if self._stop_event.is_set():
+                    raise PipelineStageCancelled()
+                try:
+                    self._queue.put(item, timeout=_QUEUE_POLL_INTERVAL_SECONDS)
+                    break
+                except queue.Full:
+                    continue
+
+        depth = self._queue.qsize()
+        self._producer_report.output_queue_depth = depth
+        self._producer_report.peak_output_queue_depth = max(
+            self._producer_report.peak_output_queue_depth, depth
+        )
+
+    def put(self, item: T) -> None:
+        self._producer_report.num_items += 1
+        self._put(item)
+
+    def close(self) -> None:
+        self._put(_EndOfStage())
+
+    def fail(self, exc: BaseException) -> None:
+        self._put(_StageError(exc))
+
+    def _get(self) -> object:
+        while True:
+            # If a later stage failed, the producer may have been cancelled without
+            # closing the queue, so we can't wait on it indefinitely.
+            if self._stop_event.is_set():
+                raise PipelineStageCancelled()
+            try:
+                return self._queue.get(timeout=_QUEUE_POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def consume(self, consumer_report: PipelineStageReport) -> Iterator[T]:
+        while True:
+            with consumer_report.waiting_for_input_timer:
+                item = self._get()
+            self._producer_report.output_queue_depth = self._queue.qsize()
+
+            if isinstance(item, _EndOfStage):
+                return
+            elif isinstance(item, _StageError):
+                raise item.exc
+            yield item  # type: ignore[misc]
+
+
+def start_stage_thread(
+    name: str,
+    target: Callable[[], None],
+    output: StageQueue,
+    report: PipelineStageReport,
+) -> threading.Thread:
+    """Runs `target` on a new thread, closing `output` once it completes.
+
+    The thread runs in a copy of the caller's context, so that context variables
+    (e.g. the global graph context) are visible to the stage.
+    """
+
+    context = contextvars.copy_context()
+
+    def _run() -> None:
+        report._start_time = time.perf_counter()
+        try:
+            context.run(target)
+        except PipelineStageCancelled:
+            logger.debug(f"Pipeline stage {name} was cancelled")
+            return
+        except BaseException as e:
+            logger.debug(f"Pipeline stage {name} failed: {e}", exc_info=True)
+            try:
+                output.fail(e)
+            except PipelineStageCancelled:
+                pass
+            return
+
+        try:
+            output.close()
+        except PipelineStageCancelled:
+            pass
+
+    thread = threading.Thread(target=_run, name=f"pipeline-stage-{name}", daemon=True)
+    thread.start()
+    return thread
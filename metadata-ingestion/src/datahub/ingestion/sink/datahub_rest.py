@@ -6,7 +6,7 @@ import logging
 import threading
 import uuid
 from enum import auto
-from typing import List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pydantic
 
@@ -19,6 +19,7 @@ from datahub.configuration.env_vars import (
     get_rest_sink_default_max_threads,
     get_rest_sink_default_mode,
 )
+from datahub.emitter.async_rest_emitter import DataHubAsyncRestEmitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.emitter.rest_emitter import (
@@ -26,6 +27,7 @@ from datahub.emitter.rest_emitter import (
     DEFAULT_REST_EMITTER_ENDPOINT,
     DataHubRestEmitter,
     EmitMode,
+    RestEmitterStats,
     RestSinkEndpoint,
 )
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
@@ -42,11 +44,12 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.utilities.partition_executor import (
+    AsyncBatchPartitionExecutor,
     BatchPartitionExecutor,
     PartitionExecutor,
 )
 from datahub.utilities.perf_timer import PerfTimer
-from datahub.utilities.server_config_util import set_gms_config
+from datahub.utilities.server_config_util import RestServiceConfig, set_gms_config
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +65,11 @@ class RestSinkMode(ConfigEnum):
     # https://github.com/datahub-project/datahub/pull/10706
     ASYNC_BATCH = auto()
 
+    # Same batching semantics as ASYNC_BATCH, but batches are emitted using asyncio.
+    # This allows many more batches to be in flight at once (bounded by max_pending_requests),
+    # multiplexed over a pool of at most max_connections connections.
+    ASYNCIO_BATCH = auto()
+
 
 _DEFAULT_REST_SINK_MODE = pydantic.parse_obj_as(
     RestSinkMode, get_rest_sink_default_mode() or RestSinkMode.ASYNC_BATCH
@@ -80,6 +88,12 @@ class DatahubRestSinkConfig(DatahubClientConfig):
     # Only applies in async batch mode.
     max_per_batch: pydantic.PositiveInt = 100
 
+    # Only applies in asyncio batch mode.
+    max_connections: pydantic.PositiveInt = 50
+
+    # Request bodies are only compressed if the server advertises support for it.
+    request_compression: bool = True
+
     @pydantic.validator("max_per_batch", always=True)
     def validate_max_per_batch(cls, v):
         if v > BATCH_INGEST_MAX_PAYLOAD_LENGTH:
@@ -102,6 +116,11 @@ class DataHubRestSinkReport(SinkReport):
 
     main_thread_blocking_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
 
+    # Shared by all of the sink's emitters.
+    emitter_stats: RestEmitterStats = dataclasses.field(
+        default_factory=RestEmitterStats
+    )
+
     def compute_stats(self) -> None:
         super().compute_stats()
 
@@ -129,6 +148,8 @@ def _get_partition_key(record_envelope: RecordEnvelope) -> str:
 
 class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
     _emitter_thread_local: threading.local
+    # Fetched once by the first emitter, and shared with the others.
+    _server_config: Optional[RestServiceConfig] = None
     treat_errors_as_warnings: bool = False
 
     def __post_init__(self) -> None:
@@ -141,6 +162,8 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 f"💥 Failed to connect to DataHub with {repr(self.emitter)}"
             ) from exc
 
+        self._server_config = gms_config
+
         self.report.gms_version = gms_config.service_version
         self.report.mode = self.config.mode
         self.report.endpoint = self.config.endpoint
@@ -149,8 +172,23 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         logger.debug("Setting gms config")
         set_gms_config(gms_config)
 
-        self.executor: Union[PartitionExecutor, BatchPartitionExecutor]
-        if self.config.mode == RestSinkMode.ASYNC_BATCH:
+        self.executor: Union[
+            PartitionExecutor, BatchPartitionExecutor, AsyncBatchPartitionExecutor
+        ]
+        if self.config.mode == RestSinkMode.ASYNCIO_BATCH:
+            self._async_emitter = DataHubAsyncRestEmitter(
+                **self._get_emitter_kwargs(self.config),
+                max_connections=self.config.max_connections,
+                stats=self.report.emitter_stats,
+            )
+            self._async_emitter.set_server_config(gms_config)
+            self.executor = AsyncBatchPartitionExecutor(
+                max_pending=self.config.max_pending_requests,
+                process_batch=self._emit_batch_wrapper_async,
+                max_per_batch=self.config.max_per_batch,
+                on_shutdown=self._async_emitter.close_async,
+            )
+        elif self.config.mode == RestSinkMode.ASYNC_BATCH:
             self.executor = BatchPartitionExecutor(
                 max_workers=self.config.max_threads,
                 max_pending=self.config.max_pending_requests,
@@ -164,10 +202,10 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             )
 
     @classmethod
-    def _make_emitter(cls, config: DatahubRestSinkConfig) -> DataHubRestEmitter:
-        return DataHubRestEmitter(
-            config.server,
-            config.token,
+    def _get_emitter_kwargs(cls, config: DatahubRestSinkConfig) -> Dict[str, Any]:
+        return dict(
+            gms_server=config.server,
+            token=config.token,
             connect_timeout_sec=config.timeout_sec,  # reuse timeout_sec for connect timeout
             read_timeout_sec=config.timeout_sec,
             retry_status_codes=config.retry_status_codes,
@@ -179,8 +217,17 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             openapi_ingestion=config.endpoint == RestSinkEndpoint.OPENAPI,
             client_mode=config.client_mode,
             datahub_component=config.datahub_component,
+            request_compression=config.request_compression,
         )
 
+    @classmethod
+    def _make_emitter(
+        cls,
+        config: DatahubRestSinkConfig,
+        stats: Optional[RestEmitterStats] = None,
+    ) -> DataHubRestEmitter:
+        return DataHubRestEmitter(**cls._get_emitter_kwargs(config), stats=stats)
+
     @property
     def emitter(self) -> DataHubRestEmitter:
         # While this is a property, it actually uses one emitter per thread.
@@ -190,7 +237,12 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         thread_local = self._emitter_thread_local
         if not hasattr(thread_local, "emitter"):
             self.config.client_mode = ClientMode.INGESTION
-            thread_local.emitter = DatahubRestSink._make_emitter(self.config)
+            thread_local.emitter = DatahubRestSink._make_emitter(
+                self.config, stats=self.report.emitter_stats
+            )
+            if self._server_config is not None:
+                # The request encoding is negotiated via the server config.
+                thread_local.emitter.set_server_config(self._server_config)
         return thread_local.emitter
 
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
@@ -258,8 +310,8 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         # TODO: Add timing metrics
         self.emitter.emit(record, emit_mode=emit_mode)
 
-    def _emit_batch_wrapper(
-        self,
+    @staticmethod
+    def _unpack_batch(
         records: List[
             Tuple[
                 Union[
@@ -269,7 +321,7 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 ],
             ]
         ],
-    ) -> None:
+    ) -> List[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]]:
         events: List[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]] = []
 
         for record in records:
@@ -282,7 +334,43 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             else:
                 events.append(event)
 
+        return events
+
+    def _emit_batch_wrapper(
+        self,
+        records: List[
+            Tuple[
+                Union[
+                    MetadataChangeEvent,
+                    MetadataChangeProposal,
+                    MetadataChangeProposalWrapper,
+                ],
+            ]
+        ],
+    ) -> None:
+        events = self._unpack_batch(records)
         chunks = self.emitter.emit_mcps(events, emit_mode=EmitMode.ASYNC)
+        self._report_batch_emitted(chunks)
+
+    async def _emit_batch_wrapper_async(
+        self,
+        records: List[
+            Tuple[
+                Union[
+                    MetadataChangeEvent,
+                    MetadataChangeProposal,
+                    MetadataChangeProposalWrapper,
+                ],
+            ]
+        ],
+    ) -> None:
+        events = self._unpack_batch(records)
+        chunks = await self._async_emitter.emit_mcps_async(
+            events, emit_mode=EmitMode.ASYNC
+        )
+        self._report_batch_emitted(chunks)
+
+    def _report_batch_emitted(self, chunks: int) -> None:
         self.report.async_batches_prepared += 1
         if chunks > 1:
             self.report.async_batches_split += chunks
@@ -319,8 +407,13 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                     ),
                 )
                 self.report.pending_requests += 1
-            elif self.config.mode == RestSinkMode.ASYNC_BATCH:
-                assert isinstance(self.executor, BatchPartitionExecutor)
+            elif self.config.mode in (
+                RestSinkMode.ASYNC_BATCH,
+                RestSinkMode.ASYNCIO_BATCH,
+            ):
+                assert isinstance(
+                    self.executor, (BatchPartitionExecutor, AsyncBatchPartitionExecutor)
+                )
                 partition_key = _get_partition_key(record_envelope)
                 self.executor.submit(
                     partition_key,
@@ -357,6 +450,10 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         with self.report.main_thread_blocking_timer:
             self.executor.shutdown()
 
+        if self.config.mode == RestSinkMode.ASYNCIO_BATCH:
+            # The executor already closed the aiohttp session, on its event loop.
+            self._async_emitter.close()
+
     def __repr__(self) -> str:
         return self.emitter.__repr__()
 
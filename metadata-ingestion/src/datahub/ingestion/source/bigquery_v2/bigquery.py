@@ -362,6 +362,10 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
     def get_report(self) -> BigQueryV2Report:
         return self.report
 
+    def close(self) -> None:
+        self.bq_schema_extractor.close()
+        super().close()
+
     def add_config_to_report(self):
         self.report.include_table_lineage = self.config.include_table_lineage
         self.report.use_date_sharded_audit_log_tables = (
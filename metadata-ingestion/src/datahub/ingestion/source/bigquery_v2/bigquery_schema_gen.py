@@ -226,6 +226,9 @@ class BigQuerySchemaGenerator:
             )
         )
 
+    def close(self) -> None:
+        self.classification_handler.close()
+
     @property
     def store_table_refs(self):
         return (
@@ -117,6 +117,18 @@ class BigQueryQueriesExtractorConfig(BigQueryBaseConfig):
         "See [this](https://cloud.google.com/bigquery/docs/information-schema-jobs#scope_and_syntax) for details.",
     )
 
+    parallel_sql_parsing_workers: Optional[int] = Field(
+        default=None,
+        description="[Advanced] If set to more than 1, observed queries are parsed in this many worker processes "
+        "instead of on the main thread. Useful for very large query logs, where SQL parsing is the bottleneck.",
+    )
+
+    sql_parsing_cache_path: Optional[pathlib.Path] = Field(
+        default=None,
+        description="[Advanced] Path to a local file used to cache SQL parsing results across runs. "
+        "Recurring queries are only re-parsed if the schemas of the tables they reference have changed.",
+    )
+
 
 class BigQueryQueriesExtractor(Closeable):
     """
@@ -188,6 +200,8 @@ class BigQueryQueriesExtractor(Closeable):
             is_temp_table=self.is_temp_table,
             is_allowed_table=self.is_allowed_table,
             format_queries=False,
+            parallel_parsing_workers=self.config.parallel_sql_parsing_workers,
+            parse_cache_path=self.config.sql_parsing_cache_path,
         )
 
         self.report.sql_aggregator = self.aggregator.report
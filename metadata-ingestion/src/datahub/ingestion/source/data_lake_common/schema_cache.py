@@ -0,0 +1,72 @@
+import json
+import pathlib
+import threading
+from datetime import timedelta
+from typing import List, Optional
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.metadata.schema_classes import SchemaFieldClass
+from datahub.utilities.file_backed_collections import PersistentFileBackedDict
+
+_CACHE_TABLE_NAME = "schema_cache"
+
+DEFAULT_SCHEMA_CACHE_TTL = timedelta(days=30)
+
+
+class PersistentSchemaCache(Closeable):
+    """A persistent cache of inferred schemas, stored in a local SQLite file.
+
+    Entries are keyed by the path and ETag of the file the schema was inferred from,
+    along with the settings that affect inference. Since the ETag changes whenever
+    the object is overwritten, files which haven't changed since a previous run
+    don't need to be read again.
+
+    The cache can be used from multiple threads.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        ttl: timedelta = DEFAULT_SCHEMA_CACHE_TTL,
+    ):
+        self.path = path
+        self.ttl = ttl
+
+        # The fields are stored serialized, since callers (e.g. transformers)
+        # may modify the emitted fields in place.
+        self._cache = PersistentFileBackedDict[str](
+            path=path,
+            tablename=_CACHE_TABLE_NAME,
+            ttl=ttl,
+        )
+        # FileBackedDict only guards the connection, not its in-memory cache.
+        self._lock = threading.Lock()
+
+    @classmethod
+    def make_key(
+        cls,
+        path: str,
+        e_tag: str,
+        extension: str,
+        content_type: Optional[str],
+        max_rows: int,
+    ) -> str:
+        return json.dumps([path, e_tag, extension, content_type, max_rows])
+
+    def get(self, key: str) -> Optional[List[SchemaFieldClass]]:
+        with self._lock:
+            fields_json = self._cache.get(key)
+        if fields_json is None:
+            return None
+        return [SchemaFieldClass.from_obj(field) for field in json.loads(fields_json)]
+
+    def set(self, key: str, fields: List[SchemaFieldClass]) -> None:
+        with self._lock:
+            self._cache[key] = json.dumps([field.to_obj() for field in fields])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def close(self) -> None:
+        self._cache.close()
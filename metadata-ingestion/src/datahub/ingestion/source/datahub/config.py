@@ -69,6 +69,18 @@ class DataHubSourceConfig(StatefulIngestionConfigBase):
         description="Number of records to fetch from the database at a time",
     )
 
+    database_partitions: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of urn ranges to split the versioned aspects table into. "
+            "Each range is read over its own database connection, in parallel. "
+            "All aspects of an entity belong to the same range, so they are still ingested in order. "
+            "Progress is checkpointed per range, and an interrupted run resumes with the same ranges. "
+            "The connection pool is sized to match, unless `pool_size` is set in the connection options."
+        ),
+    )
+
     database_table_name: str = Field(
         default=DEFAULT_DATABASE_TABLE_NAME,
         description="Name of database table containing all versioned aspects",
@@ -2,7 +2,17 @@ import json
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from sqlalchemy import create_engine, text
 
@@ -14,6 +24,7 @@ from datahub.ingestion.source.datahub.report import DataHubSourceReport
 from datahub.ingestion.source.sql.sql_config import SQLAlchemyConnectionConfig
 from datahub.metadata.schema_classes import SystemMetadataClass
 from datahub.utilities.lossy_collections import LossyDict, LossyList
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +35,24 @@ DATE_FORMAT = "%Y-%m-%d"
 ROW = TypeVar("ROW", bound=Dict[str, Any])
 
 
+class UrnRange(NamedTuple):
+    """A range of urns, from `lower` (inclusive) to `upper` (exclusive).
+
+    The first range has an empty `lower` bound and the last one has no `upper` bound.
+    """
+
+    lower: str
+    upper: Optional[str]
+
+    @classmethod
+    def from_bounds(cls, bounds: List[str]) -> List["UrnRange"]:
+        """Splits all urns into ranges, given the sorted lower bound of each range."""
+        return [
+            cls(lower, bounds[i + 1] if i + 1 < len(bounds) else None)
+            for i, lower in enumerate(bounds)
+        ]
+
+
 class VersionOrderer(Generic[ROW]):
     """Orders rows by (createdon, version == 0).
 
@@ -81,9 +110,13 @@ class DataHubDatabaseReader:
     ):
         self.config = config
         self.report = report
+        options = dict(connection_config.options)
+        if config.database_partitions > 1:
+            # Each urn range is read over its own connection, all at the same time.
+            options.setdefault("pool_size", config.database_partitions)
         self.engine = create_engine(
             url=connection_config.get_sql_alchemy_url(),
-            **connection_config.options,
+            **options,
         )
 
         # Cache for available dates to avoid redundant queries
@@ -120,9 +153,15 @@ class DataHubDatabaseReader:
             # For other databases (e.g., MySQL), use JSON_EXTRACT.
             return "JSON_EXTRACT(metadata, '$.removed')"
 
-    def query(self, set_structured_properties_filter: bool) -> str:
+    def query(
+        self,
+        set_structured_properties_filter: bool,
+        urn_range: Optional[UrnRange] = None,
+    ) -> str:
         """
         Main query that gets data for specified date range with appropriate filters.
+
+        If `urn_range` is set, only aspects of urns in that range are returned.
         """
         structured_prop_filter = f" AND urn {'' if set_structured_properties_filter else 'NOT'} like 'urn:li:structuredProperty:%%'"
 
@@ -151,11 +190,13 @@ class DataHubDatabaseReader:
                 {"" if not self.config.exclude_aspects else "AND mav.aspect NOT IN %(exclude_aspects)s"}
                 AND mav.createdon >= %(since_createdon)s
                 AND mav.createdon < %(end_createdon)s
+                {"" if urn_range is None else "AND mav.urn >= %(urn_lower)s"}
+                {"" if urn_range is None or urn_range.upper is None else "AND mav.urn < %(urn_upper)s"}
             ORDER BY
-                createdon,
-                urn,
-                aspect,
-                version
+                mav.createdon,
+                mav.urn,
+                mav.aspect,
+                mav.version
         ) as t
         WHERE 1=1
             {"" if self.config.include_soft_deleted_entities else " AND (removed = false or removed is NULL)"}
@@ -223,6 +264,7 @@ class DataHubDatabaseReader:
         end_date: datetime,
         set_structured_properties_filter: bool,
         limit: int,
+        urn_range: Optional[UrnRange] = None,
     ) -> Iterable[Dict[str, Any]]:
         """
         Retrieves data rows within a specified date range using pagination.
@@ -240,6 +282,7 @@ class DataHubDatabaseReader:
         end_date: End of date range (exclusive)
         set_structured_properties_filter: Whether to apply structured filtering
         limit: Maximum rows to fetch per query
+        urn_range: Only fetch rows for urns in this range, if set
 
         Returns:
             An iterable of database rows as dictionaries
@@ -251,7 +294,9 @@ class DataHubDatabaseReader:
         while True:
             try:
                 # Set up query and parameters - using named parameters
-                query = self.query(set_structured_properties_filter)
+                query = self.query(
+                    set_structured_properties_filter, urn_range=urn_range
+                )
                 params: Dict[str, Any] = {
                     "since_createdon": start_date.strftime(DATETIME_FORMAT),
                     "end_createdon": end_date.strftime(DATETIME_FORMAT),
@@ -260,6 +305,9 @@ class DataHubDatabaseReader:
                     # Always pass exclude_aspects as a tuple, postgres doesn't support lists
                     "exclude_aspects": tuple(self.config.exclude_aspects),
                 }
+                if urn_range is not None:
+                    params["urn_lower"] = urn_range.lower
+                    params["urn_upper"] = urn_range.upper
 
                 logger.info(
                     f"Querying data from {start_date.strftime(DATETIME_FORMAT)} to {end_date.strftime(DATETIME_FORMAT)} "
@@ -302,14 +350,25 @@ class DataHubDatabaseReader:
                 raise
 
     def get_all_aspects(
-        self, from_createdon: datetime, stop_time: datetime
-    ) -> Iterable[Tuple[MetadataChangeProposalWrapper, datetime]]:
+        self,
+        from_createdon: datetime,
+        stop_time: datetime,
+        partition_progress: Optional[Dict[str, datetime]] = None,
+    ) -> Iterable[Tuple[MetadataChangeProposalWrapper, datetime, Optional[str]]]:
+        """Yields all aspects, along with their createdon timestamp and partition.
+
+        If `partition_progress` is set, aspects other than structured properties are
+        read in urn ranges, in parallel. It maps the lower bound of each range, see
+        `get_urn_ranges`, to the timestamp to read that range from. The partition of
+        those aspects is the lower bound of their range, and `None` otherwise.
+        """
         logger.info("Fetching Structured properties aspects")
-        yield from self.get_aspects(
+        for mcp, createdon in self.get_aspects(
             from_createdon=from_createdon,
             stop_time=stop_time,
             set_structured_properties_filter=True,
-        )
+        ):
+            yield mcp, createdon, None
 
         logger.info(
             f"Waiting for {self.config.structured_properties_template_cache_invalidation_interval} seconds for structured properties cache to invalidate"
@@ -320,11 +379,21 @@ class DataHubDatabaseReader:
         )
 
         logger.info("Fetching aspects")
-        yield from self.get_aspects(
-            from_createdon=from_createdon,
-            stop_time=stop_time,
-            set_structured_properties_filter=False,
-        )
+        if partition_progress:
+            yield from self.get_partitioned_aspects(
+                {
+                    urn_range: partition_progress[urn_range.lower]
+                    for urn_range in UrnRange.from_bounds(sorted(partition_progress))
+                },
+                stop_time=stop_time,
+            )
+        else:
+            for mcp, createdon in self.get_aspects(
+                from_createdon=from_createdon,
+                stop_time=stop_time,
+                set_structured_properties_filter=False,
+            ):
+                yield mcp, createdon, None
 
     def get_aspects(
         self,
@@ -346,6 +415,82 @@ class DataHubDatabaseReader:
             if mcp:
                 yield mcp, row["createdon"]
 
+    def get_urn_ranges(self, num_partitions: int) -> List[UrnRange]:
+        """Splits the urns into ranges holding a similar number of rows.
+
+        All boundaries are found in a single ordered pass over the primary key,
+        which starts with the urn. Fewer ranges are returned if there aren't enough
+        distinct urns.
+        """
+        table = self.engine.dialect.identifier_preparer.quote(
+            self.config.database_table_name
+        )
+        rows = self.execute_with_params(
+            f"""
+            SELECT MIN(urn) AS lower
+            FROM (
+                SELECT urn, NTILE({int(num_partitions)}) OVER (ORDER BY urn) AS tile
+                FROM {table}
+            ) AS tiles
+            GROUP BY tile
+            ORDER BY lower
+            """,
+            {},
+        )
+
+        # The first range also covers urns that sort before any existing one.
+        bounds = [""]
+        for row in rows[1:]:
+            if row["lower"] > bounds[-1]:
+                bounds.append(row["lower"])
+
+        urn_ranges = UrnRange.from_bounds(bounds)
+        logger.info(f"Split the aspects table into {len(urn_ranges)} urn ranges")
+        return urn_ranges
+
+    def get_partitioned_aspects(
+        self, partitions: Dict[UrnRange, datetime], stop_time: datetime
+    ) -> Iterable[Tuple[MetadataChangeProposalWrapper, datetime, str]]:
+        """Reads each urn range over its own connection, in parallel.
+
+        Aspects of different urns are interleaved, but all aspects of an urn come from
+        the same range, so they're still yielded in (createdon, version) order.
+        """
+        self.report.num_database_partitions = len(partitions)
+        errors: List[Exception] = []
+
+        def _read_partition(
+            urn_range: UrnRange, from_createdon: datetime
+        ) -> Iterable[Tuple[Dict[str, Any], str]]:
+            orderer = VersionOrderer[Dict[str, Any]](
+                enabled=self.config.include_all_versions
+            )
+            try:
+                rows = self._get_rows(
+                    start_date=from_createdon,
+                    end_date=stop_time,
+                    set_structured_properties_filter=False,
+                    limit=self.config.database_query_batch_size,
+                    urn_range=urn_range,
+                )
+                for row in orderer(rows):
+                    yield row, urn_range.lower
+            except Exception as e:
+                # The executor doesn't surface worker errors, so re-raise them below.
+                errors.append(e)
+
+        for row, partition in ThreadedIteratorExecutor.process(
+            worker_func=_read_partition,
+            args_list=list(partitions.items()),
+            max_workers=len(partitions),
+        ):
+            mcp = self._parse_row(row)
+            if mcp:
+                yield mcp, row["createdon"], partition
+
+        if errors:
+            raise errors[0]
+
     def get_soft_deleted_rows(self) -> Iterable[Dict[str, Any]]:
         """
         Fetches all soft-deleted entities from the database using pagination.
@@ -94,7 +94,9 @@ class DataHubSource(StatefulIngestionSourceBase):
             )
 
             yield from self._get_database_workunits(
-                from_createdon=state.database_createdon_datetime, reader=database_reader
+                from_createdon=state.database_createdon_datetime,
+                partition_progress=state.database_partition_createdon_datetimes,
+                reader=database_reader,
             )
             self._commit_progress()
         else:
@@ -123,12 +125,33 @@ class DataHubSource(StatefulIngestionSourceBase):
             )
 
     def _get_database_workunits(
-        self, from_createdon: datetime, reader: DataHubDatabaseReader
+        self,
+        from_createdon: datetime,
+        partition_progress: Dict[str, datetime],
+        reader: DataHubDatabaseReader,
     ) -> Iterable[MetadataWorkUnit]:
         logger.info(f"Fetching database aspects starting from {from_createdon}")
         progress = ProgressTimer(report_every=timedelta(seconds=60))
-        mcps = reader.get_all_aspects(from_createdon, self.report.stop_time)
-        for i, (mcp, createdon) in enumerate(mcps):
+
+        if partition_progress:
+            logger.info(
+                f"Resuming {len(partition_progress)} urn ranges from the last checkpoint"
+            )
+        elif self.config.database_partitions > 1:
+            partition_progress = {
+                urn_range.lower: from_createdon
+                for urn_range in reader.get_urn_ranges(self.config.database_partitions)
+            }
+            # Record every range up front, so a resumed run reads the same ranges.
+            for partition, createdon in partition_progress.items():
+                self.stateful_ingestion_handler.update_checkpoint(
+                    last_createdon=createdon, database_partition=partition
+                )
+
+        mcps = reader.get_all_aspects(
+            from_createdon, self.report.stop_time, partition_progress=partition_progress
+        )
+        for i, (mcp, createdon, partition) in enumerate(mcps):
             if not self.urn_pattern.allowed(str(mcp.entityUrn)):
                 continue
 
@@ -145,10 +168,16 @@ class DataHubSource(StatefulIngestionSourceBase):
                 or not self.report.num_database_parse_errors
             ):
                 self.stateful_ingestion_handler.update_checkpoint(
-                    last_createdon=createdon
+                    last_createdon=createdon, database_partition=partition
                 )
             self._commit_progress(i)
 
+        if (
+            self.config.commit_with_parse_errors
+            or not self.report.num_database_parse_errors
+        ):
+            self.stateful_ingestion_handler.complete_database_partitions()
+
     def _get_kafka_workunits(
         self, from_offsets: Dict[int, int], soft_deleted_urns: List[str]
     ) -> Iterable[MetadataWorkUnit]:
@@ -13,6 +13,7 @@ class DataHubSourceReport(StatefulIngestionReport):
 
     num_database_aspects_ingested: int = 0
     num_database_parse_errors: int = 0
+    num_database_partitions: int = 0
     # error -> aspect -> [urn]
     database_parse_errors: LossyDict[str, LossyDict[str, LossyList[str]]] = field(
         default_factory=LossyDict
@@ -18,6 +18,12 @@ if TYPE_CHECKING:
 class DataHubIngestionState(CheckpointStateBase):
     database_createdon_ts: NonNegativeInt = 0
 
+    # Maps the lower urn bound of each partition -> createdon timestamp.
+    # Only set while a partitioned read of the database is in progress.
+    database_partition_createdon_ts: Dict[str, NonNegativeInt] = Field(
+        default_factory=dict
+    )
+
     # Maps partition -> offset
     kafka_offsets: Dict[int, NonNegativeInt] = Field(default_factory=dict)
 
@@ -27,6 +33,13 @@ class DataHubIngestionState(CheckpointStateBase):
             self.database_createdon_ts / 1000, tz=timezone.utc
         )
 
+    @property
+    def database_partition_createdon_datetimes(self) -> Dict[str, datetime]:
+        return {
+            partition: datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
+            for partition, ts in self.database_partition_createdon_ts.items()
+        }
+
 
 class PartitionOffset(NamedTuple):
     partition: int
@@ -77,16 +90,33 @@ class StatefulDataHubIngestionHandler(
         self,
         *,
         last_createdon: Optional[datetime] = None,
+        database_partition: Optional[str] = None,
         last_offset: Optional[PartitionOffset] = None,
     ) -> None:
         cur_checkpoint = self.state_provider.get_current_checkpoint(self.job_id)
         if cur_checkpoint:
             cur_state = cast(DataHubIngestionState, cur_checkpoint.state)
-            if last_createdon:
+            if last_createdon and database_partition is not None:
+                cur_state.database_partition_createdon_ts[database_partition] = int(
+                    last_createdon.timestamp() * 1000
+                )
+            elif last_createdon:
                 cur_state.database_createdon_ts = int(last_createdon.timestamp() * 1000)
             if last_offset:
                 cur_state.kafka_offsets[last_offset.partition] = last_offset.offset + 1
 
+    def complete_database_partitions(self) -> None:
+        """Folds the progress of a completed partitioned read into the createdon timestamp."""
+        cur_checkpoint = self.state_provider.get_current_checkpoint(self.job_id)
+        if cur_checkpoint:
+            cur_state = cast(DataHubIngestionState, cur_checkpoint.state)
+            if cur_state.database_partition_createdon_ts:
+                cur_state.database_createdon_ts = max(
+                    cur_state.database_createdon_ts,
+                    *cur_state.database_partition_createdon_ts.values(),
+                )
+                cur_state.database_partition_createdon_ts = {}
+
     def commit_checkpoint(self) -> None:
         if self.state_provider.ingestion_checkpointing_state_provider:
             self.state_provider.prepare_for_commit()
@@ -568,6 +568,10 @@ class DynamoDBSource(StatefulIngestionSourceBase):
     def get_report(self) -> DynamoDBSourceReport:
         return self.report
 
+    def close(self) -> None:
+        self.classification_handler.close()
+        super().close()
+
     def _get_domain_wu(
         self, dataset_name: str, entity_urn: str
     ) -> Iterable[MetadataWorkUnit]:
@@ -1,10 +1,13 @@
 import pathlib
-from typing import Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import lkml
 import lkml.simple
 import lkml.tree
 
+if TYPE_CHECKING:
+    from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
+
 # Patch lkml to support the manifest.lkml files.
 # We have to patch both locations because lkml uses a immutable tuple
 # instead of a list for this type.
@@ -18,11 +21,26 @@ lkml.simple.PLURAL_KEYS = (
 lkml.tree.PLURAL_KEYS = lkml.simple.PLURAL_KEYS
 
 
-def load_lkml(path: Union[str, pathlib.Path]) -> dict:
-    """Loads a LookML file from disk and returns a dictionary."""
+def parse_lkml(text: str) -> dict:
+    """Parses the contents of a LookML file and returns a dictionary."""
 
     # Using this method instead of lkml.load directly ensures
     # that our patches to lkml are applied.
 
+    return lkml.load(text)
+
+
+def load_lkml(
+    path: Union[str, pathlib.Path], parse_cache: Optional["LookMLParseCache"] = None
+) -> dict:
+    """Loads a LookML file from disk and returns a dictionary.
+
+    If a parse cache is given, the file is only parsed if it isn't in the cache yet.
+    """
+
     with open(path) as file:
-        return lkml.load(file)
+        text = file.read()
+
+    if parse_cache is not None:
+        return parse_cache.load(text)
+    return parse_lkml(text)
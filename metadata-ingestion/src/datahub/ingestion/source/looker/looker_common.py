@@ -1,12 +1,14 @@
 import datetime
+import functools
 import itertools
 import logging
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field as dataclasses_field
 from enum import Enum
-from functools import lru_cache
 from typing import (
     Dict,
     Iterable,
@@ -20,6 +22,7 @@ from typing import (
     cast,
 )
 
+import cachetools
 from looker_sdk.error import SDKError
 from looker_sdk.rtl.serialize import DeserializeError
 from looker_sdk.sdk.api40.models import (
@@ -50,7 +53,10 @@ from datahub.ingestion.source.looker.looker_config import (
 from datahub.ingestion.source.looker.looker_constant import IMPORTED_PROJECTS
 from datahub.ingestion.source.looker.looker_dataclasses import ProjectInclude
 from datahub.ingestion.source.looker.looker_file_loader import LookerViewFileLoader
-from datahub.ingestion.source.looker.looker_lib_wrapper import LookerAPI
+from datahub.ingestion.source.looker.looker_lib_wrapper import (
+    LookerAPI,
+    LookerExploreCacheStats,
+)
 from datahub.ingestion.source.looker.lookml_config import (
     BASE_PROJECT_NAME,
     LookMLSourceReport,
@@ -103,6 +109,7 @@ from datahub.metadata.urns import TagUrn
 from datahub.sdk.dataset import Dataset
 from datahub.sql_parsing.sqlglot_lineage import ColumnRef
 from datahub.utilities.lossy_collections import LossyList, LossySet
+from datahub.utilities.ordered_set import OrderedSet
 from datahub.utilities.url_util import remove_port_from_url
 
 CORPUSER_DATAHUB = "urn:li:corpuser:datahub"
@@ -1470,8 +1477,24 @@ def gen_model_key(config: LookerCommonConfig, model_name: str) -> LookMLModelKey
     )
 
 
+_ExploreKey = Tuple[str, str]
+
+
+def _explore_cache_entry_size(looker_explore: Optional[LookerExplore]) -> int:
+    # Fields make up most of an explore's footprint, so they're a decent proxy for it.
+    if looker_explore is None or looker_explore.fields is None:
+        return 1
+    return 1 + len(looker_explore.fields)
+
+
 class LookerExploreRegistry:
-    """A LRU caching registry of Looker Explores"""
+    """A size-aware LRU caching registry of Looker Explores.
+
+    Rather than holding a fixed number of explores, the cache is bounded by the
+    total number of fields across the cached explores, so it can hold as many
+    explores as the instance has, as long as they fit. Concurrent lookups of the
+    same explore only fetch it once.
+    """
 
     def __init__(
         self,
@@ -1483,8 +1506,96 @@ class LookerExploreRegistry:
         self.report = report
         self.source_config = source_config
 
-    @lru_cache(maxsize=200)
+        self.cache_stats = LookerExploreCacheStats(
+            capacity=source_config.explore_cache_max_fields
+        )
+        self._lock = threading.Lock()
+        self._cache: "cachetools.LRUCache[_ExploreKey, Optional[LookerExplore]]" = (
+            cachetools.LRUCache(
+                maxsize=source_config.explore_cache_max_fields,
+                getsizeof=_explore_cache_entry_size,
+            )
+        )
+        self._fetch_locks: Dict[_ExploreKey, threading.Lock] = {}
+        # Explores get fetched from the dashboard processing threads and from the
+        # prefetching pool they share, so we bound the total concurrency here.
+        self._fetch_semaphore = threading.BoundedSemaphore(source_config.max_threads)
+        # Dashboards are processed concurrently, so the prefetching pool is shared
+        # rather than started by every dashboard.
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=source_config.max_threads,
+            thread_name_prefix="looker-explore-prefetch",
+        )
+
     def get_explore(self, model: str, explore: str) -> Optional[LookerExplore]:
+        return self._get_or_fetch_explore((model, explore), prefetch=False)
+
+    def prefetch(self, explores: Iterable[_ExploreKey]) -> None:
+        """Fetches the given explores concurrently, so later lookups are served from the cache."""
+
+        with self._lock:
+            missing = [key for key in OrderedSet(explores) if key not in self._cache]
+        if len(missing) <= 1:
+            # Nothing to gain from fetching a single explore ahead of time.
+            return
+
+        futures = [
+            self._prefetch_executor.submit(self._get_or_fetch_explore, key, True)
+            for key in missing
+        ]
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        self._prefetch_executor.shutdown(wait=True)
+
+    def _get_or_fetch_explore(
+        self, key: _ExploreKey, prefetch: bool
+    ) -> Optional[LookerExplore]:
+        with self._lock:
+            if not prefetch:
+                self.cache_stats.lookups += 1
+            if key in self._cache:
+                if not prefetch:
+                    self.cache_stats.hits += 1
+                return self._cache[key]
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        with fetch_lock:
+            with self._lock:
+                # Another thread may have fetched it while we were waiting.
+                if key in self._cache:
+                    if not prefetch:
+                        self.cache_stats.hits += 1
+                    return self._cache[key]
+
+            with self._fetch_semaphore:
+                looker_explore = self._fetch_explore(*key)
+
+            with self._lock:
+                self.cache_stats.api_calls += 1
+                if prefetch:
+                    self.cache_stats.prefetched += 1
+                else:
+                    self.cache_stats.misses += 1
+                self._add_to_cache(key, looker_explore)
+                self._fetch_locks.pop(key, None)
+
+        return looker_explore
+
+    def _add_to_cache(
+        self, key: _ExploreKey, looker_explore: Optional[LookerExplore]
+    ) -> None:
+        num_cached = len(self._cache)
+        try:
+            self._cache[key] = looker_explore
+        except ValueError:
+            # The explore is larger than the whole cache.
+            self.cache_stats.too_large_to_cache += 1
+            return
+        self.cache_stats.evictions += num_cached + 1 - len(self._cache)
+
+    def _fetch_explore(self, model: str, explore: str) -> Optional[LookerExplore]:
         logger.debug(f"Retrieving explore: model={model}, explore={explore}")
         looker_explore = LookerExplore.from_api(
             model,
@@ -1502,8 +1613,21 @@ class LookerExploreRegistry:
         return looker_explore
 
     def compute_stats(self) -> Dict:
+        with self._lock:
+            self.cache_stats.size = int(self._cache.currsize)
+            self.cache_stats.explores_cached = len(self._cache)
+            self.cache_stats.explore_calls_saved = (
+                self.cache_stats.lookups - self.cache_stats.api_calls
+            )
+            cache_info = functools._CacheInfo(
+                hits=self.cache_stats.hits,
+                misses=self.cache_stats.misses,
+                maxsize=self.cache_stats.capacity,
+                currsize=len(self._cache),
+            )
         return {
-            "cache_info": self.get_explore.cache_info(),
+            "cache_info": cache_info,
+            "cache_stats": self.cache_stats,
         }
 
 
@@ -272,6 +272,12 @@ class LookerDashboardSourceConfig(
         default_factory=lambda: os.cpu_count() or 40,
         description="Max parallelism for Looker API calls. Defaults to cpuCount or 40",
     )
+    explore_cache_max_fields: int = Field(
+        500_000,
+        description="[Advanced] Upper bound on the size of the in-memory explore cache, measured in the total "
+        "number of fields across the cached explores. The cache holds as many explores as fit, so that explores "
+        "referenced by many dashboards are only fetched once. Least recently used explores are evicted beyond it.",
+    )
     external_base_url: Optional[str] = Field(
         None,
         description="Optional URL to use when constructing external URLs to Looker if the `base_url` is not the "
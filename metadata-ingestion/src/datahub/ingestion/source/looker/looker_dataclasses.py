@@ -14,6 +14,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +55,7 @@ class LookerModel:
         path: str,
         source_config: LookMLSourceConfig,
         reporter: LookMLSourceReport,
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> "LookerModel":
         logger.debug(f"Loading model from {path}")
         connection = looker_model_dict["connection"]
@@ -68,6 +70,7 @@ class LookerModel:
             reporter,
             seen_so_far=set(),
             traversal_path=pathlib.Path(path).stem,
+            parse_cache=parse_cache,
         )
         logger.debug(f"{path} has resolved_includes: {resolved_includes}")
         explores = looker_model_dict.get("explores", [])
@@ -83,6 +86,7 @@ class LookerModel:
                     path=included_file,
                     reporter=reporter,
                     source_config=source_config,
+                    parse_cache=parse_cache,
                 )
                 included_explores = parsed.get("explores", [])
                 explores.extend(included_explores)
@@ -113,6 +117,7 @@ class LookerModel:
         reporter: LookMLSourceReport,
         seen_so_far: Set[str],
         traversal_path: str = "",  # a cosmetic parameter to aid debugging
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> List[ProjectInclude]:
         """Resolve ``include`` statements in LookML model files to a list of ``.lkml`` files.
 
@@ -226,6 +231,7 @@ class LookerModel:
                         path=included_file,
                         reporter=reporter,
                         source_config=source_config,
+                        parse_cache=parse_cache,
                     )
                     seen_so_far.add(included_file)
                     if "includes" in parsed:  # we have more includes to resolve!
@@ -240,6 +246,7 @@ class LookerModel:
                                 reporter,
                                 seen_so_far,
                                 traversal_path=f"{traversal_path} -> {pathlib.Path(included_file).stem}",
+                                parse_cache=parse_cache,
                             )
                         )
                 except Exception as e:
@@ -280,6 +287,7 @@ class LookerViewFile:
         raw_file_content: str,
         source_config: LookMLSourceConfig,
         reporter: LookMLSourceReport,
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> "LookerViewFile":
         logger.debug(f"Loading view file at {absolute_file_path}")
         includes = looker_view_file_dict.get("includes", [])
@@ -295,6 +303,7 @@ class LookerViewFile:
             source_config,
             reporter,
             seen_so_far=seen_so_far,
+            parse_cache=parse_cache,
         )
         logger.debug(
             f"resolved_includes for {absolute_file_path} is {resolved_includes}"
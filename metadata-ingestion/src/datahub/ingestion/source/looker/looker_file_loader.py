@@ -17,6 +17,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,7 @@ class LookerViewFileLoader:
         reporter: LookMLSourceReport,
         source_config: LookMLSourceConfig,
         manifest_constants: Optional[Dict[str, LookerConstant]] = None,
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> None:
         self.viewfile_cache: Dict[str, Optional[LookerViewFile]] = {}
         self._root_project_name = root_project_name
@@ -41,6 +43,7 @@ class LookerViewFileLoader:
         self.reporter = reporter
         self.source_config = source_config
         self.manifest_constants = manifest_constants or {}
+        self.parse_cache = parse_cache
 
     def _load_viewfile(
         self, project_name: str, path: str, reporter: LookMLSourceReport
@@ -85,6 +88,7 @@ class LookerViewFileLoader:
                 source_config=self.source_config,
                 resolve_constants=True,
                 manifest_constants=self.manifest_constants,
+                parse_cache=self.parse_cache,
             )
 
             looker_viewfile = LookerViewFile.from_looker_dict(
@@ -96,6 +100,7 @@ class LookerViewFileLoader:
                 raw_file_content=raw_file_content,
                 source_config=self.source_config,
                 reporter=reporter,
+                parse_cache=self.parse_cache,
             )
             logger.debug(f"adding viewfile for path {path} to the cache")
             self.viewfile_cache[path] = looker_viewfile
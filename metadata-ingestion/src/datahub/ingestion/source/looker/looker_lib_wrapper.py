@@ -81,6 +81,23 @@ class LookerAPIStats(BaseModel):
     generate_sql_query_calls: int = 0
 
 
+class LookerExploreCacheStats(BaseModel):
+    # The capacity and size are measured in explore fields, see LookerExploreRegistry.
+    capacity: int = 0
+    size: int = 0
+    explores_cached: int = 0
+    # Explore lookups, and the explore API calls made for them or ahead of them.
+    lookups: int = 0
+    api_calls: int = 0
+    hits: int = 0
+    misses: int = 0
+    prefetched: int = 0
+    evictions: int = 0
+    too_large_to_cache: int = 0
+    # Lookups minus the explore API calls actually made, including those made to prefetch.
+    explore_calls_saved: int = 0
+
+
 class LookerAPI:
     """A holder class for a Looker client"""
 
@@ -1322,6 +1322,15 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
         if self._should_skip_dashboard_by_folder_path(looker_dashboard):
             return self._create_empty_result(dashboard_id, start_time)
 
+        # Fetch the explores referenced by the dashboard's elements concurrently,
+        # instead of one at a time while building the chart entities.
+        self.explore_registry.prefetch(
+            (input_field.model, input_field.explore)
+            for element in looker_dashboard.dashboard_elements
+            for input_field in element.input_fields or []
+            if input_field.view_field is None
+        )
+
         # Build entities list
         entities: List[Entity] = []
 
@@ -1686,3 +1695,7 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        self.explore_registry.close()
+        super().close()
@@ -29,6 +29,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 
 if TYPE_CHECKING:
     from datahub.ingestion.source.looker.looker_dataclasses import LookerConstant
@@ -510,9 +511,10 @@ def load_and_preprocess_file(
     reporter: LookMLSourceReport,
     manifest_constants: Optional[Dict[str, "LookerConstant"]] = None,
     resolve_constants: bool = False,
+    parse_cache: Optional[LookMLParseCache] = None,
 ) -> dict:
     manifest_constants = manifest_constants or {}
-    parsed = load_lkml(path)
+    parsed = load_lkml(path, parse_cache=parse_cache)
 
     process_lookml_template_language(
         view_lkml_file_dict=parsed,
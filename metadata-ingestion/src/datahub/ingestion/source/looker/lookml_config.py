@@ -1,4 +1,5 @@
 import logging
+import pathlib
 from dataclasses import dataclass, field as dataclass_field
 from datetime import timedelta
 from typing import Any, Dict, Literal, Optional, Union
@@ -20,6 +21,7 @@ from datahub.ingestion.source.looker.looker_lib_wrapper import (
     LookerAPIConfig,
     TransportOptionsConfig,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCacheReport
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalSourceReport,
     StatefulStaleMetadataRemovalConfig,
@@ -61,6 +63,7 @@ class LookMLSourceReport(StaleEntityRemovalSourceReport):
     query_parse_failure_views: LossyList[str] = dataclass_field(
         default_factory=LossyList
     )
+    parse_cache: Optional[LookMLParseCacheReport] = None
     _looker_api: Optional[LookerAPI] = None
 
     def report_models_scanned(self) -> None:
@@ -174,6 +177,19 @@ class LookMLSourceConfig(
         False,
         description="When enabled, sql parsing will be executed in a separate process to prevent memory leaks.",
     )
+    parallel_lkml_parsing_workers: Optional[int] = Field(
+        default=None,
+        description="[Advanced] If set to more than 1, all LookML files in the projects are parsed in this many "
+        "worker processes before the models are processed. Useful for very large projects, where parsing "
+        "the LookML files is the bottleneck.",
+    )
+    parse_cache_path: Optional[pathlib.Path] = Field(
+        default=None,
+        description="[Advanced] Path to a local file used to cache parsed LookML files and the SQL parsing results "
+        "of derived views across runs. Files are keyed by a hash of their contents, so unchanged files are "
+        "not parsed again. Derived views are only re-parsed if their SQL or the schemas of the tables "
+        "they reference have changed.",
+    )
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = Field(
         default=None, description=""
     )
@@ -0,0 +1,227 @@
+import concurrent.futures
+import dataclasses
+import hashlib
+import importlib.metadata
+import json
+import logging
+import multiprocessing
+import pathlib
+from datetime import timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from datahub._version import __version__
+from datahub.ingestion.api.closeable import Closeable
+from datahub.ingestion.api.report import Report
+from datahub.ingestion.source.looker.lkml_patched import parse_lkml
+from datahub.sql_parsing.schema_resolver import SchemaResolver
+from datahub.sql_parsing.sql_parsing_cache import (
+    PersistentSqlParsingCache,
+    compute_schema_hash,
+)
+from datahub.sql_parsing.sqlglot_lineage import SqlParsingResult
+from datahub.utilities.file_backed_collections import PersistentFileBackedDict
+from datahub.utilities.ordered_set import OrderedSet
+from datahub.utilities.perf_timer import PerfTimer
+
+logger = logging.getLogger(__name__)
+
+_FILES_TABLE_NAME = "lkml_parsed_files"
+
+# Files parsed by a different version of lkml or of our patches may parse differently.
+_CACHE_VERSION = f"{__version__}:{importlib.metadata.version('lkml')}"
+
+DEFAULT_LOOKML_PARSE_CACHE_TTL = timedelta(days=14)
+
+# Files are shipped to the worker processes in chunks, to amortize the IPC overhead.
+_PARSE_CHUNK_SIZE = 50
+
+
+@dataclasses.dataclass
+class LookMLParseCacheReport(Report):
+    num_lkml_files_preparsed: int = 0
+    num_lkml_files_preparse_failed: int = 0
+    num_lkml_cache_hits: int = 0
+    num_lkml_cache_misses: int = 0
+    num_sql_parsing_cache_hits: int = 0
+    num_sql_parsing_cache_misses: int = 0
+    num_sql_parsing_cache_stale: int = 0
+
+    preparse_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
+
+
+def _parse_lkml_text(text: str) -> Optional[str]:
+    # Runs in the worker processes. Failures are left to the main process,
+    # which will fail to parse the file again and report it like it normally would.
+    try:
+        return json.dumps(parse_lkml(text))
+    except Exception:
+        return None
+
+
+class LookMLParseCache(Closeable):
+    """A cache of parsed LookML files and of the SQL parsing results of derived views.
+
+    Parsed files are keyed by a hash of their contents, so a file is only parsed
+    again once it changes, no matter where it lives in the project. SQL parsing
+    results are handled by a `PersistentSqlParsingCache`, which is stored in the
+    same file.
+
+    If no path is given, the cache is backed by a temporary file and only lasts
+    for the current run. That's still useful for `preparse`, which parses files
+    across a pool of worker processes ahead of time.
+    """
+
+    def __init__(
+        self,
+        path: Optional[pathlib.Path],
+        report: Optional[LookMLParseCacheReport] = None,
+        ttl: timedelta = DEFAULT_LOOKML_PARSE_CACHE_TTL,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.report = report or LookMLParseCacheReport()
+
+        # Files are stored serialized, since callers modify the parsed dict in place.
+        self._files = PersistentFileBackedDict[str](
+            path=path,
+            tablename=_FILES_TABLE_NAME,
+            version=_CACHE_VERSION,
+            ttl=ttl,
+        )
+        self._sql_parsing_cache = PersistentSqlParsingCache(
+            self._files.connection.filename,
+            ttl=ttl,
+            shared_connection=self._files.connection,
+        )
+
+    @classmethod
+    def make_key(cls, text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def load(self, text: str) -> dict:
+        """Returns the parsed contents of a LookML file, parsing it if needed."""
+
+        key = self.make_key(text)
+        parsed_json = self._files.get(key)
+        if parsed_json is not None:
+            self.report.num_lkml_cache_hits += 1
+            return json.loads(parsed_json)
+
+        self.report.num_lkml_cache_misses += 1
+        parsed = parse_lkml(text)
+        self._files[key] = json.dumps(parsed)
+        return parsed
+
+    def preparse(self, paths: Iterable[pathlib.Path], max_workers: int) -> None:
+        """Parses all files which aren't cached yet, using a pool of worker processes.
+
+        Files which can't be read or parsed are skipped here. They get reported
+        once the source tries to load them.
+        """
+
+        pending: List[Tuple[str, str]] = []
+        for path in paths:
+            try:
+                text = path.read_text()
+            except Exception as e:
+                logger.debug(f"Skipping {path} while pre-parsing: {e}")
+                continue
+
+            key = self.make_key(text)
+            if key not in self._files:
+                pending.append((key, text))
+
+        if not pending:
+            return
+
+        logger.info(
+            f"Parsing {len(pending)} LookML files across {max_workers} worker processes"
+        )
+        with (
+            self.report.preparse_timer,
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                # The fork start method is not safe when the main process uses threads.
+                # See the comment in classification_mixin.py for more details.
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor,
+        ):
+            parsed_files = executor.map(
+                _parse_lkml_text,
+                (text for _, text in pending),
+                chunksize=_PARSE_CHUNK_SIZE,
+            )
+            for (key, _), parsed_json in zip(pending, parsed_files):
+                if parsed_json is None:
+                    self.report.num_lkml_files_preparse_failed += 1
+                    continue
+
+                self.report.num_lkml_files_preparsed += 1
+                self._files[key] = parsed_json
+
+    @classmethod
+    def make_sql_parsing_key(
+        cls,
+        query: str,
+        platform: str,
+        platform_instance: Optional[str],
+        env: str,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+    ) -> str:
+        # The urns in the result also depend on the platform instance and env.
+        return json.dumps(
+            [
+                PersistentSqlParsingCache.make_key(
+                    query,
+                    platform=platform,
+                    default_db=default_db,
+                    default_schema=default_schema,
+                ),
+                platform_instance,
+                env,
+            ]
+        )
+
+    def _compute_schema_hash(
+        self, parsed: SqlParsingResult, schema_resolver: SchemaResolver
+    ) -> str:
+        return compute_schema_hash(
+            schema_resolver.resolve_urn(urn)
+            for urn in OrderedSet(parsed.in_tables + parsed.out_tables)
+        )
+
+    def get_sql_parsing_result(
+        self, key: str, schema_resolver: SchemaResolver
+    ) -> Optional[SqlParsingResult]:
+        entry = self._sql_parsing_cache.get(key)
+        if entry is None:
+            self.report.num_sql_parsing_cache_misses += 1
+            return None
+
+        # The entry is only valid if none of the referenced schemas changed.
+        if entry.schema_hash != self._compute_schema_hash(
+            entry.result, schema_resolver
+        ):
+            self.report.num_sql_parsing_cache_stale += 1
+            self._sql_parsing_cache.invalidate(key)
+            return None
+
+        self.report.num_sql_parsing_cache_hits += 1
+        return entry.result
+
+    def set_sql_parsing_result(
+        self, key: str, parsed: SqlParsingResult, schema_resolver: SchemaResolver
+    ) -> None:
+        self._sql_parsing_cache.set(
+            key,
+            parsed,
+            schema_hash=self._compute_schema_hash(parsed, schema_resolver),
+        )
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def close(self) -> None:
+        self._sql_parsing_cache.close()
+        self._files.close()
@@ -65,6 +65,10 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import (
+    LookMLParseCache,
+    LookMLParseCacheReport,
+)
 from datahub.ingestion.source.looker.lookml_refinement import LookerRefinementResolver
 from datahub.ingestion.source.looker.view_upstream import (
     AbstractViewUpstream,
@@ -144,6 +148,7 @@ class LookerView:
         populate_sql_logic_in_descriptions: bool = False,
         looker_client: Optional[LookerAPI] = None,
         view_to_explore_map: Optional[Dict[str, str]] = None,
+        parse_cache: Optional[LookMLParseCache] = None,
     ) -> Optional["LookerView"]:
         view_name = view_context.name()
 
@@ -164,6 +169,7 @@ class LookerView:
             reporter=reporter,
             looker_client=looker_client,
             view_to_explore_map=view_to_explore_map,
+            parse_cache=parse_cache,
         )
 
         field_type_vs_raw_fields = OrderedDict(
@@ -322,6 +328,19 @@ class LookMLSource(StatefulIngestionSourceBase):
 
         self.manifest_constants: Dict[str, "LookerConstant"] = {}
 
+        # Only needed when caching parsed files across runs, or when parsing them
+        # in worker processes, which hand their results over through the cache.
+        self.parse_cache: Optional[LookMLParseCache] = None
+        if (
+            self.source_config.parse_cache_path is not None
+            or (self.source_config.parallel_lkml_parsing_workers or 0) > 1
+        ):
+            self.reporter.parse_cache = LookMLParseCacheReport()
+            self.parse_cache = LookMLParseCache(
+                self.source_config.parse_cache_path,
+                report=self.reporter.parse_cache,
+            )
+
     def _load_model(self, path: str) -> LookerModel:
         logger.debug(f"Loading model from file {path}")
 
@@ -329,6 +348,7 @@ class LookMLSource(StatefulIngestionSourceBase):
             path=path,
             reporter=self.reporter,
             source_config=self.source_config,
+            parse_cache=self.parse_cache,
         )
 
         looker_model = LookerModel.from_looker_dict(
@@ -339,6 +359,7 @@ class LookMLSource(StatefulIngestionSourceBase):
             path,
             self.source_config,
             self.reporter,
+            parse_cache=self.parse_cache,
         )
         return looker_model
 
@@ -577,6 +598,8 @@ class LookMLSource(StatefulIngestionSourceBase):
                 self.manifest_constants,
             )
 
+            if self.parse_cache is not None:
+                self._preparse_lkml_files()
             yield from self.get_internal_workunits()
 
             if not self.report.events_produced and not self.report.failures:
@@ -586,6 +609,21 @@ class LookMLSource(StatefulIngestionSourceBase):
                     "No metadata was produced. Check the logs for more details.",
                 )
 
+    def _preparse_lkml_files(self) -> None:
+        assert self.parse_cache is not None
+        workers = self.source_config.parallel_lkml_parsing_workers
+        if not workers or workers <= 1:
+            return
+
+        paths = sorted(
+            {
+                path.resolve()
+                for project_folder in self.base_projects_folder.values()
+                for path in pathlib.Path(project_folder).glob("**/*.lkml")
+            }
+        )
+        self.parse_cache.preparse(paths, max_workers=workers)
+
     def _recursively_check_manifests(
         self,
         tmp_dir: str,
@@ -694,6 +732,7 @@ class LookMLSource(StatefulIngestionSourceBase):
             self.reporter,
             self.source_config,
             self.manifest_constants,
+            parse_cache=self.parse_cache,
         )
         logger.debug(f"LookML Constants : {', '.join(self.manifest_constants.keys())}")
 
@@ -891,6 +930,7 @@ class LookMLSource(StatefulIngestionSourceBase):
                                 view_to_explore_map=view_to_explore_map
                                 if view_to_explore_map
                                 else None,
+                                parse_cache=self.parse_cache,
                             )
                         except Exception as e:
                             self.reporter.report_warning(
@@ -1042,3 +1082,8 @@ class LookMLSource(StatefulIngestionSourceBase):
 
     def get_report(self):
         return self.reporter
+
+    def close(self) -> None:
+        if self.parse_cache is not None:
+            self.parse_cache.close()
+        super().close()
@@ -38,6 +38,7 @@ from datahub.ingestion.source.looker.lookml_config import (
     LookMLSourceConfig,
     LookMLSourceReport,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
 from datahub.ingestion.source.looker.urn_functions import get_qualified_table_name
 from datahub.sql_parsing.schema_resolver import match_columns_to_schema
 from datahub.sql_parsing.sqlglot_lineage import (
@@ -747,8 +748,10 @@ class SqlBasedDerivedViewUpstream(AbstractViewUpstream, ABC):
         config: LookMLSourceConfig,
         reporter: LookMLSourceReport,
         ctx: PipelineContext,
+        parse_cache: Optional[LookMLParseCache] = None,
     ):
         super().__init__(view_context, looker_view_id_cache, config, reporter, ctx)
+        self.parse_cache = parse_cache
         # These are the function where we need to catch the response once calculated
         self._get_spr = lru_cache(maxsize=1)(self.__get_spr)
         self._get_upstream_dataset_urn = lru_cache(maxsize=1)(
@@ -760,15 +763,49 @@ class SqlBasedDerivedViewUpstream(AbstractViewUpstream, ABC):
         if not self.config.parse_table_names_from_sql:
             return None
 
-        spr = create_lineage_sql_parsed_result(
-            query=self.get_sql_query(),
-            default_schema=self.view_context.view_connection.default_schema,
-            default_db=self.view_context.view_connection.default_db,
-            platform=self.view_context.view_connection.platform,
-            platform_instance=self.view_context.view_connection.platform_instance,
-            env=self.view_context.view_connection.platform_env or self.config.env,
+        query = self.get_sql_query()
+        connection = self.view_context.view_connection
+        env = connection.platform_env or self.config.env
+
+        if self.parse_cache is None:
+            return create_lineage_sql_parsed_result(
+                query=query,
+                default_schema=connection.default_schema,
+                default_db=connection.default_db,
+                platform=connection.platform,
+                platform_instance=connection.platform_instance,
+                env=env,
+                graph=self.ctx.graph,
+            )
+
+        # The schema resolver is only used to check whether the schemas of the
+        # upstream tables changed since the cached result was produced.
+        schema_resolver = create_and_cache_schema_resolver(
+            platform=connection.platform,
+            platform_instance=connection.platform_instance,
+            env=env,
             graph=self.ctx.graph,
         )
+        key = LookMLParseCache.make_sql_parsing_key(
+            query,
+            platform=connection.platform,
+            platform_instance=connection.platform_instance,
+            env=env,
+            default_db=connection.default_db,
+            default_schema=connection.default_schema,
+        )
+        spr = self.parse_cache.get_sql_parsing_result(key, schema_resolver)
+        if spr is None:
+            spr = create_lineage_sql_parsed_result(
+                query=query,
+                default_schema=connection.default_schema,
+                default_db=connection.default_db,
+                platform=connection.platform,
+                platform_instance=connection.platform_instance,
+                env=env,
+                graph=self.ctx.graph,
+            )
+            self.parse_cache.set_sql_parsing_result(key, spr, schema_resolver)
         return spr
 
     def __get_upstream_dataset_urn(self) -> List[Urn]:
@@ -1131,6 +1168,7 @@ def create_view_upstream(
     reporter: LookMLSourceReport,
     looker_client: Optional["LookerAPI"] = None,
     view_to_explore_map: Optional[Dict[str, str]] = None,
+    parse_cache: Optional[LookMLParseCache] = None,
 ) -> AbstractViewUpstream:
     # Looker client is required for LookerQueryAPIBasedViewUpstream also enforced by config.use_api_for_view_lineage
     # view_to_explore_map is required for Looker query API args
@@ -1198,6 +1236,7 @@ def create_view_upstream(
             reporter=reporter,
             ctx=ctx,
             looker_view_id_cache=looker_view_id_cache,
+            parse_cache=parse_cache,
         )
 
     if view_context.is_direct_sql_query_case():
@@ -1207,6 +1246,7 @@ def create_view_upstream(
             reporter=reporter,
             ctx=ctx,
             looker_view_id_cache=looker_view_id_cache,
+            parse_cache=parse_cache,
         )
 
     if view_context.is_native_derived_case():
@@ -265,6 +265,10 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
     def get_report(self) -> RedshiftReport:
         return self.report
 
+    def close(self) -> None:
+        self.classification_handler.close()
+        super().close()
+
     eskind_to_platform = {1: "glue", 2: "hive", 3: "postgres", 4: "redshift"}
 
     def __init__(self, config: RedshiftConfig, ctx: PipelineContext):
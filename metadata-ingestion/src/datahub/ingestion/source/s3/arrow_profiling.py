@@ -0,0 +1,595 @@
+import dataclasses
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
+import pyarrow.dataset as ds
+import pyarrow.fs
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.profiling.common import (
+    Cardinality,
+    convert_to_cardinality,
+)
+from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    HistogramClass,
+    QuantileClass,
+    ValueFrequencyClass,
+)
+from datahub.telemetry import stats, telemetry
+
+logger = logging.getLogger(__name__)
+
+# Kept in line with the Spark-based profiler.
+NUM_SAMPLE_ROWS = 20
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+MAX_HIST_BINS = 25
+
+# Number of rows read from the files at a time.
+BATCH_SIZE = 64 * 1024
+
+# Number of values per numeric column kept to compute approximate quantiles and histograms.
+QUANTILE_SAMPLE_SIZE = 100_000
+
+# Distinct values are counted exactly until a column has more than this many of them.
+# Columns with few distinct values get their value frequencies from these counts.
+MAX_EXACT_DISTINCT_VALUES = 1000
+
+# 2^14 registers give a standard error of about 0.8% for distinct counts.
+HLL_PRECISION = 14
+
+_FEW_CARDINALITIES = [
+    Cardinality.ONE,
+    Cardinality.TWO,
+    Cardinality.VERY_FEW,
+    Cardinality.FEW,
+]
+_MANY_CARDINALITIES = [Cardinality.MANY, Cardinality.VERY_MANY, Cardinality.UNIQUE]
+
+
+def open_arrow_dataset(
+    path: str, ext: str, filesystem: Optional[pyarrow.fs.FileSystem] = None
+) -> Optional[ds.Dataset]:
+    """Opens a file, or a directory of (partitioned) files, as a pyarrow dataset.
+
+    Returns None if the file type can't be read with pyarrow.
+    """
+
+    file_format: ds.FileFormat
+    if ext.endswith(".parquet"):
+        file_format = ds.ParquetFileFormat()
+    elif ext.endswith(".csv"):
+        file_format = ds.CsvFileFormat()
+    elif ext.endswith(".tsv"):
+        file_format = ds.CsvFileFormat(
+            parse_options=pyarrow.csv.ParseOptions(delimiter="\t")
+        )
+    elif ext.endswith(".jsonl"):
+        file_format = ds.JsonFileFormat()
+    else:
+        # pyarrow can't read avro files, nor json files which aren't newline-delimited.
+        return None
+
+    return ds.dataset(
+        path, format=file_format, filesystem=filesystem, partitioning="hive"
+    )
+
+
+def _splitmix64(values: np.ndarray) -> np.ndarray:
+    # Mixes the bits of 64-bit values, so that they can be used as hashes.
+    # Integer overflow is intended here, and wraps around.
+    z = values + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _hash_values(values: pa.Array) -> np.ndarray:
+    """Hashes non-null values to 64 bits. Equal values get equal hashes within a process."""
+
+    type_ = values.type
+    if pa.types.is_integer(type_) or pa.types.is_boolean(type_):
+        raw = pc.cast(values, pa.int64()).to_numpy().view(np.uint64)
+    elif pa.types.is_floating(type_):
+        raw = pc.cast(values, pa.float64()).to_numpy().view(np.uint64)
+    elif pa.types.is_timestamp(type_) or pa.types.is_date64(type_):
+        raw = values.view(pa.int64()).to_numpy().view(np.uint64)
+    elif pa.types.is_date32(type_):
+        raw = values.view(pa.int32()).to_numpy().astype(np.int64).view(np.uint64)
+    else:
+        raw = np.array(
+            [hash(value) for value in values.to_pylist()], dtype=np.int64
+        ).view(np.uint64)
+    return _splitmix64(raw)
+
+
+def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    # Binary search for the highest set bit of each (non-zero) 64-bit value.
+    counts = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        has_zeros = values < (np.uint64(1) << np.uint64(64 - shift))
+        counts[has_zeros] += shift
+        values = np.where(has_zeros, values << np.uint64(shift), values)
+    return counts
+
+
+class _HyperLogLog:
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        indexes = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        # The low bit stops the count at the bits which are left after the index.
+        remaining = (hashes << np.uint64(self.precision)) | np.uint64(
+            1 << (self.precision - 1)
+        )
+        ranks = (_count_leading_zeros(remaining) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, indexes, ranks)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / float(np.sum(np.exp2(-self.registers.astype(float))))
+        num_zero_registers = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and num_zero_registers > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * math.log(m / num_zero_registers)
+        return int(round(estimate))
+
+
+class _Reservoir:
+    """Picks a uniform random sample of fixed size from a stream of batches."""
+
+    def __init__(self, size: int, rng: np.random.Generator) -> None:
+        self.size = size
+        self.num_seen = 0
+        self._rng = rng
+
+    def offer(self, batch_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns which positions in the batch to keep, and at which slots of the sample."""
+
+        positions = np.arange(batch_size)
+        seen = self.num_seen + positions
+        slots = np.where(
+            seen < self.size, seen, self._rng.integers(0, seen + 1, size=batch_size)
+        )
+        keep = slots < self.size
+        self.num_seen += batch_size
+        return positions[keep], slots[keep]
+
+
+@dataclasses.dataclass
+class _FooterStats:
+    null_count: int
+    has_min_max: bool = True
+    min: Any = None
+    max: Any = None
+
+
+@dataclasses.dataclass
+class _ColumnAccumulator:
+    name: str
+    type_: pa.DataType
+
+    null_count: int = 0
+    footer_stats: Optional[_FooterStats] = None
+
+    hll: Optional[_HyperLogLog] = None
+    value_counts: Optional[Dict[Any, int]] = None
+
+    min: Any = None
+    max: Any = None
+
+    # Streaming mean and variance, see
+    # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm
+    num_values: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    quantile_sample: Optional[np.ndarray] = None
+
+    sample_values: List[Any] = dataclasses.field(default_factory=list)
+
+    @property
+    def is_numeric(self) -> bool:
+        return (
+            pa.types.is_integer(self.type_)
+            or pa.types.is_floating(self.type_)
+            or pa.types.is_decimal(self.type_)
+        )
+
+    @property
+    def is_temporal(self) -> bool:
+        return pa.types.is_date(self.type_) or pa.types.is_timestamp(self.type_)
+
+    @property
+    def is_string(self) -> bool:
+        return pa.types.is_string(self.type_) or pa.types.is_large_string(self.type_)
+
+    def unique_count(self) -> Optional[int]:
+        if self.value_counts is not None:
+            return len(self.value_counts)
+        if self.hll is not None:
+            return self.hll.count()
+        return None
+
+    def add(self, values: pa.Array, quantile_reservoir: Optional[_Reservoir]) -> None:
+        if self.footer_stats is None:
+            self.null_count += values.null_count
+        values = pc.drop_null(values)
+        if pa.types.is_floating(self.type_):
+            # Like with Spark, NaNs are counted as nulls.
+            is_nan = pc.is_nan(values)
+            if self.footer_stats is None:
+                self.null_count += pc.sum(is_nan).as_py() or 0
+            values = pc.filter(values, pc.invert(is_nan))
+        if len(values) == 0:
+            return
+
+        self._add_distinct(values)
+
+        if (self.is_numeric or self.is_temporal) and (
+            self.footer_stats is None or self.footer_stats.min is None
+        ):
+            min_max = pc.min_max(values).as_py()
+            if self.min is None or min_max["min"] < self.min:
+                self.min = min_max["min"]
+            if self.max is None or min_max["max"] > self.max:
+                self.max = min_max["max"]
+
+        if self.is_numeric and quantile_reservoir is not None:
+            self._add_numeric(values, quantile_reservoir)
+
+    def _add_distinct(self, values: pa.Array) -> None:
+        if self.hll is None:
+            return
+
+        if self.value_counts is not None:
+            counts = pc.value_counts(values)
+            if len(counts) > MAX_EXACT_DISTINCT_VALUES:
+                self.value_counts = None
+            else:
+                for item in counts.to_pylist():
+                    value = item["values"]
+                    self.value_counts[value] = (
+                        self.value_counts.get(value, 0) + item["counts"]
+                    )
+                if len(self.value_counts) > MAX_EXACT_DISTINCT_VALUES:
+                    self.value_counts = None
+
+        self.hll.add_hashes(_hash_values(pc.unique(values)))
+
+    def _add_numeric(self, values: pa.Array, quantile_reservoir: _Reservoir) -> None:
+        floats = pc.cast(values, pa.float64()).to_numpy()
+
+        batch_count = len(floats)
+        batch_mean = float(np.mean(floats))
+        batch_m2 = float(np.sum(np.square(floats - batch_mean)))
+        total = self.num_values + batch_count
+        delta = batch_mean - self.mean
+        self.mean += delta * batch_count / total
+        self.m2 += batch_m2 + delta * delta * self.num_values * batch_count / total
+        self.num_values = total
+
+        if self.quantile_sample is None:
+            self.quantile_sample = np.empty(0)
+        positions, slots = quantile_reservoir.offer(batch_count)
+        if len(slots):
+            # The sample grows until the reservoir is full.
+            num_new_slots = int(slots.max()) + 1 - len(self.quantile_sample)
+            if num_new_slots > 0:
+                self.quantile_sample = np.concatenate(
+                    [self.quantile_sample, np.empty(num_new_slots)]
+                )
+            self.quantile_sample[slots] = floats[positions]
+
+
+def _collect_parquet_footer_stats(
+    dataset: ds.Dataset, columns: List[str]
+) -> Dict[str, _FooterStats]:
+    """Aggregates the null counts and min/max values of top-level columns from the
+    footers of all parquet files in the dataset.
+
+    Statistics are only returned for columns which have them in every row group.
+    """
+
+    if not isinstance(dataset, ds.FileSystemDataset) or not isinstance(
+        dataset.format, ds.ParquetFileFormat
+    ):
+        return {}
+
+    num_row_groups = 0
+    num_row_groups_with_stats: Dict[str, int] = {}
+    footer_stats: Dict[str, _FooterStats] = {}
+    for fragment in dataset.get_fragments():
+        metadata = fragment.metadata
+        num_row_groups += metadata.num_row_groups
+        for row_group_index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(row_group_index)
+            for column_index in range(row_group.num_columns):
+                column = row_group.column(column_index)
+                name = column.path_in_schema
+                statistics = column.statistics
+                if (
+                    name not in columns
+                    or statistics is None
+                    or not statistics.has_null_count
+                ):
+                    continue
+
+                num_row_groups_with_stats[name] = (
+                    num_row_groups_with_stats.get(name, 0) + 1
+                )
+                current = footer_stats.setdefault(name, _FooterStats(null_count=0))
+                current.null_count += statistics.null_count
+                if statistics.has_min_max:
+                    if current.min is None or statistics.min < current.min:
+                        current.min = statistics.min
+                    if current.max is None or statistics.max > current.max:
+                        current.max = statistics.max
+                else:
+                    current.has_min_max = False
+
+    return {
+        name: stats_
+        for name, stats_ in footer_stats.items()
+        if num_row_groups_with_stats[name] == num_row_groups
+    }
+
+
+class _SingleTableArrowProfiler:
+    """Profiles a table with pyarrow, without requiring Spark.
+
+    All metrics are computed in a single streaming pass over the record batches of the
+    table, so memory usage doesn't grow with the size of the table. Distinct counts are
+    approximated with HyperLogLog, and quantiles and histograms are computed from a
+    uniform sample of each numeric column. For parquet files, the row count and, where
+    possible, column null counts and min/max values are taken from the file footers.
+
+    The same metrics are computed for each column type and cardinality as with the
+    Spark-based profiler.
+    """
+
+    def __init__(
+        self,
+        dataset: ds.Dataset,
+        profiling_config: DataLakeProfilerConfig,
+        report: DataLakeSourceReport,
+        file_path: str,
+    ):
+        self.dataset = dataset
+        self.profiling_config = profiling_config
+        self.report = report
+        self.file_path = file_path
+        self.profile = DatasetProfileClass(timestampMillis=get_sys_time())
+        self.columns_to_profile: List[str] = []
+        self.ignored_columns: List[str] = []
+        self._rng = np.random.default_rng(seed=0)
+
+    def profile_table(self) -> DatasetProfileClass:
+        schema = self.dataset.schema
+        self.profile.columnCount = len(schema.names)
+
+        if self.profiling_config.profile_table_level_only:
+            self.profile.rowCount = self.dataset.count_rows()
+            return self.profile
+
+        self._select_columns_to_profile(schema.names)
+
+        footer_stats = _collect_parquet_footer_stats(
+            self.dataset, self.columns_to_profile
+        )
+        accumulators = []
+        for column in self.columns_to_profile:
+            accumulator = _ColumnAccumulator(
+                name=column, type_=schema.field(column).type
+            )
+            accumulator.footer_stats = self._usable_footer_stats(
+                accumulator, footer_stats.get(column)
+            )
+            if not pa.types.is_nested(accumulator.type_):
+                accumulator.hll = _HyperLogLog()
+                accumulator.value_counts = {}
+            accumulators.append(accumulator)
+
+        row_count = self._scan(accumulators)
+        self.profile.rowCount = row_count
+
+        telemetry.telemetry_instance.ping(
+            "profile_data_lake_table",
+            {"rows_profiled": stats.discretize(row_count)},
+        )
+
+        self.profile.fieldProfiles = [
+            self._build_column_profile(accumulator, row_count)
+            for accumulator in accumulators
+        ]
+        return self.profile
+
+    @staticmethod
+    def _usable_footer_stats(
+        accumulator: _ColumnAccumulator, footer_stats: Optional[_FooterStats]
+    ) -> Optional[_FooterStats]:
+        if footer_stats is None or pa.types.is_floating(accumulator.type_):
+            # NaNs are counted as nulls, but aren't included in the footer's null count.
+            return None
+        if not (
+            footer_stats.has_min_max
+            and (pa.types.is_integer(accumulator.type_) or accumulator.is_temporal)
+        ):
+            # Min/max statistics of other types, e.g. strings, may be truncated.
+            footer_stats.min = footer_stats.max = None
+        return footer_stats
+
+    def _select_columns_to_profile(self, columns: List[str]) -> None:
+        for column in columns:
+            if not self.profiling_config._allow_deny_patterns.allowed(column):
+                self.ignored_columns.append(column)
+                continue
+            self.columns_to_profile.append(column)
+
+        max_columns = self.profiling_config.max_number_of_fields_to_profile
+        if max_columns is not None and len(self.columns_to_profile) > max_columns:
+            columns_being_dropped = self.columns_to_profile[max_columns:]
+            self.columns_to_profile = self.columns_to_profile[:max_columns]
+
+            self.report.report_file_dropped(
+                f"The max_number_of_fields_to_profile={max_columns} reached. Profile of columns {self.file_path}({', '.join(sorted(columns_being_dropped))})"
+            )
+
+    def _scan(self, accumulators: List[_ColumnAccumulator]) -> int:
+        sample_reservoir = _Reservoir(NUM_SAMPLE_ROWS, self._rng)
+        quantile_reservoirs = {
+            accumulator.name: _Reservoir(QUANTILE_SAMPLE_SIZE, self._rng)
+            for accumulator in accumulators
+            if accumulator.is_numeric
+        }
+
+        row_count = 0
+        for batch in self.dataset.to_batches(
+            columns=self.columns_to_profile, batch_size=BATCH_SIZE
+        ):
+            row_count += batch.num_rows
+
+            sample_positions, sample_slots = sample_reservoir.offer(batch.num_rows)
+            for accumulator in accumulators:
+                values = batch.column(accumulator.name)
+                accumulator.add(values, quantile_reservoirs.get(accumulator.name))
+
+                if self.profiling_config.include_field_sample_values and len(
+                    sample_positions
+                ):
+                    sampled = values.take(pa.array(sample_positions)).to_pylist()
+                    for slot, value in zip(sample_slots, sampled):
+                        if slot < len(accumulator.sample_values):
+                            accumulator.sample_values[slot] = value
+                        else:
+                            accumulator.sample_values.append(value)
+        return row_count
+
+    def _build_column_profile(
+        self, accumulator: _ColumnAccumulator, row_count: int
+    ) -> DatasetFieldProfileClass:
+        column_profile = DatasetFieldProfileClass(fieldPath=accumulator.name)
+        config = self.profiling_config
+
+        footer_stats = accumulator.footer_stats
+        null_count = (
+            footer_stats.null_count
+            if footer_stats is not None
+            else accumulator.null_count
+        )
+        non_null_count = row_count - null_count
+        null_proportion = null_count / row_count if row_count > 0 else 0
+
+        if config.include_field_null_count:
+            column_profile.nullCount = null_count
+            column_profile.nullProportion = null_proportion
+
+        unique_count = accumulator.unique_count()
+        if unique_count is not None:
+            # The estimate can be slightly off, but there can't be more distinct values than values.
+            unique_count = min(unique_count, non_null_count)
+            column_profile.uniqueCount = unique_count
+            column_profile.uniqueProportion = (
+                unique_count / non_null_count if non_null_count > 0 else 0
+            )
+
+        if config.include_field_sample_values:
+            column_profile.sampleValues = sorted(
+                str(value) for value in accumulator.sample_values
+            )
+
+        cardinality = convert_to_cardinality(
+            unique_count, column_profile.uniqueProportion
+        )
+
+        if accumulator.is_numeric:
+            if cardinality in _FEW_CARDINALITIES:
+                self._add_distinct_value_frequencies(column_profile, accumulator)
+            elif cardinality in _MANY_CARDINALITIES:
+                self._add_min_max(column_profile, accumulator)
+                self._add_numeric_stats(column_profile, accumulator)
+        elif accumulator.is_string:
+            if cardinality in _FEW_CARDINALITIES:
+                self._add_distinct_value_frequencies(column_profile, accumulator)
+        elif accumulator.is_temporal:
+            self._add_min_max(column_profile, accumulator)
+            if cardinality in _FEW_CARDINALITIES:
+                self._add_distinct_value_frequencies(column_profile, accumulator)
+
+        return column_profile
+
+    def _add_min_max(
+        self, column_profile: DatasetFieldProfileClass, accumulator: _ColumnAccumulator
+    ) -> None:
+        footer_stats = accumulator.footer_stats
+        if footer_stats is not None and footer_stats.min is not None:
+            min_value, max_value = footer_stats.min, footer_stats.max
+        else:
+            min_value, max_value = accumulator.min, accumulator.max
+
+        if self.profiling_config.include_field_min_value and min_value is not None:
+            column_profile.min = str(min_value)
+        if self.profiling_config.include_field_max_value and max_value is not None:
+            column_profile.max = str(max_value)
+
+    def _add_numeric_stats(
+        self, column_profile: DatasetFieldProfileClass, accumulator: _ColumnAccumulator
+    ) -> None:
+        config = self.profiling_config
+        if accumulator.num_values == 0 or accumulator.quantile_sample is None:
+            return
+
+        if config.include_field_mean_value:
+            column_profile.mean = str(accumulator.mean)
+        if config.include_field_stddev_value:
+            column_profile.stdev = str(
+                math.sqrt(accumulator.m2 / accumulator.num_values)
+            )
+
+        sample = accumulator.quantile_sample
+        if config.include_field_median_value:
+            column_profile.median = str(float(np.quantile(sample, 0.5)))
+        if config.include_field_quantiles:
+            column_profile.quantiles = [
+                QuantileClass(
+                    quantile=str(quantile),
+                    value=str(float(np.quantile(sample, quantile))),
+                )
+                for quantile in QUANTILES
+            ]
+        finite_sample = sample[np.isfinite(sample)]
+        if config.include_field_histogram and len(finite_sample) > 0:
+            heights, boundaries = np.histogram(finite_sample, bins=MAX_HIST_BINS)
+            # Scale the sample up to the number of values in the column.
+            scale = accumulator.num_values / len(sample)
+            column_profile.histogram = HistogramClass(
+                [str(float(boundary)) for boundary in boundaries],
+                [float(height) * scale for height in heights],
+            )
+
+    def _add_distinct_value_frequencies(
+        self, column_profile: DatasetFieldProfileClass, accumulator: _ColumnAccumulator
+    ) -> None:
+        if (
+            not self.profiling_config.include_field_distinct_value_frequencies
+            or accumulator.value_counts is None
+        ):
+            return
+
+        column_profile.distinctValueFrequencies = sorted(
+            (
+                ValueFrequencyClass(value=str(value), frequency=frequency)
+                for value, frequency in accumulator.value_counts.items()
+            ),
+            key=lambda x: x.value,
+        )
@@ -1,4 +1,6 @@
 import logging
+import os
+import pathlib
 from typing import Any, Dict, List, Optional, Union
 
 import pydantic
@@ -93,6 +95,19 @@ class DataLakeSourceConfig(
         description="Either a boolean, in which case it controls whether we verify the server's TLS certificate, or a string, in which case it must be a path to a CA bundle to use.",
     )
 
+    max_workers: int = Field(
+        default=5 * (os.cpu_count() or 4),
+        description="Number of worker threads used to list table folders and to infer schemas in parallel. "
+        "Set to 1 to disable.",
+    )
+
+    schema_cache_path: Optional[pathlib.Path] = Field(
+        default=None,
+        description="[Advanced] Path to a local file used to cache inferred schemas across runs. "
+        "Entries are keyed by the ETag of the object the schema was inferred from, so files which "
+        "haven't changed since a previous run are not read again.",
+    )
+
     number_of_files_to_sample: int = Field(
         default=100,
         description="Number of files to list to sample for schema inference. This will be ignored if sample_files is set to False in the pathspec.",
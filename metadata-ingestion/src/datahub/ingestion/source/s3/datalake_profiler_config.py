@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 import pydantic
 from pydantic.fields import Field
@@ -12,6 +12,13 @@ class DataLakeProfilerConfig(ConfigModel):
     enabled: bool = Field(
         default=False, description="Whether profiling should be done."
     )
+    engine: Literal["spark", "arrow"] = Field(
+        default="spark",
+        description="The engine used to compute profiles. `spark` runs PyDeequ analyzers on a local Spark session. "
+        "`arrow` computes profiles in-process with pyarrow, in a single streaming pass over the files, and does not require Spark or Java. "
+        "It supports parquet, csv, tsv and jsonl files, and uses the statistics in parquet footers where possible. "
+        "Distinct counts are approximated with HyperLogLog, and quantiles and histograms are computed from a sample of each column.",
+    )
     operation_config: OperationConfig = Field(
         default_factory=OperationConfig,
         description="Experimental feature. To specify operation configs.",
@@ -5,6 +5,7 @@ from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalSourceReport,
 )
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
 
 
 @dataclasses.dataclass
@@ -12,10 +13,22 @@ class DataLakeSourceReport(StaleEntityRemovalSourceReport):
     files_scanned = 0
     filtered: LossyList[str] = dataclass_field(default_factory=LossyList)
     number_of_files_filtered: int = 0
+    num_schema_cache_hits: int = 0
+    num_schema_cache_misses: int = 0
+
+    # Bytes downloaded to infer schemas from files which are read with range requests.
+    schema_inference_bytes_downloaded: int = 0
+    schema_inference_bytes_downloaded_per_file: TopKDict[str, int] = dataclass_field(
+        default_factory=int_top_k_dict
+    )
 
     def report_file_scanned(self) -> None:
         self.files_scanned += 1
 
+    def report_schema_inference_download(self, file: str, num_bytes: int) -> None:
+        self.schema_inference_bytes_downloaded += num_bytes
+        self.schema_inference_bytes_downloaded_per_file[file] = num_bytes
+
     def report_file_dropped(self, file: str) -> None:
         self.filtered.append(file)
         self.number_of_files_filtered += 1
@@ -1,15 +1,20 @@
 import dataclasses
 import functools
+import io
 import logging
 import os
 import pathlib
 import posixpath
 import re
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import PurePath
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
+import pyarrow.dataset
+import pyarrow.fs
 import smart_open.compression as so_compression
 from pyspark.conf import SparkConf
 from pyspark.sql import SparkSession
@@ -34,7 +39,9 @@ from datahub.ingestion.api.decorators import (
 )
 from datahub.ingestion.api.source import MetadataWorkUnitProcessor
 from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.fs.s3_fs import S3RangeReader
 from datahub.ingestion.source.aws.s3_boto_utils import (
+    DirEntry,
     get_s3_tags,
     list_folders_path,
     list_objects_recursive_path,
@@ -54,6 +61,9 @@ from datahub.ingestion.source.data_lake_common.object_store import (
     create_object_store_adapter,
 )
 from datahub.ingestion.source.data_lake_common.path_spec import FolderTraversalMethod
+from datahub.ingestion.source.data_lake_common.schema_cache import (
+    PersistentSchemaCache,
+)
 from datahub.ingestion.source.s3.config import DataLakeSourceConfig, PathSpec
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
@@ -85,6 +95,10 @@ from datahub.utilities.perf_timer import PerfTimer
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Files opened with range requests start by downloading this many bytes from where
+# the schema is stored. Any further reads are coalesced into requests of this size.
+RANGE_READ_BUFFER_SIZE = 64 * 1024
+
 # Hack to support the .gzip extension with smart_open.
 so_compression.register_compressor(".gzip", so_compression._COMPRESSOR_REGISTRY[".gz"])
 
@@ -97,6 +111,7 @@ config_options_to_report = [
 
 # profiling flags to emit telemetry for
 profiling_flags_to_report = [
+    "engine",
     "profile_table_level_only",
     "include_field_null_count",
     "include_field_min_value",
@@ -144,6 +159,7 @@ class Folder:
     sample_file: str
     partition_id: Optional[List[Tuple[str, str]]] = None
     is_partition: bool = False
+    sample_file_e_tag: Optional[str] = None
 
     def partition_id_text(self) -> Optional[str]:
         return (
@@ -169,6 +185,7 @@ class BrowsePath:
     size: int
     partitions: List[Folder]
     content_type: Optional[str] = None
+    e_tag: Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -184,6 +201,8 @@ class TableData:
     max_partition: Optional[Folder] = None
     min_partition: Optional[Folder] = None
     content_type: Optional[str] = None
+    # ETag of the file at full_path, if known.
+    e_tag: Optional[str] = None
 
 
 @platform_name("S3 / Local Files", id="s3")
@@ -208,6 +227,7 @@ class S3Source(StatefulIngestionSourceBase):
     profiling_times_taken: List[float]
     container_WU_creator: ContainerWUCreator
     object_store_adapter: Any
+    schema_cache: Optional[PersistentSchemaCache]
 
     def __init__(self, config: DataLakeSourceConfig, ctx: PipelineContext):
         super().__init__(config, ctx)
@@ -219,6 +239,11 @@ class S3Source(StatefulIngestionSourceBase):
             self.source_config.platform_instance,
             self.source_config.env,
         )
+        self.schema_cache = (
+            PersistentSchemaCache(self.source_config.schema_cache_path)
+            if self.source_config.schema_cache_path
+            else None
+        )
 
         # Create an object store adapter for handling external URLs and paths
         if self.is_s3_platform():
@@ -282,7 +307,8 @@ class S3Source(StatefulIngestionSourceBase):
                     for config_flag in profiling_flags_to_report
                 },
             )
-            self.init_spark()
+            if config.profiling.engine == "spark":
+                self.init_spark()
 
     def init_spark(self):
         os.environ.setdefault("SPARK_VERSION", "3.5")
@@ -428,6 +454,63 @@ class S3Source(StatefulIngestionSourceBase):
         return df.toDF(*(c.replace(".", "_") for c in df.columns))
 
     def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
+        extension = pathlib.Path(table_data.full_path).suffix
+        from datahub.ingestion.source.data_lake_common.path_spec import (
+            SUPPORTED_COMPRESSIONS,
+        )
+
+        if path_spec.enable_compression and (extension[1:] in SUPPORTED_COMPRESSIONS):
+            # Removing the compression extension and using the one before that like .json.gz -> .json
+            extension = pathlib.Path(table_data.full_path).with_suffix("").suffix
+        if extension == "" and path_spec.default_extension:
+            extension = f".{path_spec.default_extension}"
+
+        cache_key = None
+        if self.schema_cache is not None and table_data.e_tag:
+            cache_key = PersistentSchemaCache.make_key(
+                path=table_data.full_path,
+                e_tag=table_data.e_tag,
+                extension=extension,
+                content_type=table_data.content_type,
+                max_rows=self.source_config.max_rows,
+            )
+
+        cached_fields = (
+            self.schema_cache.get(cache_key)
+            if self.schema_cache is not None and cache_key is not None
+            else None
+        )
+        if cached_fields is not None:
+            self.report.num_schema_cache_hits += 1
+            fields = cached_fields
+        else:
+            if cache_key is not None:
+                self.report.num_schema_cache_misses += 1
+            fields = self._infer_fields(table_data, extension)
+            # Failed inferences aren't cached, so that they're retried on the next run.
+            if self.schema_cache is not None and cache_key is not None and fields:
+                self.schema_cache.set(cache_key, fields)
+
+        if self.source_config.sort_schema_fields:
+            fields = sorted(fields, key=lambda f: f.fieldPath)
+
+        if self.source_config.add_partition_columns_to_schema and table_data.partitions:
+            add_partition_columns_to_schema(
+                fields=fields, path_spec=path_spec, full_path=table_data.full_path
+            )
+
+        return fields
+
+    def _infer_fields(self, table_data: TableData, extension: str) -> List:
+        inferrer = self._get_inferrer(extension, table_data.content_type)
+        if inferrer is None:
+            self.report.report_warning(
+                table_data.full_path,
+                f"file {table_data.full_path} has unsupported extension",
+            )
+            return []
+
+        range_reader: Optional[S3RangeReader] = None
         if self.is_s3_platform():
             if self.source_config.aws_config is None:
                 raise ValueError("AWS config is required for S3 file sources")
@@ -437,51 +520,51 @@ class S3Source(StatefulIngestionSourceBase):
             )
 
             path = re.sub(URI_SCHEME_REGEX, "s3://", table_data.full_path)
-            file = smart_open(path, "rb", transport_params={"client": s3_client})
+            if inferrer.reads_byte_ranges and not self._is_compressed(path):
+                # Only fetch the parts of the file the schema is read from. For most
+                # files, that takes a single request.
+                range_reader = S3RangeReader.from_path(
+                    s3_client,
+                    path,
+                    prefetch_size=RANGE_READ_BUFFER_SIZE,
+                    prefetch_from_end=inferrer.reads_from_end,
+                )
+                file = io.BufferedReader(
+                    range_reader, buffer_size=RANGE_READ_BUFFER_SIZE
+                )
+            else:
+                file = smart_open(path, "rb", transport_params={"client": s3_client})
         else:
             # We still use smart_open here to take advantage of the compression
             # capabilities of smart_open.
             file = smart_open(table_data.full_path, "rb")
 
-        extension = pathlib.Path(table_data.full_path).suffix
-        from datahub.ingestion.source.data_lake_common.path_spec import (
-            SUPPORTED_COMPRESSIONS,
-        )
-
-        if path_spec.enable_compression and (extension[1:] in SUPPORTED_COMPRESSIONS):
-            # Removing the compression extension and using the one before that like .json.gz -> .json
-            extension = pathlib.Path(table_data.full_path).with_suffix("").suffix
-        if extension == "" and path_spec.default_extension:
-            extension = f".{path_spec.default_extension}"
-
         fields = []
-        inferrer = self._get_inferrer(extension, table_data.content_type)
-        if inferrer:
-            try:
-                fields = inferrer.infer_schema(file)
-                logger.debug(f"Extracted fields in schema: {fields}")
-            except Exception as e:
-                self.report.report_warning(
-                    table_data.full_path,
-                    f"could not infer schema for file {table_data.full_path}: {e}",
-                )
-        else:
+        try:
+            fields = inferrer.infer_schema(file)
+            logger.debug(f"Extracted fields in schema: {fields}")
+        except Exception as e:
             self.report.report_warning(
                 table_data.full_path,
-                f"file {table_data.full_path} has unsupported extension",
+                f"could not infer schema for file {table_data.full_path}: {e}",
             )
         file.close()
 
-        if self.source_config.sort_schema_fields:
-            fields = sorted(fields, key=lambda f: f.fieldPath)
-
-        if self.source_config.add_partition_columns_to_schema and table_data.partitions:
-            add_partition_columns_to_schema(
-                fields=fields, path_spec=path_spec, full_path=table_data.full_path
+        if range_reader is not None:
+            self.report.report_schema_inference_download(
+                table_data.full_path, range_reader.bytes_downloaded
             )
 
         return fields
 
+    @staticmethod
+    def _is_compressed(path: str) -> bool:
+        # smart_open transparently decompresses files based on their extension.
+        return (
+            pathlib.PurePosixPath(path).suffix.lower()
+            in so_compression.get_supported_extensions()
+        )
+
     def _get_inferrer(
         self, extension: str, content_type: Optional[str]
     ) -> Optional[SchemaInferenceBase]:
@@ -512,9 +595,89 @@ class S3Source(StatefulIngestionSourceBase):
         else:
             return None
 
+    def read_file_arrow(self, file: str, ext: str) -> Optional[pyarrow.dataset.Dataset]:
+        from datahub.ingestion.source.s3.arrow_profiling import open_arrow_dataset
+
+        logger.debug(f"Opening file {file} for profiling with pyarrow")
+        telemetry.telemetry_instance.ping("data_lake_file", {"extension": ext})
+
+        filesystem: Optional[pyarrow.fs.FileSystem] = None
+        if self.is_s3_platform():
+            if self.source_config.aws_config is None:
+                raise ValueError("AWS config is required for S3 file sources")
+
+            aws_config = self.source_config.aws_config
+            credentials = aws_config.get_credentials()
+            filesystem = pyarrow.fs.S3FileSystem(
+                access_key=credentials.get("aws_access_key_id"),
+                secret_key=credentials.get("aws_secret_access_key"),
+                session_token=credentials.get("aws_session_token"),
+                region=aws_config.aws_region,
+                endpoint_override=aws_config.aws_endpoint_url,
+            )
+            # pyarrow expects S3 paths without the scheme.
+            file = f"{get_bucket_name(file)}/{get_bucket_relative_path(file)}"
+
+        dataset = open_arrow_dataset(file, ext, filesystem)
+        if dataset is None:
+            self.report.report_warning(
+                file,
+                f"file {file} has an extension which is not supported by the arrow profiling engine",
+            )
+        return dataset
+
+    def get_table_profile_arrow(
+        self, table_data: TableData, dataset_urn: str
+    ) -> Iterable[MetadataWorkUnit]:
+        from datahub.ingestion.source.s3.arrow_profiling import (
+            _SingleTableArrowProfiler,
+        )
+
+        dataset = None
+        try:
+            dataset = self.read_file_arrow(
+                table_data.table_path
+                if table_data.partitions
+                else table_data.full_path,
+                os.path.splitext(table_data.full_path)[1],
+            )
+        except Exception as e:
+            logger.error(e)
+
+        if dataset is None:
+            self.report.report_warning(
+                table_data.display_name,
+                f"unable to read table {table_data.display_name} from file {table_data.full_path}",
+            )
+            return
+
+        with PerfTimer() as timer:
+            table_profiler = _SingleTableArrowProfiler(
+                dataset,
+                self.source_config.profiling,
+                self.report,
+                table_data.full_path,
+            )
+            profile = table_profiler.profile_table()
+
+            time_taken = timer.elapsed_seconds()
+            logger.info(
+                f"Finished profiling {table_data.full_path}; took {time_taken:.3f} seconds"
+            )
+            self.profiling_times_taken.append(time_taken)
+
+        yield MetadataChangeProposalWrapper(
+            entityUrn=dataset_urn,
+            aspect=profile,
+        ).as_workunit()
+
     def get_table_profile(
         self, table_data: TableData, dataset_urn: str
     ) -> Iterable[MetadataWorkUnit]:
+        if self.source_config.profiling.engine == "arrow":
+            yield from self.get_table_profile_arrow(table_data, dataset_urn)
+            return
+
         # Importing here to avoid Deequ dependency for non profiling use cases
         # Deequ fails if Spark is not available which is not needed for non profiling use cases
         from pydeequ.analyzers import AnalyzerContext
@@ -650,7 +813,10 @@ class S3Source(StatefulIngestionSourceBase):
         return self.object_store_adapter.get_external_url(table_data)
 
     def ingest_table(
-        self, table_data: TableData, path_spec: PathSpec
+        self,
+        table_data: TableData,
+        path_spec: PathSpec,
+        fields_future: Optional["Future[List]"] = None,
     ) -> Iterable[MetadataWorkUnit]:
         aspects: List[Optional[_Aspect]] = []
 
@@ -721,7 +887,11 @@ class S3Source(StatefulIngestionSourceBase):
         aspects.append(dataset_properties)
         if table_data.size_in_bytes > 0:
             try:
-                fields = self.get_fields(table_data, path_spec)
+                fields = (
+                    fields_future.result()
+                    if fields_future is not None
+                    else self.get_fields(table_data, path_spec)
+                )
                 schema_metadata = SchemaMetadata(
                     schemaName=table_data.display_name,
                     platform=data_platform_urn,
@@ -836,8 +1006,38 @@ class S3Source(StatefulIngestionSourceBase):
                 )
             ),
             content_type=browse_path.content_type,
+            e_tag=browse_path.e_tag,
         )
 
+    def get_fields_concurrently(
+        self, path_spec: PathSpec, tables: Iterable[TableData]
+    ) -> Iterable[Tuple[TableData, Optional["Future[List]"]]]:
+        """
+        Starts inferring the schemas of the given tables in a bounded thread pool, and yields
+        each table along with the future of its fields, in order. Only a limited number of
+        tables are inferred ahead of the consumer, so that their schemas aren't all held in
+        memory at once.
+        """
+        max_workers = self.source_config.max_workers
+        if max_workers <= 1:
+            for table_data in tables:
+                yield table_data, None
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Deque[Tuple[TableData, Optional["Future[List]"]]] = deque()
+            for table_data in tables:
+                future = (
+                    executor.submit(self.get_fields, table_data, path_spec)
+                    if table_data.size_in_bytes > 0
+                    else None
+                )
+                pending.append((table_data, future))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+
     def resolve_templated_folders(self, prefix: str) -> Iterable[str]:
         folder_split: List[str] = prefix.split("*", 1)
         # If the len of split is 1 it means we don't have * in the prefix
@@ -1013,6 +1213,7 @@ class S3Source(StatefulIngestionSourceBase):
                 creation_time=folder_info.min_time,
                 modification_time=folder_info.max_time,
                 sample_file=max_file_s3_path,
+                sample_file_e_tag=latest_obj.e_tag,
                 size=folder_info.total_size,
             )
 
@@ -1127,111 +1328,25 @@ class S3Source(StatefulIngestionSourceBase):
             )
             logger.info(f"Resolved prefixes: {resolved_prefixes}")
 
-            # STEP 3: Process each resolved prefix to find table folders
-            for resolved_prefix in resolved_prefixes:
-                logger.info(f"Processing resolved prefix: {resolved_prefix}")
-
-                # Get all folders that could be tables under this resolved prefix
-                # These are the actual table names (e.g., "users", "events", "logs")
-                table_folders = list(
-                    list_folders_path(
-                        resolved_prefix, aws_config=self.source_config.aws_config
+            # STEP 3: Find the table folders under each resolved prefix, and
+            # STEP 4: process each of them to create a table-level dataset.
+            # Prefixes and table folders are listed in parallel, but the results are yielded in order.
+            with ThreadPoolExecutor(
+                max_workers=self.source_config.max_workers
+            ) as executor:
+                table_folders = [
+                    folder
+                    for folders in executor.map(
+                        self._list_table_folders, resolved_prefixes
                     )
-                )
-                logger.debug(
-                    f"Found table folders under {resolved_prefix}: {[folder.name for folder in table_folders]}"
-                )
-
-                # STEP 4: Process each table folder to create a table-level dataset
-                for folder in table_folders:
-                    logger.info(f"Processing table path: {folder.path}")
-
-                    # Extract table name using the ORIGINAL path spec pattern matching (not the modified one)
-                    # This uses the compiled regex pattern to extract the table name from the full path
-                    table_name, _ = self.extract_table_name_and_path(
-                        path_spec, folder.path
-                    )
-
-                    # Apply table name filtering if configured
-                    if not path_spec.tables_filter_pattern.allowed(table_name):
-                        logger.debug(f"Table '{table_name}' not allowed and skipping")
-                        continue
-
-                    # STEP 5: Handle partition traversal based on configuration
-                    dirs_to_process = []
-
-                    if path_spec.traversal_method == FolderTraversalMethod.ALL:
-                        # Process ALL partitions (original behavior)
-                        dirs_to_process = [folder.path]
-                        logger.debug(
-                            f"Processing ALL partition folders under: {folder.path}"
-                        )
-
-                    else:
-                        # Use the original get_dir_to_process logic for MIN/MAX
-                        if (
-                            path_spec.traversal_method == FolderTraversalMethod.MIN_MAX
-                            or path_spec.traversal_method == FolderTraversalMethod.MAX
-                        ):
-                            # Get MAX partition using original logic
-                            dirs_to_process_max = self.get_dir_to_process(
-                                uri=folder.path,
-                                path_spec=path_spec,
-                                min=False,
-                            )
-                            if dirs_to_process_max:
-                                dirs_to_process.extend(dirs_to_process_max)
-                                logger.debug(
-                                    f"Added MAX partition: {dirs_to_process_max}"
-                                )
-
-                        if path_spec.traversal_method == FolderTraversalMethod.MIN_MAX:
-                            # Get MIN partition using original logic
-                            dirs_to_process_min = self.get_dir_to_process(
-                                uri=folder.path,
-                                path_spec=path_spec,
-                                min=True,
-                            )
-                            if dirs_to_process_min:
-                                dirs_to_process.extend(dirs_to_process_min)
-                                logger.debug(
-                                    f"Added MIN partition: {dirs_to_process_min}"
-                                )
-
-                    # Process the selected partitions
-                    all_folders = []
-                    for partition_path in dirs_to_process:
-                        logger.info(f"Scanning files in partition: {partition_path}")
-                        partition_files = list(
-                            self.get_folder_info(path_spec, partition_path)
-                        )
-                        all_folders.extend(partition_files)
-
-                    if all_folders:
-                        # Use the most recent file across all processed partitions
-                        latest_file = max(
-                            all_folders, key=lambda x: x.modification_time
-                        )
-
-                        # Get partition information
-                        partitions = [f for f in all_folders if f.is_partition]
-
-                        # Calculate total size of processed partitions
-                        total_size = sum(f.size for f in all_folders)
-
-                        # Create ONE BrowsePath per table
-                        # The key insight: we need to provide the sample file for schema inference
-                        # but the table path should be extracted correctly by extract_table_name_and_path
-                        yield BrowsePath(
-                            file=latest_file.sample_file,  # Sample file for schema inference
-                            timestamp=latest_file.modification_time,  # Latest timestamp
-                            size=total_size,  # Size of processed partitions
-                            partitions=partitions,  # Partition metadata
-                        )
-                    else:
-                        logger.warning(
-                            f"No files found in processed partitions for table {table_name}"
-                        )
+                    for folder in folders
+                ]
+                for browse_path in executor.map(
+                    functools.partial(self._browse_table_folder, path_spec),
+                    table_folders,
+                ):
+                    if browse_path is not None:
+                        yield browse_path
 
         except Exception as e:
             if isinstance(e, s3.meta.client.exceptions.NoSuchBucket):
@@ -1243,6 +1358,105 @@ class S3Source(StatefulIngestionSourceBase):
             logger.error(f"Error in _process_templated_path: {e}")
             raise e
 
+    def _list_table_folders(self, resolved_prefix: str) -> List[DirEntry]:
+        logger.info(f"Processing resolved prefix: {resolved_prefix}")
+
+        # Get all folders that could be tables under this resolved prefix
+        # These are the actual table names (e.g., "users", "events", "logs")
+        table_folders = list(
+            list_folders_path(resolved_prefix, aws_config=self.source_config.aws_config)
+        )
+        logger.debug(
+            f"Found table folders under {resolved_prefix}: {[folder.name for folder in table_folders]}"
+        )
+        return table_folders
+
+    def _browse_table_folder(
+        self, path_spec: PathSpec, folder: DirEntry
+    ) -> Optional[BrowsePath]:
+        """
+        Lists the selected partitions of a table folder, and returns a single BrowsePath for
+        the table, or None if the table is filtered out or has no files.
+        """
+        logger.info(f"Processing table path: {folder.path}")
+
+        # Extract table name using the ORIGINAL path spec pattern matching (not the modified one)
+        # This uses the compiled regex pattern to extract the table name from the full path
+        table_name, _ = self.extract_table_name_and_path(path_spec, folder.path)
+
+        # Apply table name filtering if configured
+        if not path_spec.tables_filter_pattern.allowed(table_name):
+            logger.debug(f"Table '{table_name}' not allowed and skipping")
+            return None
+
+        # STEP 5: Handle partition traversal based on configuration
+        dirs_to_process = []
+
+        if path_spec.traversal_method == FolderTraversalMethod.ALL:
+            # Process ALL partitions (original behavior)
+            dirs_to_process = [folder.path]
+            logger.debug(f"Processing ALL partition folders under: {folder.path}")
+
+        else:
+            # Use the original get_dir_to_process logic for MIN/MAX
+            if (
+                path_spec.traversal_method == FolderTraversalMethod.MIN_MAX
+                or path_spec.traversal_method == FolderTraversalMethod.MAX
+            ):
+                # Get MAX partition using original logic
+                dirs_to_process_max = self.get_dir_to_process(
+                    uri=folder.path,
+                    path_spec=path_spec,
+                    min=False,
+                )
+                if dirs_to_process_max:
+                    dirs_to_process.extend(dirs_to_process_max)
+                    logger.debug(f"Added MAX partition: {dirs_to_process_max}")
+
+            if path_spec.traversal_method == FolderTraversalMethod.MIN_MAX:
+                # Get MIN partition using original logic
+                dirs_to_process_min = self.get_dir_to_process(
+                    uri=folder.path,
+                    path_spec=path_spec,
+                    min=True,
+                )
+                if dirs_to_process_min:
+                    dirs_to_process.extend(dirs_to_process_min)
+                    logger.debug(f"Added MIN partition: {dirs_to_process_min}")
+
+        # Process the selected partitions
+        all_folders = []
+        for partition_path in dirs_to_process:
+            logger.info(f"Scanning files in partition: {partition_path}")
+            partition_files = list(self.get_folder_info(path_spec, partition_path))
+            all_folders.extend(partition_files)
+
+        if all_folders:
+            # Use the most recent file across all processed partitions
+            latest_file = max(all_folders, key=lambda x: x.modification_time)
+
+            # Get partition information
+            partitions = [f for f in all_folders if f.is_partition]
+
+            # Calculate total size of processed partitions
+            total_size = sum(f.size for f in all_folders)
+
+            # Create ONE BrowsePath per table
+            # The key insight: we need to provide the sample file for schema inference
+            # but the table path should be extracted correctly by extract_table_name_and_path
+            return BrowsePath(
+                file=latest_file.sample_file,  # Sample file for schema inference
+                timestamp=latest_file.modification_time,  # Latest timestamp
+                size=total_size,  # Size of processed partitions
+                partitions=partitions,  # Partition metadata
+                e_tag=latest_file.sample_file_e_tag,
+            )
+        else:
+            logger.warning(
+                f"No files found in processed partitions for table {table_name}"
+            )
+        return None
+
     def _process_simple_path(self, path_spec: PathSpec) -> Iterable[BrowsePath]:
         """
         Process simple S3 paths without {table} templates to create file-level datasets.
@@ -1302,6 +1516,7 @@ class S3Source(StatefulIngestionSourceBase):
                 size=obj.size,
                 partitions=[],  # No partitions in simple mode
                 content_type=content_type,
+                e_tag=obj.e_tag,
             )
 
     def local_browser(self, path_spec: PathSpec) -> Iterable[BrowsePath]:
@@ -1378,9 +1593,12 @@ class S3Source(StatefulIngestionSourceBase):
                             table_dict[
                                 table_data.table_path
                             ].timestamp = table_data.timestamp
+                            table_dict[table_data.table_path].e_tag = table_data.e_tag
 
-                for _, table_data in table_dict.items():
-                    yield from self.ingest_table(table_data, path_spec)
+                for table_data, fields_future in self.get_fields_concurrently(
+                    path_spec, table_dict.values()
+                ):
+                    yield from self.ingest_table(table_data, path_spec, fields_future)
 
             if not self.source_config.is_profiling_enabled():
                 return
@@ -1438,3 +1656,8 @@ class S3Source(StatefulIngestionSourceBase):
 
     def get_report(self):
         return self.report
+
+    def close(self) -> None:
+        if self.schema_cache is not None:
+            self.schema_cache.close()
+        super().close()
@@ -9,6 +9,9 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import SchemaField
 
 
 class AvroInferrer(SchemaInferenceBase):
+    # The schema is stored in the header of the file.
+    reads_byte_ranges = True
+
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
         reader = DataFileReader(file, DatumReader())
         fields = schema_util.avro_schema_to_mce_fields(reader.schema)
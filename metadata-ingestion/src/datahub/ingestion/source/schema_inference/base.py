@@ -8,6 +8,13 @@ class SchemaInferenceBase:
     Base class for file schema inference.
     """
 
+    # Whether the schema can be read from a few byte ranges of the file, like a header or
+    # a footer, rather than by scanning it from the start. Such files can be opened with
+    # range requests instead of being downloaded.
+    reads_byte_ranges: bool = False
+    # Whether those byte ranges are at the end of the file, rather than at the start.
+    reads_from_end: bool = False
+
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
         """
         Infer schema from file.
@@ -73,6 +73,10 @@ def map_pyarrow_type(pyarrow_type: Type) -> Type:
 
 
 class ParquetInferrer(SchemaInferenceBase):
+    # The schema is stored in the footer of the file.
+    reads_byte_ranges = True
+    reads_from_end = True
+
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
         # infer schema of a parquet file without reading the whole file
 
@@ -0,0 +1,142 @@
+import dataclasses
+import pathlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator, List, Optional
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_collections import PersistentFileBackedDict
+
+_BUCKETS_TABLE_NAME = "audit_log_buckets"
+_ENTRIES_TABLE_NAME = "audit_log_entries"
+
+# Rows can show up in the ACCOUNT_USAGE views up to ~3 hours after the query ran.
+# A bucket fetched before that may be missing queries, so it'll be fetched again.
+ACCOUNT_USAGE_LATENCY = timedelta(hours=3)
+
+
+@dataclasses.dataclass
+class _CachedBucket:
+    # The time range that was fetched. This only differs from the bucket's bounds
+    # for the first and last buckets of the window.
+    start_time: datetime
+    end_time: datetime
+    fetched_at: datetime
+    fingerprint: str
+    num_entries: int
+
+
+@dataclasses.dataclass
+class _CachedEntry:
+    bucket_start: int
+    entry: Any
+
+
+class SnowflakeAuditLogCache(Closeable):
+    """A persistent, time-partitioned cache of parsed query log entries.
+
+    Entries are stored per usage bucket, along with the time range that was fetched
+    for that bucket. A bucket can be reused by a later run if it covers the same
+    time range, was fetched after all of that range's queries had landed in the
+    ACCOUNT_USAGE views, and was fetched with the same settings. All other buckets
+    in the window need to be fetched again.
+
+    Buckets which start before the beginning of the window are dropped.
+    """
+
+    def __init__(self, path: pathlib.Path, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+
+        self._buckets = PersistentFileBackedDict[_CachedBucket](
+            path=path,
+            tablename=_BUCKETS_TABLE_NAME,
+        )
+        self._entries = PersistentFileBackedDict[_CachedEntry](
+            shared_connection=self._buckets.connection,
+            tablename=_ENTRIES_TABLE_NAME,
+            extra_columns={"bucket_start": lambda v: v.bucket_start},
+        )
+
+    @classmethod
+    def _bucket_key(cls, bucket_start: datetime) -> int:
+        return int(bucket_start.timestamp())
+
+    def prune(self, window_start: datetime) -> None:
+        cutoff = self._bucket_key(window_start)
+        self._buckets.sql_query(
+            f"DELETE FROM {self._buckets.tablename} WHERE CAST(key AS INTEGER) < ?",
+            (cutoff,),
+        )
+        self._entries.sql_query(
+            f"DELETE FROM {self._entries.tablename} WHERE bucket_start < ?",
+            (cutoff,),
+        )
+
+    def is_complete(
+        self, bucket_start: datetime, start_time: datetime, end_time: datetime
+    ) -> bool:
+        bucket = self._buckets.get(str(self._bucket_key(bucket_start)))
+        return (
+            bucket is not None
+            and bucket.fingerprint == self.fingerprint
+            and bucket.start_time == start_time
+            and bucket.end_time == end_time
+            and bucket.fetched_at >= end_time + ACCOUNT_USAGE_LATENCY
+        )
+
+    def set_bucket(
+        self,
+        bucket_start: datetime,
+        start_time: datetime,
+        end_time: datetime,
+        entries: Iterable[Any],
+        fetched_at: Optional[datetime] = None,
+    ) -> None:
+        """Replaces the entries of a bucket.
+
+        The bucket is only recorded once all of its entries have been written,
+        so a run which gets interrupted part-way won't leave a truncated bucket behind.
+        """
+
+        fetched_at = fetched_at or datetime.now(tz=timezone.utc)
+        key = self._bucket_key(bucket_start)
+
+        self._buckets.pop(str(key), None)
+        self._buckets.flush()
+        self._entries.sql_query(
+            f"DELETE FROM {self._entries.tablename} WHERE bucket_start = ?", (key,)
+        )
+
+        num_entries = 0
+        for entry in entries:
+            self._entries[f"{key}:{num_entries:010d}"] = _CachedEntry(
+                bucket_start=key, entry=entry
+            )
+            num_entries += 1
+        self._entries.flush()
+
+        self._buckets[str(key)] = _CachedBucket(
+            start_time=start_time,
+            end_time=end_time,
+            fetched_at=fetched_at,
+            fingerprint=self.fingerprint,
+            num_entries=num_entries,
+        )
+        self._buckets.flush()
+
+    def get_entries(self, bucket_starts: List[datetime]) -> Iterator[Any]:
+        """Yields the entries of the given buckets, in the order they were added."""
+
+        for bucket_start in bucket_starts:
+            for row in self._entries.sql_query_iterator(
+                f"SELECT value FROM {self._entries.tablename} WHERE bucket_start = ? ORDER BY key",
+                (self._bucket_key(bucket_start),),
+            ):
+                yield self._entries.deserializer(row[0]).entry
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def close(self) -> None:
+        self._entries.close()
+        self._buckets.close()
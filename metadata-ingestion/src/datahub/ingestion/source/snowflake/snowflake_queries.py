@@ -1,6 +1,7 @@
 import contextlib
 import dataclasses
 import functools
+import itertools
 import json
 import logging
 import pathlib
@@ -17,6 +18,7 @@ from datahub.configuration.common import AllowDenyPattern, ConfigModel, HiddenFr
 from datahub.configuration.time_window_config import (
     BaseTimeWindowConfig,
     BucketDuration,
+    get_bucket_duration_delta,
     get_time_bucket,
 )
 from datahub.ingestion.api.closeable import Closeable
@@ -28,6 +30,9 @@ from datahub.ingestion.api.source_helpers import auto_workunit
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.source.snowflake.constants import SnowflakeObjectDomain
+from datahub.ingestion.source.snowflake.snowflake_audit_log_cache import (
+    SnowflakeAuditLogCache,
+)
 from datahub.ingestion.source.snowflake.snowflake_config import (
     DEFAULT_TEMP_TABLES_PATTERNS,
     QueryDedupStrategyType,
@@ -146,6 +151,26 @@ class SnowflakeQueriesExtractorConfig(ConfigModel):
 
     query_dedup_strategy: QueryDedupStrategyType = QueryDedupStrategyType.STANDARD
 
+    parallel_sql_parsing_workers: Optional[int] = pydantic.Field(
+        default=None,
+        description="[Advanced] If set to more than 1, observed queries are parsed in this many worker processes "
+        "instead of on the main thread. Useful for very large query logs, where SQL parsing is the bottleneck.",
+    )
+
+    sql_parsing_cache_path: Optional[pathlib.Path] = pydantic.Field(
+        default=None,
+        description="[Advanced] Path to a local file used to cache SQL parsing results across runs. "
+        "Recurring queries are only re-parsed if the schemas of the tables they reference have changed.",
+    )
+
+    audit_log_cache_path: Optional[pathlib.Path] = pydantic.Field(
+        default=None,
+        description="[Advanced] Path to a local file used to cache the query log across runs. "
+        "The query log is stored per usage bucket, and only the buckets which weren't fully "
+        "fetched by a previous run are fetched from Snowflake. "
+        "Buckets before the start of the time window are dropped from the file.",
+    )
+
 
 class SnowflakeQueriesSourceConfig(
     SnowflakeQueriesExtractorConfig, SnowflakeIdentifierConfig, SnowflakeFilterConfig
@@ -159,6 +184,9 @@ class SnowflakeQueriesExtractorReport(Report):
     query_log_fetch_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     users_fetch_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
 
+    num_audit_log_buckets_cached: int = 0
+    num_audit_log_buckets_fetched: int = 0
+
     audit_log_load_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     aggregator_generate_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
 
@@ -230,6 +258,8 @@ class SnowflakeQueriesExtractor(SnowflakeStructuredReportMixin, Closeable):
                 is_temp_table=self.is_temp_table,
                 is_allowed_table=self.is_allowed_table,
                 format_queries=False,
+                parallel_parsing_workers=self.config.parallel_sql_parsing_workers,
+                parse_cache_path=self.config.sql_parsing_cache_path,
             )
         )
         self.report.sql_aggregator = self.aggregator.report
@@ -312,8 +342,12 @@ class SnowflakeQueriesExtractor(SnowflakeStructuredReportMixin, Closeable):
             users = self.fetch_users()
 
         # TODO: Add some logic to check if the cached audit log is stale or not.
+        # Use audit_log_cache_path for an audit log which is kept up to date across runs.
         audit_log_file = self.local_temp_path / "audit_log.sqlite"
         use_cached_audit_log = audit_log_file.exists()
+        cached_query_log: Iterable[
+            Union[PreparsedQuery, TableRename, TableSwap, ObservedQuery, StoredProcCall]
+        ] = []
 
         if self.config.local_temp_path is None:
             self._exit_stack.callback(lambda: audit_log_file.unlink(missing_ok=True))
@@ -357,9 +391,22 @@ class SnowflakeQueriesExtractor(SnowflakeStructuredReportMixin, Closeable):
                     for copy_entry in self.fetch_copy_history():
                         queries.append(copy_entry)
 
-                with self.report.query_log_fetch_timer:
-                    for entry in self.fetch_query_log(users):
-                        queries.append(entry)
+                if self.config.audit_log_cache_path is not None:
+                    audit_log_cache = self._exit_stack.enter_context(
+                        SnowflakeAuditLogCache(
+                            self.config.audit_log_cache_path,
+                            fingerprint=self._audit_log_cache_fingerprint(),
+                        )
+                    )
+                    with self.report.query_log_fetch_timer:
+                        bucket_starts = self.update_audit_log_cache(
+                            users, audit_log_cache
+                        )
+                    cached_query_log = audit_log_cache.get_entries(bucket_starts)
+                else:
+                    with self.report.query_log_fetch_timer:
+                        for entry in self.fetch_query_log(users):
+                            queries.append(entry)
 
         stored_proc_tracker: StoredProcLineageTracker = self._exit_stack.enter_context(
             StoredProcLineageTracker(
@@ -370,7 +417,7 @@ class SnowflakeQueriesExtractor(SnowflakeStructuredReportMixin, Closeable):
         self.report.stored_proc_lineage = stored_proc_tracker.report
 
         with self.report.audit_log_load_timer:
-            for i, query in enumerate(queries):
+            for i, query in enumerate(itertools.chain(queries, cached_query_log)):
                 if i % 1000 == 0:
                     logger.info(f"Added {i} query log entries to SQL aggregator")
 
@@ -449,14 +496,84 @@ class SnowflakeQueriesExtractor(SnowflakeStructuredReportMixin, Closeable):
                     if result:
                         yield result
 
+    def _audit_log_cache_fingerprint(self) -> str:
+        # Everything which affects which rows are fetched, or how they're parsed.
+        return json.dumps(
+            {
+                "bucket_duration": self.config.window.bucket_duration,
+                "pushdown_deny_usernames": self.config.pushdown_deny_usernames,
+                "pushdown_allow_usernames": self.config.pushdown_allow_usernames,
+                "query_dedup_strategy": self.config.query_dedup_strategy,
+                "database_pattern": self.filters.filter_config.database_pattern.dict()
+                if self.config.push_down_database_pattern_access_history
+                else None,
+                "additional_database_names": self.config.additional_database_names_allowlist
+                if self.config.push_down_database_pattern_access_history
+                else None,
+                "identifiers": self.identifiers.identifier_config.dict(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    def update_audit_log_cache(
+        self, users: UsersMapping, audit_log_cache: SnowflakeAuditLogCache
+    ) -> List[datetime]:
+        """Fetches the buckets of the time window which aren't in the cache yet.
+
+        Returns the start times of all of the window's buckets, in order.
+        """
+
+        bucket_duration = self.config.window.bucket_duration
+        bucket_delta = get_bucket_duration_delta(bucket_duration)
+        bucket_start = get_time_bucket(self.start_time, bucket_duration)
+        audit_log_cache.prune(bucket_start)
+
+        bucket_starts = []
+        while bucket_start < self.end_time:
+            # Only the first and last buckets may be partially covered by the window.
+            start_time = max(bucket_start, self.start_time)
+            end_time = min(bucket_start + bucket_delta, self.end_time)
+
+            if audit_log_cache.is_complete(bucket_start, start_time, end_time):
+                self.report.num_audit_log_buckets_cached += 1
+            else:
+                logger.info(f"Fetching query log from {start_time} to {end_time}")
+                with self.structured_reporter.report_exc(
+                    "Error fetching query log from Snowflake"
+                ):
+                    # The bucket isn't recorded unless all of its entries were fetched.
+                    audit_log_cache.set_bucket(
+                        bucket_start,
+                        start_time,
+                        end_time,
+                        self._fetch_query_log(users, start_time, end_time),
+                    )
+                    self.report.num_audit_log_buckets_fetched += 1
+
+            bucket_starts.append(bucket_start)
+            bucket_start += bucket_delta
+
+        return bucket_starts
+
     def fetch_query_log(
         self, users: UsersMapping
     ) -> Iterable[
         Union[PreparsedQuery, TableRename, TableSwap, ObservedQuery, StoredProcCall]
+    ]:
+        with self.structured_reporter.report_exc(
+            "Error fetching query log from Snowflake"
+        ):
+            yield from self._fetch_query_log(users, self.start_time, self.end_time)
+
+    def _fetch_query_log(
+        self, users: UsersMapping, start_time: datetime, end_time: datetime
+    ) -> Iterable[
+        Union[PreparsedQuery, TableRename, TableSwap, ObservedQuery, StoredProcCall]
     ]:
         query_log_query = QueryLogQueryBuilder(
-            start_time=self.start_time,
-            end_time=self.end_time,
+            start_time=start_time,
+            end_time=end_time,
             bucket_duration=self.config.window.bucket_duration,
             deny_usernames=self.config.pushdown_deny_usernames,
             allow_usernames=self.config.pushdown_allow_usernames,
@@ -469,28 +586,25 @@ class SnowflakeQueriesExtractor(SnowflakeStructuredReportMixin, Closeable):
             else None,
         ).build_enriched_query_log_query()
 
-        with self.structured_reporter.report_exc(
-            "Error fetching query log from Snowflake"
-        ):
-            logger.info("Fetching query log from Snowflake")
-            resp = self.connection.query(query_log_query)
+        logger.info("Fetching query log from Snowflake")
+        resp = self.connection.query(query_log_query)
 
-            for i, row in enumerate(resp):
-                if i > 0 and i % 1000 == 0:
-                    logger.info(f"Processed {i} query log rows so far")
+        for i, row in enumerate(resp):
+            if i > 0 and i % 1000 == 0:
+                logger.info(f"Processed {i} query log rows so far")
 
-                assert isinstance(row, dict)
-                try:
-                    entry = self._parse_audit_log_row(row, users)
-                except Exception as e:
-                    self.structured_reporter.warning(
-                        "Error parsing query log row",
-                        context=f"{row}",
-                        exc=e,
-                    )
-                else:
-                    if entry:
-                        yield entry
+            assert isinstance(row, dict)
+            try:
+                entry = self._parse_audit_log_row(row, users)
+            except Exception as e:
+                self.structured_reporter.warning(
+                    "Error parsing query log row",
+                    context=f"{row}",
+                    exc=e,
+                )
+            else:
+                if entry:
+                    yield entry
 
     @classmethod
     def _has_temp_keyword(cls, query_text: str) -> bool:
@@ -218,6 +218,9 @@ class SnowflakeSchemaGenerator(SnowflakeStructuredReportMixin):
     def snowflake_identifier(self, identifier: str) -> str:
         return self.identifiers.snowflake_identifier(identifier)
 
+    def close(self) -> None:
+        self.classification_handler.close()
+
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         if self.config.extract_tags_as_structured_properties:
             logger.info("Creating structured property templates for tags")
@@ -534,6 +534,7 @@ class SnowflakeV2Source(
             identifiers=self.identifiers,
             fetch_views_from_information_schema=self.config.fetch_views_from_information_schema,
         )
+        self._exit_stack.callback(schema_extractor.close)
 
         with self.report.new_stage(f"*: {METADATA_EXTRACTION}"):
             yield from schema_extractor.get_workunits_internal()
@@ -1470,6 +1470,10 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
     def get_report(self):
         return self.report
 
+    def close(self) -> None:
+        self.classification_handler.close()
+        super().close()
+
     def loop_stored_procedures(
         self,
         inspector: Inspector,
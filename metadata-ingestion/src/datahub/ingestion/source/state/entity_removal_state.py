@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple, Type
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence, Tuple, Type
 
 import pydantic
 
@@ -62,6 +63,32 @@ def pydantic_state_migrator(mapping: Dict[str, str]) -> "V1RootValidator":
     return pydantic.root_validator(pre=True, allow_reuse=True)(_validate_field_rename)
 
 
+def encode_compact_urns(urns: Iterable[str]) -> List[Tuple[int, str]]:
+    """
+    Front-codes the sorted urns. Sorted urns share long prefixes (e.g. the platform and
+    database), so each urn is stored as the length of the prefix it shares with the
+    previous urn plus the remaining suffix. This is smaller than the plain list,
+    and also makes the bz2 compression of the state considerably faster.
+    """
+
+    encoded: List[Tuple[int, str]] = []
+    previous = ""
+    for urn in sorted(urns):
+        prefix_len = len(os.path.commonprefix((previous, urn)))
+        encoded.append((prefix_len, urn[prefix_len:]))
+        previous = urn
+    return encoded
+
+
+def decode_compact_urns(encoded: Iterable[Sequence[Any]]) -> List[str]:
+    urns: List[str] = []
+    previous = ""
+    for prefix_len, suffix in encoded:
+        previous = previous[:prefix_len] + suffix
+        urns.append(previous)
+    return urns
+
+
 class GenericCheckpointState(CheckpointStateBase):
     urns: List[str] = pydantic.Field(default_factory=list)
 
@@ -71,6 +98,10 @@ class GenericCheckpointState(CheckpointStateBase):
     # it isn't JSON serializable.
     _urns_set: set = pydantic.PrivateAttr(default_factory=set)
 
+    # If enabled, the urns are serialized as `compact_urns` instead of `urns`.
+    # Reading either format is always supported.
+    _compact_serialization: bool = pydantic.PrivateAttr(default=False)
+
     _migration = pydantic_state_migrator(
         {
             # From SQL:
@@ -86,11 +117,37 @@ class GenericCheckpointState(CheckpointStateBase):
         }
     )
 
+    @pydantic.root_validator(pre=True, allow_reuse=True)
+    def _decode_compact_urns(cls, values: dict) -> dict:
+        if values.get("compact_urns") is not None:
+            values["urns"] = list(values.get("urns") or []) + decode_compact_urns(
+                values.pop("compact_urns")
+            )
+        return values
+
+    @pydantic.model_serializer(mode="wrap")
+    def _serialize_compact_urns(
+        self, handler: pydantic.SerializerFunctionWrapHandler
+    ) -> Dict[str, Any]:
+        data = handler(self)
+        if self._compact_serialization and "urns" in data:
+            data["compact_urns"] = encode_compact_urns(data.pop("urns"))
+        return data
+
     def __init__(self, **data: Any):  # type: ignore
         super().__init__(**data)
         self.urns = deduplicate_list(self.urns)
         self._urns_set = set(self.urns)
 
+    def enable_compact_serialization(self) -> None:
+        """
+        Serializes the urns sorted and front-coded, which keeps the state small for sources
+        with a large number of entities. Versions of the CLI without support for this format
+        will fail to read the state.
+        """
+
+        self._compact_serialization = True
+
     def add_checkpoint_urn(self, type: str, urn: str) -> None:
         """
         Adds an urn into the list used for tracking the type.
@@ -115,7 +172,10 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Stream over our own urns instead of materializing the set difference, since both
+        # states already keep a set of their urns.
+        other_urns = other_checkpoint_state._urns_set
+        diff = (urn for urn in self.urns if urn not in other_urns)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -136,11 +196,20 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: (1-|intersection(self, old_checkpoint_state)| / |old_checkpoint_state|) * 100.0
         """
 
-        old_urns_filtered = filter_ignored_entity_types(old_checkpoint_state.urns)
+        # The urns of both states are already deduplicated, so we can count the overlap
+        # directly against our urn set without building any temporary sets.
+        old_count = 0
+        overlap_count = 0
+        for urn in old_checkpoint_state.urns:
+            if _is_ignored_entity_type(urn):
+                continue
+            old_count += 1
+            if urn in self._urns_set:
+                overlap_count += 1
 
-        return compute_percent_entities_changed(
-            new_entities=self.urns, old_entities=old_urns_filtered
-        )
+        if old_count:
+            return (1 - overlap_count / old_count) * 100.0
+        return 0.0
 
     def urn_count(self) -> int:
         return len(self.urns)
@@ -176,11 +245,11 @@ def filter_ignored_entity_types(urns: List[str]) -> List[str]:
     # setting of `fail_safe_threshold` due to removal of irrelevant urns from new state,
     # here, we would ignore irrelevant urns from percentage entities changed computation
     # This special handling can be removed after few months.
-    return [
-        urn
-        for urn in urns
-        if not any(
-            urn.startswith(f"urn:li:{entityType}")
-            for entityType in STATEFUL_INGESTION_IGNORED_ENTITY_TYPES
-        )
-    ]
+    return [urn for urn in urns if not _is_ignored_entity_type(urn)]
+
+
+def _is_ignored_entity_type(urn: str) -> bool:
+    return any(
+        urn.startswith(f"urn:li:{entityType}")
+        for entityType in STATEFUL_INGESTION_IGNORED_ENTITY_TYPES
+    )
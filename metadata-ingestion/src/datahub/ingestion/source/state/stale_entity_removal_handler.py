@@ -46,6 +46,10 @@ class StatefulStaleMetadataRemovalConfig(StatefulIngestionConfig):
         le=100.0,
         ge=0.0,
     )
+    compact_state: bool = pydantic.Field(
+        default=False,
+        description="Stores the entity urns in the checkpoint state sorted and front-coded, which makes the state smaller and faster to serialize for sources with many entities. Older versions of the CLI can't read state written in this format.",
+    )
 
 
 @dataclass
@@ -195,7 +199,13 @@ class StaleEntityRemovalHandler(
         return self.checkpointing_enabled
 
     def _get_state_obj(self):
-        return self.state_type_class()
+        state = self.state_type_class()
+        if (
+            self.stateful_ingestion_config
+            and self.stateful_ingestion_config.compact_state
+        ):
+            state.enable_compact_serialization()
+        return state
 
     def create_checkpoint(self) -> Optional[Checkpoint]:
         if self.is_checkpointing_enabled() and not self._ignore_new_state():
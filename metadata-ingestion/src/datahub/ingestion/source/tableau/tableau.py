@@ -1,8 +1,11 @@
 import json
 import logging
+import pathlib
 import re
+import threading
 import time
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime, timedelta, timezone
@@ -10,6 +13,7 @@ from functools import lru_cache
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -118,6 +122,9 @@ from datahub.ingestion.source.tableau.tableau_common import (
     tableau_field_to_schema_field,
     workbook_graphql_query,
 )
+from datahub.ingestion.source.tableau.tableau_metadata_cache import (
+    TableauMetadataCache,
+)
 from datahub.ingestion.source.tableau.tableau_server_wrapper import UserInfo
 from datahub.ingestion.source.tableau.tableau_validation import check_user_role
 from datahub.metadata.com.linkedin.pegasus2avro.common import (
@@ -172,6 +179,7 @@ from datahub.sql_parsing.sqlglot_lineage import (
 )
 from datahub.utilities import config_clean
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.ordered_set import OrderedSet
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.stats_collections import TopKDict
 from datahub.utilities.urns.dataset_urn import DatasetUrn
@@ -202,6 +210,18 @@ RETRIABLE_ERROR_CODES = [
     504,  # Gateway Timeout
 ]
 
+# Buckets of the metadata query latency histograms, keyed by their upper bound in seconds.
+METADATA_QUERY_LATENCY_BUCKETS: List[Tuple[float, str]] = [
+    (0.5, "<=0.5s"),
+    (1, "<=1s"),
+    (2, "<=2s"),
+    (5, "<=5s"),
+    (10, "<=10s"),
+    (30, "<=30s"),
+    (60, "<=60s"),
+    (float("inf"), ">60s"),
+]
+
 # From experience, this expiry time typically ranges from 50 minutes
 # to 2 hours but might as well be configurable. We will allow upto
 # 10 minutes of such expiry time
@@ -242,6 +262,14 @@ class TableauConnectionConfig(ConfigModel):
     )
 
     max_retries: int = Field(3, description="Number of retries for failed requests.")
+    max_concurrent_metadata_queries: int = Field(
+        default=1,
+        ge=1,
+        description="[advanced] Maximum number of Metadata API queries to run at the same time. "
+        "Large filters are split into pages, and these pages are fetched concurrently. The cursor-based "
+        "pagination within a page is still sequential. Tableau rate-limits the Metadata API, so "
+        "increase this with care.",
+    )
     ssl_verify: Union[bool, str] = Field(
         default=True,
         description="Whether to verify SSL certificates. If using self-signed certificates, set to false or provide the path to the .pem certificate bundle.",
@@ -648,6 +676,13 @@ class TableauConfig(
         "This can only be used with ingest_tags enabled as it will overwrite tags entered from the UI.",
     )
 
+    metadata_cache_path: Optional[pathlib.Path] = Field(
+        default=None,
+        description="[advanced] Path to a local file used to cache objects fetched from the Metadata API across runs. "
+        "Sheets, dashboards and embedded datasources are only fetched again if their workbook was updated, "
+        "and published datasources if they were updated themselves. Cached objects are refetched after a week.",
+    )
+
     _fetch_size = pydantic_removed_field(
         "fetch_size",
     )
@@ -862,10 +897,36 @@ class TableauSourceReport(
     num_paginated_queries_by_connection_type: Dict[str, int] = dataclass_field(
         default_factory=(lambda: defaultdict(int))
     )
+    # Number of objects taken from the metadata cache (see metadata_cache_path) instead of being fetched.
+    num_metadata_cache_hits_by_connection_type: Dict[str, int] = dataclass_field(
+        default_factory=(lambda: defaultdict(int))
+    )
+    num_metadata_cache_misses_by_connection_type: Dict[str, int] = dataclass_field(
+        default_factory=(lambda: defaultdict(int))
+    )
+    # Latency histograms of the Metadata API queries by connection type.
+    metadata_query_latency_by_connection_type: Dict[str, Dict[str, int]] = (
+        dataclass_field(default_factory=dict)
+    )
 
     # Owner extraction statistics
     num_email_fallback_to_username: int = 0
 
+    def report_metadata_query_latency(
+        self, connection_type: str, latency_seconds: float
+    ) -> None:
+        histogram = self.metadata_query_latency_by_connection_type.get(connection_type)
+        if histogram is None:
+            histogram = {label: 0 for _, label in METADATA_QUERY_LATENCY_BUCKETS}
+            self.metadata_query_latency_by_connection_type[connection_type] = histogram
+
+        label = next(
+            label
+            for bound, label in METADATA_QUERY_LATENCY_BUCKETS
+            if latency_seconds <= bound
+        )
+        histogram[label] += 1
+
 
 def report_user_role(report: TableauSourceReport, server: Server) -> None:
     title: str = "Insufficient Permissions"
@@ -943,6 +1004,11 @@ class TableauSource(StatefulIngestionSourceBase, TestableSource):
         self.config: TableauConfig = config
         self.report: TableauSourceReport = TableauSourceReport()
         self.server: Optional[Server] = None
+        self.metadata_cache: Optional[TableauMetadataCache] = (
+            TableauMetadataCache(self.config.metadata_cache_path)
+            if self.config.metadata_cache_path
+            else None
+        )
         self._authenticate(self.config.site)
 
     def _authenticate(self, site_content_url: str) -> None:
@@ -1013,6 +1079,7 @@ class TableauSource(StatefulIngestionSourceBase, TestableSource):
                         report=self.report,
                         server=self.server,
                         platform=self.platform,
+                        metadata_cache=self.metadata_cache,
                     )
                     logger.info(f"Ingesting assets of site '{site.content_url}'.")
                     yield from site_source.ingest_tableau_site()
@@ -1039,6 +1106,7 @@ class TableauSource(StatefulIngestionSourceBase, TestableSource):
                     report=self.report,
                     server=self.server,
                     platform=self.platform,
+                    metadata_cache=self.metadata_cache,
                 )
                 yield from site_source.ingest_tableau_site()
 
@@ -1061,6 +1129,8 @@ class TableauSource(StatefulIngestionSourceBase, TestableSource):
                 ex,
             )
             self.server = None
+        if self.metadata_cache is not None:
+            self.metadata_cache.close()
         super().close()
 
 
@@ -1073,12 +1143,14 @@ class TableauSiteSource:
         report: TableauSourceReport,
         server: Server,
         platform: str,
+        metadata_cache: Optional[TableauMetadataCache] = None,
     ):
         self.config: TableauConfig = config
         self.report = report
         self.server: Server = server
         self.ctx: PipelineContext = ctx
         self.platform = platform
+        self.metadata_cache = metadata_cache
 
         self.site: Optional[SiteItem] = None
         if isinstance(site, SiteItem):
@@ -1119,6 +1191,15 @@ class TableauSiteSource:
         # when emitting custom SQL data sources.
         self.custom_sql_ids_being_used: List[str] = []
 
+        # Versions of the objects which are cached in the metadata cache, keyed by the object id
+        # for the children of workbooks, and by LUID for published datasources.
+        self.workbook_child_versions: Dict[str, str] = {}
+        self.datasource_versions: Dict[str, str] = {}
+
+        # Metadata queries may run concurrently, see get_connection_objects.
+        self._reauthentication_lock = threading.Lock()
+        self._report_lock = threading.Lock()
+
         report_user_role(report=report, server=server)
 
     @property
@@ -1342,6 +1423,10 @@ class TableauSiteSource:
                     )
                     continue
                 self.datasource_project_map[ds.id] = ds.project_id
+                if ds.updated_at:
+                    self.datasource_versions[ds.id] = (
+                        f"{ds.id}@{ds.updated_at.isoformat()}"
+                    )
         except Exception as e:
             self.report.get_all_datasources_query_failed = True
             self.report.warning(
@@ -1453,18 +1538,25 @@ class TableauSiteSource:
         )
         try:
             assert self.server is not None
-            self.report.num_actual_tableau_metadata_queries += 1
-            query_data = query_metadata_cursor_based_pagination(
-                server=self.server,
-                main_query=query,
-                connection_name=connection_type,
-                first=fetch_size,
-                after=current_cursor,
-                qry_filter=query_filter,
-            )
+            with self._report_lock:
+                self.report.num_actual_tableau_metadata_queries += 1
+            with PerfTimer() as timer:
+                query_data = query_metadata_cursor_based_pagination(
+                    server=self.server,
+                    main_query=query,
+                    connection_name=connection_type,
+                    first=fetch_size,
+                    after=current_cursor,
+                    qry_filter=query_filter,
+                )
+            with self._report_lock:
+                self.report.report_metadata_query_latency(
+                    connection_type, timer.elapsed_seconds()
+                )
 
         except REAUTHENTICATE_ERRORS as e:
-            self.report.tableau_server_error_stats[e.__class__.__name__] += 1
+            with self._report_lock:
+                self.report.tableau_server_error_stats[e.__class__.__name__] += 1
             if not retry_on_auth_error or retries_remaining <= 0:
                 raise
 
@@ -1472,14 +1564,16 @@ class TableauSiteSource:
             # - within few seconds of initial authentication . We'll retry without re-auth for such cases.
             # <class 'tableauserverclient.server.endpoint.exceptions.NonXMLResponseError'>:
             # b'{"timestamp":"xxx","status":401,"error":"Unauthorized","path":"/relationship-service-war/graphql"}'
-            if self.report.last_authenticated_at and (
-                datetime.now(timezone.utc) - self.report.last_authenticated_at
-                > REGULAR_AUTH_EXPIRY_PERIOD
-            ):
-                # If ingestion has been running for over 2 hours, the Tableau
-                # temporary credentials will expire. If this happens, this exception
-                # will be thrown, and we need to re-authenticate and retry.
-                self._re_authenticate()
+            # When queries run concurrently, only the first of them to fail re-authenticates.
+            with self._reauthentication_lock:
+                if self.report.last_authenticated_at and (
+                    datetime.now(timezone.utc) - self.report.last_authenticated_at
+                    > REGULAR_AUTH_EXPIRY_PERIOD
+                ):
+                    # If ingestion has been running for over 2 hours, the Tableau
+                    # temporary credentials will expire. If this happens, this exception
+                    # will be thrown, and we need to re-authenticate and retry.
+                    self._re_authenticate()
 
             return self.get_connection_object_page(
                 query=query,
@@ -1492,7 +1586,10 @@ class TableauSiteSource:
             )
 
         except InternalServerError as ise:
-            self.report.tableau_server_error_stats[InternalServerError.__name__] += 1
+            with self._report_lock:
+                self.report.tableau_server_error_stats[
+                    InternalServerError.__name__
+                ] += 1
             # In some cases Tableau Server returns 504 error, which is a timeout error, so it worths to retry.
             # Extended with other retryable errors.
             if ise.code in RETRIABLE_ERROR_CODES:
@@ -1512,7 +1609,8 @@ class TableauSiteSource:
                 raise ise
 
         except OSError:
-            self.report.tableau_server_error_stats[OSError.__name__] += 1
+            with self._report_lock:
+                self.report.tableau_server_error_stats[OSError.__name__] += 1
             # In tableauseverclient 0.26 (which was yanked and released in 0.28 on 2023-10-04),
             # the request logic was changed to use threads.
             # https://github.com/tableau/server-client-python/commit/307d8a20a30f32c1ce615cca7c6a78b9b9bff081
@@ -1655,34 +1753,127 @@ class TableauSiteSource:
             filter_pages
         )
 
-        for filter_page in filter_pages:
-            has_next_page = 1
-            current_cursor: Optional[str] = None
-            while has_next_page:
-                filter_: str = make_filter(filter_page)
+        max_workers = self.config.max_concurrent_metadata_queries
+        if max_workers <= 1 or len(filter_pages) <= 1:
+            for filter_page in filter_pages:
+                yield from self._get_filter_page_connection_objects(
+                    query, connection_type, page_size, filter_page
+                )
+            return
+
+        # Filter pages are fetched concurrently, but their objects are still yielded
+        # in order. To bound memory usage, we don't run too far ahead of the consumer.
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tableau-metadata-query"
+        )
+        pending: Deque[Future[List[dict]]] = deque()
+        try:
+            for filter_page in filter_pages:
+                if len(pending) >= 2 * max_workers:
+                    yield from pending.popleft().result()
+                pending.append(
+                    executor.submit(
+                        list,
+                        self._get_filter_page_connection_objects(
+                            query, connection_type, page_size, filter_page
+                        ),
+                    )
+                )
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_cached_connection_objects(
+        self,
+        query: str,
+        connection_type: str,
+        page_size: int,
+        object_ids: List[str],
+        get_version: Callable[[dict], Optional[str]],
+        prepare_object: Callable[[dict], dict] = lambda obj: obj,
+    ) -> Iterable[dict]:
+        """Like get_connection_objects with an id filter, but uses the metadata cache if enabled.
+
+        `get_version` returns the current version of an object, or None if it's unknown and the
+        object can't be cached. Objects are passed through `prepare_object` before being cached,
+        so that follow-up queries can be cached along with the object.
+        """
+
+        object_ids = list(OrderedSet(object_ids))
+        if self.metadata_cache is None:
+            missing_ids = object_ids
+        else:
+            missing_ids = []
+            for object_id in object_ids:
+                cached = self.metadata_cache.get(
+                    self.metadata_cache.make_key(self.site_id, query, object_id)
+                )
+                if cached is not None and cached[0] == get_version(cached[1]):
+                    self.report.num_metadata_cache_hits_by_connection_type[
+                        connection_type
+                    ] += 1
+                    yield cached[1]
+                else:
+                    self.report.num_metadata_cache_misses_by_connection_type[
+                        connection_type
+                    ] += 1
+                    missing_ids.append(object_id)
 
+            if not missing_ids:
+                return
+
+        for obj in self.get_connection_objects(
+            query=query,
+            connection_type=connection_type,
+            query_filter={c.ID_WITH_IN: missing_ids},
+            page_size=page_size,
+        ):
+            obj = prepare_object(obj)
+            version = get_version(obj)
+            if self.metadata_cache is not None and version is not None:
+                self.metadata_cache.set(
+                    self.metadata_cache.make_key(self.site_id, query, obj[c.ID]),
+                    version,
+                    obj,
+                )
+            yield obj
+
+    def _get_filter_page_connection_objects(
+        self,
+        query: str,
+        connection_type: str,
+        page_size: int,
+        filter_page: dict,
+    ) -> Iterable[dict]:
+        has_next_page = 1
+        current_cursor: Optional[str] = None
+        while has_next_page:
+            filter_: str = make_filter(filter_page)
+
+            with self._report_lock:
                 self.report.num_paginated_queries_by_connection_type[
                     connection_type
                 ] += 1
-
                 self.report.num_expected_tableau_metadata_queries += 1
-                (
-                    connection_objects,
-                    current_cursor,
-                    has_next_page,
-                ) = self.get_connection_object_page(
-                    query=query,
-                    connection_type=connection_type,
-                    query_filter=filter_,
-                    current_cursor=current_cursor,
-                    # `filter_page` contains metadata object IDs (e.g., Project IDs, Field IDs, Sheet IDs, etc.).
-                    # The number of IDs is always less than or equal to page_size.
-                    # If the IDs are primary keys, the number of metadata objects to load matches the number of records to return.
-                    # In our case, mostly, the IDs are primary key, therefore, fetch_size is set equal to page_size.
-                    fetch_size=page_size,
-                )
 
-                yield from connection_objects.get(c.NODES) or []
+            (
+                connection_objects,
+                current_cursor,
+                has_next_page,
+            ) = self.get_connection_object_page(
+                query=query,
+                connection_type=connection_type,
+                query_filter=filter_,
+                current_cursor=current_cursor,
+                # `filter_page` contains metadata object IDs (e.g., Project IDs, Field IDs, Sheet IDs, etc.).
+                # The number of IDs is always less than or equal to page_size.
+                # If the IDs are primary keys, the number of metadata objects to load matches the number of records to return.
+                # In our case, mostly, the IDs are primary key, therefore, fetch_size is set equal to page_size.
+                fetch_size=page_size,
+            )
+
+            yield from connection_objects.get(c.NODES) or []
 
     def emit_workbooks(self) -> Iterable[MetadataWorkUnit]:
         if self.tableau_project_registry:
@@ -1716,14 +1907,27 @@ class TableauSiteSource:
 
                 yield from self.emit_workbook_as_container(workbook)
 
+                # Sheets, dashboards and embedded datasources only change when their workbook is updated.
+                workbook_version = (
+                    f"{workbook[c.LUID]}@{workbook[c.UPDATED_AT]}"
+                    if workbook.get(c.LUID) and workbook.get(c.UPDATED_AT)
+                    else None
+                )
+
                 for sheet in workbook.get(c.SHEETS, []):
                     self.sheet_ids.append(sheet[c.ID])
+                    if workbook_version:
+                        self.workbook_child_versions[sheet[c.ID]] = workbook_version
 
                 for dashboard in workbook.get(c.DASHBOARDS, []):
                     self.dashboard_ids.append(dashboard[c.ID])
+                    if workbook_version:
+                        self.workbook_child_versions[dashboard[c.ID]] = workbook_version
 
                 for ds in workbook.get(c.EMBEDDED_DATA_SOURCES, []):
                     self.embedded_datasource_ids_being_used.append(ds[c.ID])
+                    if workbook_version:
+                        self.workbook_child_versions[ds[c.ID]] = workbook_version
 
     def _track_custom_sql_ids(self, field: dict) -> None:
         # Tableau shows custom sql datasource as a table in ColumnField's upstreamColumns.
@@ -2896,24 +3100,36 @@ class TableauSiteSource:
         return datasource
 
     def emit_published_datasources(self) -> Iterable[MetadataWorkUnit]:
-        datasource_filter = (
-            {}
-            if self.config.emit_all_published_datasources
-            else {c.ID_WITH_IN: self.datasource_ids_being_used}
-        )
-
-        for datasource in self.get_connection_objects(
-            query=published_datasource_graphql_query,
-            connection_type=c.PUBLISHED_DATA_SOURCES_CONNECTION,
-            query_filter=datasource_filter,
-            page_size=self.config.effective_published_datasource_page_size,
-        ):
-            datasource = self.update_datasource_for_field_upstream(
+        def update_datasource(datasource: dict) -> dict:
+            return self.update_datasource_for_field_upstream(
                 datasource=datasource,
                 field_upstream_query=datasource_upstream_fields_graphql_query,
                 page_size=self.config.effective_published_datasource_field_upstream_page_size,
             )
 
+        datasources: Iterable[dict]
+        if self.config.emit_all_published_datasources:
+            datasources = (
+                update_datasource(datasource)
+                for datasource in self.get_connection_objects(
+                    query=published_datasource_graphql_query,
+                    connection_type=c.PUBLISHED_DATA_SOURCES_CONNECTION,
+                    page_size=self.config.effective_published_datasource_page_size,
+                )
+            )
+        else:
+            datasources = self.get_cached_connection_objects(
+                query=published_datasource_graphql_query,
+                connection_type=c.PUBLISHED_DATA_SOURCES_CONNECTION,
+                page_size=self.config.effective_published_datasource_page_size,
+                object_ids=self.datasource_ids_being_used,
+                get_version=lambda datasource: self.datasource_versions.get(
+                    datasource.get(c.LUID) or ""
+                ),
+                prepare_object=update_datasource,
+            )
+
+        for datasource in datasources:
             yield from self.emit_datasource(datasource)
 
     def emit_upstream_tables(self) -> Iterable[MetadataWorkUnit]:
@@ -3123,14 +3339,16 @@ class TableauSiteSource:
             entityUrn=sheet_urn,
         ).as_workunit()
 
-    def emit_sheets(self) -> Iterable[MetadataWorkUnit]:
-        sheets_filter = {c.ID_WITH_IN: self.sheet_ids}
+    def _get_workbook_child_version(self, obj: dict) -> Optional[str]:
+        return self.workbook_child_versions.get(obj[c.ID])
 
-        for sheet in self.get_connection_objects(
+    def emit_sheets(self) -> Iterable[MetadataWorkUnit]:
+        for sheet in self.get_cached_connection_objects(
             query=sheet_graphql_query,
             connection_type=c.SHEETS_CONNECTION,
-            query_filter=sheets_filter,
             page_size=self.config.effective_sheet_page_size,
+            object_ids=self.sheet_ids,
+            get_version=self._get_workbook_child_version,
         ):
             if self._should_ingest_worksheet(sheet):
                 yield from self.emit_sheets_as_charts(sheet, sheet.get(c.WORKBOOK))
@@ -3445,13 +3663,12 @@ class TableauSiteSource:
         )
 
     def emit_dashboards(self) -> Iterable[MetadataWorkUnit]:
-        dashboards_filter = {c.ID_WITH_IN: self.dashboard_ids}
-
-        for dashboard in self.get_connection_objects(
+        for dashboard in self.get_cached_connection_objects(
             query=dashboard_graphql_query,
             connection_type=c.DASHBOARDS_CONNECTION,
-            query_filter=dashboards_filter,
             page_size=self.config.effective_dashboard_page_size,
+            object_ids=self.dashboard_ids,
+            get_version=self._get_workbook_child_version,
         ):
             if self._should_ingest_dashboard(dashboard):
                 yield from self.emit_dashboard(dashboard, dashboard.get(c.WORKBOOK))
@@ -3593,23 +3810,34 @@ class TableauSiteSource:
         return browse_paths
 
     def emit_embedded_datasources(self) -> Iterable[MetadataWorkUnit]:
-        datasource_filter = (
-            {}
-            if self.config.emit_all_embedded_datasources
-            else {c.ID_WITH_IN: self.embedded_datasource_ids_being_used}
-        )
-
-        for datasource in self.get_connection_objects(
-            query=embedded_datasource_graphql_query,
-            connection_type=c.EMBEDDED_DATA_SOURCES_CONNECTION,
-            query_filter=datasource_filter,
-            page_size=self.config.effective_embedded_datasource_page_size,
-        ):
-            datasource = self.update_datasource_for_field_upstream(
+        def update_datasource(datasource: dict) -> dict:
+            return self.update_datasource_for_field_upstream(
                 datasource=datasource,
                 field_upstream_query=datasource_upstream_fields_graphql_query,
                 page_size=self.config.effective_embedded_datasource_field_upstream_page_size,
             )
+
+        datasources: Iterable[dict]
+        if self.config.emit_all_embedded_datasources:
+            datasources = (
+                update_datasource(datasource)
+                for datasource in self.get_connection_objects(
+                    query=embedded_datasource_graphql_query,
+                    connection_type=c.EMBEDDED_DATA_SOURCES_CONNECTION,
+                    page_size=self.config.effective_embedded_datasource_page_size,
+                )
+            )
+        else:
+            datasources = self.get_cached_connection_objects(
+                query=embedded_datasource_graphql_query,
+                connection_type=c.EMBEDDED_DATA_SOURCES_CONNECTION,
+                page_size=self.config.effective_embedded_datasource_page_size,
+                object_ids=self.embedded_datasource_ids_being_used,
+                get_version=self._get_workbook_child_version,
+                prepare_object=update_datasource,
+            )
+
+        for datasource in datasources:
             yield from self.emit_datasource(
                 datasource,
                 datasource.get(c.WORKBOOK),
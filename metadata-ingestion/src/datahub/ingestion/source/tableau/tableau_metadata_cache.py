@@ -0,0 +1,71 @@
+import dataclasses
+import hashlib
+import json
+import pathlib
+from datetime import timedelta
+from typing import Optional, Tuple
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_collections import PersistentFileBackedDict
+
+_CACHE_TABLE_NAME = "tableau_metadata_cache"
+
+# Objects can change without their version changing, e.g. a sheet's fields when the
+# published datasource they come from is modified. Refetching every object once in a
+# while bounds how stale the cache can get.
+DEFAULT_METADATA_CACHE_TTL = timedelta(days=7)
+
+
+@dataclasses.dataclass
+class _CachedObject:
+    version: str
+    # The object is serialized as soon as it's added, since callers may modify it.
+    object_json: str
+
+
+class TableauMetadataCache(Closeable):
+    """A persistent cache of objects fetched from the Tableau Metadata API.
+
+    Entries are keyed by the site, the query and the id of the object, and record
+    a version of the object along with it. The version is derived from the LUID and
+    `updatedAt` of the object, or of the workbook it's part of. Callers compute the
+    current version of each object and only need to fetch the objects which changed.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        ttl: timedelta = DEFAULT_METADATA_CACHE_TTL,
+    ):
+        self.path = path
+        self.ttl = ttl
+
+        # Objects expire once they're `ttl` old, even if they're still being used.
+        self._cache = PersistentFileBackedDict[_CachedObject](
+            path=path,
+            tablename=_CACHE_TABLE_NAME,
+            ttl=ttl,
+            touch_on_get=False,
+        )
+
+    @classmethod
+    def make_key(cls, site_id: str, query: str, object_id: str) -> str:
+        query_hash = hashlib.sha256(query.encode()).hexdigest()
+        return json.dumps([site_id, query_hash, object_id])
+
+    def get(self, key: str) -> Optional[Tuple[str, dict]]:
+        """Returns the version of the cached object along with the object."""
+
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        return entry.version, json.loads(entry.object_json)
+
+    def set(self, key: str, version: str, obj: dict) -> None:
+        self._cache[key] = _CachedObject(version=version, object_json=json.dumps(obj))
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def close(self) -> None:
+        self._cache.close()
@@ -101,14 +101,23 @@ class AddDatasetOwnership(OwnershipTransformer):
 
         logger.debug("Generating Ownership for containers")
         ownership_container_mapping: Dict[str, List[OwnerClass]] = {}
-        for entity_urn, data_ownerships in (
-            (urn, self.config.get_owners_to_add(urn)) for urn in self.entity_map
-        ):
-            if not data_ownerships:
-                continue
+        owners_to_add = {
+            urn: data_ownerships
+            for urn, data_ownerships in (
+                (urn, self.config.get_owners_to_add(urn)) for urn in self.entity_map
+            )
+            if data_ownerships
+        }
+        if not owners_to_add:
+            return []
 
-            assert self.ctx.graph
-            browse_paths = self.ctx.graph.get_aspect(entity_urn, BrowsePathsV2Class)
+        # Fetch the browse paths of all the entities with a few batched requests.
+        assert self.ctx.graph
+        all_browse_paths = self.ctx.graph.get_aspects_for_urns(
+            owners_to_add, BrowsePathsV2Class
+        )
+        for entity_urn, data_ownerships in owners_to_add.items():
+            browse_paths = all_browse_paths[entity_urn]
             if not browse_paths:
                 continue
 
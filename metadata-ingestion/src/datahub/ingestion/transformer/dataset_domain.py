@@ -124,14 +124,23 @@ class AddDatasetDomain(DatasetDomainTransformer):
         if not self.config.is_container:
             return domain_mcps
 
-        for entity_urn, domain_to_add in (
-            (urn, self.config.get_domains_to_add(urn)) for urn in self.entity_map
-        ):
-            if not domain_to_add or not domain_to_add.domains:
-                continue
+        domains_to_add = {
+            urn: domain_to_add
+            for urn, domain_to_add in (
+                (urn, self.config.get_domains_to_add(urn)) for urn in self.entity_map
+            )
+            if domain_to_add and domain_to_add.domains
+        }
+        if not domains_to_add:
+            return domain_mcps
 
-            assert self.ctx.graph
-            browse_paths = self.ctx.graph.get_aspect(entity_urn, BrowsePathsV2Class)
+        # Fetch the browse paths of all the entities with a few batched requests.
+        assert self.ctx.graph
+        all_browse_paths = self.ctx.graph.get_aspects_for_urns(
+            domains_to_add, BrowsePathsV2Class
+        )
+        for entity_urn, domain_to_add in domains_to_add.items():
+            browse_paths = all_browse_paths[entity_urn]
             if not browse_paths:
                 continue
 
@@ -0,0 +1,316 @@
+import concurrent.futures
+import dataclasses
+import logging
+import multiprocessing
+import pathlib
+import pickle
+import shutil
+import sqlite3
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.ingestion.api.report import Report
+from datahub.sql_parsing.schema_resolver import SchemaInfo, SchemaResolver
+from datahub.sql_parsing.sqlglot_lineage import SqlParsingResult, sqlglot_lineage
+from datahub.sql_parsing.sqlglot_utils import DialectOrStr
+from datahub.utilities.perf_timer import PerfTimer
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_TABLE_NAME = "schemas"
+
+
+@dataclasses.dataclass(frozen=True)
+class ParseRequest:
+    query: str
+    default_db: Optional[str] = None
+    default_schema: Optional[str] = None
+    override_dialect: Optional[DialectOrStr] = None
+
+
+@dataclasses.dataclass
+class _ParseBatchTask:
+    platform: str
+    platform_instance: Optional[str]
+    env: str
+    snapshot_path: str
+    snapshot_version: int
+    requests: List[ParseRequest]
+
+
+@dataclasses.dataclass
+class ParallelSqlParserReport(Report):
+    num_workers: int = 0
+    num_batches_submitted: int = 0
+    num_queries_submitted: int = 0
+    num_batches_failed: int = 0
+    num_batches_timed_out: int = 0
+    num_schema_snapshots: int = 0
+
+    schema_snapshot_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
+    parallel_parse_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
+
+
+class _SchemaSnapshotResolver(SchemaResolver):
+    """A schema resolver that reads from a read-only snapshot of another resolver.
+
+    This is what worker processes use. The snapshot is a plain SQLite file written
+    by the main process, since the main process's schema cache uses an exclusive
+    lock and can't be read concurrently. The main process only ever adds schemas
+    to the snapshot, which uses WAL mode so that it can be read while it's written.
+    """
+
+    def __init__(
+        self,
+        *,
+        snapshot_path: str,
+        snapshot_version: int,
+        platform: str,
+        platform_instance: Optional[str],
+        env: str,
+    ):
+        super().__init__(
+            platform=platform, platform_instance=platform_instance, env=env
+        )
+        self.snapshot_path = snapshot_path
+        self.snapshot_version = snapshot_version
+        self._snapshot_conn = sqlite3.connect(
+            f"file:{snapshot_path}?mode=ro", uri=True, check_same_thread=False
+        )
+
+    def _resolve_schema_info(self, urn: str) -> Optional[SchemaInfo]:
+        if urn in self._schema_cache:
+            return self._schema_cache[urn]
+
+        row = self._snapshot_conn.execute(
+            f"SELECT value FROM {_SNAPSHOT_TABLE_NAME} WHERE urn = ?", (urn,)
+        ).fetchone()
+        schema_info: Optional[SchemaInfo] = pickle.loads(row[0]) if row else None
+
+        self._save_to_cache(urn, schema_info)
+        return schema_info
+
+    def close(self) -> None:
+        self._snapshot_conn.close()
+        super().close()
+
+
+# Each worker process keeps a single resolver around, and only swaps it out
+# when the main process adds schemas to the snapshot. Otherwise, the resolver's
+# in-memory cache would keep treating the newly added schemas as missing.
+_worker_schema_resolver: Optional[_SchemaSnapshotResolver] = None
+
+
+def _get_worker_schema_resolver(task: _ParseBatchTask) -> _SchemaSnapshotResolver:
+    global _worker_schema_resolver
+
+    if (
+        _worker_schema_resolver is None
+        or _worker_schema_resolver.snapshot_path != task.snapshot_path
+        or _worker_schema_resolver.snapshot_version != task.snapshot_version
+    ):
+        if _worker_schema_resolver is not None:
+            _worker_schema_resolver.close()
+        _worker_schema_resolver = _SchemaSnapshotResolver(
+            snapshot_path=task.snapshot_path,
+            snapshot_version=task.snapshot_version,
+            platform=task.platform,
+            platform_instance=task.platform_instance,
+            env=task.env,
+        )
+    return _worker_schema_resolver
+
+
+def _parse_batch(task: _ParseBatchTask) -> List[SqlParsingResult]:
+    schema_resolver = _get_worker_schema_resolver(task)
+
+    # Column-level lineage generation is still bounded by the cooperative
+    # timeout inside sqlglot_lineage, exactly as it is on the main thread.
+    return [
+        sqlglot_lineage(
+            request.query,
+            schema_resolver=schema_resolver,
+            default_db=request.default_db,
+            default_schema=request.default_schema,
+            override_dialect=request.override_dialect,
+        )
+        for request in task.requests
+    ]
+
+
+class ParallelSqlParser(Closeable):
+    """Runs sqlglot_lineage across a pool of worker processes.
+
+    SQL parsing is CPU-bound, so running it on threads doesn't help much. Instead,
+    we ship batches of queries to worker processes and send the SqlParsingResults
+    back. Workers can't share the main process's schema resolver, so we maintain a
+    read-only snapshot of it, adding any new schemas before each round of parsing.
+    Schemas that are lazily fetched from DataHub are not visible to the workers
+    until the next round.
+
+    Batches that fail or exceed `batch_timeout` are returned as None, and it's up
+    to the caller to parse those queries on the main thread instead. A worker can't
+    be interrupted mid-batch, so a timed out batch keeps running in the background
+    until it finishes. Its result is discarded, and the pool of workers is replaced
+    so that later batches don't queue up behind it.
+    """
+
+    def __init__(
+        self,
+        *,
+        schema_resolver: SchemaResolver,
+        max_workers: int,
+        batch_size: int,
+        batch_timeout: Optional[float] = None,
+        report: Optional[ParallelSqlParserReport] = None,
+    ):
+        assert max_workers >= 1
+        assert batch_size >= 1
+
+        self._schema_resolver = schema_resolver
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.report = report or ParallelSqlParserReport()
+        self.report.num_workers = max_workers
+
+        self._snapshot_dir = pathlib.Path(tempfile.mkdtemp(prefix="sql_parse_"))
+        self._snapshot_path = self._snapshot_dir / "schemas.db"
+        self._snapshot_version: Optional[int] = None
+        self._snapshot_conn = sqlite3.connect(self._snapshot_path)
+        self._snapshot_conn.execute("PRAGMA journal_mode=WAL")
+        self._snapshot_conn.execute(
+            f"CREATE TABLE {_SNAPSHOT_TABLE_NAME} (urn TEXT PRIMARY KEY, value BLOB)"
+        )
+        self._snapshot_conn.commit()
+
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            # The fork start method is not safe when the main process uses threads.
+            # See the comment in classification_mixin.py for more details.
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _refresh_schema_snapshot(self) -> int:
+        version = self._schema_resolver._schema_cache_version
+        if self._snapshot_version == version:
+            return version
+
+        # Only the schemas added since the last refresh need to be written.
+        cond_sql = "NOT is_missing"
+        if self._snapshot_version is not None:
+            cond_sql += f" AND version > {self._snapshot_version}"
+
+        with self.report.schema_snapshot_timer:
+            self._snapshot_conn.executemany(
+                f"INSERT OR REPLACE INTO {_SNAPSHOT_TABLE_NAME} (urn, value) VALUES (?, ?)",
+                (
+                    (urn, pickle.dumps(schema_info))
+                    for urn, schema_info in self._schema_resolver._schema_cache.items_snapshot(
+                        cond_sql
+                    )
+                ),
+            )
+            self._snapshot_conn.commit()
+
+        self._snapshot_version = version
+        self.report.num_schema_snapshots += 1
+        return version
+
+    def parse_many(
+        self, requests: List[ParseRequest]
+    ) -> List[Optional[SqlParsingResult]]:
+        """Parse the requests in worker processes, preserving the input order.
+
+        Entries are None if the batch they belonged to failed or timed out.
+        """
+
+        if not requests:
+            return []
+
+        with self.report.parallel_parse_timer:
+            snapshot_version = self._refresh_schema_snapshot()
+
+            batches: List[
+                Tuple[int, "concurrent.futures.Future[List[SqlParsingResult]]"]
+            ] = []
+            for start in range(0, len(requests), self.batch_size):
+                task = _ParseBatchTask(
+                    platform=self._schema_resolver.platform,
+                    platform_instance=self._schema_resolver.platform_instance,
+                    env=self._schema_resolver.env,
+                    snapshot_path=str(self._snapshot_path),
+                    snapshot_version=snapshot_version,
+                    requests=requests[start : start + self.batch_size],
+                )
+                batches.append((start, self._executor.submit(_parse_batch, task)))
+                self.report.num_batches_submitted += 1
+                self.report.num_queries_submitted += len(task.requests)
+
+            results: List[Optional[SqlParsingResult]] = [None] * len(requests)
+            timed_out = False
+            for start, future in batches:
+                try:
+                    batch_results = future.result(timeout=self.batch_timeout)
+                except concurrent.futures.TimeoutError:
+                    timed_out = True
+                    self.report.num_batches_timed_out += 1
+                    logger.debug(
+                        f"Parsing batch starting at {start} exceeded the "
+                        f"{self.batch_timeout}s batch timeout"
+                    )
+                    continue
+                except Exception as e:
+                    self.report.num_batches_failed += 1
+                    logger.debug(
+                        f"Parsing batch starting at {start} failed: {e}", exc_info=True
+                    )
+                    continue
+
+                results[start : start + len(batch_results)] = batch_results
+
+            if timed_out:
+                # The old workers exit once they're done with the abandoned batches.
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+
+        return results
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._snapshot_conn.close()
+        shutil.rmtree(self._snapshot_dir, ignore_errors=True)
+
+
+def get_parse_request_key(
+    request: ParseRequest, query_hash: Optional[str] = None
+) -> Tuple[Optional[str], ...]:
+    # Queries with the same hash are guaranteed to generate the same lineage,
+    # which lets us send only one of them to the workers.
+    return (
+        query_hash or request.query,
+        request.default_db,
+        request.default_schema,
+        str(request.override_dialect) if request.override_dialect else None,
+    )
+
+
+def dedup_parse_requests(
+    requests: List[Tuple[ParseRequest, Optional[str]]],
+) -> Tuple[List[ParseRequest], List[int]]:
+    """Returns the unique requests, plus an index into them for every input request."""
+
+    unique: List[ParseRequest] = []
+    index_by_key: Dict[Tuple[Optional[str], ...], int] = {}
+    positions: List[int] = []
+    for request, query_hash in requests:
+        key = get_parse_request_key(request, query_hash)
+        if key not in index_by_key:
+            index_by_key[key] = len(unique)
+            unique.append(request)
+        positions.append(index_by_key[key])
+    return unique, positions
@@ -76,9 +76,19 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
         shared_conn = None
         if _cache_filename:
             shared_conn = ConnectionWrapper(filename=_cache_filename)
+        # Bumped whenever a non-empty schema is added to the cache. Consumers that
+        # snapshot the cache (e.g. the parallel SQL parser) use it to detect changes.
+        self._schema_cache_version = 0
+
         self._schema_cache: FileBackedDict[Optional[SchemaInfo]] = FileBackedDict(
             shared_connection=shared_conn,
-            extra_columns={"is_missing": lambda v: v is None},
+            extra_columns={
+                "is_missing": lambda v: v is None,
+                # Rows are written when they get flushed, which always happens after
+                # the version bump in _save_to_cache. As such, every schema added after
+                # a snapshot at version N is stored with a version greater than N.
+                "version": lambda v: self._schema_cache_version,
+            },
         )
 
     @property
@@ -240,6 +250,8 @@ class SchemaResolver(Closeable, SchemaResolverInterface):
         )
 
     def _save_to_cache(self, urn: str, schema_info: Optional[SchemaInfo]) -> None:
+        if schema_info is not None:
+            self._schema_cache_version += 1
         self._schema_cache[urn] = schema_info
 
     def _fetch_schema_info(self, graph: DataHubGraph, urn: str) -> Optional[SchemaInfo]:
@@ -283,6 +295,9 @@ class _SchemaResolverWithExtras(SchemaResolverInterface):
     def includes_temp_tables(self) -> bool:
         return True
 
+    def has_extra_schemas(self) -> bool:
+        return bool(self._extra_schemas)
+
     def resolve_table(self, table: _TableName) -> Tuple[str, Optional[SchemaInfo]]:
         urn = self._base_resolver.get_urn_for_table(
             table, lower=self._base_resolver._prefers_urn_lower()
@@ -32,11 +32,21 @@ from datahub.metadata.urns import (
     Urn,
 )
 from datahub.sql_parsing.fingerprint_utils import generate_hash
+from datahub.sql_parsing.parallel_sql_parser import (
+    ParallelSqlParser,
+    ParallelSqlParserReport,
+    ParseRequest,
+    dedup_parse_requests,
+)
 from datahub.sql_parsing.schema_resolver import (
     SchemaResolver,
     SchemaResolverInterface,
     _SchemaResolverWithExtras,
 )
+from datahub.sql_parsing.sql_parsing_cache import (
+    PersistentSqlParsingCache,
+    compute_schema_hash,
+)
 from datahub.sql_parsing.sql_parsing_common import QueryType, QueryTypeProps
 from datahub.sql_parsing.sqlglot_lineage import (
     ColumnLineageInfo,
@@ -87,6 +97,9 @@ _DEFAULT_QUERY_LOG_SETTING = QueryLogSetting[
 ]
 MAX_UPSTREAM_TABLES_COUNT = 300
 MAX_FINEGRAINEDLINEAGE_COUNT = 2000
+# In parallel parsing mode, this many batches per worker are buffered before
+# they are handed to the worker pool.
+_PARALLEL_PARSING_BATCHES_PER_WORKER = 4
 
 
 @dataclasses.dataclass
@@ -272,6 +285,13 @@ class PreparsedQuery:
     origin: Optional[Urn] = None
 
 
+@dataclasses.dataclass
+class _PendingObservedQuery:
+    observed: ObservedQuery
+    is_known_temp_table: bool
+    require_out_table_schema: bool
+
+
 @dataclasses.dataclass
 class SqlAggregatorReport(Report):
     _aggregator: "SqlParsingAggregator"
@@ -304,6 +324,19 @@ class SqlAggregatorReport(Report):
     parse_statement_cache_stats: Optional[dict] = dataclasses.field(default=None)
     format_query_cache_stats: Optional[dict] = dataclasses.field(default=None)
 
+    # Parallel SQL parsing.
+    num_sql_parsed_in_workers: int = 0
+    num_parallel_parse_duplicates: int = 0
+    num_parallel_parse_fallbacks: int = 0
+    parallel_parsing: Optional[ParallelSqlParserReport] = None
+
+    # Persistent SQL parsing cache.
+    sql_parsing_cache_path: Optional[str] = None
+    num_sql_parsing_cache_hits: int = 0
+    num_sql_parsing_cache_misses: int = 0
+    num_sql_parsing_cache_stale: int = 0
+    sql_parsing_cache_size: Optional[int] = None
+
     # Other lineage loading metrics.
     num_known_query_lineage: int = 0
     num_preparsed_queries: int = 0
@@ -361,6 +394,8 @@ class SqlAggregatorReport(Report):
         self.sql_parsing_cache_stats = _sqlglot_lineage_cached.cache_info()._asdict()
         self.parse_statement_cache_stats = _parse_statement.cache_info()._asdict()
         self.format_query_cache_stats = try_format_query.cache_info()._asdict()
+        if self._aggregator._parse_cache is not None:
+            self.sql_parsing_cache_size = len(self._aggregator._parse_cache)
 
         return super().compute_stats()
 
@@ -386,6 +421,10 @@ class SqlParsingAggregator(Closeable):
         is_allowed_table: Optional[Callable[[str], bool]] = None,
         format_queries: bool = True,
         query_log: QueryLogSetting = _DEFAULT_QUERY_LOG_SETTING,
+        parallel_parsing_workers: Optional[int] = None,
+        parallel_parsing_batch_size: int = 100,
+        parallel_parsing_timeout: Optional[float] = None,
+        parse_cache_path: Optional[pathlib.Path] = None,
     ) -> None:
         self.platform = DataPlatformUrn(platform)
         self.platform_instance = platform_instance
@@ -544,7 +583,35 @@ class SqlParsingAggregator(Closeable):
         self._tool_meta_extractor = ToolMetaExtractor.create(graph)
         self.report.tool_meta_report = self._tool_meta_extractor.report
 
+        # Persistent SQL parsing cache, which is reused across runs.
+        self._parse_cache: Optional[PersistentSqlParsingCache] = None
+        if parse_cache_path is not None:
+            self.report.sql_parsing_cache_path = str(parse_cache_path)
+            self._parse_cache = self._exit_stack.enter_context(
+                PersistentSqlParsingCache(parse_cache_path)
+            )
+
+        # Parallel SQL parsing. When enabled, observed queries are buffered and
+        # parsed in worker processes, and then processed in their original order.
+        self._parallel_parser: Optional[ParallelSqlParser] = None
+        self._pending_observed_queries: List[_PendingObservedQuery] = []
+        if parallel_parsing_workers and parallel_parsing_workers > 1:
+            self.report.parallel_parsing = ParallelSqlParserReport()
+            self._parallel_parser = ParallelSqlParser(
+                schema_resolver=self._schema_resolver,
+                max_workers=parallel_parsing_workers,
+                batch_size=parallel_parsing_batch_size,
+                batch_timeout=parallel_parsing_timeout,
+                report=self.report.parallel_parsing,
+            )
+            # Registered last so that it's closed first.
+            self._exit_stack.push(self._parallel_parser)
+
     def close(self) -> None:
+        # Don't drop any queries that are still waiting to be parsed.
+        if not self._closed:
+            self._flush_pending_observed_queries()
+
         # Compute stats once before closing connections
         self.report.compute_stats()
         self._closed = True
@@ -569,6 +636,8 @@ class SqlParsingAggregator(Closeable):
         # logic that we previously needed in each source
 
         if self._need_schemas:
+            # Queries observed before this schema was registered must not see it.
+            self._flush_pending_observed_queries()
             self._schema_resolver.add_schema_metadata(str(urn), schema)
 
     def register_schemas_from_stream(
@@ -669,6 +738,7 @@ class SqlParsingAggregator(Closeable):
                 for the query ID.
         """
 
+        self._flush_pending_observed_queries()
         self.report.num_known_query_lineage += 1
 
         # Generate a fingerprint for the query.
@@ -728,6 +798,7 @@ class SqlParsingAggregator(Closeable):
         logger.debug(
             f"Adding lineage to the map, downstream: {downstream_urn}, upstream: {upstream_urn}"
         )
+        self._flush_pending_observed_queries()
         self.report.num_known_mapping_lineage += 1
 
         # We generate a fake "query" object to hold the lineage.
@@ -816,7 +887,129 @@ class SqlParsingAggregator(Closeable):
         map, which will get used in subsequent queries with the same session ID.
 
         This assumes that queries come in order of increasing timestamps.
+
+        If parallel parsing is enabled, the query is buffered and only processed
+        once a full batch of queries has been parsed by the worker pool.
         """
+        pending = _PendingObservedQuery(
+            observed=observed,
+            is_known_temp_table=is_known_temp_table,
+            require_out_table_schema=require_out_table_schema,
+        )
+        if self._parallel_parser is None:
+            self._process_observed_query(pending, parsed=None)
+            return
+
+        self._pending_observed_queries.append(pending)
+        if len(self._pending_observed_queries) >= (
+            self._parallel_parser.batch_size
+            * self._parallel_parser.max_workers
+            * _PARALLEL_PARSING_BATCHES_PER_WORKER
+        ):
+            self._flush_pending_observed_queries()
+
+    def _flush_pending_observed_queries(self) -> None:
+        if not self._pending_observed_queries:
+            return
+        assert self._parallel_parser is not None
+
+        pending_queries = self._pending_observed_queries
+        self._pending_observed_queries = []
+
+        # Only unique queries are shipped off to the workers.
+        unique_requests, positions = dedup_parse_requests(
+            [
+                (
+                    ParseRequest(
+                        query=pending.observed.query,
+                        default_db=pending.observed.default_db,
+                        default_schema=pending.observed.default_schema,
+                        override_dialect=pending.observed.override_dialect,
+                    ),
+                    pending.observed.query_hash,
+                )
+                for pending in pending_queries
+            ]
+        )
+        self.report.num_parallel_parse_duplicates += len(pending_queries) - len(
+            unique_requests
+        )
+
+        # Each unique query is only looked up in the parse cache once, here.
+        results: List[Optional[SqlParsingResult]] = [None] * len(unique_requests)
+        from_parse_cache: List[bool] = [False] * len(unique_requests)
+        to_parse: List[int] = []
+        for i, request in enumerate(unique_requests):
+            results[i] = self._get_cached_parse_result(request)
+            if results[i] is None:
+                to_parse.append(i)
+            else:
+                from_parse_cache[i] = True
+
+        parsed_results = self._parallel_parser.parse_many(
+            [unique_requests[i] for i in to_parse]
+        )
+        for i, parsed in zip(to_parse, parsed_results):
+            results[i] = parsed
+            # Results which still need schemas from DataHub are re-parsed by the main
+            # process, which caches its result instead.
+            if parsed is not None and not self._needs_schemas_from_graph(parsed):
+                self._set_cached_parse_result(unique_requests[i], parsed)
+
+        for pending, position in zip(pending_queries, positions):
+            self._process_observed_query(
+                pending,
+                parsed=results[position],
+                from_parse_cache=from_parse_cache[position],
+                parse_cache_checked=True,
+            )
+
+    def _is_base_schema_resolver(
+        self, schema_resolver: SchemaResolverInterface
+    ) -> bool:
+        # Whether the resolver is equivalent to the base schema resolver,
+        # i.e. it doesn't have any temp tables registered.
+        if not schema_resolver.includes_temp_tables():
+            return True
+        return (
+            schema_resolver is self._missing_session_schema_resolver
+            and not self._missing_session_schema_resolver.has_extra_schemas()
+        )
+
+    def _needs_schemas_from_graph(self, parsed: SqlParsingResult) -> bool:
+        # Workers can't fetch schemas from DataHub. Give the main schema resolver
+        # a chance to do so if the worker couldn't resolve everything.
+        return (
+            self._schema_resolver.graph is not None
+            and parsed.debug_info.table_schemas_resolved
+            < parsed.debug_info.tables_discovered
+        )
+
+    def _can_use_parallel_parse_result(
+        self,
+        schema_resolver: SchemaResolverInterface,
+        parsed: SqlParsingResult,
+        from_parse_cache: bool,
+    ) -> bool:
+        # Workers only see the base schema resolver. If this session has temp
+        # tables registered, the query needs to be re-parsed with them in scope.
+        if not self._is_base_schema_resolver(schema_resolver):
+            return False
+
+        # Cached results were parsed by the main process if they needed it.
+        return from_parse_cache or not self._needs_schemas_from_graph(parsed)
+
+    def _process_observed_query(
+        self,
+        pending: "_PendingObservedQuery",
+        parsed: Optional[SqlParsingResult],
+        from_parse_cache: bool = False,
+        parse_cache_checked: bool = False,
+    ) -> None:
+        observed = pending.observed
+        is_known_temp_table = pending.is_known_temp_table
+        require_out_table_schema = pending.require_out_table_schema
+
         self.report.num_observed_queries += 1
 
         # All queries with no session ID are assumed to be part of the same session.
@@ -829,17 +1022,35 @@ class SqlParsingAggregator(Closeable):
             )
             session_has_temp_tables = schema_resolver.includes_temp_tables()
 
-        # Run the SQL parser.
-        parsed = self._run_sql_parser(
-            observed.query,
-            default_db=observed.default_db,
-            default_schema=observed.default_schema,
-            schema_resolver=schema_resolver,
-            session_id=session_id,
-            timestamp=observed.timestamp,
-            user=observed.user,
-            override_dialect=observed.override_dialect,
-        )
+        if parsed is not None and self._can_use_parallel_parse_result(
+            schema_resolver, parsed, from_parse_cache
+        ):
+            self.report.num_sql_parsed_in_workers += 1
+            self._record_sql_parse(
+                parsed,
+                observed.query,
+                default_db=observed.default_db,
+                default_schema=observed.default_schema,
+                session_id=session_id,
+                timestamp=observed.timestamp,
+                user=observed.user,
+            )
+        else:
+            if self._parallel_parser is not None:
+                self.report.num_parallel_parse_fallbacks += 1
+
+            # Run the SQL parser.
+            parsed = self._run_sql_parser(
+                observed.query,
+                default_db=observed.default_db,
+                default_schema=observed.default_schema,
+                schema_resolver=schema_resolver,
+                session_id=session_id,
+                timestamp=observed.timestamp,
+                user=observed.user,
+                override_dialect=observed.override_dialect,
+                check_parse_cache=not parse_cache_checked,
+            )
         if parsed.debug_info.error:
             self.report.observed_query_parse_failures.append(
                 f"{parsed.debug_info.error} on query: {observed.query[:100]}"
@@ -892,6 +1103,7 @@ class SqlParsingAggregator(Closeable):
         self._tool_meta_extractor.extract_bi_metadata(parsed)
 
         if not _is_internal:
+            self._flush_pending_observed_queries()
             self.report.num_preparsed_queries += 1
 
         if parsed.timestamp:
@@ -1009,6 +1221,7 @@ class SqlParsingAggregator(Closeable):
         will instead generate lineage for the new urn.
         """
 
+        self._flush_pending_observed_queries()
         self.report.num_table_renames += 1
 
         # This will not work if the table is renamed multiple times.
@@ -1041,6 +1254,7 @@ class SqlParsingAggregator(Closeable):
             table_swap.urn1, table_swap.urn2: The dataset URNs to swap.
         """
 
+        self._flush_pending_observed_queries()
         if table_swap.id() in self._table_swaps:
             # We have already processed this table swap once
             return
@@ -1174,15 +1388,102 @@ class SqlParsingAggregator(Closeable):
         timestamp: Optional[datetime] = None,
         user: Optional[Union[CorpUserUrn, CorpGroupUrn]] = None,
         override_dialect: Optional[DialectOrStr] = None,
+        check_parse_cache: bool = True,
     ) -> SqlParsingResult:
+        request = ParseRequest(
+            query=query,
+            default_db=default_db,
+            default_schema=default_schema,
+            override_dialect=override_dialect,
+        )
+        use_parse_cache = self._is_base_schema_resolver(schema_resolver)
+
         with self.report.sql_parsing_timer:
-            parsed = sqlglot_lineage(
-                query,
-                schema_resolver=schema_resolver,
-                default_db=default_db,
-                default_schema=default_schema,
-                override_dialect=override_dialect,
+            cached = (
+                self._get_cached_parse_result(request)
+                if use_parse_cache and check_parse_cache
+                else None
             )
+            if cached is not None:
+                parsed = cached
+            else:
+                parsed = sqlglot_lineage(
+                    query,
+                    schema_resolver=schema_resolver,
+                    default_db=default_db,
+                    default_schema=default_schema,
+                    override_dialect=override_dialect,
+                )
+                if use_parse_cache:
+                    self._set_cached_parse_result(request, parsed)
+        self._record_sql_parse(
+            parsed,
+            query,
+            default_db=default_db,
+            default_schema=default_schema,
+            session_id=session_id,
+            timestamp=timestamp,
+            user=user,
+        )
+        return parsed
+
+    def _parse_cache_key(self, request: ParseRequest) -> str:
+        return PersistentSqlParsingCache.make_key(
+            request.query,
+            platform=request.override_dialect or self.platform.platform_name,
+            default_db=request.default_db,
+            default_schema=request.default_schema,
+        )
+
+    def _compute_parse_result_schema_hash(self, parsed: SqlParsingResult) -> str:
+        return compute_schema_hash(
+            self._schema_resolver.resolve_urn(urn)
+            for urn in OrderedSet(parsed.in_tables + parsed.out_tables)
+        )
+
+    def _get_cached_parse_result(
+        self, request: ParseRequest
+    ) -> Optional[SqlParsingResult]:
+        if self._parse_cache is None:
+            return None
+
+        key = self._parse_cache_key(request)
+        entry = self._parse_cache.get(key)
+        if entry is None:
+            self.report.num_sql_parsing_cache_misses += 1
+            return None
+
+        # The entry is only valid if none of the referenced schemas changed.
+        if entry.schema_hash != self._compute_parse_result_schema_hash(entry.result):
+            self.report.num_sql_parsing_cache_stale += 1
+            self._parse_cache.invalidate(key)
+            return None
+
+        self.report.num_sql_parsing_cache_hits += 1
+        return entry.result
+
+    def _set_cached_parse_result(
+        self, request: ParseRequest, parsed: SqlParsingResult
+    ) -> None:
+        if self._parse_cache is None:
+            return
+
+        self._parse_cache.set(
+            self._parse_cache_key(request),
+            parsed,
+            schema_hash=self._compute_parse_result_schema_hash(parsed),
+        )
+
+    def _record_sql_parse(
+        self,
+        parsed: SqlParsingResult,
+        query: str,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+        session_id: str = _MISSING_SESSION_ID,
+        timestamp: Optional[datetime] = None,
+        user: Optional[Union[CorpUserUrn, CorpGroupUrn]] = None,
+    ) -> None:
         self.report.num_sql_parsed += 1
 
         # Conditionally log the query.
@@ -1206,8 +1507,6 @@ class SqlParsingAggregator(Closeable):
                 exc_info=parsed.debug_info.error,
             )
 
-        return parsed
-
     def _add_to_query_map(
         self, new: QueryMetadata, merge_lineage: bool = False
     ) -> None:
@@ -1255,6 +1554,7 @@ class SqlParsingAggregator(Closeable):
             self._query_map[query_fingerprint] = new
 
     def gen_metadata(self) -> Iterable[MetadataChangeProposalWrapper]:
+        self._flush_pending_observed_queries()
         queries_generated: Set[QueryId] = set()
 
         yield from self._gen_lineage_mcps(queries_generated)
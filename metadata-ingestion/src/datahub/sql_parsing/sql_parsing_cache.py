@@ -0,0 +1,111 @@
+import dataclasses
+import json
+import logging
+import pathlib
+from datetime import timedelta
+from typing import Iterable, Optional, Tuple
+
+import sqlglot
+
+from datahub._version import __version__
+from datahub.ingestion.api.closeable import Closeable
+from datahub.sql_parsing.fingerprint_utils import generate_hash
+from datahub.sql_parsing.schema_resolver import SchemaInfo
+from datahub.sql_parsing.sqlglot_lineage import SqlParsingResult
+from datahub.sql_parsing.sqlglot_utils import DialectOrStr, get_query_fingerprint
+from datahub.utilities.cooperative_timeout import CooperativeTimeoutError
+from datahub.utilities.file_backed_collections import (
+    ConnectionWrapper,
+    PersistentFileBackedDict,
+)
+
+logger = logging.getLogger(__name__)
+
+_CACHE_TABLE_NAME = "sql_parsing_cache"
+
+# Results produced by a different version of the parser may not be valid anymore.
+_CACHE_VERSION = f"{__version__}:{sqlglot.__version__}"
+
+DEFAULT_SQL_PARSING_CACHE_TTL = timedelta(days=14)
+
+
+@dataclasses.dataclass
+class _CachedParseResult:
+    result: SqlParsingResult
+
+    # Hash of the schemas of all tables referenced by the query, at parse time.
+    schema_hash: str
+
+
+def compute_schema_hash(schemas: Iterable[Tuple[str, Optional[SchemaInfo]]]) -> str:
+    """Hashes a collection of (urn, schema info) pairs, ignoring order."""
+
+    return generate_hash(
+        json.dumps(sorted(schemas, key=lambda item: item[0]), sort_keys=True)
+    )
+
+
+class PersistentSqlParsingCache(Closeable):
+    """A persistent cache of SQL parsing results, stored in a local SQLite file.
+
+    Unlike the in-process `_sqlglot_lineage_cached`, this cache survives across
+    ingestion runs, so recurring queries (dashboards, ETL jobs) don't need to
+    be re-parsed on every run.
+
+    Entries are keyed by the query fingerprint, dialect, and default db/schema.
+    Because we can't know which tables a query references until we've parsed it,
+    each entry also stores a hash of the schemas of the tables it referenced.
+    On lookup, the caller recomputes that hash using the current schemas, and
+    the entry is treated as stale if they don't match.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        ttl: timedelta = DEFAULT_SQL_PARSING_CACHE_TTL,
+        shared_connection: Optional[ConnectionWrapper] = None,
+    ):
+        self.path = path
+        self.ttl = ttl
+
+        # Callers which keep other tables in the same file need to share their
+        # connection, since we hold an exclusive lock on the file.
+        self._cache = PersistentFileBackedDict[_CachedParseResult](
+            path=path,
+            shared_connection=shared_connection,
+            tablename=_CACHE_TABLE_NAME,
+            version=_CACHE_VERSION,
+            ttl=ttl,
+        )
+
+    @classmethod
+    def make_key(
+        cls,
+        query: str,
+        platform: DialectOrStr,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+    ) -> str:
+        fingerprint = get_query_fingerprint(query, platform=platform, fast=True)
+        return generate_hash(
+            json.dumps([fingerprint, str(platform), default_db, default_schema])
+        )
+
+    def get(self, key: str) -> Optional[_CachedParseResult]:
+        return self._cache.get(key)
+
+    def set(self, key: str, result: SqlParsingResult, schema_hash: str) -> None:
+        if isinstance(result.debug_info.error, CooperativeTimeoutError):
+            # Timeouts are not deterministic, so these should be retried next time.
+            return
+
+        self._cache[key] = _CachedParseResult(result=result, schema_hash=schema_hash)
+
+    def invalidate(self, key: str) -> None:
+        self._cache.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def close(self) -> None:
+        self._cache.close()
@@ -1,5 +1,7 @@
 import collections
 import gzip
+import itertools
+import json
 import logging
 import pathlib
 import pickle
@@ -7,16 +9,19 @@ import shutil
 import sqlite3
 import tempfile
 import threading
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from types import TracebackType
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     MutableMapping,
     Optional,
     OrderedDict,
@@ -27,10 +32,16 @@ from typing import (
     Union,
 )
 
+from datahub._version import __version__
 from datahub.configuration.env_vars import get_override_sqlite_version_req
 from datahub.ingestion.api.closeable import Closeable
 from datahub.utilities.sentinels import Unset, unset
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -50,11 +61,21 @@ _DEFAULT_TABLE_NAME = "data"
 _DEFAULT_MEMORY_CACHE_MAX_SIZE = 900
 _DEFAULT_MEMORY_CACHE_EVICTION_BATCH_SIZE = 150
 
+# get_many embeds one parameter per key into a query, so the bulk APIs chunk
+# their inputs to stay within the same limit.
+_BULK_OPERATION_BATCH_SIZE = _DEFAULT_MEMORY_CACHE_MAX_SIZE
+
+# MEMORY is the fastest journal mode for temporary databases. WAL is useful
+# for databases that are persisted across runs, since it can't be corrupted
+# by the process crashing mid-transaction.
+_DEFAULT_JOURNAL_MODE = "MEMORY"
+
 # https://docs.python.org/3/library/sqlite3.html#sqlite-and-python-types
 # Datetimes get converted to strings
 SqliteValue = Union[int, float, str, bytes, datetime, None]
 
 _VT = TypeVar("_VT")
+_T = TypeVar("_T")
 
 
 class ConnectionWrapper:
@@ -75,7 +96,11 @@ class ConnectionWrapper:
     _temp_directory: Optional[str]
     _dependent_objects: List[Union["FileBackedList", "FileBackedDict"]]
 
-    def __init__(self, filename: Optional[pathlib.Path] = None):
+    def __init__(
+        self,
+        filename: Optional[pathlib.Path] = None,
+        journal_mode: str = _DEFAULT_JOURNAL_MODE,
+    ):
         self._temp_directory = None
         self._dependent_objects = []
 
@@ -100,7 +125,7 @@ class ConnectionWrapper:
         # to worry about data integrity too much.
         self.conn.execute('PRAGMA locking_mode = "EXCLUSIVE"')
         self.conn.execute('PRAGMA synchronous = "OFF"')
-        self.conn.execute('PRAGMA journal_mode = "MEMORY"')
+        self.conn.execute(f'PRAGMA journal_mode = "{journal_mode}"')
         self.conn.execute(f"PRAGMA journal_size_limit = {100 * 1024 * 1024}")  # 100MB
 
     @property
@@ -122,7 +147,19 @@ class ConnectionWrapper:
         self, sql: str, parameters: Union[Dict[str, Any], Sequence[Any]] = ()
     ) -> sqlite3.Cursor:
         with self.conn_lock:
-            return self.conn.executemany(sql, parameters)
+            if self.conn.in_transaction:
+                return self.conn.executemany(sql, parameters)
+
+            # We run in autocommit mode, which would otherwise commit after every
+            # row. Wrapping the batch in a single transaction is significantly faster.
+            self.conn.execute("BEGIN")
+            try:
+                cursor = self.conn.executemany(sql, parameters)
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            return cursor
 
     def close(self) -> None:
         for obj in self._dependent_objects:
@@ -175,6 +212,27 @@ def _default_deserializer(value: Any) -> Any:
     return pickle.loads(value)
 
 
+def _chunks(iterable: Iterable[_T], size: int) -> Iterator[List[_T]]:
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _to_sqlite_column_value(value: Any) -> SqliteValue:
+    # Extra columns may return lists or dicts, which SQLite can't store natively.
+    # These are stored as JSON text, so that they can be queried with SQLite's
+    # JSON functions e.g. json_each or json_extract.
+    if isinstance(value, (list, tuple, dict)):
+        if orjson is not None:
+            try:
+                return orjson.dumps(value).decode()
+            except TypeError:
+                # e.g. non-string dict keys or integers that don't fit in 64 bits.
+                pass
+        return json.dumps(value)
+    return value
+
+
 @dataclass(eq=False)
 class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
     """A dict-like object that stores its data in a temporary SQLite database.
@@ -266,9 +324,10 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         if self.indexes_created:
             return
         # The key column will automatically be indexed, but we need indexes for the extra columns.
+        if_not_exists = "IF NOT EXISTS" if self._conn.allow_table_name_reuse else ""
         for column_name in self.extra_columns:
             self._conn.execute(
-                f"CREATE INDEX {self.tablename}_{column_name} ON {self.tablename} ({column_name})"
+                f"CREATE INDEX {if_not_exists} {self.tablename}_{column_name} ON {self.tablename} ({column_name})"
             )
         self.indexes_created = True
 
@@ -291,11 +350,17 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         for _ in range(num_items_to_prune):
             key, (value, dirty) = self._active_object_cache.popitem(last=False)
             if dirty:
-                values = [key, self.serializer(value)]
-                for column_serializer in self.extra_columns.values():
-                    values.append(column_serializer(value))
-                items_to_write.append(tuple(values))
+                items_to_write.append(self._serialize_row(key, value))
 
+        self._write_rows(items_to_write)
+
+    def _serialize_row(self, key: str, value: _VT) -> Tuple[SqliteValue, ...]:
+        values = [key, self.serializer(value)]
+        for column_serializer in self.extra_columns.values():
+            values.append(_to_sqlite_column_value(column_serializer(value)))
+        return tuple(values)
+
+    def _write_rows(self, items_to_write: List[Tuple[SqliteValue, ...]]) -> None:
         if items_to_write and self._use_sqlite_on_conflict:
             # Tricky: By using a INSERT INTO ... ON CONFLICT (key) structure, we can
             # ensure that the rowid remains the same if a value is updated but is
@@ -384,6 +449,53 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         # implementation in a subtly unsafe way, so we override it here.
         return self.for_mutation(key, default=default)
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, _VT]:
+        """
+        Look up multiple keys at once, using one query per batch of keys.
+
+        Keys that are not present are omitted from the result. Unlike `__getitem__`,
+        values read from the database are not added to the in-memory cache, so
+        large lookups don't evict the working set. As such, use `for_mutation`
+        if you need to modify a value.
+        """
+        found: Dict[str, _VT] = {}
+        missing: List[str] = []
+        for key in keys:
+            if key in self._active_object_cache:
+                found[key] = self._active_object_cache[key][0]
+            else:
+                missing.append(key)
+
+        for batch in _chunks(missing, _BULK_OPERATION_BATCH_SIZE):
+            cursor = self._conn.execute(
+                f"SELECT key, value FROM {self.tablename} WHERE key IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for row in cursor:
+                found[row[0]] = self.deserializer(row[1])
+
+        return found
+
+    def update_many(
+        self, items: Union[Mapping[str, _VT], Iterable[Tuple[str, _VT]]]
+    ) -> None:
+        """
+        Write multiple items directly to the database, bypassing the in-memory cache.
+
+        This is faster than repeated `__setitem__` calls when loading many items that
+        won't be read again soon, since it avoids churning through the cache.
+        """
+        pairs: Iterable[Tuple[str, _VT]] = (
+            items.items() if isinstance(items, Mapping) else items
+        )
+        for batch in _chunks(pairs, _BULK_OPERATION_BATCH_SIZE):
+            rows = []
+            for key, value in batch:
+                # Any cached copy is now stale, and must not be written back later.
+                self._active_object_cache.pop(key, None)
+                rows.append(self._serialize_row(key, value))
+            self._write_rows(rows)
+
     def __delitem__(self, key: str) -> None:
         in_cache = False
         if key in self._active_object_cache:
@@ -497,6 +609,89 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         self.close()
 
 
+@dataclass(eq=False)
+class PersistentFileBackedDict(FileBackedDict[_VT]):
+    """A FileBackedDict that is kept across runs, e.g. to back a persistent cache.
+
+    It's stored in `path`, or in the file of `shared_connection` if one is passed.
+    Each row also records the version of the code that wrote it, and when it was
+    last used. Rows written by another version, or which haven't been used within
+    `ttl`, are dropped when the dict is opened.
+
+    Reading an entry bumps its last used time, without rewriting the entry itself.
+    If `touch_on_get` is disabled, entries instead expire `ttl` after they were written.
+    """
+
+    path: Optional[pathlib.Path] = None
+    version: str = __version__
+    ttl: Optional[timedelta] = None
+    touch_on_get: bool = True
+
+    _owns_connection: bool = field(init=False, repr=False, default=False)
+
+    def __post_init__(self) -> None:
+        for reserved_column in ("last_used", "cache_version"):
+            if reserved_column in self.extra_columns:
+                raise ValueError(f'"{reserved_column}" is a reserved column name')
+
+        if self.shared_connection is None:
+            # Unlike our temporary databases, this one needs to survive a crash mid-write.
+            self.shared_connection = ConnectionWrapper(
+                filename=self.path, journal_mode="WAL"
+            )
+            self._owns_connection = True
+
+        # Rows are only written out when they're flushed, so last_used records the
+        # time of the flush rather than of the write. That's close enough for expiry.
+        self.extra_columns = {
+            **self.extra_columns,
+            "last_used": lambda _: int(time.time()),
+            "cache_version": lambda _: self.version,
+        }
+        super().__post_init__()
+        self._prune_expired()
+
+    def _prune_expired(self) -> None:
+        cond_sql = "cache_version IS NOT ?"
+        params: Tuple[Any, ...] = (self.version,)
+        if self.ttl is not None:
+            cutoff = datetime.now(tz=timezone.utc) - self.ttl
+            cond_sql += " OR last_used < ?"
+            params += (int(cutoff.timestamp()),)
+
+        self._conn.execute(f"DELETE FROM {self.tablename} WHERE {cond_sql}", params)
+
+    @property
+    def connection(self) -> ConnectionWrapper:
+        """The connection to the file, for storing other tables alongside this one."""
+        return self._conn
+
+    def touch_last_used(self, key: str) -> None:
+        """Bumps the last used time of an entry.
+
+        If the entry hasn't been written out yet, this is a no-op, and the entry
+        gets a recent last used time once it's flushed.
+        """
+
+        self._conn.execute(
+            f"UPDATE {self.tablename} SET last_used = ? WHERE key = ?",
+            (int(time.time()), key),
+        )
+
+    def __getitem__(self, key: str) -> _VT:
+        value = super().__getitem__(key)
+        if self.touch_on_get:
+            self.touch_last_used(key)
+        return value
+
+    def close(self) -> None:
+        super().close()
+        if self._owns_connection and self.shared_connection is not None:
+            # Closing the connection closes this dict again, so only do it once.
+            self._owns_connection = False
+            self.shared_connection.close()
+
+
 class FileBackedList(Generic[_VT], Closeable):
     """An append-only, list-like object that stores its contents in a SQLite database."""
 
@@ -550,6 +745,15 @@ class FileBackedList(Generic[_VT], Closeable):
         self._dict[str(self._len)] = value
         self._len += 1
 
+    def extend(self, values: Iterable[_VT]) -> None:
+        # Bulk loads bypass the in-memory cache. See FileBackedDict.update_many.
+        def _numbered_values() -> Iterator[Tuple[str, _VT]]:
+            for value in values:
+                yield str(self._len), value
+                self._len += 1
+
+        self._dict.update_many(_numbered_values())
+
     def __len__(self) -> int:
         return self._len
 
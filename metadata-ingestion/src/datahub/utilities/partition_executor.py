@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import atexit
 import collections
 import functools
@@ -13,6 +14,7 @@ from datetime import datetime, timedelta, timezone
 from threading import BoundedSemaphore
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Deque,
     Dict,
@@ -506,3 +508,184 @@ class BatchPartitionExecutor(Closeable):
 
     def close(self) -> None:
         self.shutdown()
+
+
+class AsyncBatchPartitionExecutor(Closeable):
+    def __init__(
+        self,
+        max_pending: int,
+        process_batch: Callable[[List], Awaitable[None]],
+        max_per_batch: int = 100,
+        min_process_interval: timedelta = _DEFAULT_BATCHER_MIN_PROCESS_INTERVAL,
+        on_shutdown: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """Similar to BatchPartitionExecutor, but batches are processed by coroutines.
+
+        All batches run concurrently on a single event loop, which lives on a background
+        thread. This is useful when batch processing is I/O bound, since the number of
+        batches in flight is no longer limited by the number of worker threads.
+
+        Requests for a given key are still executed in the order they were submitted.
+        If a batch contains a key that is also part of an in-flight batch, it will wait
+        for that batch to complete before being processed.
+
+        Args:
+            max_pending: The maximum number of pending or in-flight requests to allow.
+            process_batch: A coroutine function that takes in a list of argument tuples.
+            max_per_batch: The maximum number of requests to include in a batch.
+            min_process_interval: When requests are coming in slowly, we will wait at most
+                this long before submitting a non-full batch.
+            on_shutdown: An optional coroutine function to run on the event loop before
+                it is stopped, e.g. to close async clients.
+        """
+        self.max_pending = max_pending
+        self.max_per_batch = max_per_batch
+        self.process_batch = process_batch
+        self.min_process_interval = min_process_interval
+        self.on_shutdown = on_shutdown
+
+        self._state_lock = threading.Lock()
+        self._pending_count = BoundedSemaphore(max_pending)
+        self._next_batch: List[_BatchPartitionWorkItem] = []
+        self._next_batch_start_time: Optional[datetime] = None
+        self._last_batch_by_key: Dict[str, Future] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._shutting_down = False
+
+    def _ensure_loop_started(self) -> asyncio.AbstractEventLoop:
+        if self._shutting_down:
+            raise RuntimeError(
+                f"{self.__class__.__name__} is shutting down; cannot submit new work items."
+            )
+
+        with self._state_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name=self.__class__.__name__,
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    async def _process_batch_after(
+        self, batch: List[_BatchPartitionWorkItem], dependencies: List[Future]
+    ) -> None:
+        if dependencies:
+            # We only care about ordering here, and so ignore failures in the earlier batches.
+            await asyncio.gather(
+                *(asyncio.wrap_future(dependency) for dependency in dependencies),
+                return_exceptions=True,
+            )
+        await self.process_batch([item.args for item in batch])
+
+    def _handle_batch_completion(
+        self, batch: List[_BatchPartitionWorkItem], future: Future
+    ) -> None:
+        with self._state_lock:
+            for item in batch:
+                if self._last_batch_by_key.get(item.key) is future:
+                    del self._last_batch_by_key[item.key]
+
+        for item in batch:
+            self._pending_count.release()
+            if item.done_callback:
+                item.done_callback(future)
+
+    def _dispatch_next_batch(self) -> None:
+        # Must be called with the state lock held.
+        assert self._loop is not None
+
+        batch = self._next_batch
+        self._next_batch = []
+        self._next_batch_start_time = None
+        if not batch:
+            return
+
+        dependencies = list(
+            {
+                id(dependency): dependency
+                for dependency in (
+                    self._last_batch_by_key.get(item.key) for item in batch
+                )
+                if dependency is not None
+            }.values()
+        )
+        future = asyncio.run_coroutine_threadsafe(
+            self._process_batch_after(batch, dependencies), self._loop
+        )
+        for item in batch:
+            self._last_batch_by_key[item.key] = future
+        future.add_done_callback(
+            functools.partial(self._handle_batch_completion, batch)
+        )
+
+    def _flush_if_stale(self) -> None:
+        with self._state_lock:
+            if (
+                self._next_batch_start_time is not None
+                and _now() - self._next_batch_start_time >= self.min_process_interval
+            ):
+                self._dispatch_next_batch()
+
+    def submit(
+        self,
+        key: str,
+        *args: Any,
+        done_callback: Optional[Callable[[Future], None]] = None,
+    ) -> None:
+        """See concurrent.futures.Executor#submit"""
+
+        loop = self._ensure_loop_started()
+
+        # This is where backpressure is applied.
+        self._pending_count.acquire()
+
+        with self._state_lock:
+            if self._next_batch_start_time is None:
+                self._next_batch_start_time = _now()
+                # Make sure that a partial batch doesn't wait around forever.
+                loop.call_soon_threadsafe(
+                    loop.call_later,
+                    self.min_process_interval.total_seconds(),
+                    self._flush_if_stale,
+                )
+            self._next_batch.append(_BatchPartitionWorkItem(key, args, done_callback))
+            if len(self._next_batch) >= self.max_per_batch:
+                self._dispatch_next_batch()
+
+    def flush(self) -> None:
+        """Dispatches the current batch, even if it isn't full yet."""
+        with self._state_lock:
+            if self._loop is not None:
+                self._dispatch_next_batch()
+
+    def shutdown(self) -> None:
+        self._shutting_down = True
+
+        if self._loop is None:
+            # This is required to make shutdown() idempotent.
+            logger.debug("Shutting down: event loop not started")
+            return
+
+        logger.debug(f"Shutting down {self.__class__.__name__}")
+        self.flush()
+
+        # By acquiring all the permits, we wait until all existing tasks have completed.
+        for _ in range(self.max_pending):
+            self._pending_count.acquire()
+
+        if self.on_shutdown is not None:
+            asyncio.run_coroutine_threadsafe(self.on_shutdown(), self._loop).result()
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        assert self._loop_thread is not None
+        self._loop_thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def close(self) -> None:
+        self.shutdown()
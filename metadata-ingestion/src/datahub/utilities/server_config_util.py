@@ -5,6 +5,7 @@ from enum import Enum
 from typing import (
     Any,
     Dict,
+    List,
     Optional,
     Tuple,
     Union,
@@ -208,6 +209,18 @@ class RestServiceConfig:
 
         return server_env != "core"
 
+    @property
+    def supported_request_encodings(self) -> List[str]:
+        """
+        Get the Content-Encodings that the server accepts for request bodies.
+
+        Returns:
+            A list of encodings, e.g. ["gzip", "zstd"]. Empty if the server
+            does not advertise support for compressed requests.
+        """
+        encodings = self.raw_config.get("supportedRequestEncodings") or []
+        return [str(encoding) for encoding in encodings]
+
     def supports_feature(self, feature: ServiceFeature) -> bool:
         """
         Determines whether a specific feature is supported based on service version
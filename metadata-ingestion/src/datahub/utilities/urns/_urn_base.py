@@ -1,4 +1,5 @@
 import functools
+import sys
 import urllib.parse
 from abc import abstractmethod
 from typing import ClassVar, Dict, List, Optional, Type, Union
@@ -11,6 +12,11 @@ from datahub.utilities.urns.error import InvalidUrnError
 
 URN_TYPES: Dict[str, Type["_SpecificUrn"]] = {}
 
+# Sources tend to parse and build the same urns over and over, e.g. once per workunit
+# processor. Parsed urns (and the urn builders in mce_builder) are cached, so repeats
+# are cheap and share a single object.
+_URN_CACHE_SIZE = 1 << 15
+
 
 def _split_entity_id(entity_id: str) -> List[str]:
     if not (entity_id.startswith("(") and entity_id.endswith(")")):
@@ -59,6 +65,9 @@ class Urn:
     url-encoding when the URN is created and _allow_coercion is enabled (the default).
     However, all from_string methods will try to preserve the string as-is, and will
     raise an error if the string is invalid.
+
+    Urns should be treated as immutable. from_string caches the urns it parses, and
+    may return the same object for equal strings.
     """
 
     # retained for backwards compatibility
@@ -84,7 +93,8 @@ class Urn:
 
     @property
     def entity_ids(self) -> List[str]:
-        return self._entity_ids
+        # Parsed urns are shared through the cache, so hand out a copy.
+        return list(self._entity_ids)
 
     @classmethod
     def from_string(cls, urn_str: Union[str, "Urn"], /) -> Self:
@@ -124,6 +134,10 @@ class Urn:
             # Fall through, so that we can convert a generic Urn to a specific Urn type.
             urn_str = urn_str.urn()
 
+        return _parse_urn(cls, urn_str)  # type: ignore
+
+    @classmethod
+    def _from_string_uncached(cls, urn_str: str) -> Self:
         # TODO: Add handling for url encoded urns e.g. urn%3A ...
 
         if not urn_str.startswith("urn:li:"):
@@ -160,7 +174,7 @@ class Urn:
             raise InvalidUrnError(
                 f"Unknown urn type {entity_type} for urn {urn_str} of type {cls}"
             )
-        return cls(entity_type, entity_ids)
+        return cls(sys.intern(entity_type), entity_ids)
 
     def urn(self) -> str:
         """Get the string representation of the urn."""
@@ -201,7 +215,7 @@ class Urn:
 
     @deprecated(reason="prefer .entity_ids")
     def get_entity_id(self) -> List[str]:
-        return self._entity_ids
+        return self.entity_ids
 
     @deprecated(reason="prefer .entity_type")
     def get_type(self) -> str:
@@ -297,3 +311,8 @@ class _SpecificUrn(Urn):
     @abstractmethod
     def _parse_ids(cls, entity_ids: List[str]) -> Self:
         raise NotImplementedError()
+
+
+@functools.lru_cache(maxsize=_URN_CACHE_SIZE)
+def _parse_urn(cls: Type[Urn], urn_str: str) -> Urn:
+    return cls._from_string_uncached(urn_str)
@@ -10,7 +10,7 @@ __all__ = ["Urn", "guess_entity_type", "guess_platform_name"]
 
 def guess_entity_type(urn: str) -> str:
     assert urn.startswith("urn:li:"), "urns must start with urn:li:"
-    return urn.split(":")[2]
+    return urn.split(":", maxsplit=3)[2]
 
 
 def guess_platform_name(urn: str) -> Optional[str]:
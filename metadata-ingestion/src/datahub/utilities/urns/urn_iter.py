@@ -151,9 +151,17 @@ def lowercase_dataset_urns(
         if guess_entity_type(urn) == "dataset":
             return lowercase_dataset_urn(urn)
         elif guess_entity_type(urn) == "schemaField":
+            # Parsed urns may be shared, so build a new one instead of modifying it.
             cur_urn = Urn.from_string(urn)
-            cur_urn._entity_ids[0] = lowercase_dataset_urn(cur_urn._entity_ids[0])
-            return str(cur_urn)
+            return str(
+                Urn(
+                    cur_urn.entity_type,
+                    [
+                        lowercase_dataset_urn(cur_urn.entity_ids[0]),
+                        *cur_urn.entity_ids[1:],
+                    ],
+                )
+            )
         return urn
 
     transform_urns(model, modify_urn)
@@ -0,0 +1,362 @@
+"""
+Offline benchmarks for the code paths that dominate ingestion run times.
+
+Each benchmark is a factory that builds its synthetic inputs up front, and returns
+a `BenchmarkCase` whose `run` callable is the only thing that gets timed. Sizes are
+multiplied by a scale factor, so the same suite can be used for quick smoke runs
+and for larger runs that exercise eviction and spilling to disk.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import datahub.metadata.schema_classes as models
+from datahub.emitter.mce_builder import (
+    make_dataset_urn,
+    make_dataset_urn_with_platform_instance,
+)
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.mcp_builder import DatabaseKey, SchemaKey
+from datahub.ingestion.api.source_helpers import (
+    auto_browse_path_v2,
+    auto_status_aspect,
+)
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.source.sql.sql_utils import (
+    add_table_to_schema_container,
+    gen_database_container,
+    gen_schema_container,
+)
+from datahub.ingestion.source.usage.usage_common import BaseUsageConfig
+from datahub.metadata.urns import CorpUserUrn, Urn
+from datahub.sql_parsing._models import _TableName
+from datahub.sql_parsing.schema_resolver import SchemaResolver
+from datahub.sql_parsing.sql_parsing_aggregator import (
+    ObservedQuery,
+    SqlParsingAggregator,
+)
+from datahub.sql_parsing.sqlglot_lineage import sqlglot_lineage
+from datahub.utilities.file_backed_collections import FileBackedDict
+from tests.performance.data_generation import SeedMetadata, generate_data
+from tests.performance.data_model import ColumnType, Table
+
+PLATFORM = "snowflake"
+
+
+@dataclass
+class BenchmarkCase:
+    # The number of items processed by `run`, used to compute throughput.
+    num_items: int
+    run: Callable[[], None]
+
+
+def _generate_seed(num_tables: int) -> SeedMetadata:
+    return generate_data(
+        num_containers=[max(1, num_tables // 1000), max(1, num_tables // 50)],
+        num_tables=num_tables,
+        num_views=0,
+    )
+
+
+def _table_name(table: Table) -> str:
+    return ".".join(table.name_components)
+
+
+def _build_schema_resolver(seed: SeedMetadata) -> SchemaResolver:
+    schema_resolver = SchemaResolver(platform=PLATFORM)
+    for table in seed.tables:
+        database, schema, name = table.name_components
+        urn = schema_resolver.get_urn_for_table(
+            _TableName(database=database, db_schema=schema, table=name)
+        )
+        schema_resolver.add_raw_schema_info(
+            urn, {column.name: column.type.value for column in table.columns.values()}
+        )
+    return schema_resolver
+
+
+def generate_sql_queries(seed: SeedMetadata, num_queries: int) -> List[str]:
+    """Generates INSERT ... SELECT queries with joins across the seed tables.
+
+    The WHERE clause makes every query text unique, so that parsing caches keyed on
+    the raw text don't hide the cost of parsing. Queries that only differ in that
+    literal still share a fingerprint, like they would in a real query log.
+    """
+
+    queries = []
+    for i in range(num_queries):
+        target = random.choice(seed.tables)
+        upstreams = random.sample(seed.tables, k=random.randint(1, 3))
+
+        select_columns = []
+        for j, upstream in enumerate(upstreams):
+            columns = random.sample(
+                list(upstream.columns), k=min(3, len(upstream.columns))
+            )
+            select_columns.extend(f"t{j}.{column}" for column in columns)
+
+        joins = "".join(
+            f" JOIN {_table_name(upstream)} AS t{j} ON t0.id = t{j}.id"
+            for j, upstream in enumerate(upstreams[1:], start=1)
+        )
+        queries.append(
+            f"INSERT INTO {_table_name(target)} "
+            f"SELECT {', '.join(select_columns)} "
+            f"FROM {_table_name(upstreams[0])} AS t0{joins} "
+            f"WHERE t0.id > {i}"
+        )
+    return queries
+
+
+def generate_dataset_workunits(seed: SeedMetadata) -> List[MetadataWorkUnit]:
+    """Generates the workunits a typical SQL source would emit for the seed tables."""
+
+    workunits: List[MetadataWorkUnit] = []
+    database_keys: Dict[str, DatabaseKey] = {}
+    schema_keys: Dict[str, SchemaKey] = {}
+
+    for table in seed.tables:
+        database, schema, name = table.name_components
+        if database not in database_keys:
+            database_keys[database] = DatabaseKey(platform=PLATFORM, database=database)
+            workunits.extend(
+                gen_database_container(
+                    database=database,
+                    database_container_key=database_keys[database],
+                    sub_types=["Database"],
+                )
+            )
+        schema_id = f"{database}.{schema}"
+        if schema_id not in schema_keys:
+            schema_keys[schema_id] = SchemaKey(
+                platform=PLATFORM, database=database, schema=schema
+            )
+            workunits.extend(
+                gen_schema_container(
+                    schema=schema,
+                    database=database,
+                    sub_types=["Schema"],
+                    database_container_key=database_keys[database],
+                    schema_container_key=schema_keys[schema_id],
+                )
+            )
+
+        urn = make_dataset_urn(PLATFORM, _table_name(table))
+        workunits.extend(mcp.as_workunit() for mcp in generate_dataset_mcps(urn, table))
+        workunits.extend(add_table_to_schema_container(urn, schema_keys[schema_id]))
+
+    return workunits
+
+
+_FIELD_TYPES = {
+    ColumnType.INTEGER: models.NumberTypeClass,
+    ColumnType.FLOAT: models.NumberTypeClass,
+    ColumnType.STRING: models.StringTypeClass,
+    ColumnType.BOOLEAN: models.BooleanTypeClass,
+    ColumnType.DATETIME: models.TimeTypeClass,
+}
+
+
+def generate_dataset_mcps(
+    urn: str, table: Table
+) -> Iterable[MetadataChangeProposalWrapper]:
+    yield MetadataChangeProposalWrapper(
+        entityUrn=urn,
+        aspect=models.DatasetPropertiesClass(
+            name=table.name,
+            description=f"Synthetic table {table.name}",
+            customProperties={"container": table.container.name},
+        ),
+    )
+    yield MetadataChangeProposalWrapper(
+        entityUrn=urn,
+        aspect=models.SchemaMetadataClass(
+            schemaName=table.name,
+            platform=f"urn:li:dataPlatform:{PLATFORM}",
+            version=0,
+            hash="",
+            platformSchema=models.OtherSchemaClass(rawSchema=""),
+            fields=[
+                models.SchemaFieldClass(
+                    fieldPath=column.name,
+                    type=models.SchemaFieldDataTypeClass(
+                        type=_FIELD_TYPES[column.type]()
+                    ),
+                    nativeDataType=column.type.value,
+                    nullable=column.nullable,
+                )
+                for column in table.columns.values()
+            ],
+        ),
+    )
+    yield MetadataChangeProposalWrapper(
+        entityUrn=urn, aspect=models.SubTypesClass(typeNames=["Table"])
+    )
+
+
+def bench_sqlglot_lineage(scale: float) -> BenchmarkCase:
+    num_queries = int(500 * scale)
+    seed = _generate_seed(num_tables=max(10, num_queries // 5))
+    schema_resolver = _build_schema_resolver(seed)
+    queries = generate_sql_queries(seed, num_queries)
+
+    def run() -> None:
+        for query in queries:
+            sqlglot_lineage(query, schema_resolver=schema_resolver)
+
+    return BenchmarkCase(num_items=num_queries, run=run)
+
+
+def bench_aggregator_observed_queries(scale: float) -> BenchmarkCase:
+    num_queries = int(2000 * scale)
+    seed = _generate_seed(num_tables=max(10, num_queries // 20))
+    schema_resolver = _build_schema_resolver(seed)
+
+    # Only ~1/4 of the query texts are distinct, to exercise the query merging paths.
+    query_texts = generate_sql_queries(seed, max(1, num_queries // 4))
+    users = [CorpUserUrn(f"user_{i}") for i in range(50)]
+    start_time = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    observed_queries = [
+        ObservedQuery(
+            query=random.choice(query_texts),
+            timestamp=start_time + timedelta(milliseconds=10 * i),
+            user=random.choice(users),
+        )
+        for i in range(num_queries)
+    ]
+
+    def run() -> None:
+        aggregator = SqlParsingAggregator(
+            platform=PLATFORM,
+            schema_resolver=schema_resolver,
+            generate_lineage=True,
+            generate_queries=True,
+            generate_usage_statistics=True,
+            generate_operations=True,
+            usage_config=BaseUsageConfig(
+                start_time=start_time, end_time=start_time + timedelta(days=1)
+            ),
+        )
+        for observed in observed_queries:
+            aggregator.add_observed_query(observed)
+        for _ in aggregator.gen_metadata():
+            pass
+        aggregator.close()
+
+    return BenchmarkCase(num_items=num_queries, run=run)
+
+
+def bench_file_backed_dict(scale: float) -> BenchmarkCase:
+    num_keys = int(200_000 * scale)
+    value = {"urn": "urn:li:dataset:(x,y,PROD)", "count": 1, "columns": ["a", "b"]}
+    read_keys = [f"key-{random.randrange(num_keys)}" for _ in range(num_keys)]
+
+    def run() -> None:
+        cache = FileBackedDict[dict](extra_columns={"count": lambda v: v["count"]})
+        for i in range(num_keys):
+            cache[f"key-{i}"] = dict(value)
+        # Random reads, mostly cache misses, with mutations that force write-backs.
+        for i, key in enumerate(read_keys):
+            if i % 4 == 0:
+                cache.for_mutation(key)["count"] += 1
+            else:
+                cache[key]
+        cache.flush()
+        cache.close()
+
+    return BenchmarkCase(num_items=2 * num_keys, run=run)
+
+
+def bench_mcpw_to_obj(scale: float) -> BenchmarkCase:
+    seed = _generate_seed(num_tables=int(10_000 * scale))
+    mcps = [
+        mcp
+        for table in seed.tables
+        for mcp in generate_dataset_mcps(
+            make_dataset_urn(PLATFORM, _table_name(table)), table
+        )
+    ]
+
+    def run() -> None:
+        for mcp in mcps:
+            mcp.to_obj()
+
+    return BenchmarkCase(num_items=len(mcps), run=run)
+
+
+def bench_auto_status_aspect(scale: float) -> BenchmarkCase:
+    workunits = generate_dataset_workunits(
+        _generate_seed(num_tables=int(10_000 * scale))
+    )
+
+    def run() -> None:
+        for _ in auto_status_aspect(workunits):
+            pass
+
+    return BenchmarkCase(num_items=len(workunits), run=run)
+
+
+def bench_auto_browse_path_v2(scale: float) -> BenchmarkCase:
+    workunits = generate_dataset_workunits(
+        _generate_seed(num_tables=int(10_000 * scale))
+    )
+
+    def run() -> None:
+        for _ in auto_browse_path_v2(workunits):
+            pass
+
+    return BenchmarkCase(num_items=len(workunits), run=run)
+
+
+def _generate_repeated_table_names(
+    num_tables: int, repeats: int
+) -> List[Tuple[str, str]]:
+    # Sources refer to each table many times, e.g. in every aspect and in lineage.
+    names = [
+        (f"instance_{i % 5}", f"db_{i % 20}.schema_{i % 100}.table_{i}")
+        for i in range(num_tables)
+    ]
+    repeated = names * repeats
+    random.shuffle(repeated)
+    return repeated
+
+
+def bench_make_dataset_urn(scale: float) -> BenchmarkCase:
+    names = _generate_repeated_table_names(int(20_000 * scale), repeats=10)
+
+    def run() -> None:
+        for platform_instance, name in names:
+            make_dataset_urn_with_platform_instance(PLATFORM, name, platform_instance)
+
+    return BenchmarkCase(num_items=len(names), run=run)
+
+
+def bench_urn_from_string(scale: float) -> BenchmarkCase:
+    urns = [
+        make_dataset_urn_with_platform_instance(PLATFORM, name, platform_instance)
+        for platform_instance, name in _generate_repeated_table_names(
+            int(20_000 * scale), repeats=10
+        )
+    ]
+    # Parse copies of the strings, as urns read from different aspects would be.
+    urns = [urn.encode().decode() for urn in urns]
+
+    def run() -> None:
+        for urn in urns:
+            Urn.from_string(urn)
+
+    return BenchmarkCase(num_items=len(urns), run=run)
+
+
+BENCHMARKS: Dict[str, Callable[[float], BenchmarkCase]] = {
+    "sqlglot_lineage": bench_sqlglot_lineage,
+    "aggregator_observed_queries": bench_aggregator_observed_queries,
+    "file_backed_dict": bench_file_backed_dict,
+    "mcpw_to_obj": bench_mcpw_to_obj,
+    "auto_status_aspect": bench_auto_status_aspect,
+    "auto_browse_path_v2": bench_auto_browse_path_v2,
+    "make_dataset_urn": bench_make_dataset_urn,
+    "urn_from_string": bench_urn_from_string,
+}
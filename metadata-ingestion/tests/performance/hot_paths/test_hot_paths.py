@@ -0,0 +1,230 @@
+"""
+Runs the hot path benchmarks and records throughput and peak memory usage.
+
+Every benchmark runs in a fresh process, so that memory retained by one benchmark
+doesn't skew the numbers of the next. Results can be written to a JSON file and
+compared against a previous run to catch regressions:
+
+    python -m tests.performance.hot_paths.test_hot_paths --output base.json
+    # ... make changes ...
+    python -m tests.performance.hot_paths.test_hot_paths --compare base.json
+"""
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import humanfriendly
+import psutil
+
+from datahub._version import __version__
+from datahub.utilities.perf_timer import PerfTimer
+from tests.performance.hot_paths.benchmarks import BENCHMARKS
+
+logger = logging.getLogger(__name__)
+
+_MEMORY_SAMPLE_INTERVAL_SECONDS = 0.01
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    num_items: int
+    seconds: float
+    throughput_per_second: float
+
+    # Peak RSS increase over the RSS after setup, i.e. excluding the synthetic inputs.
+    peak_memory_bytes: int
+
+
+class _PeakMemorySampler:
+    def __init__(self) -> None:
+        self._process = psutil.Process(os.getpid())
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self.baseline = self._process.memory_info().rss
+        self.peak = self.baseline
+
+    def _sample(self) -> None:
+        while not self._stop.wait(_MEMORY_SAMPLE_INTERVAL_SECONDS):
+            self.peak = max(self.peak, self._process.memory_info().rss)
+
+    def __enter__(self) -> "_PeakMemorySampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._process.memory_info().rss)
+
+
+def _run_benchmark(name: str, scale: float, seed: int) -> BenchmarkResult:
+    random.seed(seed)
+    case = BENCHMARKS[name](scale)
+
+    with _PeakMemorySampler() as memory, PerfTimer() as timer:
+        case.run()
+
+    seconds = timer.elapsed_seconds(digits=6)
+    return BenchmarkResult(
+        name=name,
+        num_items=case.num_items,
+        seconds=round(seconds, 3),
+        throughput_per_second=round(case.num_items / max(seconds, 1e-6), 2),
+        peak_memory_bytes=memory.peak - memory.baseline,
+    )
+
+
+def _get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _find_regressions(
+    results: List[BenchmarkResult], baseline: dict, max_regression: float
+) -> List[str]:
+    baseline_results: Dict[str, dict] = {
+        result["name"]: result for result in baseline["results"]
+    }
+
+    regressions = []
+    for result in results:
+        previous = baseline_results.get(result.name)
+        if previous is None:
+            continue
+
+        throughput_change = (
+            result.throughput_per_second / previous["throughput_per_second"] - 1
+        )
+        print(
+            f"{result.name}: throughput {throughput_change:+.1%}, "
+            f"peak memory {humanfriendly.format_size(previous['peak_memory_bytes'])}"
+            f" -> {humanfriendly.format_size(result.peak_memory_bytes)}"
+        )
+        if throughput_change < -max_regression:
+            regressions.append(
+                f"{result.name}: throughput dropped by {-throughput_change:.1%}"
+            )
+        # Small allocations are dominated by noise, so ignore changes below 10MB.
+        if result.peak_memory_bytes > max(
+            previous["peak_memory_bytes"] * (1 + max_regression),
+            previous["peak_memory_bytes"] + 10 * 1024 * 1024,
+        ):
+            regressions.append(
+                f"{result.name}: peak memory grew from "
+                f"{humanfriendly.format_size(previous['peak_memory_bytes'])} to "
+                f"{humanfriendly.format_size(result.peak_memory_bytes)}"
+            )
+    return regressions
+
+
+def run_test(
+    names: List[str],
+    scale: float,
+    seed: int,
+    output: Optional[str],
+    compare: Optional[str],
+    max_regression: float,
+) -> int:
+    results: List[BenchmarkResult] = []
+    for name in names:
+        logger.info(f"Running benchmark {name} at scale {scale}")
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            result = executor.submit(_run_benchmark, name, scale, seed).result()
+        results.append(result)
+        print(
+            f"{result.name}: {result.num_items} items in {result.seconds}s, "
+            f"{result.throughput_per_second:,.0f} items/s, "
+            f"peak memory {humanfriendly.format_size(result.peak_memory_bytes)}"
+        )
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(
+                {
+                    "git_commit": _get_git_commit(),
+                    "datahub_version": __version__,
+                    "python_version": platform.python_version(),
+                    "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                    "scale": scale,
+                    "seed": seed,
+                    "results": [asdict(result) for result in results],
+                },
+                f,
+                indent=2,
+            )
+
+    if compare:
+        with open(compare) as f:
+            baseline = json.load(f)
+        if baseline.get("scale") != scale:
+            logger.warning(
+                f"Baseline was recorded at scale {baseline.get('scale')}, not {scale}"
+            )
+        regressions = _find_regressions(results, baseline, max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Benchmark to run. Can be repeated. Defaults to all benchmarks.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for the size of the synthetic inputs.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--compare", help="Compare against results previously written by --output."
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="Fail if throughput drops or peak memory grows by more than this fraction.",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # These benchmarks must run entirely offline.
+    os.environ.setdefault("DATAHUB_TELEMETRY_ENABLED", "false")
+
+    sys.exit(
+        run_test(
+            names=args.benchmark or list(BENCHMARKS),
+            scale=args.scale,
+            seed=args.seed,
+            output=args.output,
+            compare=args.compare,
+            max_regression=args.max_regression,
+        )
+    )
@@ -306,6 +306,33 @@ def test_auto_browse_path_v2_with_platform_instance(telemetry_ping_mock):
     ]
 
 
+@patch("datahub.ingestion.api.source_helpers.telemetry.telemetry_instance.ping")
+def test_auto_browse_path_v2_spills_emitted_urns(telemetry_ping_mock):
+    structure = {
+        "one": {"a": {"i": ["1", "2", "3"], "ii": ["4"]}},
+        "two": {"b": {"iii": ["5", "6"]}},
+    }
+    wus = list(auto_status_aspect(_create_container_aspects(structure)))
+    # An out of batch browse path, which must still be detected after spilling.
+    wus.append(
+        MetadataChangeProposalWrapper(
+            entityUrn=make_container_urn("one"),
+            aspect=models.BrowsePathsClass(paths=["/one/two"]),
+        ).as_workunit()
+    )
+
+    expected_wus = list(auto_browse_path_v2(wus))
+    with patch("datahub.ingestion.api.source_helpers._MAX_IN_MEMORY_EMITTED_URNS", 2):
+        new_wus = list(auto_browse_path_v2(wus))
+
+    assert [wu.metadata for wu in new_wus] == [wu.metadata for wu in expected_wus]
+    assert telemetry_ping_mock.call_count == 2
+    assert (
+        telemetry_ping_mock.call_args_list[0] == telemetry_ping_mock.call_args_list[1]
+    )
+    assert telemetry_ping_mock.call_args_list[1][0][1]["num_out_of_batch"] == 1
+
+
 @patch("datahub.ingestion.api.source_helpers.telemetry.telemetry_instance.ping")
 def test_auto_browse_path_v2_invalid_batch_telemetry(telemetry_ping_mock):
     structure = {"a": {"b": ["c"]}}
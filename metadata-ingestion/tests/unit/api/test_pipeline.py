@@ -1,4 +1,5 @@
 import pathlib
+import threading
 import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterable, List, Optional, cast
@@ -18,8 +19,13 @@ from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.graph.client import get_default_graph
 from datahub.ingestion.graph.config import ClientMode, DatahubClientConfig
-from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
-from datahub.ingestion.sink.datahub_rest import DatahubRestSink
+from datahub.ingestion.run.pipeline import Pipeline, PipelineContext, PipelineStatus
+from datahub.ingestion.run.pipeline_stages import (
+    PipelineStageCancelled,
+    PipelineStageReport,
+    StageQueue,
+)
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink, DatahubRestSinkConfig
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import SystemMetadata
 from datahub.metadata.schema_classes import (
     DatasetPropertiesClass,
@@ -167,6 +173,34 @@ class TestPipeline:
         assert pipeline.ctx.graph.config.server == pipeline.config.sink.config["server"]
         assert pipeline.ctx.graph.config.token == pipeline.config.sink.config["token"]
 
+    @freeze_time(FROZEN_TIME)
+    @patch("datahub.emitter.rest_emitter.DataHubRestEmitter.fetch_server_config")
+    def test_configure_aspect_cache(self, mock_fetch_config, mock_server_config):
+        mock_fetch_config.return_value = mock_server_config
+
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "file",
+                    "config": {"path": "test_events.json"},
+                },
+                "sink": {
+                    "type": "datahub-rest",
+                    "config": {"server": "http://somehost.someplace.some:8080"},
+                },
+                "flags": {"aspect_cache_max_size": 100},
+            },
+            report_to=None,
+        )
+        assert pipeline.ctx.graph is not None
+        assert pipeline.ctx.graph.aspect_cache is not None
+        assert pipeline.ctx.graph.aspect_cache.max_size == 100
+        assert (
+            pipeline.source.get_report().aspect_cache
+            is pipeline.ctx.graph.aspect_cache.report
+        )
+        assert "aspect_cache_max_size" not in DatahubRestSinkConfig.__fields__
+
     @freeze_time(FROZEN_TIME)
     @patch("datahub.emitter.rest_emitter.DataHubRestEmitter.fetch_server_config")
     def test_configure_with_rest_sink_with_additional_props_initializes_graph(
@@ -254,6 +288,100 @@ class TestPipeline:
         assert len(sink_report.received_records) == 1
         assert expected_mce == sink_report.received_records[0].record
 
+    @freeze_time(FROZEN_TIME)
+    def test_run_staged_execution(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.api.test_pipeline.FakeSource"},
+                "transformers": [
+                    {"type": "tests.unit.api.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {"staged_execution": True, "staged_execution_queue_size": 1},
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        expected_mce = get_initial_mce()
+        dataset_snapshot = cast(DatasetSnapshotClass, expected_mce.proposedSnapshot)
+        dataset_snapshot.aspects.append(get_status_removed_aspect())
+
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+        assert len(sink_report.received_records) == 1
+        assert expected_mce == sink_report.received_records[0].record
+
+        stages = pipeline.cli_report.pipeline_stages
+        assert stages is not None
+        assert stages["source"].num_items == 1
+        assert stages["transform"].num_items == 2  # including the end-of-stream flush
+        assert stages["sink"].num_items == 2
+        assert stages["source"].output_queue_size == 1
+
+    def test_staged_execution_propagates_source_errors(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.api.test_pipeline.FakeSourceWithCrash"},
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {"staged_execution": True},
+            }
+        )
+
+        class FakeCommittable(Committable):
+            def __init__(self):
+                self.name = "test_checkpointer"
+                self.commit_policy = CommitPolicy.ALWAYS
+
+            def commit(self) -> None:
+                pass
+
+        fake_committable = FakeCommittable()
+        with patch.object(
+            FakeCommittable, "commit", wraps=fake_committable.commit
+        ) as mock_commit:
+            pipeline.ctx.register_checkpointer(fake_committable)
+            pipeline.run()
+            mock_commit.assert_not_called()
+
+        assert pipeline.final_status == PipelineStatus.ERROR
+
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+        # Workunits produced before the crash are still written.
+        assert len(sink_report.received_records) == 1
+
+    def test_stage_queue_consumer_is_cancelled_when_stopping(self):
+        stop_event = threading.Event()
+        stage_queue: StageQueue[int] = StageQueue(1, PipelineStageReport(), stop_event)
+        consumer_report = PipelineStageReport()
+        consumed: List[int] = []
+        errors: List[BaseException] = []
+
+        def _consume() -> None:
+            try:
+                for item in stage_queue.consume(consumer_report):
+                    consumed.append(item)
+            except BaseException as e:
+                errors.append(e)
+
+        # The producer went away without closing the queue, e.g. because it was
+        # cancelled after the sink failed.
+        stage_queue.put(1)
+        consumer = threading.Thread(target=_consume)
+        consumer.start()
+        time.sleep(0.2)
+        stop_event.set()
+        consumer.join(timeout=5)
+
+        assert not consumer.is_alive()
+        assert consumed == [1]
+        assert len(errors) == 1 and isinstance(errors[0], PipelineStageCancelled)
+
     @freeze_time(FROZEN_TIME)
     def test_run_including_registered_transformation(self):
         # This is not testing functionality, but just the transformer registration system.
@@ -562,6 +690,13 @@ class FakeSourceWithFailures(FakeSource):
         return self.source_report
 
 
+@platform_name("fake")
+class FakeSourceWithCrash(FakeSource):
+    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        yield from self.work_units
+        raise ValueError("source crashed")
+
+
 def get_initial_mce() -> MetadataChangeEventClass:
     return MetadataChangeEventClass(
         proposedSnapshot=DatasetSnapshotClass(
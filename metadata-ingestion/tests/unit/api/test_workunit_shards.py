@@ -0,0 +1,148 @@
+import threading
+from typing import Dict, Iterable, List
+
+import pytest
+
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.api.source import Source, SourceReport
+from datahub.ingestion.api.source_protocols import ShardedSource
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.api.workunit_shards import (
+    WorkUnitShard,
+    WorkUnitShardingReport,
+    generate_sharded_workunits,
+)
+from datahub.metadata.schema_classes import DatasetPropertiesClass, StatusClass
+
+
+def _make_workunits(shard: WorkUnitShard) -> Iterable[MetadataWorkUnit]:
+    if shard.id == "broken":
+        yield MetadataChangeProposalWrapper(
+            entityUrn=make_dataset_urn("hive", "broken.table_0"),
+            aspect=DatasetPropertiesClass(name="table_0"),
+        ).as_workunit()
+        raise ValueError("something went wrong")
+
+    for i in range(shard.data):
+        yield MetadataChangeProposalWrapper(
+            entityUrn=make_dataset_urn("hive", f"{shard.id}.table_{i}"),
+            aspect=DatasetPropertiesClass(name=f"table_{i}"),
+        ).as_workunit()
+
+
+def _group_by_shard(workunits: Iterable[MetadataWorkUnit]) -> Dict[str, List[str]]:
+    groups: Dict[str, List[str]] = {}
+    for wu in workunits:
+        table = wu.get_urn().split(",")[1]
+        shard, name = table.split(".")
+        groups.setdefault(shard, []).append(name)
+    return groups
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_generate_sharded_workunits(max_concurrency: int) -> None:
+    source_report = SourceReport()
+    sharding_report = WorkUnitShardingReport()
+    shards = [WorkUnitShard(id=f"db_{i}", data=50) for i in range(10)]
+    shards.append(WorkUnitShard(id="broken"))
+
+    workunits = list(
+        generate_sharded_workunits(
+            shards,
+            _make_workunits,
+            source_report=source_report,
+            sharding_report=sharding_report,
+            max_concurrency=max_concurrency,
+            queue_size=5,
+        )
+    )
+
+    # Workunits from each shard are kept in order, even if interleaved.
+    groups = _group_by_shard(workunits)
+    for i in range(10):
+        assert groups[f"db_{i}"] == [f"table_{j}" for j in range(50)]
+    assert groups["broken"] == ["table_0"]
+
+    # The broken shard doesn't affect the others, but is reported as a failure.
+    assert sharding_report.num_shards == 11
+    assert sharding_report.num_shards_completed == 10
+    assert sharding_report.num_shards_failed == 1
+    assert list(sharding_report.failed_shards) == ["broken"]
+    assert len(source_report.failures) == 1
+    assert sharding_report.max_concurrency == max_concurrency
+
+
+def test_generate_sharded_workunits_stops_early() -> None:
+    stopped = threading.Event()
+
+    def _endless(shard: WorkUnitShard) -> Iterable[MetadataWorkUnit]:
+        try:
+            i = 0
+            while True:
+                yield MetadataChangeProposalWrapper(
+                    entityUrn=make_dataset_urn("hive", f"{shard.id}.table_{i}"),
+                    aspect=StatusClass(removed=False),
+                ).as_workunit()
+                i += 1
+        finally:
+            stopped.set()
+
+    stream = generate_sharded_workunits(
+        [WorkUnitShard(id="a"), WorkUnitShard(id="b")],
+        _endless,
+        source_report=SourceReport(),
+        sharding_report=WorkUnitShardingReport(),
+        max_concurrency=2,
+    )
+    for i, _ in enumerate(stream):
+        if i == 100:
+            break
+
+    # Closing the stream cancels the worker threads.
+    stream.close()  # type: ignore[attr-defined]
+    assert stopped.wait(timeout=10)
+
+
+class FakeShardedSource(Source):
+    def __init__(self, ctx: PipelineContext):
+        super().__init__(ctx)
+        self.report = SourceReport()
+
+    def get_workunit_shards(self) -> Iterable[WorkUnitShard]:
+        return [WorkUnitShard(id=f"db_{i}", data=20) for i in range(5)]
+
+    def get_workunits_for_shard(
+        self, shard: WorkUnitShard
+    ) -> Iterable[MetadataChangeProposalWrapper]:
+        for i in range(shard.data):
+            yield MetadataChangeProposalWrapper(
+                entityUrn=make_dataset_urn("hive", f"{shard.id}.table_{i}"),
+                aspect=DatasetPropertiesClass(name=f"table_{i}"),
+            )
+
+    def get_report(self) -> SourceReport:
+        return self.report
+
+
+def test_sharded_source() -> None:
+    ctx = PipelineContext(run_id="sharded-source-test")
+    ctx.flags.workunit_shard_concurrency = 3
+    source = FakeShardedSource(ctx)
+    assert isinstance(source, ShardedSource)
+
+    workunits = list(source.get_workunits())
+
+    # Workunit processors still run over the merged stream.
+    status_urns = {
+        wu.get_urn() for wu in workunits if wu.get_aspect_of_type(StatusClass)
+    }
+    assert len(status_urns) == 100
+
+    report = source.get_report()
+    assert report.workunit_sharding is not None
+    assert report.workunit_sharding.num_shards == 5
+    assert report.workunit_sharding.num_shards_completed == 5
+    assert report.workunit_sharding.max_concurrency == 3
+    assert "workunit_sharding" in report.as_obj()
@@ -1,12 +1,16 @@
+import io
 import tempfile
 from typing import List, Type
 
+import boto3
 import pandas as pd
 import ujson
 from avro import schema as avro_schema
 from avro.datafile import DataFileWriter
 from avro.io import DatumWriter
+from moto import mock_s3
 
+from datahub.ingestion.fs.s3_fs import S3RangeReader
 from datahub.ingestion.source.schema_inference import csv_tsv, json, parquet
 from datahub.ingestion.source.schema_inference.avro import AvroInferrer
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
@@ -135,3 +139,39 @@ def test_infer_schema_avro():
 
         assert_field_paths_match(fields, expected_field_paths_avro)
         assert_field_types_match(fields, expected_field_types)
+
+
+@mock_s3
+def test_infer_schema_parquet_with_range_requests():
+    s3_client = boto3.client("s3", region_name="us-east-1")
+    s3_client.create_bucket(Bucket="test-bucket")
+
+    num_rows = 100_000
+    large_table = pd.DataFrame(
+        {
+            "integer_field": range(num_rows),
+            "boolean_field": [i % 2 == 0 for i in range(num_rows)],
+            "string_field": [f"value_{i}" for i in range(num_rows)],
+        }
+    )
+    buffer = io.BytesIO()
+    large_table.to_parquet(buffer)
+    s3_client.put_object(
+        Bucket="test-bucket", Key="table.parquet", Body=buffer.getvalue()
+    )
+
+    range_reader = S3RangeReader.from_path(
+        s3_client,
+        "s3://test-bucket/table.parquet",
+        prefetch_size=64 * 1024,
+        prefetch_from_end=True,
+    )
+    fields = parquet.ParquetInferrer().infer_schema(
+        io.BufferedReader(range_reader, buffer_size=64 * 1024)
+    )
+
+    assert_field_paths_match(fields, expected_field_paths)
+    assert_field_types_match(fields, expected_field_types)
+    # Only the footer of the file is downloaded, with a single request.
+    assert range_reader.requests_made == 1
+    assert 0 < range_reader.bytes_downloaded <= 64 * 1024 < len(buffer.getvalue())
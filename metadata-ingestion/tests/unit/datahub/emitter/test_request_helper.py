@@ -1,3 +1,4 @@
+import gzip
 import json
 
 import pytest
@@ -6,8 +7,10 @@ from datahub.emitter.aspect import JSON_CONTENT_TYPE
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.request_helper import (
     OpenApiRequest,
+    choose_request_encoding,
+    compress_request_body,
 )
-from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.emitter.serialization_helper import json_dumps, pre_json_transform
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeProposal
 from datahub.metadata.schema_classes import (
     AuditStampClass,
@@ -290,3 +293,42 @@ def test_from_mcp_search_sync_flag():
     assert request.method == "delete"
     # For DELETE, there's no payload so no headers
     assert len(request.payload) == 0
+
+
+def test_choose_request_encoding():
+    assert choose_request_encoding([]) is None
+    assert choose_request_encoding(["br"]) is None
+    assert choose_request_encoding(["GZIP"]) == "gzip"
+
+    # zstd is only picked if the optional zstandard package is installed.
+    assert choose_request_encoding(["gzip", "zstd"]) in {"gzip", "zstd"}
+
+
+def test_compress_request_body_gzip():
+    body = json.dumps([{"urn": f"urn:li:chart:(test,{i})"} for i in range(100)])
+    compressed = compress_request_body(body.encode(), "gzip")
+
+    assert len(compressed) < len(body)
+    assert gzip.decompress(compressed).decode() == body
+
+    # The output is deterministic.
+    assert compress_request_body(body.encode(), "gzip") == compressed
+
+    with pytest.raises(ValueError):
+        compress_request_body(body.encode(), "br")
+
+
+def test_json_dumps_matches_stdlib():
+    obj = {
+        "urn": "urn:li:chart:(test,test)",
+        "chartInfo": {
+            "value": pre_json_transform(CHART_INFO.to_obj()),
+            "headers": {},
+            "unicode": "café 🚀",
+            "escaped": "Caf\\u00e9",
+        },
+        "big": 2**70,
+        "nested": [None, True, 1.5, []],
+    }
+
+    assert json.loads(json_dumps(obj)) == obj
@@ -1,11 +1,20 @@
 import logging
-from unittest.mock import MagicMock
+import threading
+from typing import List, Optional, Tuple
+from unittest.mock import MagicMock, patch
 
 import pytest
 from looker_sdk.sdk.api40.models import LookmlModelExplore, LookmlModelExploreField
 
-from datahub.ingestion.source.looker.looker_common import ExploreUpstreamViewField
-from datahub.ingestion.source.looker.looker_config import LookerCommonConfig
+from datahub.ingestion.source.looker.looker_common import (
+    ExploreUpstreamViewField,
+    LookerExplore,
+    LookerExploreRegistry,
+)
+from datahub.ingestion.source.looker.looker_config import (
+    LookerCommonConfig,
+    LookerDashboardSourceConfig,
+)
 
 
 class TestExploreUpstreamViewFieldFormFieldName:
@@ -91,3 +100,93 @@ class TestExploreUpstreamViewFieldFormFieldName:
 
             assert result is None
             assert "Empty field name detected" in caplog.text
+
+
+class TestLookerExploreRegistry:
+    """Test the size-aware explore cache and explore prefetching."""
+
+    def setup_method(self) -> None:
+        self.registries: List[LookerExploreRegistry] = []
+
+    def make_registry(
+        self,
+        explore_cache_max_fields: int,
+    ) -> Tuple[LookerExploreRegistry, List[Tuple[str, str]]]:
+        config = MagicMock(spec=LookerDashboardSourceConfig)
+        config.explore_cache_max_fields = explore_cache_max_fields
+        config.max_threads = 4
+        registry = LookerExploreRegistry(MagicMock(), MagicMock(), config)
+        self.registries.append(registry)
+
+        fetched: List[Tuple[str, str]] = []
+        fetched_lock = threading.Lock()
+
+        def from_api(
+            model: str, explore: str, *args: object
+        ) -> Optional[LookerExplore]:
+            with fetched_lock:
+                fetched.append((model, explore))
+            if explore == "missing":
+                return None
+            # Explores are named after their number of fields.
+            return MagicMock(fields=[MagicMock()] * int(explore))
+
+        patcher = patch.object(LookerExplore, "from_api", side_effect=from_api)
+        patcher.start()
+        return registry, fetched
+
+    def teardown_method(self) -> None:
+        patch.stopall()
+        for registry in self.registries:
+            registry.close()
+
+    def test_prefetch_fetches_each_explore_once(self):
+        registry, fetched = self.make_registry(explore_cache_max_fields=1000)
+
+        registry.prefetch(
+            [("model", "10"), ("model", "20"), ("model", "10"), ("model", "missing")]
+        )
+        assert sorted(fetched) == [
+            ("model", "10"),
+            ("model", "20"),
+            ("model", "missing"),
+        ]
+
+        assert registry.get_explore("model", "20") is not None
+        assert registry.get_explore("model", "missing") is None
+        assert len(fetched) == 3
+
+        stats = registry.compute_stats()["cache_stats"]
+        assert stats.prefetched == 3
+        assert stats.hits == 2
+        assert stats.misses == 0
+        assert stats.explores_cached == 3
+        assert stats.size == 11 + 21 + 1
+        # Fetching explores nobody looks up costs calls rather than saving them.
+        assert stats.lookups == 2
+        assert stats.api_calls == 3
+        assert stats.explore_calls_saved == -1
+
+    def test_cache_is_bounded_by_explore_size(self):
+        registry, fetched = self.make_registry(explore_cache_max_fields=50)
+
+        for explore in ["20", "20", "20", "25", "100"]:
+            registry.get_explore("model", explore)
+        assert fetched == [("model", "20"), ("model", "25"), ("model", "100")]
+
+        # Both explores fit, but a third one evicts the least recently used one.
+        registry.get_explore("model", "10")
+        registry.get_explore("model", "20")
+        assert fetched[-1] == ("model", "20")
+
+        stats = registry.compute_stats()["cache_stats"]
+        assert stats.hits == 2
+        assert stats.misses == 5
+        assert stats.evictions == 2
+        assert stats.too_large_to_cache == 1
+        assert stats.size <= 50
+        assert stats.explore_calls_saved == 7 - 5
+
+        cache_info = registry.compute_stats()["cache_info"]
+        assert (cache_info.hits, cache_info.misses, cache_info.maxsize) == (2, 5, 50)
+        assert cache_info.currsize == stats.explores_cached
@@ -0,0 +1,112 @@
+import pathlib
+from datetime import datetime, timedelta, timezone
+
+from datahub.ingestion.source.looker.lkml_patched import load_lkml, parse_lkml
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
+from datahub.sql_parsing.schema_resolver import SchemaResolver
+from datahub.sql_parsing.sqlglot_lineage import sqlglot_lineage
+
+VIEW_FILE = """
+view: orders {
+  sql_table_name: analytics.orders ;;
+  dimension: id {
+    sql: ${TABLE}.id ;;
+  }
+}
+"""
+
+
+def test_parsed_files_are_reused_across_runs(tmp_path: pathlib.Path) -> None:
+    view_path = tmp_path / "orders.view.lkml"
+    view_path.write_text(VIEW_FILE)
+    (tmp_path / "broken.view.lkml").write_text("view: {{ ")
+    cache_path = tmp_path / "parse_cache.db"
+
+    with LookMLParseCache(cache_path) as cache:
+        cache.preparse(sorted(tmp_path.glob("*.lkml")), max_workers=2)
+        assert cache.report.num_lkml_files_preparsed == 1
+        assert cache.report.num_lkml_files_preparse_failed == 1
+
+        parsed = load_lkml(view_path, parse_cache=cache)
+        assert parsed == parse_lkml(VIEW_FILE)
+
+        # Callers modify the parsed files, which must not leak into the cache.
+        parsed["views"][0]["name"] = "modified"
+        assert load_lkml(view_path, parse_cache=cache)["views"][0]["name"] == "orders"
+        assert cache.report.num_lkml_cache_hits == 2
+
+    with LookMLParseCache(cache_path) as cache:
+        cache.preparse([view_path], max_workers=2)
+        assert cache.report.num_lkml_files_preparsed == 0
+
+        assert cache.load(VIEW_FILE)["views"][0]["name"] == "orders"
+        assert cache.report.num_lkml_cache_hits == 1
+
+        # Any change to the file's contents means it needs to be parsed again.
+        cache.load(VIEW_FILE + "\n")
+        assert cache.report.num_lkml_cache_misses == 1
+
+
+def test_sql_parsing_results_are_invalidated_by_schema_changes(
+    tmp_path: pathlib.Path,
+) -> None:
+    query = "SELECT id, amount FROM analytics.orders"
+    schema_resolver = SchemaResolver(platform="snowflake", env="PROD")
+    key = LookMLParseCache.make_sql_parsing_key(
+        query,
+        platform="snowflake",
+        platform_instance=None,
+        env="PROD",
+        default_db="db",
+        default_schema=None,
+    )
+    result = sqlglot_lineage(query, schema_resolver=schema_resolver, default_db="db")
+    cache_path = tmp_path / "parse_cache.db"
+
+    with LookMLParseCache(cache_path) as cache:
+        assert cache.get_sql_parsing_result(key, schema_resolver) is None
+        cache.set_sql_parsing_result(key, result, schema_resolver)
+
+    with LookMLParseCache(cache_path) as cache:
+        assert cache.get_sql_parsing_result(key, schema_resolver) == result
+
+        # The same query for another platform instance resolves to different urns.
+        assert (
+            LookMLParseCache.make_sql_parsing_key(
+                query,
+                platform="snowflake",
+                platform_instance="other",
+                env="PROD",
+                default_db="db",
+                default_schema=None,
+            )
+            != key
+        )
+
+        schema_resolver.add_raw_schema_info(
+            result.in_tables[0], {"id": "INTEGER", "amount": "NUMBER"}
+        )
+        assert cache.get_sql_parsing_result(key, schema_resolver) is None
+        assert cache.report.num_sql_parsing_cache_stale == 1
+
+
+def test_loading_a_file_keeps_it_from_expiring(tmp_path: pathlib.Path) -> None:
+    cache_path = tmp_path / "parse_cache.db"
+
+    with LookMLParseCache(cache_path) as cache:
+        cache.load(VIEW_FILE)
+        cache.load(VIEW_FILE + "\n")
+
+    with LookMLParseCache(cache_path, ttl=timedelta(days=1)) as cache:
+        # Pretend both files were last used a while ago.
+        cache._files.sql_query(
+            f"UPDATE {cache._files.tablename} SET last_used = ?",
+            (int((datetime.now(tz=timezone.utc) - timedelta(days=2)).timestamp()),),
+        )
+        cache.load(VIEW_FILE)
+        assert cache.report.num_lkml_cache_hits == 1
+
+    with LookMLParseCache(cache_path, ttl=timedelta(days=1)) as cache:
+        assert len(cache) == 1
+        cache.load(VIEW_FILE)
+        assert cache.report.num_lkml_cache_hits == 1
@@ -0,0 +1,105 @@
+import pathlib
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from datahub.ingestion.source.s3.arrow_profiling import (
+    _hash_values,
+    _HyperLogLog,
+    _SingleTableArrowProfiler,
+    open_arrow_dataset,
+)
+from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+
+
+def _profile(path: pathlib.Path, **config):
+    dataset = open_arrow_dataset(str(path), path.suffix, None)
+    assert dataset is not None
+    profiler = _SingleTableArrowProfiler(
+        dataset,
+        DataLakeProfilerConfig(enabled=True, engine="arrow", **config),
+        DataLakeSourceReport(),
+        str(path),
+    )
+    return profiler.profile_table()
+
+
+@pytest.fixture
+def parquet_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "table.parquet"
+    table = pa.table(
+        {
+            "id": pa.array(range(10_000), pa.int64()),
+            "category": pa.array(["a", "b", None, "c"] * 2_500),
+            "amount": pa.array([float(i % 100) for i in range(10_000)]),
+        }
+    )
+    pq.write_table(table, path, row_group_size=3_000)
+    return path
+
+
+def test_profile_parquet(parquet_file):
+    profile = _profile(parquet_file)
+
+    assert profile.rowCount == 10_000
+    assert profile.columnCount == 3
+    assert profile.fieldProfiles is not None
+    fields = {field.fieldPath: field for field in profile.fieldProfiles}
+
+    assert fields["id"].nullCount == 0
+    assert fields["id"].min == "0"
+    assert fields["id"].max == "9999"
+    assert fields["id"].uniqueCount == pytest.approx(10_000, rel=0.03)
+
+    assert fields["category"].nullCount == 2_500
+    assert fields["category"].uniqueCount == 3
+    assert fields["category"].distinctValueFrequencies is not None
+    assert {
+        frequency.value: frequency.frequency
+        for frequency in fields["category"].distinctValueFrequencies
+    } == {"a": 2_500, "b": 2_500, "c": 2_500}
+
+    assert fields["amount"].uniqueCount == 100
+    assert fields["amount"].mean is not None
+    assert float(fields["amount"].mean) == pytest.approx(49.5)
+    assert fields["amount"].median is not None
+    assert float(fields["amount"].median) == pytest.approx(49.5, abs=1)
+
+
+def test_profile_table_level_only(parquet_file):
+    profile = _profile(parquet_file, profile_table_level_only=True)
+
+    assert profile.rowCount == 10_000
+    assert profile.columnCount == 3
+    assert not profile.fieldProfiles
+
+
+def test_profile_csv(tmp_path):
+    path = tmp_path / "table.csv"
+    path.write_text("name,age\nalice,30\nbob,\ncarol,41\n")
+
+    profile = _profile(path)
+
+    assert profile.rowCount == 3
+    assert profile.fieldProfiles is not None
+    fields = {field.fieldPath: field for field in profile.fieldProfiles}
+    assert fields["age"].nullCount == 1
+    assert fields["age"].min == "30"
+    assert fields["age"].max == "41"
+
+
+def test_unsupported_extension(tmp_path):
+    assert open_arrow_dataset(str(tmp_path / "table.avro"), ".avro", None) is None
+
+
+def test_hyperloglog_estimate():
+    hll = _HyperLogLog()
+    for start in range(0, 200_000, 50_000):
+        # Every value is added twice to check that duplicates aren't counted.
+        values = pa.array(range(start, start + 50_000))
+        hll.add_hashes(_hash_values(values))
+        hll.add_hashes(_hash_values(values))
+
+    assert hll.count() == pytest.approx(200_000, rel=0.03)
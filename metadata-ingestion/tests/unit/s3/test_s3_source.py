@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from datetime import datetime, timezone
 from typing import List, Tuple
@@ -16,6 +17,7 @@ from datahub.ingestion.source.data_lake_common.path_spec import PathSpec
 from datahub.ingestion.source.s3.source import (
     Folder,
     S3Source,
+    TableData,
     partitioned_folder_comparator,
 )
 
@@ -393,9 +395,56 @@ def test_get_folder_info_returns_expected_folder(s3_resource):
         modification_time=datetime(2025, 1, 1, 2, tzinfo=timezone.utc),
         size=150,
         sample_file="s3://my-bucket/my-folder/dir1/0002.csv",
+        sample_file_e_tag=f'"{hashlib.md5(b" " * 150).hexdigest()}"',
     )
 
 
+def test_get_fields_uses_schema_cache(tmp_path):
+    data_file = tmp_path / "table.csv"
+    data_file.write_text("a,b\n1,x\n")
+
+    source = S3Source.create(
+        config_dict={
+            "path_specs": [{"include": f"{tmp_path}/*.csv"}],
+            "schema_cache_path": str(tmp_path / "schema_cache.db"),
+        },
+        ctx=PipelineContext(run_id="test-s3"),
+    )
+    path_spec = source.source_config.path_specs[0]
+    table_data = TableData(
+        display_name="table.csv",
+        is_s3=False,
+        full_path=str(data_file),
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        table_path=str(data_file),
+        size_in_bytes=data_file.stat().st_size,
+        number_of_files=1,
+        e_tag='"etag-1"',
+    )
+
+    fields = source.get_fields(table_data, path_spec)
+    assert [field.fieldPath for field in fields] == ["a", "b"]
+    assert source.report.num_schema_cache_misses == 1
+
+    # Changes made to the emitted fields, e.g. by transformers, don't leak into the cache.
+    fields[0].description = "modified"
+
+    # As long as the ETag doesn't change, the file isn't read again.
+    data_file.write_text("c\n1\n")
+    fields = source.get_fields(table_data, path_spec)
+    assert [field.fieldPath for field in fields] == ["a", "b"]
+    assert source.report.num_schema_cache_hits == 1
+    assert fields[0].description is None
+    fields[0].description = "modified"
+    assert source.get_fields(table_data, path_spec)[0].description is None
+
+    table_data.e_tag = '"etag-2"'
+    fields = source.get_fields(table_data, path_spec)
+    assert [field.fieldPath for field in fields] == ["c"]
+    assert source.report.num_schema_cache_misses == 2
+    source.close()
+
+
 def test_s3_region_in_external_url():
     """Test that AWS region is properly used in external URLs."""
     source = S3Source.create(
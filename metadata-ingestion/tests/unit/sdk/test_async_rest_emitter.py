@@ -0,0 +1,142 @@
+import json
+from typing import AsyncIterator, List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from datahub.configuration.common import OperationalError
+from datahub.emitter.async_rest_emitter import DataHubAsyncRestEmitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.rest_emitter import EmitMode
+from datahub.metadata.com.linkedin.pegasus2avro.dataset import DatasetProfile
+
+
+class _FakeGms:
+    def __init__(self) -> None:
+        self.url = ""
+        self.requests: List[dict] = []
+        self.responses: List[web.Response] = []
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests.append(
+            {
+                "method": request.method,
+                "path_qs": request.path_qs,
+                "headers": dict(request.headers),
+                "body": await request.text(),
+            }
+        )
+        if self.responses:
+            return self.responses.pop(0)
+        return web.json_response([])
+
+
+@pytest.fixture
+async def fake_gms() -> AsyncIterator[_FakeGms]:
+    gms = _FakeGms()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", gms.handle)
+
+    server = TestServer(app)
+    await server.start_server()
+    gms.url = str(server.make_url(""))
+    yield gms
+    await server.close()
+
+
+def _make_mcps(n: int) -> List[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,User.UserAccount{i},PROD)",
+            aspect=DatasetProfile(
+                rowCount=2000 + i,
+                columnCount=15,
+                timestampMillis=1626995099686,
+            ),
+        )
+        for i in range(n)
+    ]
+
+
+async def test_emit_mcps_async_openapi(fake_gms: _FakeGms) -> None:
+    emitter = DataHubAsyncRestEmitter(
+        fake_gms.url,
+        token="test-token",
+        openapi_ingestion=True,
+    )
+    try:
+        result = await emitter.emit_mcps_async(
+            _make_mcps(3), emit_mode=EmitMode.SYNC_PRIMARY
+        )
+    finally:
+        await emitter.close_async()
+        emitter.close()
+
+    assert result == 1
+    assert len(fake_gms.requests) == 1
+    request = fake_gms.requests[0]
+    assert request["method"] == "POST"
+    assert request["path_qs"] == "/openapi/v3/entity/dataset?async=false"
+    assert request["headers"]["Authorization"] == "Bearer test-token"
+    assert len(json.loads(request["body"])) == 3
+
+
+async def test_emit_mcps_async_restli(fake_gms: _FakeGms) -> None:
+    emitter = DataHubAsyncRestEmitter(
+        fake_gms.url,
+        openapi_ingestion=False,
+    )
+    try:
+        result = await emitter.emit_mcps_async(_make_mcps(2), emit_mode=EmitMode.ASYNC)
+    finally:
+        await emitter.close_async()
+        emitter.close()
+
+    assert result == 1
+    request = fake_gms.requests[0]
+    assert request["path_qs"] == "/aspects?action=ingestProposalBatch"
+    payload = json.loads(request["body"])
+    assert payload["async"] == "true"
+    assert len(payload["proposals"]) == 2
+
+
+async def test_emit_mcps_async_retries(fake_gms: _FakeGms) -> None:
+    fake_gms.responses = [web.Response(status=503)]
+
+    emitter = DataHubAsyncRestEmitter(
+        fake_gms.url,
+        openapi_ingestion=True,
+        retry_max_times=1,
+    )
+    try:
+        await emitter.emit_mcps_async(_make_mcps(1))
+    finally:
+        await emitter.close_async()
+        emitter.close()
+
+    assert len(fake_gms.requests) == 2
+    # The retry must send the original request again.
+    assert fake_gms.requests[1]["body"] == fake_gms.requests[0]["body"]
+    assert json.loads(fake_gms.requests[1]["body"])
+
+
+async def test_emit_mcps_async_error(fake_gms: _FakeGms) -> None:
+    fake_gms.responses = [
+        web.json_response(
+            {"message": "something went wrong", "stackTrace": "..."}, status=400
+        )
+    ]
+
+    emitter = DataHubAsyncRestEmitter(
+        fake_gms.url,
+        openapi_ingestion=True,
+    )
+    try:
+        with pytest.raises(OperationalError, match="something went wrong") as excinfo:
+            await emitter.emit_mcps_async(_make_mcps(1))
+    finally:
+        await emitter.close_async()
+        emitter.close()
+
+    assert "stackTrace" not in excinfo.value.info
@@ -1,11 +1,23 @@
 from unittest.mock import Mock, patch
 
+from requests.models import HTTPError
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.graph.aspect_cache import AspectCache
 from datahub.ingestion.graph.client import (
     DatahubClientConfig,
     DataHubGraph,
     entity_type_to_graphql,
 )
-from datahub.metadata.schema_classes import CorpUserEditableInfoClass
+from datahub.metadata.schema_classes import CorpUserEditableInfoClass, StatusClass
+from datahub.utilities.sentinels import unset
+from datahub.utilities.server_config_util import RestServiceConfig
+
+
+def _server_config(version: str) -> RestServiceConfig:
+    return RestServiceConfig(
+        raw_config={"versions": {"acryldata/datahub": {"version": version}}}
+    )
 
 
 @patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
@@ -26,6 +38,166 @@ def test_get_aspect(mock_test_connection):
         assert editable is not None
 
 
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_aspect_cached(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig(server="http://fake-domain.local"))
+    graph.enable_aspect_cache(max_size=10, ttl_sec=300)
+    user_urn = "urn:li:corpuser:foo"
+    with patch("requests.Session.get") as mock_get:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(
+            return_value={
+                "version": 0,
+                "aspect": {
+                    "com.linkedin.identity.CorpUserEditableInfo": {"title": "eng"}
+                },
+            }
+        )
+        mock_get.return_value = mock_response
+
+        first = graph.get_aspect(user_urn, CorpUserEditableInfoClass)
+        assert first is not None
+        # Mutating the returned aspect must not affect the cached copy.
+        first.title = "changed"
+        second = graph.get_aspect(user_urn, CorpUserEditableInfoClass)
+        assert second is not None and second.title == "eng"
+        assert mock_get.call_count == 1
+
+        # Writing the aspect through the graph invalidates the cache.
+        with patch("datahub.emitter.rest_emitter.DataHubRestEmitter.emit_mcp"):
+            graph.emit_mcp(
+                MetadataChangeProposalWrapper(
+                    entityUrn=user_urn, aspect=CorpUserEditableInfoClass(title="pm")
+                )
+            )
+        graph.get_aspect(user_urn, CorpUserEditableInfoClass)
+        assert mock_get.call_count == 2
+
+    assert graph.aspect_cache is not None
+    report = graph.aspect_cache.report.as_obj()
+    assert report["num_hits"] == 1
+    assert report["num_misses"] == 2
+    assert report["num_invalidations"] == 1
+    assert report["hit_rate"] == round(1 / 3, 4)
+
+
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_aspects_for_urns(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig(server="http://fake-domain.local"))
+    graph.set_server_config(_server_config("v1.0.1"))
+    graph.enable_aspect_cache(max_size=10, ttl_sec=300)
+    urns = [f"urn:li:corpuser:user{i}" for i in range(5)]
+    with patch("requests.Session.post") as mock_post:
+        mock_response = Mock()
+        mock_response.json = Mock(
+            return_value=[
+                {"urn": urn, "corpUserEditableInfo": {"value": {"title": urn}}}
+                for urn in urns[:3]
+            ]
+        )
+        mock_post.return_value = mock_response
+
+        aspects = graph.get_aspects_for_urns(
+            urns, CorpUserEditableInfoClass, batch_size=10
+        )
+        assert mock_post.call_count == 1
+        assert [aspect.title if aspect else None for aspect in aspects.values()] == [
+            *urns[:3],
+            None,
+            None,
+        ]
+
+        # Both the found and missing aspects are now cached.
+        aspects_again = graph.get_aspects_for_urns(urns, CorpUserEditableInfoClass)
+        assert aspects_again == aspects
+        assert mock_post.call_count == 1
+
+
+def _mock_get_aspect_response(url: str) -> Mock:
+    mock_response = Mock()
+    if "user0" in url:
+        mock_response.status_code = 200
+        mock_response.json = Mock(
+            return_value={
+                "aspect": {
+                    "com.linkedin.identity.CorpUserEditableInfo": {"title": "user0"}
+                }
+            }
+        )
+    else:
+        mock_response.status_code = 404
+    return mock_response
+
+
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_aspects_for_urns_without_batch_get(mock_test_connection):
+    mock_test_connection.return_value = {}
+    urns = ["urn:li:corpuser:user0", "urn:li:corpuser:user1"]
+
+    # Older servers don't have the OpenAPI v3 batch endpoint.
+    graph = DataHubGraph(DatahubClientConfig(server="http://fake-domain.local"))
+    graph.set_server_config(_server_config("v0.15.0"))
+    with (
+        patch("requests.Session.post") as mock_post,
+        patch(
+            "requests.Session.get", side_effect=_mock_get_aspect_response
+        ) as mock_get,
+    ):
+        aspects = graph.get_aspects_for_urns(urns, CorpUserEditableInfoClass)
+        assert mock_post.call_count == 0
+        assert mock_get.call_count == 2
+        assert aspects == {
+            urns[0]: CorpUserEditableInfoClass(title="user0"),
+            urns[1]: None,
+        }
+
+    # Servers which report a new enough version, but still lack the endpoint.
+    graph.set_server_config(_server_config("v1.0.1"))
+    with (
+        patch("requests.Session.post") as mock_post,
+        patch(
+            "requests.Session.get", side_effect=_mock_get_aspect_response
+        ) as mock_get,
+    ):
+        not_found = Mock(status_code=404)
+        not_found.raise_for_status = Mock(
+            side_effect=HTTPError("404 Not Found", response=not_found)
+        )
+        mock_post.return_value = not_found
+
+        aspects_again = graph.get_aspects_for_urns(urns, CorpUserEditableInfoClass)
+        assert mock_post.call_count == 1
+        assert mock_get.call_count == 2
+        assert aspects_again == aspects
+
+
+def test_aspect_cache_ttl_and_eviction() -> None:
+    now = 0.0
+    cache = AspectCache(max_size=2, ttl_sec=10, clock=lambda: now)
+
+    cache.put("urn:li:corpuser:a", "status", StatusClass(removed=False))
+    cache.put("urn:li:corpuser:b", "status", None)
+    assert cache.get("urn:li:corpuser:a", "status") == StatusClass(removed=False)
+    assert cache.get("urn:li:corpuser:b", "status") is None
+
+    # "a" was used more recently than "b", so "b" gets evicted.
+    cache.get("urn:li:corpuser:a", "status")
+    cache.put("urn:li:corpuser:c", "status", None)
+    assert cache.get("urn:li:corpuser:b", "status") is unset
+    assert cache.report.num_evictions == 1
+
+    now = 20.0
+    assert cache.get("urn:li:corpuser:a", "status") is unset
+    assert cache.report.num_expired == 1
+
+    cache.put("urn:li:corpuser:c", "status", None)
+    cache.invalidate("urn:li:corpuser:c")
+    assert len(cache) == 0
+
+
 def test_graphql_entity_types() -> None:
     # FIXME: This is a subset of all the types, but it's enough to get us ok coverage.
 
@@ -1,5 +1,8 @@
+import dataclasses
+import gzip
 import json
 import os
+import threading
 import time
 from datetime import timedelta
 from typing import Any, Dict
@@ -24,6 +27,7 @@ from datahub.emitter.rest_emitter import (
     DatahubRestEmitter,
     EmitMode,
     RequestsSessionConfig,
+    RestEmitterStats,
     RestSinkEndpoint,
     logger,
 )
@@ -981,6 +985,104 @@ class TestDataHubRestEmitter:
                     == f"{MOCK_GMS_ENDPOINT}/openapi/v3/entity/dataset?async=false"
                 )
 
+    def test_restli_emitter_max_bytes_non_ascii(self):
+        emitter = DataHubRestEmitter(MOCK_GMS_ENDPOINT, openapi_ingestion=False)
+
+        # Each item is about a quarter of the max size in characters, but over half
+        # of it in bytes, so they can't share a chunk.
+        items = [
+            MetadataChangeProposalWrapper(
+                entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,{i}{'é' * (INGEST_MAX_PAYLOAD_BYTES // 4)},PROD)",
+                aspect=Status(removed=False),
+            )
+            for i in range(3)
+        ]
+
+        payloads = emitter._prepare_restli_payloads(items, EmitMode.SYNC_PRIMARY)
+
+        assert len(payloads) > 1
+        for payload in payloads:
+            assert len(payload.encode()) <= INGEST_MAX_PAYLOAD_BYTES
+
+    def test_request_compression(self):
+        emitter = DataHubRestEmitter(MOCK_GMS_ENDPOINT, openapi_ingestion=True)
+        emitter.set_server_config(
+            RestServiceConfig(raw_config={"supportedRequestEncodings": ["gzip"]})
+        )
+
+        items = [
+            MetadataChangeProposalWrapper(
+                entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,User.UserAccount{i},PROD)",
+                aspect=DatasetProperties(description="x" * 1000),
+            )
+            for i in range(5)
+        ]
+
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 200
+        with patch.object(
+            emitter._session, "post", return_value=mock_response
+        ) as mock_post:
+            emitter.emit_mcps(items)
+
+        mock_post.assert_called_once()
+        kwargs = mock_post.call_args[1]
+        assert kwargs["headers"] == {"Content-Encoding": "gzip"}
+        assert len(json.loads(gzip.decompress(kwargs["data"]))) == 5
+
+        assert emitter.stats.num_requests == 1
+        assert emitter.stats.num_requests_compressed == 1
+        assert emitter.stats.bytes_on_wire == len(kwargs["data"])
+        assert emitter.stats.bytes_on_wire < emitter.stats.payload_bytes
+
+    def test_request_compression_not_advertised(self):
+        emitter = DataHubRestEmitter(MOCK_GMS_ENDPOINT, openapi_ingestion=True)
+        emitter.set_server_config(RestServiceConfig(raw_config={}))
+
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 200
+        with patch.object(
+            emitter._session, "post", return_value=mock_response
+        ) as mock_post:
+            emitter.emit_mcps(
+                [
+                    MetadataChangeProposalWrapper(
+                        entityUrn="urn:li:dataset:(urn:li:dataPlatform:mysql,User.UserAccount,PROD)",
+                        aspect=DatasetProperties(description="x" * 2000),
+                    )
+                ]
+            )
+
+        kwargs = mock_post.call_args[1]
+        assert "headers" not in kwargs
+        assert len(json.loads(kwargs["data"])) == 1
+        assert emitter.stats.num_requests_compressed == 0
+        assert emitter.stats.bytes_on_wire == emitter.stats.payload_bytes
+
+    def test_request_stats_shared_across_threads(self):
+        stats = RestEmitterStats()
+
+        def record_requests() -> None:
+            for _ in range(1000):
+                stats.record_request(
+                    payload_bytes=10, bytes_on_wire=4, compression_time_seconds=0.001
+                )
+
+        threads = [threading.Thread(target=record_requests) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert dataclasses.asdict(stats) == {
+            "num_requests": 8000,
+            "num_requests_compressed": 8000,
+            "payload_bytes": 80000,
+            "bytes_on_wire": 32000,
+            "serialization_time_seconds": 0.0,
+            "compression_time_seconds": pytest.approx(8.0),
+        }
+
     def test_openapi_sync_full_emit_mode(self, openapi_emitter):
         """Test that SYNC_WAIT emit mode correctly sets async=false URL parameter and sync header"""
 
@@ -8,6 +8,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.dataset import (
     Upstream,
     UpstreamLineage,
 )
+from datahub.metadata.urns import Urn
 from datahub.utilities.urns.urn_iter import list_urns_with_path, lowercase_dataset_urns
 
 
@@ -149,5 +150,10 @@ def test_dataset_urn_lowercase_transformer():
 
     assert original != expected  # sanity check
 
+    field_urn = Urn.from_string(_fldUrn("downstreamTable", "c5"))
+
     lowercase_dataset_urns(original)
     assert original == expected
+
+    # Parsed urns are shared, so they must not have been modified in place.
+    assert field_urn.urn() == _fldUrn("downstreamTable", "c5")
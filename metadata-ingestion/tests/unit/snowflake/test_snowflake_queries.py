@@ -1,5 +1,6 @@
 import datetime
-from typing import Optional
+import pathlib
+from typing import List, Optional, Tuple
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +12,9 @@ from datahub.configuration.time_window_config import (
     BaseTimeWindowConfig,
     BucketDuration,
 )
+from datahub.ingestion.source.snowflake.snowflake_audit_log_cache import (
+    SnowflakeAuditLogCache,
+)
 from datahub.ingestion.source.snowflake.snowflake_config import (
     QueryDedupStrategyType,
     SnowflakeIdentifierConfig,
@@ -819,3 +823,127 @@ class TestSnowflakeQueriesExtractorStatefulTimeWindowIngestion:
             mock_fetch_users.assert_called_once()
             mock_fetch_copy_history.assert_called_once()
             mock_fetch_query_log.assert_called_once()
+
+
+class TestSnowflakeQueriesExtractorAuditLogCache:
+    """Tests for fetching the query log incrementally with audit_log_cache_path."""
+
+    def _create_mock_extractor(
+        self,
+        audit_log_cache_path: pathlib.Path,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+    ) -> SnowflakeQueriesExtractor:
+        config = SnowflakeQueriesExtractorConfig(
+            window=BaseTimeWindowConfig(
+                start_time=start_time,
+                end_time=end_time,
+                bucket_duration=BucketDuration.DAY,
+            ),
+            audit_log_cache_path=audit_log_cache_path,
+        )
+
+        mock_identifiers = Mock()
+        mock_identifiers.platform = "snowflake"
+        mock_identifiers.identifier_config = SnowflakeIdentifierConfig()
+
+        return SnowflakeQueriesExtractor(
+            connection=Mock(),
+            config=config,
+            structured_report=Mock(),
+            filters=Mock(),
+            identifiers=mock_identifiers,
+        )
+
+    def _fetch_query_log(
+        self,
+        extractor: SnowflakeQueriesExtractor,
+        audit_log_cache_path: pathlib.Path,
+    ) -> Tuple[List[str], List[Tuple[datetime.datetime, datetime.datetime]]]:
+        fetched_ranges = []
+
+        def _fetch(users, start_time, end_time):
+            fetched_ranges.append((start_time, end_time))
+            yield f"{start_time.isoformat()} - {end_time.isoformat()}"
+
+        with (
+            SnowflakeAuditLogCache(
+                audit_log_cache_path,
+                fingerprint=extractor._audit_log_cache_fingerprint(),
+            ) as cache,
+            patch.object(extractor, "_fetch_query_log", side_effect=_fetch),
+        ):
+            bucket_starts = extractor.update_audit_log_cache({}, cache)
+            entries = list(cache.get_entries(bucket_starts))
+
+        extractor.close()
+        return entries, fetched_ranges
+
+    def test_only_missing_buckets_are_fetched(self, tmp_path):
+        cache_path = tmp_path / "audit_log_cache.sqlite"
+        day = datetime.timedelta(days=1)
+        jan1 = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+        extractor = self._create_mock_extractor(cache_path, jan1, jan1 + 2.5 * day)
+        entries, fetched_ranges = self._fetch_query_log(extractor, cache_path)
+        assert fetched_ranges == [
+            (jan1, jan1 + day),
+            (jan1 + day, jan1 + 2 * day),
+            (jan1 + 2 * day, jan1 + 2.5 * day),
+        ]
+        assert len(entries) == 3
+        assert extractor.report.num_audit_log_buckets_fetched == 3
+        assert extractor.report.num_audit_log_buckets_cached == 0
+
+        # The next run only needs to fetch the new tail of the window,
+        # and the bucket which is no longer part of the window is dropped.
+        extractor = self._create_mock_extractor(
+            cache_path, jan1 + day, jan1 + 3.5 * day
+        )
+        entries, fetched_ranges = self._fetch_query_log(extractor, cache_path)
+        assert fetched_ranges == [
+            (jan1 + 2 * day, jan1 + 3 * day),
+            (jan1 + 3 * day, jan1 + 3.5 * day),
+        ]
+        assert entries == [
+            f"{(jan1 + day).isoformat()} - {(jan1 + 2 * day).isoformat()}",
+            f"{(jan1 + 2 * day).isoformat()} - {(jan1 + 3 * day).isoformat()}",
+            f"{(jan1 + 3 * day).isoformat()} - {(jan1 + 3.5 * day).isoformat()}",
+        ]
+        assert extractor.report.num_audit_log_buckets_fetched == 2
+        assert extractor.report.num_audit_log_buckets_cached == 1
+
+        with SnowflakeAuditLogCache(cache_path, fingerprint="") as cache:
+            assert len(cache) == 3
+
+    def test_recently_fetched_bucket_is_not_complete(self, tmp_path):
+        start_time = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+        end_time = start_time + datetime.timedelta(days=1)
+
+        with SnowflakeAuditLogCache(
+            tmp_path / "audit_log_cache.sqlite", fingerprint="config"
+        ) as cache:
+            # Queries may still be landing in the ACCOUNT_USAGE views.
+            cache.set_bucket(
+                start_time,
+                start_time,
+                end_time,
+                ["query"],
+                fetched_at=end_time + datetime.timedelta(hours=1),
+            )
+            assert not cache.is_complete(start_time, start_time, end_time)
+
+            cache.set_bucket(
+                start_time,
+                start_time,
+                end_time,
+                ["query"],
+                fetched_at=end_time + datetime.timedelta(hours=4),
+            )
+            assert cache.is_complete(start_time, start_time, end_time)
+            assert list(cache.get_entries([start_time])) == ["query"]
+
+        with SnowflakeAuditLogCache(
+            tmp_path / "audit_log_cache.sqlite", fingerprint="other config"
+        ) as cache:
+            assert not cache.is_complete(start_time, start_time, end_time)
@@ -12,6 +12,8 @@ from datahub.configuration.time_window_config import BucketDuration, get_time_bu
 from datahub.ingestion.sink.file import write_metadata_file
 from datahub.ingestion.source.usage.usage_common import BaseUsageConfig
 from datahub.metadata.urns import CorpUserUrn, DatasetUrn
+from datahub.sql_parsing.parallel_sql_parser import ParallelSqlParser, ParseRequest
+from datahub.sql_parsing.schema_resolver import SchemaResolver
 from datahub.sql_parsing.sql_parsing_aggregator import (
     KnownQueryLineageInfo,
     ObservedQuery,
@@ -1297,3 +1299,202 @@ def test_partial_empty_downstream_column_in_snowflake_lineage(
         RESOURCE_DIR
         / "test_partial_empty_downstream_column_in_snowflake_lineage_golden.json",
     )
+
+
+@freeze_time(FROZEN_TIME)
+def test_parallel_parsing_temp_table() -> None:
+    # Same as test_temp_table, but with SQL parsing done in worker processes.
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+        parallel_parsing_workers=2,
+        parallel_parsing_batch_size=1,
+    )
+
+    aggregator._schema_resolver.add_raw_schema_info(
+        DatasetUrn("redshift", "dev.public.bar").urn(),
+        {"a": "int", "b": "int", "c": "int"},
+    )
+
+    for query, session_id in [
+        ("create table foo as select a, 2*b as b from bar", "session1"),
+        ("create temp table foo as select a, b+c as c from bar", "session2"),
+        ("create table foo_session2 as select * from foo", "session2"),
+        ("create table foo_session3 as select * from foo", "session3"),
+    ]:
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query=query,
+                default_db="dev",
+                default_schema="public",
+                session_id=session_id,
+            )
+        )
+
+    # Nothing is processed until the batch is flushed.
+    assert aggregator.report.num_observed_queries == 0
+
+    mcps = list(aggregator.gen_metadata())
+    aggregator.close()
+
+    # The query that reads from the session2 temp table must be re-parsed
+    # on the main thread, since the workers don't know about temp tables.
+    assert aggregator.report.num_observed_queries == 4
+    assert aggregator.report.num_sql_parsed_in_workers == 3
+    assert aggregator.report.num_parallel_parse_fallbacks == 1
+
+    check_goldens_stream(
+        outputs=mcps,
+        golden_path=RESOURCE_DIR / "test_temp_table.json",
+    )
+
+
+@freeze_time(FROZEN_TIME)
+def test_parallel_parsing_dedups_queries() -> None:
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+        parallel_parsing_workers=2,
+    )
+
+    for _ in range(3):
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query="create table foo as select a, b from bar",
+                default_db="dev",
+                default_schema="public",
+            )
+        )
+
+    mcps = list(aggregator.gen_metadata())
+    aggregator.close()
+
+    assert aggregator.report.num_parallel_parse_duplicates == 2
+    assert aggregator.report.parallel_parsing is not None
+    assert aggregator.report.parallel_parsing.num_queries_submitted == 1
+
+    check_goldens_stream(
+        outputs=mcps,
+        golden_path=RESOURCE_DIR / "test_basic_lineage.json",
+    )
+
+
+def test_parallel_parser_snapshot_only_adds_new_schemas() -> None:
+    schema_resolver = SchemaResolver(platform="redshift")
+    schema_resolver.add_raw_schema_info(
+        DatasetUrn("redshift", "dev.public.bar").urn(), {"a": "int", "b": "int"}
+    )
+    request = ParseRequest(
+        query="select a, b from baz", default_db="dev", default_schema="public"
+    )
+
+    parser = ParallelSqlParser(
+        schema_resolver=schema_resolver, max_workers=1, batch_size=1
+    )
+    try:
+        [result] = parser.parse_many([request])
+        assert result is not None
+        assert result.debug_info.table_schemas_resolved == 0
+
+        # The worker already saw baz as missing, but must pick up its new schema.
+        schema_resolver.add_raw_schema_info(
+            DatasetUrn("redshift", "dev.public.baz").urn(), {"a": "int", "b": "int"}
+        )
+        changes_before = parser._snapshot_conn.total_changes
+        [result] = parser.parse_many([request])
+        assert result is not None
+        assert result.debug_info.table_schemas_resolved == 1
+        assert parser._snapshot_conn.total_changes - changes_before == 1
+        assert parser.report.num_schema_snapshots == 2
+    finally:
+        parser.close()
+
+
+@freeze_time(FROZEN_TIME)
+def test_persistent_parse_cache(tmp_path: pathlib.Path) -> None:
+    cache_path = tmp_path / "sql_parsing_cache.db"
+
+    def _run(bar_schema: dict) -> SqlParsingAggregator:
+        aggregator = SqlParsingAggregator(
+            platform="redshift",
+            generate_lineage=True,
+            generate_usage_statistics=False,
+            generate_operations=False,
+            parse_cache_path=cache_path,
+        )
+        aggregator._schema_resolver.add_raw_schema_info(
+            DatasetUrn("redshift", "dev.public.bar").urn(), bar_schema
+        )
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query="create table foo as select a, b from bar",
+                default_db="dev",
+                default_schema="public",
+            )
+        )
+        list(aggregator.gen_metadata())
+        aggregator.close()
+        return aggregator
+
+    first = _run({"a": "int", "b": "int"})
+    assert first.report.num_sql_parsing_cache_misses == 1
+    assert first.report.num_sql_parsing_cache_hits == 0
+
+    second = _run({"a": "int", "b": "int"})
+    assert second.report.num_sql_parsing_cache_hits == 1
+    assert second.report.num_sql_parsing_cache_misses == 0
+
+    # If an upstream schema changes, the cached result is not used.
+    third = _run({"a": "int", "b": "int", "c": "int"})
+    assert third.report.num_sql_parsing_cache_stale == 1
+    assert third.report.num_sql_parsing_cache_hits == 0
+
+
+@freeze_time(FROZEN_TIME)
+def test_parallel_parsing_checks_parse_cache_once(tmp_path: pathlib.Path) -> None:
+    cache_path = tmp_path / "sql_parsing_cache.db"
+
+    def _run() -> SqlParsingAggregator:
+        aggregator = SqlParsingAggregator(
+            platform="redshift",
+            generate_lineage=True,
+            generate_usage_statistics=False,
+            generate_operations=False,
+            parallel_parsing_workers=2,
+            parse_cache_path=cache_path,
+        )
+        aggregator._schema_resolver.add_raw_schema_info(
+            DatasetUrn("redshift", "dev.public.bar").urn(),
+            {"a": "int", "b": "int", "c": "int"},
+        )
+        for query, session_id in [
+            ("create temp table foo as select a, b+c as c from bar", "session2"),
+            ("create table foo_session2 as select * from foo", "session2"),
+        ]:
+            aggregator.add_observed_query(
+                ObservedQuery(
+                    query=query,
+                    default_db="dev",
+                    default_schema="public",
+                    session_id=session_id,
+                )
+            )
+        list(aggregator.gen_metadata())
+        aggregator.close()
+        return aggregator
+
+    # The query reading from the temp table falls back to the main process,
+    # which must not look it up in the cache again.
+    first = _run()
+    assert first.report.num_parallel_parse_fallbacks == 1
+    assert first.report.num_sql_parsing_cache_misses == 2
+    assert first.report.num_sql_parsing_cache_hits == 0
+
+    second = _run()
+    assert second.report.num_parallel_parse_fallbacks == 1
+    assert second.report.num_sql_parsing_cache_misses == 0
+    assert second.report.num_sql_parsing_cache_hits == 2
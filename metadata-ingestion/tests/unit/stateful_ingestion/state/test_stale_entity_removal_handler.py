@@ -1,9 +1,13 @@
+import json
 from typing import Dict, List, Tuple
 
 import pytest
 
 from datahub.ingestion.source.state.entity_removal_state import (
+    GenericCheckpointState,
     compute_percent_entities_changed,
+    decode_compact_urns,
+    encode_compact_urns,
     filter_ignored_entity_types,
 )
 
@@ -63,3 +67,61 @@ def test_filter_ignored_entity_types():
         "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset2,PROD)",
         "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset3,PROD)",
     ]
+
+
+def test_compact_urns_roundtrip():
+    urns = [
+        "urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.table2,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.table1,PROD)",
+        "urn:li:container:8d7f3b7b2f1c4e0a9b1f2c3d4e5f6a7b",
+        "urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.table10,PROD)",
+    ]
+    encoded = encode_compact_urns(urns)
+
+    # Urns are sorted, and only store the suffix after the shared prefix.
+    assert encoded[0] == (0, "urn:li:container:8d7f3b7b2f1c4e0a9b1f2c3d4e5f6a7b")
+    assert encoded[3] == (
+        len("urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.table"),
+        "2,PROD)",
+    )
+    assert decode_compact_urns(encoded) == sorted(urns)
+
+
+def test_compact_state_serialization():
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.table{i},PROD)"
+        for i in range(100)
+    ]
+    state = GenericCheckpointState(urns=urns, serde="utf-8")
+    state.enable_compact_serialization()
+
+    serialized = json.loads(state.to_bytes().decode())
+    assert "urns" not in serialized
+    assert len(serialized["compact_urns"]) == len(urns)
+
+    # Deserialization handles both the compact and the regular format.
+    restored = GenericCheckpointState.parse_obj(serialized)
+    assert sorted(restored.urns) == sorted(urns)
+    assert restored.urn_count() == len(urns)
+    assert GenericCheckpointState.parse_obj({"urns": urns}).urns == urns
+
+
+def test_state_diff():
+    old_state = GenericCheckpointState(
+        urns=[
+            "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset1,PROD)",
+            "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset2,PROD)",
+            "urn:li:container:dummy_container",
+            "urn:li:dataProcessInstance:478810e859f870a54f72c681f41af619",
+        ]
+    )
+    new_state = GenericCheckpointState(
+        urns=["urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset1,PROD)"]
+    )
+
+    assert list(old_state.get_urns_not_in("dataset", new_state)) == [
+        "urn:li:dataset:(urn:li:dataPlatform:postgres,dummy_dataset2,PROD)"
+    ]
+    assert len(list(old_state.get_urns_not_in("*", new_state))) == 3
+    # The dataProcessInstance urn is ignored, so 2 of the 3 remaining urns changed.
+    assert new_state.get_percent_entities_changed(old_state) == pytest.approx(200 / 3)
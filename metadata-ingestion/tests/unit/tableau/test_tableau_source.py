@@ -29,6 +29,9 @@ from datahub.ingestion.source.tableau.tableau_common import (
     optimize_query_filter,
     tableau_field_to_schema_field,
 )
+from datahub.ingestion.source.tableau.tableau_metadata_cache import (
+    TableauMetadataCache,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.schema import SchemaField
 from datahub.metadata.schema_classes import (
     DatasetLineageTypeClass,
@@ -550,6 +553,133 @@ def test_get_filter_pages_id_filter_splits_into_multiple_filters():
     ]
 
 
+def _mock_metadata_query(server, main_query, connection_name, first, after, qry_filter):
+    # Each filter page has two pages of results.
+    return {
+        c.DATA: {
+            connection_name: {
+                c.NODES: [{c.ID: f"{qry_filter}/{after}"}],
+                c.PAGE_INFO: {
+                    c.HAS_NEXT_PAGE: after is None,
+                    "endCursor": "cursor" if after is None else None,
+                },
+            }
+        }
+    }
+
+
+@pytest.mark.parametrize("max_concurrent_metadata_queries", [1, 4])
+def test_get_connection_objects_concurrently(max_concurrent_metadata_queries):
+    config_dict = default_config.copy()
+    config_dict["max_concurrent_metadata_queries"] = max_concurrent_metadata_queries
+    config = TableauConfig.parse_obj(config_dict)
+    report = TableauSourceReport()
+    site_source = TableauSiteSource(
+        config=config,
+        ctx=PipelineContext(run_id="test", pipeline_name="test"),
+        site=SiteIdContentUrl(site_id="site1", site_content_url="site1"),
+        report=report,
+        server=mock.MagicMock(spec=Server),
+        platform="tableau",
+    )
+
+    ids = [f"id_{i}" for i in range(25)]
+    with mock.patch(
+        "datahub.ingestion.source.tableau.tableau.query_metadata_cursor_based_pagination",
+        side_effect=_mock_metadata_query,
+    ):
+        objects = list(
+            site_source.get_connection_objects(
+                query="query",
+                connection_type=c.WORKBOOKS_CONNECTION,
+                page_size=2,
+                query_filter={c.ID_WITH_IN: ids},
+            )
+        )
+
+    # The objects are returned in the same order regardless of concurrency.
+    filters = [make_filter(page) for page in get_filter_pages({c.ID_WITH_IN: ids}, 2)]
+    assert [obj[c.ID] for obj in objects] == [
+        f"{filter_}/{after}" for filter_ in filters for after in [None, "cursor"]
+    ]
+
+    assert report.num_actual_tableau_metadata_queries == 26
+    assert (
+        sum(
+            report.metadata_query_latency_by_connection_type[
+                c.WORKBOOKS_CONNECTION
+            ].values()
+        )
+        == 26
+    )
+
+
+def test_get_cached_connection_objects(tmp_path):
+    config = TableauConfig.parse_obj(default_config)
+    queried_ids: List[List[str]] = []
+
+    def mock_metadata_query(
+        server, main_query, connection_name, first, after, qry_filter
+    ):
+        ids = json.loads(qry_filter[len(f"{c.ID_WITH_IN}: ") :])
+        queried_ids.append(ids)
+        return {
+            c.DATA: {
+                connection_name: {
+                    c.NODES: [{c.ID: id, c.NAME: f"sheet {id}"} for id in ids],
+                    c.PAGE_INFO: {c.HAS_NEXT_PAGE: False},
+                }
+            }
+        }
+
+    def get_sheets(
+        metadata_cache: TableauMetadataCache, versions: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        site_source = TableauSiteSource(
+            config=config,
+            ctx=PipelineContext(run_id="test", pipeline_name="test"),
+            site=SiteIdContentUrl(site_id="site1", site_content_url="site1"),
+            report=TableauSourceReport(),
+            server=mock.MagicMock(spec=Server),
+            platform="tableau",
+            metadata_cache=metadata_cache,
+        )
+        with mock.patch(
+            "datahub.ingestion.source.tableau.tableau.query_metadata_cursor_based_pagination",
+            side_effect=mock_metadata_query,
+        ):
+            return list(
+                site_source.get_cached_connection_objects(
+                    query="query",
+                    connection_type=c.SHEETS_CONNECTION,
+                    page_size=10,
+                    object_ids=list(versions),
+                    get_version=lambda sheet: versions.get(sheet[c.ID]),
+                )
+            )
+
+    with TableauMetadataCache(tmp_path / "tableau_metadata_cache.sqlite") as cache:
+        versions = {"s1": "wb1@1", "s2": "wb1@1", "s3": "wb2@1"}
+        sheets = get_sheets(cache, versions)
+        assert [sheet[c.ID] for sheet in sheets] == ["s1", "s2", "s3"]
+        assert queried_ids == [["s1", "s2", "s3"]]
+
+        # Only the sheets of the updated workbook are fetched again.
+        queried_ids.clear()
+        versions["s3"] = "wb2@2"
+        sheets = get_sheets(cache, versions)
+        assert sorted(sheets, key=lambda sheet: sheet[c.ID]) == [
+            {c.ID: "s1", c.NAME: "sheet s1"},
+            {c.ID: "s2", c.NAME: "sheet s2"},
+            {c.ID: "s3", c.NAME: "sheet s3"},
+        ]
+        assert queried_ids == [["s3"]]
+
+        queried_ids.clear()
+        assert len(get_sheets(cache, versions)) == 3
+        assert queried_ids == []
+
+
 def test_optimize_query_filter_removes_duplicates():
     query_filter = {
         c.ID_WITH_IN: ["id1", "id2", "id1"],
@@ -1,9 +1,43 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+import pytest
+from datahub_classify.helper_classes import ColumnInfo, Metadata
+
 from datahub.ingestion.glossary.classification_mixin import (
     ClassificationHandler,
     ClassificationReportMixin,
     ClassificationSourceConfigMixin,
 )
-from datahub.ingestion.glossary.classifier import ClassificationConfig
+from datahub.ingestion.glossary.classifier import ClassificationConfig, Classifier
+
+
+class NoopClassifier(Classifier):
+    def classify(self, columns: List[ColumnInfo]) -> List[ColumnInfo]:
+        return columns
+
+
+class CrashingClassifier(Classifier):
+    def classify(self, columns: List[ColumnInfo]) -> List[ColumnInfo]:
+        os._exit(1)
+
+
+def _make_columns(num_columns: int) -> List[ColumnInfo]:
+    return [
+        ColumnInfo(
+            metadata=Metadata(
+                {
+                    "Name": f"column_{i}",
+                    "Description": None,
+                    "DataType": "int",
+                    "Dataset_Name": "db.schema.table",
+                }
+            ),
+            values=[i],
+        )
+        for i in range(num_columns)
+    ]
 
 
 def test_get_classifiers_without_classification_config():
@@ -34,3 +68,51 @@ def test_get_classifiers_with_none_classification():
 
     # Should return empty list when classification is None
     assert handler.get_classifiers() == []
+
+
+def test_async_classify_reuses_worker_pool():
+    config = ClassificationSourceConfigMixin(
+        classification=ClassificationConfig(enabled=True, max_workers=2)
+    )
+    report = ClassificationReportMixin()
+    handler = ClassificationHandler(config, report)
+    handler.classifiers = [NoopClassifier()]
+
+    columns = _make_columns(12)
+
+    try:
+        result = handler.async_classify(0, columns)
+        executor = handler._executor
+        assert executor is not None
+        assert sorted(column.metadata.name for column in result) == sorted(
+            column.metadata.name for column in columns
+        )
+
+        # Classifying another table doesn't start a new pool of workers.
+        handler.async_classify(0, columns[:3])
+        assert handler._executor is executor
+    finally:
+        handler.close()
+
+    assert handler._executor is None
+
+
+def test_async_classify_replaces_broken_worker_pool():
+    config = ClassificationSourceConfigMixin(
+        classification=ClassificationConfig(enabled=True, max_workers=2)
+    )
+    report = ClassificationReportMixin()
+    handler = ClassificationHandler(config, report)
+    handler.classifiers = [CrashingClassifier()]
+    columns = _make_columns(3)
+
+    try:
+        with pytest.raises(BrokenProcessPool):
+            handler.async_classify(0, columns)
+        assert handler._executor is None
+
+        # The next table is classified by a new pool of workers.
+        handler.classifiers = [NoopClassifier()]
+        assert len(list(handler.async_classify(0, columns))) == 3
+    finally:
+        handler.close()
@@ -1,14 +1,24 @@
-from datetime import datetime
-from typing import Any, Dict, List
+import contextlib
+import re
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Union
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import DateTime, bindparam, create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.elements import TextClause
 
+from datahub.ingestion.source.datahub.config import DataHubSourceConfig
 from datahub.ingestion.source.datahub.datahub_database_reader import (
     DATETIME_FORMAT,
     DataHubDatabaseReader,
+    UrnRange,
     VersionOrderer,
 )
+from datahub.ingestion.source.datahub.report import DataHubSourceReport
+from datahub.ingestion.source.sql.sql_config import SQLAlchemyConnectionConfig
 
 
 @pytest.fixture
@@ -53,6 +63,7 @@ def mock_reader():
         "datahub.ingestion.source.datahub.datahub_database_reader.create_engine"
     ) as mock_create_engine:
         config = MagicMock()
+        config.database_partitions = 1
         connection_config = MagicMock()
         report = MagicMock()
         mock_engine = MagicMock()
@@ -79,7 +90,7 @@ def test_get_rows_for_date_range_no_rows(mock_reader):
 
     # Assert
     assert len(result) == 0
-    mock_reader.query.assert_called_once_with(False)
+    mock_reader.query.assert_called_once_with(False, urn_range=None)
     mock_reader.execute_server_cursor.assert_called_once()
 
 
@@ -98,7 +109,7 @@ def test_get_rows_for_date_range_with_rows(mock_reader):
 
     # Assert
     assert result == mock_rows
-    mock_reader.query.assert_called_once_with(False)
+    mock_reader.query.assert_called_once_with(False, urn_range=None)
     assert mock_reader.execute_server_cursor.call_count == 1
 
 
@@ -306,3 +317,178 @@ def test_get_rows_for_date_range_exclude_aspects(mock_reader):
     assert "exclude_aspects" in called_params
     assert isinstance(called_params["exclude_aspects"], tuple)
     assert called_params["exclude_aspects"] == ("aspect1", "aspect2")
+
+
+SQLITE_START = datetime(2023, 1, 1)
+
+
+class SqliteTestConnection:
+    """Runs the reader's queries, which use pyformat parameters, against SQLite."""
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+
+    def begin(self) -> Any:
+        return self._conn.begin()
+
+    def execution_options(self, **options: Any) -> "SqliteTestConnection":
+        return SqliteTestConnection(self._conn.execution_options(**options))
+
+    def execute(self, query: Union[str, TextClause], params: Any = None) -> Any:
+        if isinstance(query, str):
+            query = self._to_sqlite(query)
+        return self._conn.execute(query, params or {})
+
+    @staticmethod
+    def _to_sqlite(query: str) -> TextClause:
+        # SQLite only supports named parameters. Escape colons in literals,
+        # e.g. urn prefixes, so they aren't read as parameters.
+        query = query.replace(":", "\\:").replace("%%", "%")
+        clause = text(re.sub(r"%\((\w+)\)s", r":\1", query))
+        if "%(exclude_aspects)s" in query:
+            clause = clause.bindparams(bindparam("exclude_aspects", expanding=True))
+        # SQLite has no datetime type, so parse the timestamps ourselves.
+        return clause.columns(createdon=DateTime)
+
+
+class SqliteTestEngine:
+    """Lets the reader use SQLite as if it were MySQL, which it otherwise rejects."""
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self.dialect = SimpleNamespace(
+            name="mysql", identifier_preparer=engine.dialect.identifier_preparer
+        )
+
+    @contextlib.contextmanager
+    def connect(self) -> Iterator[SqliteTestConnection]:
+        with self._engine.connect() as conn:
+            yield SqliteTestConnection(conn)
+
+
+@pytest.fixture
+def sqlite_reader(tmp_path):
+    sqlalchemy_uri = f"sqlite:///{tmp_path / 'datahub.db'}"
+    engine = create_engine(sqlalchemy_uri)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE metadata_aspect_v2 ("
+                "urn VARCHAR(500), aspect VARCHAR(200), version BIGINT, "
+                "metadata TEXT, systemmetadata TEXT, createdon DATETIME, "
+                "PRIMARY KEY (urn, aspect, version))"
+            )
+        )
+        # Version 1 is the previous value of each aspect, version 0 the latest.
+        conn.execute(
+            text(
+                "INSERT INTO metadata_aspect_v2 VALUES "
+                "(:urn, 'status', :version, :metadata, NULL, :createdon)"
+            ),
+            [
+                {
+                    "urn": f"urn:li:corpuser:user{i}",
+                    "version": version,
+                    "metadata": f'{{"removed": {"true" if version else "false"}}}',
+                    "createdon": (
+                        SQLITE_START + timedelta(minutes=i + 10 * (1 - version))
+                    ).strftime(DATETIME_FORMAT),
+                }
+                for i in range(10)
+                for version in (0, 1)
+            ],
+        )
+
+    connection_config = SQLAlchemyConnectionConfig(
+        scheme="sqlite", host_port="", sqlalchemy_uri=sqlalchemy_uri
+    )
+    config = DataHubSourceConfig(
+        database_connection=connection_config,
+        include_all_versions=True,
+        structured_properties_template_cache_invalidation_interval=0,
+    )
+    reader = DataHubDatabaseReader(config, connection_config, DataHubSourceReport())
+    reader.engine = SqliteTestEngine(engine)  # type: ignore
+    return reader
+
+
+def test_get_urn_ranges(sqlite_reader):
+    urn_ranges = sqlite_reader.get_urn_ranges(3)
+
+    assert urn_ranges == [
+        UrnRange("", "urn:li:corpuser:user3"),
+        UrnRange("urn:li:corpuser:user3", "urn:li:corpuser:user7"),
+        UrnRange("urn:li:corpuser:user7", None),
+    ]
+
+
+def test_pool_sized_for_partitions():
+    connection_config = SQLAlchemyConnectionConfig(
+        scheme="mysql+pymysql", host_port="localhost:3306"
+    )
+    config = DataHubSourceConfig(
+        database_connection=connection_config, database_partitions=8
+    )
+    with patch(
+        "datahub.ingestion.source.datahub.datahub_database_reader.create_engine"
+    ) as mock_create_engine:
+        DataHubDatabaseReader(config, connection_config, DataHubSourceReport())
+        assert mock_create_engine.call_args.kwargs["pool_size"] == 8
+
+        connection_config.options["pool_size"] = 4
+        DataHubDatabaseReader(config, connection_config, DataHubSourceReport())
+        assert mock_create_engine.call_args.kwargs["pool_size"] == 4
+
+
+def test_get_all_aspects_partitioned(sqlite_reader):
+    urn_ranges = sqlite_reader.get_urn_ranges(3)
+
+    aspects = list(
+        sqlite_reader.get_all_aspects(
+            SQLITE_START,
+            datetime(2024, 1, 1),
+            partition_progress={
+                urn_range.lower: SQLITE_START for urn_range in urn_ranges
+            },
+        )
+    )
+
+    assert len(aspects) == 20
+    assert sqlite_reader.report.num_database_partitions == 3
+    aspects_by_urn: Dict[str, List[bool]] = {}
+    for mcp, createdon, partition in aspects:
+        assert isinstance(createdon, datetime)
+        urn_range = next(r for r in urn_ranges if r.lower == partition)
+        assert mcp.entityUrn >= urn_range.lower
+        assert urn_range.upper is None or mcp.entityUrn < urn_range.upper
+        aspects_by_urn.setdefault(mcp.entityUrn, []).append(mcp.aspect.removed)
+
+    # Each urn's previous version is ingested before its latest one.
+    assert aspects_by_urn == {
+        f"urn:li:corpuser:user{i}": [True, False] for i in range(10)
+    }
+
+
+def test_get_all_aspects_resumes_partitions(sqlite_reader):
+    # The first range was interrupted after ingesting the previous versions of its aspects.
+    partition_progress = {
+        "": SQLITE_START + timedelta(minutes=10),
+        "urn:li:corpuser:user5": SQLITE_START,
+    }
+
+    aspects = list(
+        sqlite_reader.get_all_aspects(
+            SQLITE_START, datetime(2024, 1, 1), partition_progress=partition_progress
+        )
+    )
+
+    assert sorted(
+        (partition, mcp.entityUrn, mcp.aspect.removed) for mcp, _, partition in aspects
+    ) == sorted(
+        [("", f"urn:li:corpuser:user{i}", False) for i in range(5)]
+        + [
+            ("urn:li:corpuser:user5", f"urn:li:corpuser:user{i}", removed)
+            for i in range(5, 10)
+            for removed in (False, True)
+        ]
+    )
@@ -1,7 +1,18 @@
 import json
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, MutableSequence, Optional, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    MutableSequence,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
 from unittest import mock
 from uuid import uuid4
 
@@ -174,6 +185,15 @@ def create_and_run_test_pipeline(
     return events_file
 
 
+def batched(fake_get_aspect: Callable[..., Any]) -> Callable[..., Dict[str, Any]]:
+    def fake_get_aspects_for_urns(
+        entity_urns: Iterable[str], aspect_type: Type[Any], batch_size: int = 100
+    ) -> Dict[str, Any]:
+        return {urn: fake_get_aspect(urn, aspect_type) for urn in entity_urns}
+
+    return fake_get_aspects_for_urns
+
+
 def make_dataset_with_owner() -> models.MetadataChangeEventClass:
     return models.MetadataChangeEventClass(
         proposedSnapshot=models.DatasetSnapshotClass(
@@ -1132,7 +1152,7 @@ def test_pattern_container_and_dataset_ownership_transformation(
         run_id="test_pattern_container_and_dataset_ownership_transformation"
     )
     pipeline_context.graph = mock_datahub_graph_instance
-    pipeline_context.graph.get_aspect = fake_get_aspect  # type: ignore
+    pipeline_context.graph.get_aspects_for_urns = batched(fake_get_aspect)  # type: ignore
 
     # No owner aspect for the first dataset
     no_owner_aspect_dataset = models.MetadataChangeEventClass(
@@ -1261,7 +1281,7 @@ def test_pattern_container_and_dataset_ownership_with_no_container(
         run_id="test_pattern_container_and_dataset_ownership_with_no_container"
     )
     pipeline_context.graph = mock_datahub_graph_instance
-    pipeline_context.graph.get_aspect = fake_get_aspect  # type: ignore
+    pipeline_context.graph.get_aspects_for_urns = batched(fake_get_aspect)  # type: ignore
 
     # No owner aspect for the first dataset
     no_owner_aspect = models.MetadataChangeEventClass(
@@ -1384,7 +1404,7 @@ def test_pattern_container_and_dataset_ownership_with_no_match(
         run_id="test_pattern_container_and_dataset_ownership_with_no_match"
     )
     pipeline_context.graph = mock_datahub_graph_instance
-    pipeline_context.graph.get_aspect = fake_get_aspect  # type: ignore
+    pipeline_context.graph.get_aspects_for_urns = batched(fake_get_aspect)  # type: ignore
 
     # No owner aspect for the first dataset
     no_owner_aspect = models.MetadataChangeEventClass(
@@ -2905,7 +2925,7 @@ def test_pattern_container_and_dataset_domain_transformation(
         run_id="test_pattern_container_and_dataset_domain_transformation"
     )
     pipeline_context.graph = mock_datahub_graph_instance
-    pipeline_context.graph.get_aspect = fake_get_aspect  # type: ignore
+    pipeline_context.graph.get_aspects_for_urns = batched(fake_get_aspect)  # type: ignore
 
     with_domain_aspect = make_generic_dataset_mcp(
         aspect=models.DomainsClass(domains=[datahub_domain])
@@ -3003,7 +3023,7 @@ def test_pattern_container_and_dataset_domain_transformation_with_no_container(
         run_id="test_pattern_container_and_dataset_domain_transformation_with_no_container"
     )
     pipeline_context.graph = mock_datahub_graph_instance
-    pipeline_context.graph.get_aspect = fake_get_aspect  # type: ignore
+    pipeline_context.graph.get_aspects_for_urns = batched(fake_get_aspect)  # type: ignore
 
     with_domain_aspect = make_generic_dataset_mcp(
         aspect=models.DomainsClass(domains=[datahub_domain])
@@ -3075,7 +3095,7 @@ def test_pattern_add_container_dataset_domain_no_match(mock_datahub_graph_instan
             ]
         )
 
-    pipeline_context.graph.get_aspect = fake_get_aspect  # type: ignore
+    pipeline_context.graph.get_aspects_for_urns = batched(fake_get_aspect)  # type: ignore
 
     output = run_dataset_transformer_pipeline(
         transformer_type=PatternAddDatasetDomain,
@@ -166,6 +166,34 @@ def test_urn_from_urn_tricky() -> None:
     assert tag.name == "urn:li:tag:legacy"
 
 
+def test_urn_from_string_cached() -> None:
+    urn_str = "urn:li:dataset:(urn:li:dataPlatform:abc,def,PROD)"
+
+    urn = Urn.from_string(urn_str)
+    assert isinstance(urn, DatasetUrn)
+    assert Urn.from_string(urn_str) is urn
+    assert DatasetUrn.from_string(urn_str) == urn
+
+    # Errors aren't cached, and the caller's class is still checked.
+    for _ in range(2):
+        with pytest.raises(InvalidUrnError):
+            CorpUserUrn.from_string(urn_str)
+        with pytest.raises(InvalidUrnError):
+            Urn.from_string("urn:li:dataset:(urn:li:dataPlatform:abc,def)")
+
+
+def test_urn_entity_ids_not_shared() -> None:
+    urn_str = "urn:li:dataset:(urn:li:dataPlatform:abc,def,PROD)"
+
+    Urn.from_string(urn_str).entity_ids.append("oops")
+    assert Urn.from_string(urn_str).urn() == urn_str
+    assert Urn.from_string(urn_str).entity_ids == [
+        "urn:li:dataPlatform:abc",
+        "def",
+        "PROD",
+    ]
+
+
 def test_urn_doctest() -> None:
     assert_doctest(datahub.utilities.urns._urn_base)
 
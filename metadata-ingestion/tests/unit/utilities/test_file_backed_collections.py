@@ -5,6 +5,7 @@ import pathlib
 import random
 import sqlite3
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Counter, Dict
 from unittest.mock import patch
 
@@ -14,6 +15,7 @@ from datahub.utilities.file_backed_collections import (
     ConnectionWrapper,
     FileBackedDict,
     FileBackedList,
+    PersistentFileBackedDict,
 )
 
 
@@ -420,6 +422,78 @@ def test_file_list() -> None:
         my_list[100] = 100
 
 
+@pytest.mark.parametrize("use_sqlite_on_conflict", [True, False])
+def test_bulk_operations(use_sqlite_on_conflict: bool) -> None:
+    cache = FileBackedDict[int](
+        extra_columns={"doubled": lambda v: v * 2},
+        cache_max_size=10,
+        cache_eviction_batch_size=5,
+        _use_sqlite_on_conflict=use_sqlite_on_conflict,
+    )
+
+    # A dirty cached value must not overwrite the bulk-written one later on.
+    cache["key-1"] = -1
+    cache.update_many((f"key-{i}", i) for i in range(2000))
+    cache.update_many({"key-5": 500})
+    cache.flush()
+
+    assert len(cache) == 2000
+    assert cache["key-1"] == 1
+    assert cache["key-5"] == 500
+    assert (
+        cache.sql_query(f"SELECT doubled FROM {cache.tablename} WHERE key = 'key-5'")[
+            0
+        ][0]
+        == 1000
+    )
+
+    cache["key-7"] = 70
+    assert cache.get_many(["key-7", "key-5", "missing"]) == {
+        "key-7": 70,
+        "key-5": 500,
+    }
+    assert len(cache.get_many(f"key-{i}" for i in range(0, 4000, 2))) == 1000
+
+
+def test_extra_columns_json() -> None:
+    cache = FileBackedDict[Dict[str, int]](
+        extra_columns={"keys": lambda v: sorted(v.keys())},
+        cache_max_size=0,
+    )
+    cache["a"] = {"x": 1, "y": 2}
+    cache["b"] = {"y": 3}
+
+    assert (
+        cache.sql_query(
+            f"SELECT {cache.tablename}.key FROM {cache.tablename}, json_each({cache.tablename}.keys) WHERE json_each.value = 'x'"
+        )[0][0]
+        == "a"
+    )
+
+
+def test_file_list_extend() -> None:
+    my_list = FileBackedList[int](cache_max_size=5, cache_eviction_batch_size=5)
+    my_list.append(100)
+    my_list.extend(range(10))
+    my_list.append(200)
+
+    assert len(my_list) == 12
+    assert list(my_list) == [100, *range(10), 200]
+
+
+def test_wal_journal_mode(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "persisted.db"
+    with ConnectionWrapper(filename=filename, journal_mode="WAL") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        cache = FileBackedDict[int](shared_connection=conn)
+        cache.update_many({"a": 1, "b": 2})
+        cache.close()
+
+    with ConnectionWrapper(filename=filename) as conn:
+        cache = FileBackedDict[int](shared_connection=conn)
+        assert dict(cache) == {"a": 1, "b": 2}
+
+
 def test_file_cleanup():
     cache = FileBackedDict[int]()
     filename = pathlib.Path(cache._conn.filename)
@@ -431,3 +505,52 @@ def test_file_cleanup():
     assert filename.exists()
     cache.close()
     assert not filename.exists()
+
+
+def test_reopen_persisted_dict_with_extra_columns(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "persisted.db"
+
+    for i in range(2):
+        with ConnectionWrapper(filename=filename) as conn:
+            cache = FileBackedDict[int](
+                shared_connection=conn,
+                tablename="data",
+                extra_columns={"is_even": lambda v: v % 2 == 0},
+            )
+            cache[f"key{i}"] = i
+            cache.close()
+
+    with ConnectionWrapper(filename=filename) as conn:
+        cache = FileBackedDict[int](
+            shared_connection=conn,
+            tablename="data",
+            extra_columns={"is_even": lambda v: v % 2 == 0},
+        )
+        assert dict(cache) == {"key0": 0, "key1": 1}
+        assert cache.sql_query("SELECT key FROM data WHERE is_even")[0][0] == "key0"
+
+
+def test_persistent_dict_expires_entries(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "cache.db"
+
+    with PersistentFileBackedDict[int](path=filename, tablename="cache") as cache:
+        cache["a"] = 1
+        cache["b"] = 2
+
+    with PersistentFileBackedDict[int](
+        path=filename, tablename="cache", ttl=timedelta(days=1)
+    ) as cache:
+        # Pretend both entries were last used a while ago, and then read one of them.
+        cache.sql_query("UPDATE cache SET last_used = 0")
+        assert cache.get("a") == 1
+
+    with PersistentFileBackedDict[int](
+        path=filename, tablename="cache", ttl=timedelta(days=1)
+    ) as cache:
+        assert dict(cache) == {"a": 1}
+
+    # Entries written by another version are dropped.
+    with PersistentFileBackedDict[int](
+        path=filename, tablename="cache", version="other"
+    ) as cache:
+        assert len(cache) == 0
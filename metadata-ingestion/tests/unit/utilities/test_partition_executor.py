@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import math
 import time
@@ -7,6 +8,7 @@ from datetime import timedelta
 import pytest
 
 from datahub.utilities.partition_executor import (
+    AsyncBatchPartitionExecutor,
     BatchPartitionExecutor,
     PartitionExecutor,
 )
@@ -197,3 +199,64 @@ def test_empty_batch_partition_executor():
         max_workers=5, max_pending=20, process_batch=lambda batch: None, max_per_batch=2
     ) as executor:
         assert executor is not None
+
+
+def test_async_batch_partition_executor_key_ordering() -> None:
+    executing_keys = set()
+    processed = []
+    shutdown_called = []
+
+    async def process_batch(batch):
+        batch_keys = {key for key, _ in batch}
+        assert not executing_keys & batch_keys, "Key is already executing"
+        executing_keys.update(batch_keys)
+
+        await asyncio.sleep(0.05)  # Simulate I/O
+
+        executing_keys.difference_update(batch_keys)
+        processed.extend(batch)
+
+    async def on_shutdown():
+        shutdown_called.append(True)
+
+    done_futures = []
+    with AsyncBatchPartitionExecutor(
+        max_pending=10,
+        max_per_batch=2,
+        process_batch=process_batch,
+        on_shutdown=on_shutdown,
+    ) as executor:
+        for i in range(20):
+            key = f"key{i % 3}"
+            executor.submit(key, key, i, done_callback=done_futures.append)
+
+        # Test idempotency of shutdown().
+        executor.shutdown()
+
+    assert len(processed) == 20
+    assert len(done_futures) == 20
+    assert all(future.exception() is None for future in done_futures)
+    assert shutdown_called == [True]
+
+    # Requests for a given key must be processed in submission order.
+    for key in ["key0", "key1", "key2"]:
+        ids = [id for k, id in processed if k == key]
+        assert ids == sorted(ids)
+
+
+def test_async_batch_partition_executor_flushes_partial_batches() -> None:
+    processed = []
+
+    async def process_batch(batch):
+        processed.extend(batch)
+
+    with AsyncBatchPartitionExecutor(
+        max_pending=10,
+        max_per_batch=5,
+        process_batch=process_batch,
+        min_process_interval=timedelta(seconds=0.1),
+    ) as executor:
+        executor.submit("key1", "key1", "task1")
+
+        time.sleep(1)
+        assert processed == [("key1", "task1")]
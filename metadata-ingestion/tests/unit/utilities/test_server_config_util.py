@@ -160,6 +160,17 @@ def test_is_no_code_enabled(sample_config):
     assert config.is_no_code_enabled is False
 
 
+def test_supported_request_encodings(sample_config):
+    """Test reading the request encodings advertised by the server."""
+    config = RestServiceConfig(raw_config=sample_config)
+    assert config.supported_request_encodings == []
+
+    modified_config = sample_config.copy()
+    modified_config["supportedRequestEncodings"] = ["gzip", "zstd"]
+    config = RestServiceConfig(raw_config=modified_config)
+    assert config.supported_request_encodings == ["gzip", "zstd"]
+
+
 def test_is_managed_ingestion_enabled(sample_config):
     """Test checking if managed ingestion is enabled."""
     config = RestServiceConfig(raw_config=sample_config)